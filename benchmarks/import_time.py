@@ -0,0 +1,84 @@
+"""
+Import-time benchmark for WinFormPy.
+
+Runs each import statement in fresh interpreters and reports the median
+wall time of the process and the time spent in the import statement itself.
+
+Usage:
+    python benchmarks/import_time.py            # warm (bytecode cached)
+    python benchmarks/import_time.py --cold     # no bytecode cache
+    python benchmarks/import_time.py --budget-ms 500
+
+Exits with status 1 if any statement exceeds --budget-ms.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STATEMENTS = [
+    "from winformpy import Form, Button",
+    "from winformpy.winformpy import Form, Button",
+    "from winformpy import DatePickerBox",
+    "from winformpy import *",
+]
+
+
+def _run_once(statement, cold):
+    """Runs one statement in a new interpreter.
+
+    Returns:
+        Tuple (wall_ms, import_ms): whole process, and the statement alone
+    """
+    probe = (
+        "import time; _t = time.perf_counter()\n"
+        f"{statement}\n"
+        "print((time.perf_counter() - _t) * 1000)"
+    )
+    cmd = [sys.executable]
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        if cold:
+            # Fresh, empty pycache: every module is compiled from source
+            cmd += ["-X", f"pycache_prefix={cache_dir}"]
+        cmd += ["-c", probe]
+        start = time.perf_counter()
+        result = subprocess.run(cmd, env=env, capture_output=True, text=True, cwd=ROOT)
+        wall_ms = (time.perf_counter() - start) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f"{statement!r} failed:\n{result.stderr}")
+    return wall_ms, float(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="interpreters per statement")
+    parser.add_argument("--cold", action="store_true", help="disable the bytecode cache")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="fail if the median wall time exceeds this")
+    args = parser.parse_args(argv)
+
+    baseline = statistics.median(_run_once("pass", args.cold)[0] for _ in range(args.runs))
+    print(f"{'statement':<48} {'wall ms':>9} {'import ms':>10}")
+    print(f"{'(interpreter startup)':<48} {baseline:>9.1f} {'':>10}")
+
+    over_budget = False
+    for statement in STATEMENTS:
+        samples = [_run_once(statement, args.cold) for _ in range(args.runs)]
+        wall = statistics.median(s[0] for s in samples)
+        imported = statistics.median(s[1] for s in samples)
+        print(f"{statement:<48} {wall:>9.1f} {imported:>10.1f}")
+        if args.budget_ms is not None and wall > args.budget_ms:
+            over_budget = True
+
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""Retained-mode Graphics diffing, checked against a fake canvas (no display needed)."""
+
+import copy
+import itertools
+
+from winformpy.winformpy import Graphics, Rectangle, SolidBrush
+
+
+class FakeCanvas:
+    """Records canvas items the way tk.Canvas would hold them."""
+
+    def __init__(self):
+        self.items = {}
+        self._ids = itertools.count(1)
+
+    def _create(self, kind, *coords, **options):
+        item = next(self._ids)
+        self.items[item] = [kind, coords, options]
+        return item
+
+    def create_rectangle(self, *coords, **options):
+        return self._create('rectangle', *coords, **options)
+
+    def coords(self, item, *coords):
+        self.items[item][1] = coords
+
+    def itemconfigure(self, item, **options):
+        self.items[item][2].update(options)
+
+    def delete(self, item):
+        del self.items[item]
+
+    def tag_raise(self, item, above):
+        pass
+
+    def tag_lower(self, item):
+        pass
+
+
+RECTS = [Rectangle(i * 20, 0, 10, 10) for i in range(10)]
+
+
+def paint(graphics, clip=None, color='red', changed=None):
+    graphics._begin_paint(clip)
+    for index, rect in enumerate(RECTS):
+        if graphics.IsVisible(rect):
+            graphics.FillRectangle(SolidBrush(color if index == changed else 'red'), rect)
+    graphics._end_paint()
+
+
+def test_clipped_paint_keeps_items_skipped_with_is_visible():
+    canvas = FakeCanvas()
+    graphics = Graphics(canvas)
+    paint(graphics)
+    assert len(canvas.items) == 10
+    before = copy.deepcopy(canvas.items)
+
+    paint(graphics, clip=RECTS[5], color='blue', changed=5)
+
+    assert len(canvas.items) == 10
+    changed = [item for item, value in canvas.items.items() if value[2] != before[item][2]]
+    assert len(changed) == 1
+    assert canvas.items[changed[0]][1] == (100, 0, 110, 10)
+    assert canvas.items[changed[0]][2]['fill'] == 'blue'
+
+
+def test_full_paint_after_clipped_paint_reuses_items():
+    canvas = FakeCanvas()
+    graphics = Graphics(canvas)
+    paint(graphics)
+    paint(graphics, clip=RECTS[2])
+    ids = set(canvas.items)
+    paint(graphics)
+    assert set(canvas.items) == ids
@@ -1,6 +1,89 @@
-from .winformpy import *
-from .winformpy_extended import *
-from .winformpy_tools import *
+"""
+WinFormPy package.
+
+Names are resolved lazily (PEP 562): ``from winformpy import Form, Button``
+imports only the core module, and ``winformpy_extended`` / ``winformpy_tools``
+are loaded the first time one of their names is requested. ``from winformpy
+import *`` still exports everything, as before. Printing (``PrintDocument``
+and its writers) is loaded the same way, from ``printing``.
+"""
+
+import importlib
+
+# Names provided by the optional modules; everything else lives in the core
+# winformpy.py module. Listed here so looking one up doesn't import the rest.
+_LAZY_EXPORTS = {
+    # winformpy_extended
+    'install_library': 'winformpy_extended',
+    'PhotoImage': 'winformpy_extended',
+    'ExtendedLabel': 'winformpy_extended',
+    'ConsoleTextBox': 'winformpy_extended',
+    'DateFormat': 'winformpy_extended',
+    'DatePickerBox': 'winformpy_extended',
+    # winformpy_tools
+    'FontManager': 'winformpy_tools',
+    'ColorManager': 'winformpy_tools',
+    'CSSManager': 'winformpy_tools',
+    'parse_css_string': 'winformpy_tools',
+    'css_to_tkinter_config': 'winformpy_tools',
+    'apply_css_to_widget': 'winformpy_tools',
+    'css_to_winform_props': 'winformpy_tools',
+    'apply_css_to_winform_control': 'winformpy_tools',
+    'LayoutManager': 'winformpy_tools',
+    'AutoLayoutManager': 'winformpy_tools',
+    # printing
+    'PageSettings': 'printing',
+    'PrintedPage': 'printing',
+    'PrintDocument': 'printing',
+    'DataGridViewPrinter': 'printing',
+    'RichTextBoxPrinter': 'printing',
+}
+
+_CORE_MODULE = 'winformpy'
+_STAR_MODULES = (_CORE_MODULE, 'printing', 'winformpy_extended', 'winformpy_tools')
+
+# Submodules that are imported explicitly (from winformpy.winui3 import ...)
+# rather than re-exported at package level.
+_SUBMODULES = frozenset(('winformpy', 'winformpy_extended', 'winformpy_tools', 'printing',
+                         'winui3', 'mdipy', 'mauipy', 'ui_elements', 'templates'))
+
+
+def _import(module_name):
+    return importlib.import_module(f'.{module_name}', __name__)
+
+
+def _public_names(module):
+    return [name for name in vars(module) if not name.startswith('_')]
+
+
+def __getattr__(name):
+    if name == '__all__':
+        # Star import: load every module, later ones override earlier ones
+        # exactly like the previous chain of star imports did.
+        exported = {}
+        for module_name in _STAR_MODULES:
+            module = _import(module_name)
+            for public in _public_names(module):
+                exported[public] = getattr(module, public)
+        globals().update(exported)
+        globals()['__all__'] = list(exported)
+        return globals()['__all__']
+    if name.startswith('__') or name in _SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = _import(_LAZY_EXPORTS.get(name, _CORE_MODULE))
+    try:
+        value = getattr(module, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    names = set(globals()) | set(_LAZY_EXPORTS)
+    names.update(_public_names(_import(_CORE_MODULE)))
+    return sorted(names)
+
 
 # WinUI 3 controls are available via:
 # from winformpy.winui3 import WinUIButton, WinUILabel, etc.
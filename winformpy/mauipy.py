@@ -34,6 +34,7 @@ from datetime import datetime, date, time
 import calendar
 import sys
 import subprocess
+from collections import OrderedDict
 
 
 # =============================================================
@@ -117,11 +118,196 @@ class EventArgs:
 EventArgs.Empty = EventArgs()
 
 
+# =============================================================================
+# PAGE CACHE - Reuse of constructed pages
+# =============================================================================
+
+def _notify_page(page, hook):
+    """Calls page.OnAppearing / page.OnDisappearing if the page defines it."""
+    handler = getattr(page, hook, None)
+    if callable(handler):
+        handler()
+
+
+class PageCache:
+    """
+    Keyed LRU of constructed pages, used by Shell and NavigationPage.
+    
+    A page is keyed by its class and constructor arguments, so navigating to
+    the same destination again shows the existing page (widgets and state
+    intact) instead of building a new one. Pages refresh their data in
+    OnAppearing. When the cache is full, the least recently used page is
+    handed to on_evict, which destroys it unless it is still on screen.
+    
+    Properties:
+        Capacity (int): Maximum number of cached pages.
+        Count (int): Number of pages currently cached.
+    
+    Example:
+        >>> app = Shell(props={'PageCacheSize': 8})
+        >>> app.NavigateTo(HomePage)      # built once
+        >>> app.NavigateTo(SettingsPage)
+        >>> app.NavigateTo(HomePage)      # reused
+    """
+    def __init__(self, capacity=8, on_evict=None):
+        self._capacity = capacity
+        self._on_evict = on_evict
+        self._pages = OrderedDict()
+    
+    @property
+    def Capacity(self):
+        return self._capacity
+    
+    @Capacity.setter
+    def Capacity(self, value):
+        self._capacity = value
+        self._trim()
+    
+    @staticmethod
+    def MakeKey(page_class, args=(), kwargs=None):
+        """Returns the cache key for a page, or None if the arguments are unhashable."""
+        key = (page_class, tuple(args), tuple(sorted((kwargs or {}).items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def Get(self, key):
+        """Returns the cached page for key (marking it recently used), or None."""
+        page = self._pages.get(key)
+        if page is not None:
+            self._pages.move_to_end(key)
+        return page
+    
+    def Put(self, key, page):
+        """Caches page under key, evicting the least recently used pages if needed."""
+        self._pages[key] = page
+        self._pages.move_to_end(key)
+        self._trim()
+    
+    def _trim(self):
+        while len(self._pages) > max(0, self._capacity):
+            _, evicted = self._pages.popitem(last=False)
+            if self._on_evict:
+                self._on_evict(evicted)
+    
+    def Contains(self, page):
+        """Returns True if page is one of the cached instances."""
+        return any(cached is page for cached in self._pages.values())
+    
+    def Clear(self):
+        """Empties the cache, evicting every page."""
+        pages = list(self._pages.values())
+        self._pages.clear()
+        if self._on_evict:
+            for page in pages:
+                self._on_evict(page)
+    
+    @property
+    def Count(self):
+        return len(self._pages)
+
+
+class _PageHost:
+    """
+    Page construction, caching and route preloading shared by Shell and
+    NavigationPage. Subclasses provide _page_master() and _page_stack_list().
+    """
+    _page_cache = None
+    _routes = None
+    _preload_queue = None
+    
+    def _init_page_host(self, cache_size):
+        self._routes = {}
+        self._preload_queue = []
+        self._page_cache = PageCache(cache_size, self._on_page_evicted) if cache_size > 0 else None
+    
+    @property
+    def PageCacheSize(self):
+        """Gets or sets how many constructed pages are kept for reuse (0 disables caching)."""
+        return self._page_cache.Capacity if self._page_cache else 0
+    
+    @PageCacheSize.setter
+    def PageCacheSize(self, value):
+        if value <= 0:
+            if self._page_cache:
+                cache, self._page_cache = self._page_cache, None
+                cache.Clear()
+        elif self._page_cache:
+            self._page_cache.Capacity = value
+        else:
+            self._page_cache = PageCache(value, self._on_page_evicted)
+    
+    def RegisterRoute(self, route, page_class, *args, **kwargs):
+        """Registers a named route; NavigateTo/PushAsync accept the route name."""
+        self._routes[route] = (page_class, args, kwargs)
+    
+    def PreloadRoutes(self, routes=None):
+        """
+        Builds the pages of registered routes ahead of time, one per idle
+        callback so the UI stays responsive, and stores them in the page
+        cache. Requires PageCacheSize > 0.
+        """
+        if not self._page_cache:
+            return
+        names = list(self._routes) if routes is None else list(routes)
+        start = not self._preload_queue
+        self._preload_queue.extend(names)
+        if start and self._preload_queue:
+            self._page_master().after_idle(self._preload_next)
+    
+    def _preload_next(self):
+        if not self._preload_queue or not self._page_cache:
+            self._preload_queue = []
+            return
+        page_class, args, kwargs = self._routes[self._preload_queue.pop(0)]
+        key = PageCache.MakeKey(page_class, args, kwargs)
+        if key is not None and self._page_cache.Get(key) is None:
+            self._page_cache.Put(key, page_class(self._page_master(), *args, **kwargs))
+        if self._preload_queue:
+            self._page_master().after_idle(self._preload_next)
+    
+    def _resolve_page(self, page_class, args, kwargs):
+        """Returns a page for page_class (or a route name), reusing a cached one if possible."""
+        if isinstance(page_class, str):
+            page_class, route_args, route_kwargs = self._routes[page_class]
+            args = args or route_args
+            kwargs = kwargs or route_kwargs
+        key = PageCache.MakeKey(page_class, args, kwargs) if self._page_cache else None
+        page = self._page_cache.Get(key) if key is not None else None
+        if page is None:
+            page = page_class(self._page_master(), *args, **kwargs)
+            if key is not None:
+                self._page_cache.Put(key, page)
+        return page
+    
+    def _show_page(self, page, previous):
+        """Hides previous and shows page, raising OnDisappearing/OnAppearing."""
+        if previous is not None and previous is not page:
+            _notify_page(previous, 'OnDisappearing')
+            previous._frame.pack_forget()
+        page._frame.pack(fill=tk.BOTH, expand=True)
+        _notify_page(page, 'OnAppearing')
+    
+    def _release_page(self, page):
+        """Hides a page leaving the stack; destroys it unless it is cached."""
+        _notify_page(page, 'OnDisappearing')
+        if self._page_cache and self._page_cache.Contains(page):
+            page._frame.pack_forget()
+        else:
+            page._frame.destroy()
+    
+    def _on_page_evicted(self, page):
+        if not any(p is page for p in self._page_stack_list()):
+            page._frame.destroy()
+
+
 # =============================================================================
 # SHELL - Main Application Container
 # =============================================================================
 
-class Shell:
+class Shell(_PageHost):
     """
     Main application container with integrated navigation and flyout menu.
     
@@ -140,12 +326,15 @@ class Shell:
         FlyoutWidth (int): Width of the flyout menu in pixels (default: 250).
         HeaderTitle (str): Text displayed in the header bar.
         HeaderColor (str): Background color of the header bar.
+        PageCacheSize (int): Pages kept for reuse by NavigateTo (default: 0, off).
     
     Methods:
         AddMenuItem(text, command, icon): Adds a menu item to the flyout.
         AddMenuSeparator(): Adds a visual separator in the flyout menu.
-        NavigateTo(page_class): Navigates to a new page.
+        NavigateTo(page_class): Navigates to a page (class or registered route).
         GoBack(): Returns to the previous page in the navigation stack.
+        RegisterRoute(route, page_class): Names a page for NavigateTo.
+        PreloadRoutes(): Builds registered pages into the cache at idle time.
         Run(): Starts the application main loop.
     
     Example:
@@ -164,7 +353,8 @@ class Shell:
             'HeaderColor': '#512BD4',
             'FlyoutWidth': 250,
             'HeaderHeight': 50,
-            'CenterOnScreen': True
+            'CenterOnScreen': True,
+            'PageCacheSize': 0
         }
         
         # Apply props over defaults
@@ -191,6 +381,7 @@ class Shell:
         
         # Build UI structure
         self._build_shell_structure()
+        self._init_page_host(defaults['PageCacheSize'])
         
     def _build_shell_structure(self):
         """Builds the internal shell structure."""
@@ -353,18 +544,22 @@ class Shell:
         sep.pack(fill=tk.X, padx=10, pady=5)
         
     def NavigateTo(self, page_class, *args, **kwargs):
-        """Navigates to a new page."""
-        # Create page instance
-        page = page_class(self._content_frame, *args, **kwargs)
+        """Navigates to a page.
         
-        # Hide current page
-        if self._current_page:
-            self._current_page._frame.pack_forget()
-            
-        # Show new page
-        page._frame.pack(fill=tk.BOTH, expand=True)
+        page_class may also be a route name registered with RegisterRoute.
+        With PageCacheSize > 0 an already constructed page is reused; if it
+        is further down the stack it is moved to the top.
+        """
+        # Create page instance (or reuse a cached one)
+        page = self._resolve_page(page_class, args, kwargs)
+        if page is self._current_page:
+            return page
+        
+        # Hide current page, show new page
+        self._show_page(page, self._current_page)
         
         # Update stack and title
+        self._page_stack = [p for p in self._page_stack if p is not page]
         self._page_stack.append(page)
         self._current_page = page
         self.HeaderTitle = getattr(page, 'Title', '')
@@ -374,14 +569,20 @@ class Shell:
     def GoBack(self):
         """Goes back to the previous page."""
         if len(self._page_stack) > 1:
-            # Remove current page
+            # Remove current page (kept hidden if cached, destroyed otherwise)
             current = self._page_stack.pop()
-            current._frame.destroy()
+            self._release_page(current)
             
             # Show previous page
             self._current_page = self._page_stack[-1]
-            self._current_page._frame.pack(fill=tk.BOTH, expand=True)
+            self._show_page(self._current_page, None)
             self.HeaderTitle = getattr(self._current_page, 'Title', '')
+    
+    def _page_master(self):
+        return self._content_frame
+    
+    def _page_stack_list(self):
+        return self._page_stack
             
     @property
     def CanGoBack(self):
@@ -415,6 +616,10 @@ class ContentPage:
         BackColor (str): Background color of the page content area.
         Content (Frame): The scrollable content frame for adding child controls.
     
+    Methods:
+        OnAppearing(): Override to refresh data when the page is shown.
+        OnDisappearing(): Override to pause work when the page is hidden.
+    
     Example:
         >>> class HomePage(ContentPage):
         ...     def __init__(self, master):
@@ -480,9 +685,17 @@ class ContentPage:
     def Content(self):
         """Returns the content frame where controls should be added."""
         return self._content
+    
+    def OnAppearing(self):
+        """Called each time the page is shown. Override to refresh data."""
+        pass
+    
+    def OnDisappearing(self):
+        """Called each time the page is hidden or leaves the navigation stack."""
+        pass
 
 
-class NavigationPage:
+class NavigationPage(_PageHost):
     """
     Container page with built-in navigation bar and hierarchical page stack.
     
@@ -495,10 +708,13 @@ class NavigationPage:
         BackColor (str): Background color of the page.
         NavBarColor (str): Background color of the navigation bar.
         NavBarHeight (int): Height of the navigation bar in pixels.
+        PageCacheSize (int): Pages kept for reuse by PushAsync (default: 0, off).
     
     Methods:
-        PushAsync(page_class): Pushes a new page onto the navigation stack.
+        PushAsync(page_class): Pushes a page (class or registered route) onto the stack.
         PopAsync(): Removes the current page and returns to the previous one.
+        RegisterRoute(route, page_class): Names a page for PushAsync.
+        PreloadRoutes(): Builds registered pages into the cache at idle time.
     
     Example:
         >>> nav = NavigationPage(root, root_page_class=MainPage)
@@ -511,7 +727,8 @@ class NavigationPage:
             'Title': '',
             'BackColor': '#FAFAFA',
             'NavBarColor': '#2196F3',
-            'NavBarHeight': 50
+            'NavBarHeight': 50,
+            'PageCacheSize': 0
         }
         
         # Apply props over defaults
@@ -565,24 +782,24 @@ class NavigationPage:
         # Page stack
         self._stack = []
         self._current = None
+        self._init_page_host(defaults['PageCacheSize'])
         
         # Push root page if provided
         if root_page_class:
             self.PushAsync(root_page_class)
             
     def PushAsync(self, page_class, *args, **kwargs):
-        """Pushes a new page onto the navigation stack."""
-        # Create page
-        page = page_class(self._content_container, *args, **kwargs)
+        """Pushes a page onto the navigation stack (reused from the page cache if enabled)."""
+        # Create page (or reuse a cached one)
+        page = self._resolve_page(page_class, args, kwargs)
+        if page is self._current:
+            return page
         
-        # Hide current
-        if self._current:
-            self._current._frame.pack_forget()
-            
-        # Show new page
-        page._frame.pack(fill=tk.BOTH, expand=True)
+        # Hide current, show new page
+        self._show_page(page, self._current)
         
         # Update stack
+        self._stack = [p for p in self._stack if p is not page]
         self._stack.append(page)
         self._current = page
         
@@ -594,13 +811,13 @@ class NavigationPage:
     def PopAsync(self):
         """Pops the current page from the stack."""
         if len(self._stack) > 1:
-            # Remove current
+            # Remove current (kept hidden if cached, destroyed otherwise)
             page = self._stack.pop()
-            page._frame.destroy()
+            self._release_page(page)
             
             # Show previous
             self._current = self._stack[-1]
-            self._current._frame.pack(fill=tk.BOTH, expand=True)
+            self._show_page(self._current, None)
             
             # Update navbar
             self._update_navbar()
@@ -608,6 +825,12 @@ class NavigationPage:
     def _go_back(self):
         """Internal back button handler."""
         self.PopAsync()
+    
+    def _page_master(self):
+        return self._content_container
+    
+    def _page_stack_list(self):
+        return self._stack
         
     def _update_navbar(self):
         """Updates the navigation bar state."""
@@ -734,7 +957,9 @@ class TabbedPage:
                 
         # Hide current page
         if self._current_index >= 0 and self._tabs[self._current_index]['page']:
-            self._tabs[self._current_index]['page']._frame.pack_forget()
+            previous = self._tabs[self._current_index]['page']
+            _notify_page(previous, 'OnDisappearing')
+            previous._frame.pack_forget()
             
         # Create page if needed
         tab = self._tabs[index]
@@ -744,6 +969,7 @@ class TabbedPage:
         # Show page
         tab['page']._frame.pack(fill=tk.BOTH, expand=True)
         self._current_index = index
+        _notify_page(tab['page'], 'OnAppearing')
 
 
 # =============================================================================
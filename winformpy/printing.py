@@ -0,0 +1,762 @@
+"""
+WinFormPy Printing - PrintDocument and its PDF/PostScript output
+
+PrintDocument raises PrintPage once per page; e.Graphics records the page's
+draw commands in hundredths of an inch. Print() streams the pages into a PDF
+or PostScript file. DataGridViewPrinter and RichTextBoxPrinter are
+ready-made PrintPage handlers.
+
+Loaded on first use: ``from winformpy import PrintDocument`` imports this
+module, importing winformpy alone does not.
+"""
+
+import bisect
+import itertools
+import zlib
+import tkinter as tk
+
+from .winformpy import (
+    Color, EventArgs, Font, Pen, PrintPageEventArgs, PrinterSettings, Rectangle,
+    Size, SolidBrush, _no_op_event, _points_to_coords, _rect_coords,
+)
+
+# Paper sizes in hundredths of an inch (the WinForms page unit), portrait
+_PAPER_SIZES = {
+    "Letter": (850, 1100),
+    "Legal": (850, 1400),
+    "A4": (827, 1169),
+    "A3": (1169, 1654),
+    "Executive": (725, 1050),
+}
+
+# Standard PostScript/PDF fonts, indexed by bold + 2 * italic
+_PRINT_FONT_FAMILIES = {
+    "Helvetica": ("Helvetica", "Helvetica-Bold", "Helvetica-Oblique", "Helvetica-BoldOblique"),
+    "Times": ("Times-Roman", "Times-Bold", "Times-Italic", "Times-BoldItalic"),
+    "Courier": ("Courier", "Courier-Bold", "Courier-Oblique", "Courier-BoldOblique"),
+}
+_PRINT_FONTS = tuple(name for names in _PRINT_FONT_FAMILIES.values() for name in names)
+_PRINT_FONT_INDEX = {name: index for index, name in enumerate(_PRINT_FONTS)}
+
+# Helvetica advance widths (1/1000 em) for ASCII 32..126, from its AFM metrics
+_HELVETICA_WIDTHS = (
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+)
+
+_print_colors = {}
+_print_fonts = {}
+_print_glyph_widths = {}
+_print_rgb_operands = {}
+
+
+def _print_font(font):
+    """Maps a Font, a (family, size[, style]) tuple or None to (ps_font_name, size_pt)."""
+    if isinstance(font, Font):
+        key = (font.Name, font.Size, 'bold' if font.Bold else '', 'italic' if font.Italic else '')
+    else:
+        key = font if isinstance(font, tuple) and len(font) >= 2 else None
+    resolved = _print_fonts.get(key)
+    if resolved is not None:
+        return resolved
+    family, size, bold, italic = "Helvetica", 9, False, False
+    if key is not None:
+        tokens = ' '.join(str(t) for t in key[2:]).lower().split()
+        family, size = key[0], key[1]
+        bold, italic = 'bold' in tokens, 'italic' in tokens
+    lowered = str(family).lower()
+    if any(name in lowered for name in ("courier", "consolas", "mono", "console")):
+        names = _PRINT_FONT_FAMILIES["Courier"]
+    elif "sans" not in lowered and any(name in lowered for name in ("times", "serif", "georgia", "garamond", "cambria")):
+        names = _PRINT_FONT_FAMILIES["Times"]
+    else:
+        names = _PRINT_FONT_FAMILIES["Helvetica"]
+    resolved = _print_fonts[key] = (names[bool(bold) + 2 * bool(italic)], abs(size) or 9)
+    return resolved
+
+
+class _GlyphWidths(dict):
+    """Character -> advance width (em) in one standard font; other characters get an average width."""
+
+    def __init__(self, ps_name):
+        if ps_name.startswith("Courier"):
+            super().__init__()
+            self._default = 0.6
+            return
+        factor = 0.9 if ps_name.startswith("Times") else 1.0
+        if "Bold" in ps_name:
+            factor *= 1.06
+        super().__init__((chr(32 + i), width * factor / 1000) for i, width in enumerate(_HELVETICA_WIDTHS))
+        self._default = 0.556 * factor
+
+    def __missing__(self, char):
+        return self._default
+
+
+def _glyph_widths(ps_name):
+    widths = _print_glyph_widths.get(ps_name)
+    if widths is None:
+        widths = _print_glyph_widths[ps_name] = _GlyphWidths(ps_name)
+    return widths
+
+
+def _print_text_width(text, ps_name, size):
+    """Width of one line of text in page units (metrics of the standard fonts, approximated)."""
+    return sum(map(_glyph_widths(ps_name).__getitem__, text)) * size * 100 / 72
+
+
+def _print_fit_count(text, width, ps_name, size):
+    """Number of leading characters of text that fit in width page units."""
+    advances = list(itertools.accumulate(map(_glyph_widths(ps_name).__getitem__, text)))
+    return bisect.bisect_right(advances, width * 72 / (size * 100))
+
+
+def _fit_print_text(text, width, font):
+    """Cuts text with an ellipsis so it fits in width page units."""
+    ps_name, size = _print_font(font)
+    if _print_text_width(text, ps_name, size) <= width:
+        return text
+    count = _print_fit_count(text, width - _print_text_width("...", ps_name, size), ps_name, size)
+    return text[:count] + "..." if count else ""
+
+
+def _wrap_print_text(line, width, ps_name, size):
+    """Yields the pieces of one line of text that fit in width page units (word wrap)."""
+    if _print_text_width(line, ps_name, size) <= width:
+        yield line
+        return
+    space = _print_text_width(" ", ps_name, size)
+    current, current_width = None, 0
+    for word in line.split(' '):
+        word_width = _print_text_width(word, ps_name, size)
+        if current is not None and current_width + space + word_width <= width:
+            current += ' ' + word
+            current_width += space + word_width
+            continue
+        if current is not None:
+            yield current
+        # Words longer than a whole line are broken between characters
+        while word_width > width and len(word) > 1:
+            count = max(1, _print_fit_count(word, width, ps_name, size))
+            yield word[:count]
+            word = word[count:]
+            word_width = _print_text_width(word, ps_name, size)
+        current, current_width = word, word_width
+    if current is not None:
+        yield current
+
+
+def _print_color(color):
+    """Resolves a Color, hex string or color name to '#rrggbb' without Tk."""
+    key = '#000000' if color is None else str(color)
+    resolved = _print_colors.get(key)
+    if resolved is None:
+        value = (key if key.startswith('#') else str(Color.FromName(key))).lstrip('#')
+        if len(value) == 3:
+            value = ''.join(char * 2 for char in value)
+        try:
+            int(value, 16)
+            resolved = '#' + value.lower() if len(value) == 6 else '#000000'
+        except ValueError:
+            resolved = '#000000'
+        _print_colors[key] = resolved
+    return resolved
+
+
+def _print_number(value):
+    value = round(value, 2)
+    return str(int(value)) if value == int(value) else repr(value)
+
+
+def _print_rgb(color):
+    """'#rrggbb' -> 'r g b' operands (0..1) for setrgbcolor / rg."""
+    operands = _print_rgb_operands.get(color)
+    if operands is None:
+        operands = _print_rgb_operands[color] = ' '.join(
+            _print_number(int(color[i:i + 2], 16) / 255) for i in (1, 3, 5))
+    return operands
+
+
+def _print_string(text, encoding):
+    """PostScript/PDF string literal, non-ASCII bytes as octal escapes."""
+    if text.isascii() and text.isprintable():
+        return '(' + text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)') + ')'
+    out = []
+    for byte in text.encode(encoding, 'replace'):
+        if byte in (40, 41, 92):  # ( ) backslash
+            out.append('\\' + chr(byte))
+        elif 32 <= byte < 127:
+            out.append(chr(byte))
+        else:
+            out.append('\\%03o' % byte)
+    return '(' + ''.join(out) + ')'
+
+
+class PageSettings:
+    """Paper size, orientation and margins of printed pages.
+
+    Bounds and Margins are in hundredths of an inch, like WinForms.
+    """
+
+    def __init__(self, paper_size="A4", landscape=False, margins=(100, 100, 100, 100)):
+        self.PaperSize = paper_size
+        self.Landscape = landscape
+        self.Margins = tuple(margins)  # Left, Right, Top, Bottom
+
+    @property
+    def Bounds(self):
+        """Gets the page bounds, taking Landscape into account."""
+        width, height = _PAPER_SIZES.get(self.PaperSize, _PAPER_SIZES["A4"])
+        if self.Landscape:
+            width, height = height, width
+        return Rectangle(0, 0, width, height)
+
+    @property
+    def MarginBounds(self):
+        """Gets the printable area inside the margins."""
+        left, right, top, bottom = self.Margins
+        bounds = self.Bounds
+        return Rectangle(left, top, bounds.Width - left - right, bounds.Height - top - bottom)
+
+    def Clone(self):
+        """Creates a copy of this PageSettings."""
+        return PageSettings(self.PaperSize, self.Landscape, self.Margins)
+
+
+class PrintedPage:
+    """One page produced by PrintDocument.GeneratePages(): number, bounds and draw commands."""
+
+    __slots__ = ('Number', 'Bounds', 'Commands')
+
+    def __init__(self, number, bounds, commands):
+        self.Number = number
+        self.Bounds = bounds
+        self.Commands = commands
+
+
+class _PageGraphics:
+    """
+    Graphics of a printed page (e.Graphics in PrintPage).
+
+    Records draw commands in page units: hundredths of an inch, origin at
+    the top-left corner of the paper. Offers the drawing methods of the
+    screen Graphics plus MeasureString; fonts map to the standard
+    Helvetica, Times and Courier families.
+    """
+
+    def __init__(self):
+        self._commands = []
+
+    def _shape(self, kind, coords, pen=None, brush=None):
+        if pen is not None:
+            self._commands.append((kind, coords, _print_color(pen.Color), None, pen.Width))
+        else:
+            self._commands.append((kind, coords, None, _print_color(brush.Color), 0))
+
+    def DrawLine(self, pen, x1, y1, x2, y2):
+        """Draws a line between two points."""
+        self._commands.append(('line', (x1, y1, x2, y2), _print_color(pen.Color), pen.Width, pen.DashPattern))
+
+    def DrawLines(self, pen, points):
+        """Draws a polyline through the given points."""
+        coords = _points_to_coords(points)
+        if len(coords) >= 4:
+            self._commands.append(('line', coords, _print_color(pen.Color), pen.Width, pen.DashPattern))
+
+    def DrawRectangle(self, pen, *rect):
+        """Draws a rectangle outline: (x, y, width, height) or a Rectangle."""
+        self._shape('rect', _rect_coords(rect), pen=pen)
+
+    def FillRectangle(self, brush, *rect):
+        """Fills a rectangle: (x, y, width, height) or a Rectangle."""
+        self._shape('rect', _rect_coords(rect), brush=brush)
+
+    def DrawEllipse(self, pen, *rect):
+        """Draws the ellipse inscribed in a rectangle."""
+        self._shape('oval', _rect_coords(rect), pen=pen)
+
+    def FillEllipse(self, brush, *rect):
+        """Fills the ellipse inscribed in a rectangle."""
+        self._shape('oval', _rect_coords(rect), brush=brush)
+
+    def DrawPolygon(self, pen, points):
+        """Draws a closed polygon outline."""
+        self._shape('polygon', _points_to_coords(points), pen=pen)
+
+    def FillPolygon(self, brush, points):
+        """Fills a closed polygon."""
+        self._shape('polygon', _points_to_coords(points), brush=brush)
+
+    def DrawString(self, text, font, brush, x, y):
+        """Draws text with its top-left corner at (x, y); '\\n' starts a new line."""
+        ps_name, size = _print_font(font)
+        color = _print_color(brush.Color)
+        line_height = size * 100 / 72 * 1.2
+        for line in str(text).split('\n'):
+            if line:
+                self._commands.append(('text', x, y, line, ps_name, size, color))
+            y += line_height
+
+    def MeasureString(self, text, font):
+        """Size of text drawn with font, in page units."""
+        ps_name, size = _print_font(font)
+        lines = str(text).split('\n')
+        width = max(_print_text_width(line, ps_name, size) for line in lines)
+        return Size(width, len(lines) * size * 100 / 72 * 1.2)
+
+
+class PrintDocument:
+    """
+    Defines a document that is printed one page at a time.
+
+    Handle PrintPage to draw each page on e.Graphics (hundredths of an
+    inch) and set e.HasMorePages while more pages follow. Pages are
+    produced lazily, one per PrintPage, and dropped once written, so a
+    10,000-page report prints in constant memory. Print() streams them to
+    a PDF or PostScript file; PrintPreviewDialog shows them on screen.
+
+    Usage:
+        doc = PrintDocument()
+        doc.PrintPage = on_print_page
+        doc.PrinterSettings.PrintFileName = "report.pdf"
+        doc.Print()
+    """
+
+    def __init__(self):
+        self.DocumentName = "document"
+        self.PrinterSettings = PrinterSettings()
+        self.DefaultPageSettings = PageSettings(self.PrinterSettings.PaperSize,
+                                                self.PrinterSettings.Landscape)
+
+        # VB Events
+        self.BeginPrint = _no_op_event
+        self.PrintPage = _no_op_event
+        self.EndPrint = _no_op_event
+
+    def GeneratePages(self):
+        """Yields the document's pages one at a time, raising PrintPage for each.
+
+        BeginPrint is raised first and EndPrint when the generator finishes
+        or is closed. Setting e.Cancel in BeginPrint or PrintPage stops it.
+
+        Yields:
+            PrintedPage
+        """
+        begin = EventArgs()
+        self.BeginPrint(self, begin)
+        if begin.Cancel:
+            return
+        try:
+            number = 0
+            while True:
+                number += 1
+                settings = self.DefaultPageSettings
+                e = PrintPageEventArgs(_PageGraphics(), settings.MarginBounds, settings.Bounds, settings)
+                self.PrintPage(self, e)
+                if e.Cancel:
+                    return
+                yield PrintedPage(number, e.PageBounds, e.Graphics._commands)
+                if not e.HasMorePages:
+                    return
+        finally:
+            self.EndPrint(self, EventArgs())
+
+    def Print(self):
+        """Prints the document to PrinterSettings.PrintFileName.
+
+        A name ending in .pdf writes PDF, anything else PostScript. Without a
+        file name a save dialog asks for one, as a print-to-file printer
+        does. PrintRange "SomePages" (FromPage..ToPage), Copies and Collate
+        are honored.
+
+        Returns:
+            Number of pages written (0 if no file was chosen)
+        """
+        path = self.PrinterSettings.PrintFileName
+        if not path:
+            from tkinter import filedialog
+            path = filedialog.asksaveasfilename(
+                title="Print to file", initialfile=f"{self.DocumentName}.pdf", defaultextension=".pdf",
+                filetypes=[("PDF", "*.pdf"), ("PostScript", "*.ps"), ("All files", "*.*")])
+            if not path:
+                return 0
+        writer_class = _PdfWriter if path.lower().endswith('.pdf') else _PostScriptWriter
+        with open(path, 'wb') as stream:
+            writer = writer_class(stream, self.DocumentName)
+            writer.begin()
+            self._write_pages(writer)
+            writer.end()
+        return writer.PageCount
+
+    def _write_pages(self, writer):
+        settings = self.PrinterSettings
+        first, last = 1, None
+        if settings.PrintRange == "SomePages":
+            first, last = settings.FromPage, settings.ToPage
+        copies = max(1, int(settings.Copies or 1))
+        # Collated copies run the whole document again; otherwise each page repeats
+        runs, repeats = (copies, 1) if settings.Collate else (1, copies)
+        for _ in range(runs):
+            pages = self.GeneratePages()
+            try:
+                for page in pages:
+                    if last is not None and page.Number > last:
+                        break
+                    if page.Number >= first:
+                        for _ in range(repeats):
+                            writer.write_page(page)
+            finally:
+                pages.close()
+
+
+class _PostScriptWriter:
+    """Streams PrintedPages to a DSC-conforming PostScript file."""
+
+    def __init__(self, stream, title):
+        self._stream = stream
+        self._title = title
+        self.PageCount = 0
+
+    def _write(self, text):
+        self._stream.write(text.encode('latin-1', 'replace'))
+
+    def begin(self):
+        fonts = ''.join(f"/{name}-L1 /{name} _wfpfont\n" for name in _PRINT_FONTS)
+        self._write(
+            "%!PS-Adobe-3.0\n"
+            f"%%Title: {self._title}\n"
+            "%%Creator: WinFormPy\n"
+            "%%Pages: (atend)\n"
+            "%%EndComments\n"
+            "%%BeginProlog\n"
+            "/_wfpfont { findfont dup length dict begin\n"
+            "  { 1 index /FID ne { def } { pop pop } ifelse } forall\n"
+            "  /Encoding ISOLatin1Encoding def currentdict end definefont pop } bind def\n"
+            "/_wfpoval { 4 dict begin /y2 exch def /x2 exch def /y1 exch def /x1 exch def\n"
+            "  matrix currentmatrix newpath x1 x2 add 2 div y1 y2 add 2 div translate\n"
+            "  x2 x1 sub 2 div y2 y1 sub 2 div scale 0 0 1 0 360 arc closepath setmatrix end } bind def\n"
+            "%%EndProlog\n"
+            "%%BeginSetup\n"
+            f"{fonts}"
+            "%%EndSetup\n")
+
+    def write_page(self, page):
+        self.PageCount += 1
+        width, height = _print_number(page.Bounds.Width * 0.72), _print_number(page.Bounds.Height * 0.72)
+        out = [
+            f"%%Page: {page.Number} {self.PageCount}\n",
+            f"%%BeginPageSetup\n<< /PageSize [{width} {height}] >> setpagedevice\n%%EndPageSetup\n",
+            # Page units: hundredths of an inch, y growing downwards
+            f"save\n0 {height} translate 0.72 -0.72 scale\n",
+        ]
+        num = _print_number
+        for command in page.Commands:
+            kind = command[0]
+            if kind == 'text':
+                _, x, y, text, ps_name, size, color = command
+                em = size * 100 / 72
+                out.append(f"/{ps_name}-L1 findfont {num(em)} scalefont setfont {_print_rgb(color)} setrgbcolor "
+                           f"gsave {num(x)} {num(y + em * 0.8)} translate 1 -1 scale 0 0 moveto "
+                           f"{_print_string(text, 'latin-1')} show grestore\n")
+                continue
+            if kind == 'line':
+                _, coords, color, width, dash = command
+                fill = None
+            else:
+                _, coords, color, fill, width = command
+                dash = None
+            if kind == 'oval':
+                if coords[0] == coords[2] or coords[1] == coords[3]:
+                    continue
+                path = ' '.join(num(v) for v in coords) + " _wfpoval"
+            elif kind == 'rect':
+                x1, y1, x2, y2 = coords
+                path = (f"newpath {num(x1)} {num(y1)} moveto {num(x2)} {num(y1)} lineto "
+                        f"{num(x2)} {num(y2)} lineto {num(x1)} {num(y2)} lineto closepath")
+            else:
+                pairs = [f"{num(coords[i])} {num(coords[i + 1])}" for i in range(0, len(coords) - 1, 2)]
+                if not pairs:
+                    continue
+                path = f"newpath {pairs[0]} moveto " + ' '.join(f"{p} lineto" for p in pairs[1:])
+                if kind == 'polygon':
+                    path += " closepath"
+            if fill is not None:
+                out.append(f"{_print_rgb(fill)} setrgbcolor {path} fill\n")
+            else:
+                pattern = ' '.join(num(v) for v in dash) if dash else ''
+                out.append(f"{_print_rgb(color)} setrgbcolor {num(width)} setlinewidth [{pattern}] 0 setdash "
+                           f"{path} stroke\n")
+        out.append("restore showpage\n")
+        self._write(''.join(out))
+
+    def end(self):
+        self._write(f"%%Trailer\n%%Pages: {self.PageCount}\n%%EOF\n")
+
+
+class _PdfWriter:
+    """Streams PrintedPages to a PDF file; only object offsets stay in memory."""
+
+    _CATALOG, _PAGES, _RESOURCES = 1, 2, 3
+
+    def __init__(self, stream, title):
+        self._stream = stream
+        self._title = title
+        self._position = 0
+        self._offsets = {}
+        self._next_id = 4
+        self._kids = []
+        self.PageCount = 0
+
+    def _write(self, data):
+        self._stream.write(data)
+        self._position += len(data)
+
+    def _new_id(self):
+        object_id = self._next_id
+        self._next_id += 1
+        return object_id
+
+    def _object(self, object_id, body):
+        self._offsets[object_id] = self._position
+        self._write(b"%d 0 obj\n" % object_id + body + b"\nendobj\n")
+
+    def begin(self):
+        self._write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        fonts = []
+        for index, name in enumerate(_PRINT_FONTS):
+            font_id = self._new_id()
+            self._object(font_id, f"<< /Type /Font /Subtype /Type1 /BaseFont /{name} "
+                                  f"/Encoding /WinAnsiEncoding >>".encode())
+            fonts.append(f"/F{index} {font_id} 0 R")
+        self._object(self._RESOURCES, f"<< /Font << {' '.join(fonts)} >> >>".encode())
+
+    def write_page(self, page):
+        content = zlib.compress(self._content(page).encode('ascii'))
+        content_id, page_id = self._new_id(), self._new_id()
+        self._object(content_id, b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(content)
+                     + content + b"\nendstream")
+        width, height = _print_number(page.Bounds.Width * 0.72), _print_number(page.Bounds.Height * 0.72)
+        self._object(page_id, f"<< /Type /Page /Parent {self._PAGES} 0 R /MediaBox [0 0 {width} {height}] "
+                              f"/Resources {self._RESOURCES} 0 R /Contents {content_id} 0 R >>".encode())
+        self._kids.append(page_id)
+        self.PageCount += 1
+
+    @staticmethod
+    def _content(page):
+        num = _print_number
+        # Page units: hundredths of an inch, y growing downwards
+        out = [f"0.72 0 0 -0.72 0 {num(page.Bounds.Height * 0.72)} cm\n"]
+        for command in page.Commands:
+            kind = command[0]
+            if kind == 'text':
+                _, x, y, text, ps_name, size, color = command
+                em = size * 100 / 72
+                out.append(f"BT /F{_PRINT_FONT_INDEX[ps_name]} {num(em)} Tf {_print_rgb(color)} rg "
+                           f"1 0 0 -1 {num(x)} {num(y + em * 0.8)} Tm {_print_string(text, 'cp1252')} Tj ET\n")
+                continue
+            if kind == 'line':
+                _, coords, color, width, dash = command
+                fill = None
+            else:
+                _, coords, color, fill, width = command
+                dash = None
+            if kind == 'rect':
+                x1, y1, x2, y2 = coords
+                path = f"{num(x1)} {num(y1)} {num(x2 - x1)} {num(y2 - y1)} re"
+            elif kind == 'oval':
+                x1, y1, x2, y2 = coords
+                cx, cy, rx, ry = (x1 + x2) / 2, (y1 + y2) / 2, (x2 - x1) / 2, (y2 - y1) / 2
+                kx, ky = rx * 0.5523, ry * 0.5523
+                path = (f"{num(cx + rx)} {num(cy)} m "
+                        f"{num(cx + rx)} {num(cy + ky)} {num(cx + kx)} {num(cy + ry)} {num(cx)} {num(cy + ry)} c "
+                        f"{num(cx - kx)} {num(cy + ry)} {num(cx - rx)} {num(cy + ky)} {num(cx - rx)} {num(cy)} c "
+                        f"{num(cx - rx)} {num(cy - ky)} {num(cx - kx)} {num(cy - ry)} {num(cx)} {num(cy - ry)} c "
+                        f"{num(cx + kx)} {num(cy - ry)} {num(cx + rx)} {num(cy - ky)} {num(cx + rx)} {num(cy)} c h")
+            else:
+                pairs = [f"{num(coords[i])} {num(coords[i + 1])}" for i in range(0, len(coords) - 1, 2)]
+                if not pairs:
+                    continue
+                path = f"{pairs[0]} m " + ' '.join(f"{p} l" for p in pairs[1:])
+                if kind == 'polygon':
+                    path += " h"
+            if fill is not None:
+                out.append(f"{_print_rgb(fill)} rg {path} f\n")
+            else:
+                pattern = ' '.join(num(v) for v in dash) if dash else ''
+                out.append(f"{_print_rgb(color)} RG {num(width)} w [{pattern}] 0 d {path} S\n")
+        return ''.join(out)
+
+    def end(self):
+        kids = ' '.join(f"{kid} 0 R" for kid in self._kids)
+        self._object(self._PAGES, f"<< /Type /Pages /Kids [{kids}] /Count {len(self._kids)} >>".encode())
+        self._object(self._CATALOG, f"<< /Type /Catalog /Pages {self._PAGES} 0 R >>".encode())
+        info_id = self._new_id()
+        self._object(info_id, f"<< /Title {_print_string(self._title, 'cp1252')} /Producer (WinFormPy) >>".encode())
+        xref_position = self._position
+        entries = ''.join("%010d 00000 n \n" % self._offsets[i] for i in range(1, self._next_id))
+        self._write(f"xref\n0 {self._next_id}\n0000000000 65535 f \n{entries}".encode())
+        self._write(f"trailer\n<< /Size {self._next_id} /Root {self._CATALOG} 0 R /Info {info_id} 0 R >>\n"
+                    f"startxref\n{xref_position}\n%%EOF\n".encode())
+
+
+def _iter_text_lines(control):
+    """Yields the lines of a TextBox/RichTextBox without copying all of its text."""
+    widget = getattr(control, '_tk_widget', None)
+    if isinstance(widget, tk.Text):
+        count = int(widget.index('end-1c').split('.')[0])
+        for number in range(1, count + 1):
+            yield widget.get(f"{number}.0", f"{number}.end")
+        return
+    text = str(control.Text)
+    start = 0
+    while True:
+        end = text.find('\n', start)
+        if end < 0:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+class DataGridViewPrinter:
+    """
+    Prints a DataGridView as a paginated table through a PrintDocument.
+
+    Visible columns are scaled to the margin width, the header row repeats
+    on every page and cell text is cut to its column. Rows are read page
+    by page, so nothing is laid out ahead of time.
+
+    Usage:
+        doc = DataGridViewPrinter(grid, "Orders").Attach(PrintDocument())
+        doc.PrinterSettings.PrintFileName = "orders.pdf"
+        doc.Print()
+    """
+
+    def __init__(self, grid, title=None, font=None):
+        self.Grid = grid
+        self.Title = title
+        self.Font = font or ("Helvetica", 9)
+        self.HeaderFont = ("Helvetica", 9, "bold")
+        self.TitleFont = ("Helvetica", 14, "bold")
+        self._row = 0
+        self._page = 0
+
+    def Attach(self, document):
+        """Handles BeginPrint/PrintPage of document. Returns the document."""
+        document.BeginPrint = self.BeginPrint
+        document.PrintPage = self.PrintPage
+        if self.Title:
+            document.DocumentName = self.Title
+        return document
+
+    def BeginPrint(self, sender, e):
+        self._row = 0
+        self._page = 0
+
+    def PrintPage(self, sender, e):
+        g = e.Graphics
+        area = e.MarginBounds
+        black = SolidBrush("#000000")
+        grid_pen = Pen("#A0A0A0", 0.5)
+        columns = [column for column in self.Grid.Columns if column.Visible]
+        scale = area.Width / (sum(column.Width for column in columns) or 1)
+        widths = [column.Width * scale for column in columns]
+        row_height = g.MeasureString("Ag", self.Font).Height + 6
+        self._page += 1
+
+        y = area.Y
+        if self.Title and self._page == 1:
+            g.DrawString(self.Title, self.TitleFont, black, area.X, y)
+            y += g.MeasureString(self.Title, self.TitleFont).Height + 10
+
+        g.FillRectangle(SolidBrush("#E8E8E8"), area.X, y, area.Width, row_height)
+        x = area.X
+        for column, width in zip(columns, widths):
+            header = _fit_print_text(str(column.HeaderText or column.Name), width - 8, self.HeaderFont)
+            g.DrawString(header, self.HeaderFont, black, x + 4, y + 3)
+            x += width
+        y += row_height
+        g.DrawLine(grid_pen, area.X, y, area.Right, y)
+
+        rows = self.Grid.Rows
+        count = len(rows)
+        printed = 0
+        # At least one row per page, even if it does not fit, so printing always ends
+        while self._row < count and (printed == 0 or y + row_height <= area.Bottom):
+            row = rows[self._row]
+            self._row += 1
+            if not row.Visible:
+                continue
+            cells = row.Cells
+            x = area.X
+            for column, width in zip(columns, widths):
+                index = column.Index
+                value = cells[index].Value if 0 <= index < len(cells) else None
+                if value is not None and value != "":
+                    text = _fit_print_text(str(value).replace('\n', ' '), width - 8, self.Font)
+                    g.DrawString(text, self.Font, black, x + 4, y + 3)
+                x += width
+            y += row_height
+            g.DrawLine(grid_pen, area.X, y, area.Right, y)
+            printed += 1
+        while self._row < count and not rows[self._row].Visible:
+            self._row += 1
+
+        footer = f"Page {self._page}"
+        g.DrawString(footer, self.Font, black, area.Right - g.MeasureString(footer, self.Font).Width,
+                     area.Bottom + 20)
+        e.HasMorePages = self._row < count
+
+
+class RichTextBoxPrinter:
+    """
+    Prints the text of a RichTextBox (or TextBox) through a PrintDocument,
+    word-wrapped to the margins.
+
+    Lines are read from the control and wrapped as pages are produced.
+    Character formatting is not reproduced: the whole text uses Font
+    (the control's font unless one is given).
+    """
+
+    def __init__(self, textbox, font=None):
+        self.TextBox = textbox
+        self.Font = font or getattr(textbox, 'Font', None)
+        self.ForeColor = "#000000"
+        self._lines = None
+        self._pending = None
+
+    def Attach(self, document):
+        """Handles BeginPrint/PrintPage of document. Returns the document."""
+        document.BeginPrint = self.BeginPrint
+        document.PrintPage = self.PrintPage
+        return document
+
+    def BeginPrint(self, sender, e):
+        self._lines = None
+        self._pending = None
+
+    def _wrapped_lines(self, width):
+        ps_name, size = _print_font(self.Font)
+        for line in _iter_text_lines(self.TextBox):
+            yield from _wrap_print_text(line.expandtabs(4), width, ps_name, size)
+
+    def PrintPage(self, sender, e):
+        g = e.Graphics
+        area = e.MarginBounds
+        if self._lines is None:
+            self._lines = self._wrapped_lines(area.Width)
+        brush = SolidBrush(self.ForeColor)
+        line_height = g.MeasureString("Ag", self.Font).Height
+        y = area.Y
+        line = self._pending if self._pending is not None else next(self._lines, None)
+        while line is not None and (y == area.Y or y + line_height <= area.Bottom):
+            if line:
+                g.DrawString(line, self.Font, brush, area.X, y)
+            y += line_height
+            line = next(self._lines, None)
+        self._pending = line
+        e.HasMorePages = line is not None
@@ -18,19 +18,34 @@ FEATURES
 - Command bar with modern icons
 - Address bar with breadcrumbs
 - Tabbed content area
+- Real file system listing: folders are read with os.scandir on a worker
+  thread and streamed into a virtual-mode ListView, so folders with 100k
+  entries appear progressively without freezing the window
+- Per-folder listing cache, invalidated when the folder's mtime changes
+- Image thumbnails for the rows in view, decoded and scaled on winformpy's
+  shared image load pool (PIL when installed, Tk's PNG/GIF otherwise)
 - Details pane (optional)
 """
 
 import sys
 import os
+import queue
+import string
+import threading
+import importlib.util
+from collections import OrderedDict
+from datetime import datetime
 
 # Add project to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from winformpy import (
     Form, Panel, Button, Label, TextBox, TabControl, TabPage,
-    ListBox, AnchorStyles, DockStyle, FlowLayoutPanel, FlowDirection
+    ListView, ListViewItem, ColumnHeader, View, HorizontalAlignment, Timer,
+    AnchorStyles, DockStyle, FlowLayoutPanel, FlowDirection, ImageList, PictureBoxSizeMode
 )
+# The image load pool behind PictureBox.LoadAsync also loads the thumbnails
+from winformpy import _ImageLoadJob, _ImageLoadPool, _create_photo_image
 
 
 # Windows 11 Fluent Design Color Palette
@@ -94,26 +109,310 @@ class Win11Colors:
 class FileItem:
     """Represents a file or folder item."""
     
-    def __init__(self, name, item_type="file", size="", modified="", icon="📄"):
+    def __init__(self, name, item_type="file", size="", modified="", icon="📄", path=None):
         self.name = name
         self.type = item_type
         self.size = size
         self.modified = modified
         self.icon = icon
+        self.path = path
         self.is_folder = item_type == "folder"
 
 
+# =============================================================================
+# File system listing
+# =============================================================================
+
+# Icon glyph by extension; unknown extensions fall back to the generic file icon
+_ICON_BY_EXTENSION = {
+    '.txt': '📝', '.md': '📝', '.log': '📝',
+    '.doc': '📄', '.docx': '📄', '.pdf': '📕',
+    '.xls': '📊', '.xlsx': '📊', '.csv': '📊',
+    '.png': '🖼', '.jpg': '🖼', '.jpeg': '🖼', '.gif': '🖼', '.bmp': '🖼', '.ico': '🖼',
+    '.mp3': '🎵', '.wav': '🎵', '.flac': '🎵',
+    '.mp4': '🎞', '.avi': '🎞', '.mkv': '🎞',
+    '.zip': '🗜', '.7z': '🗜', '.rar': '🗜', '.tar': '🗜', '.gz': '🗜',
+    '.py': '🐍', '.exe': '⚙', '.dll': '⚙',
+}
+
+# Rows sent from the scanner thread to the UI per batch
+SCAN_BATCH_SIZE = 512
+# How often (ms) the UI drains the scanner queue
+SCAN_POLL_INTERVAL = 30
+
+# Thumbnail edge in pixels (fits a Details row) and thumbnails kept in memory
+THUMBNAIL_SIZE = 20
+THUMBNAIL_CACHE_SIZE = 512
+# Without Pillow, Tk decodes thumbnails itself and only knows these formats
+if importlib.util.find_spec('PIL') is not None:
+    _THUMBNAIL_EXTENSIONS = {'.png', '.gif', '.jpg', '.jpeg', '.bmp', '.ico', '.webp', '.ppm'}
+else:
+    _THUMBNAIL_EXTENSIONS = {'.png', '.gif', '.ppm'}
+
+
+def _format_size(size):
+    """Formats a byte count like Explorer does (KB rounded up)."""
+    if size < 1024 * 1024:
+        return f"{(size + 1023) // 1024:,} KB"
+    if size < 1024 ** 3:
+        return f"{size / 1024 ** 2:.1f} MB"
+    return f"{size / 1024 ** 3:.1f} GB"
+
+
+def _type_name(name):
+    ext = os.path.splitext(name)[1]
+    return f"{ext[1:].upper()} File" if ext else "File"
+
+
+class FileEntry:
+    """Raw listing row produced by the scanner thread.
+
+    Only plain data is stored here; display strings (date, size, type, icon)
+    are built on demand by ``display_item`` when the row scrolls into view,
+    so a 100k-entry folder costs one ``os.scandir`` pass and nothing more.
+    """
+
+    __slots__ = ('name', 'path', 'is_folder', 'size', 'mtime', '_item')
+
+    def __init__(self, name, path, is_folder, size=0, mtime=None):
+        self.name = name
+        self.path = path
+        self.is_folder = is_folder
+        self.size = size
+        self.mtime = mtime
+        self._item = None
+
+    def sort_key(self):
+        return (not self.is_folder, self.name.lower())
+
+    def display_item(self):
+        """Returns the FileItem for this row (built once, on first display)."""
+        if self._item is None:
+            modified = (datetime.fromtimestamp(self.mtime).strftime('%d/%m/%Y %H:%M')
+                        if self.mtime is not None else "")
+            if self.is_folder:
+                self._item = FileItem(self.name, "folder", "", modified, "📁", self.path)
+            else:
+                ext = os.path.splitext(self.name)[1].lower()
+                self._item = FileItem(self.name, _type_name(self.name), _format_size(self.size),
+                                      modified, _ICON_BY_EXTENSION.get(ext, "📄"), self.path)
+        return self._item
+
+
+def _scan_entry(entry):
+    """Builds a FileEntry from an os.DirEntry (stat errors leave blanks)."""
+    try:
+        is_folder = entry.is_dir()
+        info = entry.stat()
+        return FileEntry(entry.name, entry.path, is_folder,
+                         0 if is_folder else info.st_size, info.st_mtime)
+    except OSError:
+        return FileEntry(entry.name, entry.path, False)
+
+
+def _this_pc_entries():
+    """Entries shown for "This PC": user folders followed by drives."""
+    home = os.path.expanduser("~")
+    entries = []
+    for name in ('Desktop', 'Documents', 'Downloads', 'Pictures', 'Music', 'Videos'):
+        path = os.path.join(home, name)
+        if os.path.isdir(path):
+            entries.append(FileEntry(name, path, True))
+    if os.name == 'nt':
+        drives = [f"{letter}:\\" for letter in string.ascii_uppercase
+                  if os.path.exists(f"{letter}:\\")]
+    else:
+        drives = [os.sep]
+    entries.extend(FileEntry(drive, drive, True) for drive in drives)
+    return entries
+
+
+class DirectoryCache:
+    """Per-folder listing cache, invalidated by the folder's mtime.
+
+    Adding, removing or renaming an entry updates the folder's mtime, so a
+    cached listing is reused only while it still matches the folder on disk.
+    """
+
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self._listings = {}  # path -> (st_mtime_ns, entries)
+
+    @staticmethod
+    def _mtime(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def get(self, path):
+        """Returns the cached entries for path, or None if missing or stale."""
+        cached = self._listings.get(path)
+        if cached is None:
+            return None
+        if cached[0] != self._mtime(path):
+            del self._listings[path]
+            return None
+        return cached[1]
+
+    def put(self, path, mtime_ns, entries):
+        if mtime_ns is None:
+            return
+        self._listings.pop(path, None)
+        if len(self._listings) >= self.max_entries:
+            # Dicts keep insertion order: drop the oldest listing
+            del self._listings[next(iter(self._listings))]
+        self._listings[path] = (mtime_ns, entries)
+
+    def invalidate(self, path):
+        self._listings.pop(path, None)
+
+
+class DirectoryScanner(threading.Thread):
+    """Worker thread that lists a folder with os.scandir.
+
+    Messages pushed to ``results`` are ``(generation, kind, payload)``:
+    ``'rows'`` with a batch of SCAN_BATCH_SIZE new entries, then either
+    ``'done'`` with the whole listing sorted folders-first (sorting 100k
+    entries takes a few hundred ms, so it happens here and not on the UI
+    thread) or ``'error'`` with the OSError. Setting ``cancelled`` stops the
+    scan at the next entry; the UI also drops messages whose generation is
+    not current, so a late batch from an old folder is never shown.
+    """
+
+    def __init__(self, path, generation, results):
+        super().__init__(daemon=True)
+        self.path = path
+        self.generation = generation
+        self.results = results
+        self.mtime_ns = DirectoryCache._mtime(path)
+        self.cancelled = False
+
+    def run(self):
+        entries = []
+        sent = 0
+        try:
+            with os.scandir(self.path) as it:
+                for entry in it:
+                    if self.cancelled:
+                        return
+                    entries.append(_scan_entry(entry))
+                    if len(entries) - sent >= SCAN_BATCH_SIZE:
+                        self.results.put((self.generation, 'rows', entries[sent:]))
+                        sent = len(entries)
+        except OSError as error:
+            self.results.put((self.generation, 'rows', entries[sent:]))
+            self.results.put((self.generation, 'error', error))
+            return
+        entries.sort(key=FileEntry.sort_key)
+        if not self.cancelled:
+            self.results.put((self.generation, 'done', entries))
+
+
+# Shared by every tab, so reopening a folder in a new tab is instant
+_directory_cache = DirectoryCache()
+
+
+class ThumbnailLoader:
+    """Loads image thumbnails for the rows in view, off the UI thread.
+
+    Loads go to the image load pool shared with PictureBox.LoadAsync: files
+    are read, decoded and scaled on its worker threads and the PhotoImage is
+    made on the UI thread. Thumbnails are kept in ``images`` (the ListView's
+    SmallImageList), keyed by path and mtime, up to THUMBNAIL_CACHE_SIZE;
+    the least recently shown are dropped first. Loads for rows that scroll
+    out of view or for a folder that was left are cancelled.
+    """
+
+    def __init__(self, list_view):
+        self.list_view = list_view
+        self.images = ImageList({'ImageSize': (THUMBNAIL_SIZE, THUMBNAIL_SIZE)})
+        self._jobs = {}                # key -> pending _ImageLoadJob
+        self._recent = OrderedDict()   # keys in images, least recently shown first
+        self._failed = set()           # keys that could not be decoded
+
+    def image_key(self, entry):
+        """Returns the ImageList key of entry's thumbnail, or '' while there is none.
+
+        A missing thumbnail is queued for loading; the row is redrawn when
+        it is ready.
+        """
+        if entry.is_folder or os.path.splitext(entry.name)[1].lower() not in _THUMBNAIL_EXTENSIONS:
+            return ''
+        key = f"{entry.mtime}|{entry.path}"
+        if key in self._recent:
+            self._recent.move_to_end(key)
+            return key
+        if key not in self._jobs and key not in self._failed:
+            job = _ImageLoadJob(self, entry.path, (THUMBNAIL_SIZE, THUMBNAIL_SIZE),
+                                PictureBoxSizeMode.Zoom)
+            job.key = key
+            self._jobs[key] = job
+            _ImageLoadPool.submit(job, self.list_view._tk_widget)
+        return ''
+
+    def keep_only(self, entries):
+        """Cancels the loads of every row not in entries (the rows in view)."""
+        wanted = {f"{entry.mtime}|{entry.path}" for entry in entries}
+        for key in [key for key in self._jobs if key not in wanted]:
+            _ImageLoadPool.cancel(self._jobs.pop(key))
+
+    def reset(self):
+        """Cancels every pending load (the folder changed); thumbnails stay cached."""
+        self.keep_only(())
+        self._failed.clear()
+
+    # Called by the image load pool on the UI thread
+
+    def _on_async_progress(self, job, percent):
+        pass
+
+    def _on_async_finished(self, job, payload, error):
+        if self._jobs.get(job.key) is not job:
+            return  # Cancelled: the row scrolled away or the folder changed
+        del self._jobs[job.key]
+        photo = None
+        if error is None and not job.cancelled:
+            try:
+                photo = _create_photo_image(payload, self.list_view._tk_widget)
+            except Exception:
+                pass  # Not an image Tk can show
+        if photo is None:
+            self._failed.add(job.key)
+            return
+        # Without Pillow the image arrives at full size: shrink it with Tk
+        factor = -(-max(photo.width(), photo.height()) // THUMBNAIL_SIZE)
+        if factor > 1:
+            photo = photo.subsample(factor)
+        self.images.Images.Add(photo, job.key)
+        self._recent[job.key] = None
+        if len(self._recent) > THUMBNAIL_CACHE_SIZE:
+            oldest, _ = self._recent.popitem(last=False)
+            self.images.Images.RemoveByKey(oldest)
+        self.list_view.RedrawItems(0, self.list_view.VirtualListSize - 1, True)
+
+
 class ExplorerTab:
     """Represents a file explorer tab."""
     
-    def __init__(self, tab_control, path="This PC", on_navigate=None):
+    def __init__(self, tab_control, path="This PC", on_navigate=None, form=None, on_status=None):
         self.tab_control = tab_control
         self.path = path
         self.history = [path]
         self.history_index = 0
         self.on_navigate = on_navigate
+        self.on_status = on_status
         self.selected_items = []
         
+        # Listing state: rows shown in the ListView and the scan feeding them
+        self.entries = []
+        self._generation = 0
+        self._scanner = None
+        self._scan_results = queue.Queue()
+        self._scan_timer = Timer(form if form is not None else tab_control._tk_widget,
+                                 {'Interval': SCAN_POLL_INTERVAL})
+        self._scan_timer.Tick = lambda s, e: self._drain_scan_results()
+        
         # Create tab page
         self.tab_page = TabPage(tab_control, {
             'Text': self._get_folder_name(path),
@@ -225,44 +524,26 @@ class ExplorerTab:
             'BackColor': Win11Colors.CONTENT_BG
         })
         
-        # Column headers
-        self.header_panel = Panel(self.content_area, {
-            'Height': 30,
-            'Dock': 'Top',
-            'BackColor': Win11Colors.CONTENT_BG
-        })
-        
-        headers = [
-            ('Name', 0, 400),
-            ('Date modified', 410, 150),
-            ('Type', 570, 100),
-            ('Size', 680, 80)
-        ]
-        
-        for text, left, width in headers:
-            lbl = Label(self.header_panel, {
-                'Text': text,
-                'Left': left,
-                'Top': 5,
-                'Width': width,
-                'Height': 20,
-                'ForeColor': Win11Colors.CONTENT_TEXT,
-                'BackColor': Win11Colors.CONTENT_BG
-            })
-        
-        # Separator line
-        self.separator = Panel(self.content_area, {
-            'Height': 1,
-            'Dock': 'Top',
-            'BackColor': Win11Colors.CONTENT_BORDER
-        })
-        
-        # File list
-        self.file_list = ListBox(self.content_area, {
+        # File list: details view in VirtualMode, rows are requested through
+        # RetrieveVirtualItem only when they scroll into view
+        self.file_list = ListView(self.content_area, {
             'Dock': 'Fill',
-            'BackColor': Win11Colors.CONTENT_BG,
-            'ForeColor': Win11Colors.CONTENT_TEXT
+            'View': View.Details,
+            'FullRowSelect': True,
+            'Columns': [
+                ColumnHeader({'Text': 'Name', 'Width': 400}),
+                ColumnHeader({'Text': 'Date modified', 'Width': 150}),
+                ColumnHeader({'Text': 'Type', 'Width': 120}),
+                ColumnHeader({'Text': 'Size', 'Width': 100,
+                              'TextAlign': HorizontalAlignment.Right}),
+            ]
         })
+        self.thumbnails = ThumbnailLoader(self.file_list)
+        self.file_list.SmallImageList = self.thumbnails.images
+        self.file_list.RetrieveVirtualItem = self._on_retrieve_virtual_item
+        self.file_list.CacheVirtualItems = self._on_cache_virtual_items
+        self.file_list.DoubleClick = self._on_item_double_click
+        self.file_list.VirtualMode = True
     
     def _on_address_keypress(self, sender, e):
         """Handle Enter in address bar."""
@@ -270,35 +551,128 @@ class ExplorerTab:
             self.navigate(self.txt_address.Text)
     
     def _load_content(self, path):
-        """Load folder content."""
-        self.file_list.Items.Clear()
+        """Load folder content.
+        
+        Cached listings (still matching the folder's mtime) are shown at
+        once; otherwise a DirectoryScanner streams the folder in and the
+        rows appear batch by batch while the window stays responsive.
+        """
+        self._cancel_scan()
+        self.thumbnails.reset()
+        self._generation += 1
         
         if path == "This PC":
-            # Show drives
-            items = [
-                "📁 Desktop",
-                "📁 Documents",
-                "📁 Downloads",
-                "📁 Pictures",
-                "📁 Music",
-                "📁 Videos",
-                "──────────────",
-                "💿 Local Disk (C:)",
-                "💿 Data (D:)",
-            ]
-        else:
-            # Show sample files
-            items = [
-                "📁 Folder 1                    Today            File folder",
-                "📁 Folder 2                    Yesterday        File folder",
-                "📄 document.docx               Today            Word Doc        24 KB",
-                "📊 spreadsheet.xlsx            Yesterday        Excel           156 KB",
-                "🖼 image.png                   Last week        PNG Image       2.4 MB",
-                "📝 notes.txt                   Today            Text File       4 KB",
-            ]
+            self._show_entries(_this_pc_entries())
+            return
+        
+        cached = _directory_cache.get(path)
+        if cached is not None:
+            self._show_entries(cached)
+            return
         
-        for item in items:
-            self.file_list.Items.Add(item)
+        self._show_entries([], complete=False)
+        self._scanner = DirectoryScanner(path, self._generation, self._scan_results)
+        self._scanner.start()
+        self._scan_timer.Enabled = True
+    
+    def _cancel_scan(self):
+        if self._scanner is not None:
+            self._scanner.cancelled = True
+            self._scanner = None
+        self._scan_timer.Enabled = False
+    
+    def _show_entries(self, entries, complete=True):
+        self.entries = entries
+        self.file_list.VirtualListSize = len(entries)
+        self.file_list.EnsureVisible(0)
+        self._report_status(complete)
+    
+    def _drain_scan_results(self):
+        """Timer tick: moves the scanner's batches into the ListView."""
+        scanner = self._scanner
+        if scanner is None:
+            self._scan_timer.Enabled = False
+            return
+        count = len(self.entries)
+        kind, payload = self._read_scan_results(scanner)
+        if kind is None:
+            if scanner.is_alive():
+                if len(self.entries) != count:
+                    # Only the visible page is re-read, however many rows arrived
+                    self.file_list.VirtualListSize = len(self.entries)
+                    self._report_status(complete=False)
+                return
+            # The scanner may have queued its last message and exited after
+            # the queue read empty: read once more before finishing
+            kind, payload = self._read_scan_results(scanner)
+        
+        # Scan complete: show the sorted listing and cache it for the next visit
+        self._scanner = None
+        self._scan_timer.Enabled = False
+        if kind == 'done':
+            self.entries = payload
+            _directory_cache.put(scanner.path, scanner.mtime_ns, payload)
+        self.file_list.VirtualListSize = len(self.entries)
+        self.file_list.Refresh()
+        self._report_status(complete=True, error=payload if kind == 'error' else None)
+    
+    def _read_scan_results(self, scanner):
+        """Appends queued row batches of scanner to entries.
+        
+        Returns:
+            (kind, payload) of the final message ('done' or 'error'), or
+            (None, None) when the queue ran empty first
+        """
+        while True:
+            try:
+                generation, kind, payload = self._scan_results.get_nowait()
+            except queue.Empty:
+                return None, None
+            if generation != scanner.generation:
+                continue  # Leftovers from a cancelled scan
+            if kind != 'rows':
+                return kind, payload
+            self.entries.extend(payload)
+    
+    def _report_status(self, complete, error=None):
+        if self.on_status:
+            count = len(self.entries)
+            text = f"{count:,} item" + ("" if count == 1 else "s")
+            if error is not None:
+                text += " (access denied)" if isinstance(error, PermissionError) else " (error)"
+            elif not complete:
+                text += "…"
+            self.on_status(self, text)
+    
+    def refresh_status(self):
+        """Re-sends the item count (e.g. when this tab becomes current)."""
+        self._report_status(complete=self._scanner is None)
+    
+    def _on_retrieve_virtual_item(self, sender, e):
+        """Builds the ListViewItem for one visible row."""
+        if not 0 <= e.ItemIndex < len(self.entries):
+            return
+        entry = self.entries[e.ItemIndex]
+        item = entry.display_item()
+        image_key = self.thumbnails.image_key(entry)
+        e.Item = ListViewItem({
+            'Text': item.name if image_key else f"{item.icon} {item.name}",
+            'ImageKey': image_key,
+            'SubItems': [item.modified, "File folder" if item.is_folder else item.type, item.size],
+            'Tag': item
+        })
+    
+    def _on_cache_virtual_items(self, sender, e):
+        """Rows StartIndex..EndIndex are about to be shown: drop other thumbnail loads."""
+        self.thumbnails.keep_only(self.entries[e.StartIndex:e.EndIndex + 1])
+    
+    def _on_item_double_click(self, sender, e):
+        """Open the double-clicked folder."""
+        selected = self.file_list.SelectedIndices
+        if selected and selected[0] < len(self.entries):
+            entry = self.entries[selected[0]]
+            if entry.is_folder:
+                self.navigate(entry.path)
     
     def navigate(self, path):
         """Navigate to a path."""
@@ -344,8 +718,14 @@ class ExplorerTab:
                 self.navigate("This PC")
     
     def refresh(self):
-        """Refresh current content."""
+        """Refresh current content (always re-reads the folder)."""
+        _directory_cache.invalidate(self.path)
         self._load_content(self.path)
+    
+    def close(self):
+        """Stops any scan and thumbnail loads in progress."""
+        self._cancel_scan()
+        self.thumbnails.reset()
 
 
 class ExplorerApp:
@@ -451,7 +831,7 @@ class ExplorerApp:
         
         # Item count
         self.lbl_items = Label(self.status_bar, {
-            'Text': '6 items',
+            'Text': '',
             'Left': 10,
             'Top': 5,
             'Width': 100,
@@ -596,7 +976,8 @@ class ExplorerApp:
     
     def new_tab(self, path="This PC"):
         """Create a new explorer tab."""
-        tab = ExplorerTab(self.tab_control, path=path)
+        tab = ExplorerTab(self.tab_control, path=path, form=self.form,
+                          on_status=self._on_tab_status)
         self.tabs.append(tab)
         
         # Select the new tab
@@ -611,6 +992,7 @@ class ExplorerApp:
         if tab in self.tabs:
             index = self.tabs.index(tab)
             self.tabs.remove(tab)
+            tab.close()
             
             if self.tabs:
                 new_index = min(index, len(self.tabs) - 1)
@@ -628,6 +1010,12 @@ class ExplorerApp:
         if 0 <= index < len(self.tabs):
             self.current_tab = self.tabs[index]
             self._update_title()
+            self.current_tab.refresh_status()
+    
+    def _on_tab_status(self, tab, text):
+        """Show the item count of the current tab in the status bar."""
+        if tab is self.current_tab or self.current_tab is None:
+            self.lbl_items.Text = text
     
     def _update_title(self):
         """Update window title."""
@@ -5,10 +5,12 @@ Manages message history and state, with optional delegation to external backend.
 The backend can implement send/receive operations for external chat services.
 """
 
+import queue
+import threading
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Callable, Any, Dict
+from typing import List, Optional, Callable, Any, Dict, Iterator
 
 
 class ChatState(Enum):
@@ -28,6 +30,7 @@ class ChatMessage:
         self.is_user = is_user
         self.timestamp = timestamp or datetime.now()
         self.is_read = False
+        self.is_streaming = False  # True while a streamed reply is still arriving
         self.id = id(self)
 
 
@@ -72,6 +75,25 @@ class ChatBackend(ABC):
         """
         pass
     
+    def stream_message(self, text: str, context: Optional[List[Dict[str, Any]]] = None) -> Iterator[str]:
+        """
+        Send a message and yield the response incrementally (optional).
+        
+        Called on a worker thread when the manager runs in streaming mode.
+        Override to yield text chunks (tokens) as they arrive from the service.
+        The default implementation yields the full send_message() reply once.
+        
+        Args:
+            text: The message text to send
+            context: Snapshot of the conversation context
+            
+        Yields:
+            str: Successive chunks of the response text
+        """
+        response = self.send_message(text, context)
+        if response:
+            yield response
+    
     def connect(self) -> bool:
         """
         Connect to the chat service (optional).
@@ -146,9 +168,19 @@ class ChatManager:
         on_message_received: Called when a new message is received
         on_state_changed: Called when the chat state changes
         on_error: Called when an error occurs
+        on_stream_started: Called when a streamed reply starts (placeholder message)
+        on_message_updated: Called when new chunks were appended to a streamed message
+        on_stream_completed: Called when a streamed reply has finished
+    
+    Streaming:
+        With streaming=True the backend is called on a worker thread through
+        ChatBackend.stream_message(). Chunks are queued and applied to the
+        reply message by process_stream(), which the UI calls on its own
+        thread at a throttled frame rate (ChatPanel does this automatically).
     """
     
-    def __init__(self, backend: Optional[ChatBackend] = None):
+    def __init__(self, backend: Optional[ChatBackend] = None, streaming: bool = False,
+                 context_window: Optional[int] = None):
         """
         Initialize the chat manager.
         
@@ -156,13 +188,28 @@ class ChatManager:
             backend: Optional backend implementing ChatBackend.
                     If None, messages are stored locally only without
                     external service integration.
+            streaming: If True, backend calls run on a worker thread and the
+                    reply is streamed into the message chunk by chunk.
+            context_window: Optional maximum number of messages sent to the
+                    backend as context (None sends the whole conversation).
         """
         # Backend for external operations
         self._backend = backend
+        self.streaming = streaming
+        self.context_window = context_window
         
         # Message history
         self.messages = []
         
+        # Backend context, appended as messages are added instead of rebuilt
+        self._context = []
+        self._context_ids = []  # message id of each context entry
+        
+        # Active streamed reply
+        self._stream_queue = queue.SimpleQueue()
+        self._stream_message = None
+        self._stream_cancel = None
+        
         # State management
         self._state = ChatState.Idle
         self._is_user_typing = False
@@ -172,6 +219,9 @@ class ChatManager:
         self.on_message_received = None  # Callback function(message)
         self.on_state_changed = None     # Callback function(old_state, new_state)
         self.on_error = None             # Callback function(error_message)
+        self.on_stream_started = None    # Callback function(message)
+        self.on_message_updated = None   # Callback function(message)
+        self.on_stream_completed = None  # Callback function(message)
     
     @property
     def state(self):
@@ -221,6 +271,11 @@ class ChatManager:
     def has_backend(self) -> bool:
         """Returns True if an external backend is configured."""
         return self._backend is not None
+    
+    @property
+    def is_streaming(self) -> bool:
+        """Returns True while a streamed reply is in progress."""
+        return self._stream_message is not None
 
     def send_message(self, text, delegate_to_backend=True):
         """
@@ -239,10 +294,12 @@ class ChatManager:
         self.state = ChatState.Sending
         msg = ChatMessage(text, is_user=True)
         msg.is_read = True  # User's own messages are always read
-        self.messages.append(msg)
+        self._append(msg)
         
         # Delegate to backend if configured
-        if delegate_to_backend and self._backend:
+        if delegate_to_backend and self._backend and self.streaming:
+            self._start_stream(text)
+        elif delegate_to_backend and self._backend:
             try:
                 self.state = ChatState.WaitingResponse
                 context = self._build_context()
@@ -259,21 +316,144 @@ class ChatManager:
         
         return msg
     
+    def _append(self, msg):
+        """Adds a message to the history and, unless still streaming, to the context."""
+        self.messages.append(msg)
+        if not msg.is_streaming:
+            self._append_context(msg)
+    
+    def _append_context(self, msg):
+        """Serializes one message into the backend context."""
+        self._context.append({
+            'role': 'user' if msg.is_user else 'assistant',
+            'content': msg.text,
+            'timestamp': msg.timestamp.isoformat()
+        })
+        self._context_ids.append(msg.id)
+        # Trim with slack so the front is only dropped once per window
+        if self.context_window and len(self._context) > self.context_window * 2:
+            del self._context[:-self.context_window]
+            del self._context_ids[:-self.context_window]
+    
     def _build_context(self) -> List[Dict[str, Any]]:
         """
         Build conversation context for backend.
         
+        The context is maintained incrementally; this only takes a snapshot,
+        truncated to context_window messages when set.
+        
         Returns:
             List of message dictionaries with role and content
         """
-        context = []
-        for msg in self.messages:
-            context.append({
-                'role': 'user' if msg.is_user else 'assistant',
-                'content': msg.text,
-                'timestamp': msg.timestamp.isoformat()
-            })
-        return context
+        if self.context_window:
+            return self._context[-self.context_window:]
+        return list(self._context)
+    
+    def remove_message(self, message):
+        """Removes a message from the history and the backend context."""
+        if message in self.messages:
+            self.messages.remove(message)
+            if message.id in self._context_ids:
+                index = self._context_ids.index(message.id)
+                del self._context[index]
+                del self._context_ids[index]
+    
+    # =========================================================================
+    # Streaming
+    # =========================================================================
+    
+    def _start_stream(self, text):
+        """Creates the reply placeholder and starts the backend worker thread."""
+        self.cancel_stream()
+        reply = ChatMessage('', is_user=False)
+        reply.is_streaming = True
+        self._append(reply)
+        
+        cancel = threading.Event()
+        self._stream_message = reply
+        self._stream_cancel = cancel
+        self._is_assistant_typing = True
+        self.state = ChatState.WaitingResponse
+        
+        context = self._build_context()
+        backend = self._backend
+        stream_queue = self._stream_queue
+        
+        def worker():
+            try:
+                for chunk in backend.stream_message(text, context):
+                    if cancel.is_set():
+                        break
+                    if chunk:
+                        stream_queue.put((reply, 'chunk', chunk))
+                stream_queue.put((reply, 'done', None))
+            except Exception as e:
+                stream_queue.put((reply, 'error', str(e)))
+        
+        threading.Thread(target=worker, name='ChatStream', daemon=True).start()
+        if self.on_stream_started:
+            self.on_stream_started(reply)
+    
+    def process_stream(self) -> bool:
+        """
+        Applies queued reply chunks. Call periodically from the UI thread.
+        
+        All chunks that arrived since the previous call are appended at once
+        and on_message_updated is fired a single time.
+        
+        Returns:
+            bool: True while a streamed reply is still in progress
+        """
+        reply = self._stream_message
+        chunks = []
+        finished = error = None
+        while True:
+            try:
+                message, kind, payload = self._stream_queue.get_nowait()
+            except queue.Empty:
+                break
+            if message is not reply:
+                continue  # Leftovers of a cancelled stream
+            if kind == 'chunk':
+                chunks.append(payload)
+            else:
+                finished, error = kind, payload
+                break
+        
+        if reply is None:
+            return False
+        if chunks:
+            reply.text += ''.join(chunks)
+            if self.state != ChatState.AssistantTyping:
+                self.state = ChatState.AssistantTyping
+            if self.on_message_updated:
+                self.on_message_updated(reply)
+        if finished:
+            self._finish_stream(reply)
+            if error and self.on_error:
+                self.on_error(error)
+        return self._stream_message is not None
+    
+    def cancel_stream(self):
+        """Stops the streamed reply in progress, keeping the text received so far."""
+        reply = self._stream_message
+        if reply is not None:
+            self._stream_cancel.set()
+            self._finish_stream(reply)
+    
+    def _finish_stream(self, reply):
+        """Completes a streamed reply and adds it to the context."""
+        reply.is_streaming = False
+        self._stream_message = None
+        self._stream_cancel = None
+        self._is_assistant_typing = False
+        if reply.text:
+            self._append_context(reply)
+        else:
+            self.remove_message(reply)
+        self.state = ChatState.Idle
+        if self.on_stream_completed:
+            self.on_stream_completed(reply)
 
     def receive_message(self, text):
         """
@@ -287,7 +467,7 @@ class ChatManager:
         """
         self._is_assistant_typing = False
         msg = ChatMessage(text, is_user=False)
-        self.messages.append(msg)
+        self._append(msg)
         self.state = ChatState.Idle
         if self.on_message_received:
             self.on_message_received(msg)
@@ -320,7 +500,10 @@ class ChatManager:
     
     def clear_history(self):
         """Clears all message history."""
+        self.cancel_stream()
         self.messages.clear()
+        self._context.clear()
+        self._context_ids.clear()
         self.state = ChatState.Idle
     
     def get_history(self, limit=None):
@@ -389,7 +572,7 @@ class ChatManager:
                         if 'timestamp' in msg_data else None
                 )
                 msg.is_read = msg_data.get('is_read', True)
-                self.messages.append(msg)
+                self._append(msg)
             return True
         except Exception as e:
             if self.on_error:
@@ -13,7 +13,100 @@ from winformpy.winformpy import (
     Font, FlatStyle, Clipboard
 )
 from winformpy.ui_elements.chat.chat_manager import ChatManager
+import bisect
 import tkinter as tk
+import tkinter.font as tkfont
+
+
+class TextMeasurer:
+    """
+    Word-wraps text with a single tkfont.Font and cached measurements.
+    
+    Every distinct word is measured through Tk once; wrapping a message is then
+    plain arithmetic, so re-wrapping a long transcript after a resize is cheap.
+    """
+    
+    def __init__(self, root, family='Segoe UI', size=10, cache_size=20000):
+        self.font = tkfont.Font(root=root, family=family, size=size)
+        self.line_height = self.font.metrics('linespace')
+        self._widths = {}
+        self._cache_size = cache_size
+    
+    def measure(self, text):
+        """Returns the pixel width of ``text``, measuring each string once."""
+        width = self._widths.get(text)
+        if width is None:
+            if len(self._widths) >= self._cache_size:
+                self._widths.clear()
+            width = self._widths[text] = self.font.measure(text)
+        return width
+    
+    def wrap(self, text, max_width):
+        """
+        Wraps text to ``max_width`` pixels.
+        
+        Returns:
+            tuple: (lines, widest_line_width)
+        """
+        max_width = max(1, max_width)
+        space = self.measure(' ')
+        lines = []
+        widest = 0
+        for paragraph in text.split('\n'):
+            line, line_width = [], 0
+            for word in paragraph.split(' '):
+                word_width = self.measure(word)
+                if word_width > max_width:
+                    # Break words longer than a line by characters
+                    for chunk, chunk_width in self._split_word(word, max_width):
+                        if line:
+                            lines.append(' '.join(line))
+                            widest = max(widest, line_width)
+                        line, line_width = [chunk], chunk_width
+                    continue
+                needed = word_width + (space if line else 0)
+                if line and line_width + needed > max_width:
+                    lines.append(' '.join(line))
+                    widest = max(widest, line_width)
+                    line, line_width = [word], word_width
+                else:
+                    line.append(word)
+                    line_width += needed
+            lines.append(' '.join(line))
+            widest = max(widest, line_width)
+        return lines, min(widest, max_width)
+    
+    def _split_word(self, word, max_width):
+        """Yields (chunk, width) pieces of a word that each fit in max_width."""
+        chunk, chunk_width = '', 0
+        for char in word:
+            char_width = self.measure(char)
+            if chunk and chunk_width + char_width > max_width:
+                yield chunk, chunk_width
+                chunk, chunk_width = '', 0
+            chunk += char
+            chunk_width += char_width
+        if chunk:
+            yield chunk, chunk_width
+
+
+class _TranscriptEntry:
+    """Measured layout of one message in the ChatPanel transcript."""
+    
+    __slots__ = ('message', 'show_timestamp', 'show_status', 'show_avatar',
+                 'lines', 'text_height', 'bubble_width', 'bubble_height', 'height')
+    
+    def __init__(self, message, show_timestamp=True, show_status=True, show_avatar=True):
+        self.message = message
+        self.show_timestamp = show_timestamp
+        self.show_status = show_status
+        self.show_avatar = show_avatar
+        self.lines = []
+        self.text_height = 0
+        self.bubble_width = 0
+        self.bubble_height = 0
+        self.height = 0
+
 
 class ChatBubble(Panel):
     """A single chat message bubble."""
@@ -122,6 +215,15 @@ class ChatPanel(Panel):
         'assistant_bubble': '#F0F0F0'
     }
     
+    # Transcript layout (pixels)
+    TOP_MARGIN = 3
+    ROW_SPACING = 6       # vertical gap between bubbles
+    BUBBLE_PADDING = 12
+    AVATAR_SIZE = 32
+    TYPING_HEIGHT = 40
+    OVERSCAN = 2          # extra bubbles drawn above and below the viewport
+    STREAM_FRAME_MS = 50  # streamed replies are redrawn at most this often
+    
     def __init__(self, master_form, props=None, manager=None):
         """
         Initialize the ChatPanel.
@@ -179,6 +281,10 @@ class ChatPanel(Panel):
         # Use provided manager or create a new one
         self.manager = manager if manager is not None else ChatManager()
         self.manager.on_message_received = self.add_message_bubble
+        self.manager.on_stream_started = self._on_stream_started
+        self.manager.on_message_updated = self._on_stream_updated
+        self.manager.on_stream_completed = self._on_stream_completed
+        self._stream_pump_active = False
         
         # Store responses for simulated conversation (fallback when no backend)
         self._response_index = 0
@@ -242,7 +348,12 @@ class ChatPanel(Panel):
         self.txt_input.BindKey('Return', self._on_enter_pressed)
     
     def _create_messages_area(self):
-        """Create the scrollable messages area using tkinter Canvas."""
+        """Create the virtualized messages area on a single tkinter Canvas.
+        
+        Messages are not widgets: each one is a _TranscriptEntry measured once
+        with a TextMeasurer, and only the entries in view are drawn, using a
+        small pool of recycled canvas item groups.
+        """
         # Apply MessageArea sub-properties
         msg_bg = self._message_area_props.get('BackColor', self.COLORS['background'])
         
@@ -252,6 +363,19 @@ class ChatPanel(Panel):
             'BackColor': msg_bg
         })
         
+        # Transcript state: entries plus the prefix sums of their heights
+        self._entries = []
+        self._offsets = [self.TOP_MARGIN]  # _offsets[i] = top of entry i, last = total height
+        self._slots = {}                   # entry index -> slot tag while drawn
+        self._free_slots = []
+        self._slot_count = 0
+        self._layout_width = 0
+        self._relayout_job = None
+        self._last_scroll_first = None
+        self._typing_indicator = None
+        self._canvas = None
+        self._scrollbar = None
+        
         # Get the tkinter widget from the panel for custom canvas creation
         container_widget = self.messages_container.GetTkWidget()
         
@@ -266,27 +390,28 @@ class ChatPanel(Panel):
             self._scrollbar_visible = False
             
             self._canvas.configure(yscrollcommand=self._on_scroll_update)
-            
-            # Inner frame for messages
-            self._messages_frame = tk.Frame(self._canvas, bg='#FFFFFF')
-            self._canvas_window = self._canvas.create_window((0, 0), window=self._messages_frame, anchor='nw')
+            self._measurer = TextMeasurer(self._canvas, 'Segoe UI', 10)
             
             # Bind events
-            self._messages_frame.bind('<Configure>', self._on_frame_configure)
             self._canvas.bind('<Configure>', self._on_canvas_configure)
             
             # Mouse wheel scrolling
             self._canvas.bind('<MouseWheel>', self._on_mousewheel)
-            self._messages_frame.bind('<MouseWheel>', self._on_mousewheel)
-        
-        # Track current Y position for stacking messages
-        self._next_message_y = 5
+            self._canvas.bind('<Button-4>', self._on_mousewheel)
+            self._canvas.bind('<Button-5>', self._on_mousewheel)
+            
+            # Bubble interaction, resolved by hit-testing the transcript
+            self._canvas.bind('<Button-3>', self._on_canvas_right_click)
+            self._canvas.bind('<Double-Button-1>', self._on_canvas_double_click)
     
     def _on_scroll_update(self, first, last):
-        """Handle scroll updates and auto-hide scrollbar."""
+        """Handle scroll updates, draw newly exposed messages and auto-hide scrollbar."""
         if self._scrollbar:
             self._scrollbar.set(first, last)
             self._update_scrollbar_visibility()
+        if first != self._last_scroll_first:
+            self._last_scroll_first = first
+            self._update_visible_bubbles()
     
     def _update_scrollbar_visibility(self):
         """Show/hide scrollbar based on whether it's needed."""
@@ -302,20 +427,24 @@ class ChatPanel(Panel):
         elif not needed and self._scrollbar_visible:
             self._scrollbar.pack_forget()
             self._scrollbar_visible = False
-        
-    def _on_frame_configure(self, event):
-        """Update scroll region when frame content changes."""
-        self._canvas.configure(scrollregion=self._canvas.bbox('all'))
-        self._update_scrollbar_visibility()
     
     def _on_canvas_configure(self, event):
-        """Update frame width when canvas is resized."""
-        self._canvas.itemconfig(self._canvas_window, width=event.width)
+        """Re-wrap the transcript when the canvas width changes."""
+        if event.width != self._layout_width:
+            self._schedule_relayout()
+        else:
+            self._update_visible_bubbles()
         self._update_scrollbar_visibility()
     
     def _on_mousewheel(self, event):
         """Handle mouse wheel scrolling - only scroll if scrollbar is needed."""
-        if self._scrollbar_visible:
+        if not self._scrollbar_visible:
+            return
+        if event.num == 4:
+            self._canvas.yview_scroll(-1, 'units')
+        elif event.num == 5:
+            self._canvas.yview_scroll(1, 'units')
+        else:
             self._canvas.yview_scroll(int(-1 * (event.delta / 120)), 'units')
         
     def _on_send_click(self, sender, e):
@@ -347,7 +476,12 @@ class ChatPanel(Panel):
 
     def _create_rounded_rectangle(self, canvas, x1, y1, x2, y2, radius=15, **kwargs):
         """Draw a rounded rectangle on a canvas."""
-        points = [
+        return canvas.create_polygon(self._rounded_points(x1, y1, x2, y2, radius), smooth=True, **kwargs)
+
+    @staticmethod
+    def _rounded_points(x1, y1, x2, y2, radius=15):
+        """Returns the smoothed polygon points of a rounded rectangle."""
+        return [
             x1 + radius, y1,
             x2 - radius, y1,
             x2, y1,
@@ -362,149 +496,240 @@ class ChatPanel(Panel):
             x1, y1,
             x1 + radius, y1
         ]
-        return canvas.create_polygon(points, smooth=True, **kwargs)
 
     def add_message_bubble(self, message, show_timestamp=True, show_status=True, show_avatar=True):
-        """Add a message bubble to the chat area with Messenger-like features."""
-        if not hasattr(self, '_messages_frame') or not self._messages_frame:
+        """Add a message bubble to the chat area with Messenger-like features.
+        
+        The message is measured once and appended to the transcript; a canvas
+        bubble is only drawn while it is scrolled into view.
+        """
+        if not self._canvas:
             return
         
-        # Calculate width based on canvas size
+        entry = _TranscriptEntry(message, show_timestamp, show_status, show_avatar)
+        self._measure_entry(entry, self._current_width())
+        self._entries.append(entry)
+        self._offsets.append(self._offsets[-1] + entry.height)
+        
+        self._update_scroll_region()
+        self._scroll_to_bottom()
+        return entry
+    
+    def clear_messages(self):
+        """Remove every bubble from the chat area (the manager history is untouched)."""
+        if not self._canvas:
+            return
+        self._entries = []
+        self._offsets = [self.TOP_MARGIN]
+        self._release_all_slots()
+        self._update_scroll_region()
+    
+    def _current_width(self):
+        """Returns the width used to lay out bubbles."""
         canvas_width = self._canvas.winfo_width()
         if canvas_width < 100:
             canvas_width = 500  # Default width
-        
+        return canvas_width
+    
+    def _measure_entry(self, entry, canvas_width):
+        """Wraps the text of an entry and computes its bubble geometry."""
         bubble_container_width = canvas_width - 20
+        wrap_width = int(bubble_container_width * 0.70) - 50
         
-        # Get colors from COLORS (may be customized via sub-properties)
-        user_bubble_bg = self.COLORS.get('user_bubble', '#DCF8C6')
-        assistant_bubble_bg = self.COLORS.get('assistant_bubble', '#F0F0F0')
+        entry.lines, text_width = self._measurer.wrap(entry.message.text, wrap_width)
+        text_height = len(entry.lines) * self._measurer.line_height + 4
         
-        # Apply bubble-specific sub-properties
-        user_fg = self._user_bubble_props.get('ForeColor', '#000000')
-        assistant_fg = self._assistant_bubble_props.get('ForeColor', '#000000')
-        
-        # Colors for user vs assistant
+        timestamp_height = 15 if entry.show_timestamp else 0
+        avatar_size = self.AVATAR_SIZE if entry.show_avatar else 0
+        entry.bubble_width = text_width + self.BUBBLE_PADDING * 2 + 20
+        entry.bubble_height = text_height + self.BUBBLE_PADDING * 2 + timestamp_height
+        entry.text_height = text_height
+        entry.height = max(entry.bubble_height, avatar_size) + 10 + self.ROW_SPACING
+    
+    def _schedule_relayout(self):
+        """Coalesces width changes into a single re-wrap of the transcript."""
+        if self._relayout_job is None and self._canvas:
+            self._relayout_job = self._canvas.after_idle(self._relayout)
+    
+    def _relayout(self):
+        """Re-measures every entry for the current width and rebuilds the offsets."""
+        self._relayout_job = None
+        width = self._current_width()
+        self._layout_width = self._canvas.winfo_width()
+        offsets = [self.TOP_MARGIN]
+        for entry in self._entries:
+            self._measure_entry(entry, width)
+            offsets.append(offsets[-1] + entry.height)
+        self._offsets = offsets
+        self._release_all_slots()
+        self._update_scroll_region()
+    
+    def _rebuild_offsets(self, start=0):
+        """Recomputes the prefix sums from entry ``start`` onwards."""
+        del self._offsets[start + 1:]
+        for entry in self._entries[start:]:
+            self._offsets.append(self._offsets[-1] + entry.height)
+    
+    def _content_height(self):
+        """Total transcript height, including the typing indicator."""
+        height = self._offsets[-1]
+        if self._typing_indicator:
+            height += self.TYPING_HEIGHT
+        return height
+    
+    def _update_scroll_region(self):
+        """Sets the scroll region from the prefix sums and redraws the visible bubbles."""
+        self._canvas.configure(scrollregion=(0, 0, self._current_width(), self._content_height()))
+        self._position_typing_indicator()
+        self._update_visible_bubbles()
+        self._update_scrollbar_visibility()
+    
+    def _visible_range(self):
+        """Returns the [start, end) entry range intersecting the viewport."""
+        top = self._canvas.canvasy(0)
+        height = self._canvas.winfo_height()
+        if height <= 1:
+            height = 600
+        start = max(0, bisect.bisect_right(self._offsets, top) - 1 - self.OVERSCAN)
+        end = min(len(self._entries), bisect.bisect_left(self._offsets, top + height) + self.OVERSCAN)
+        return start, end
+    
+    def _update_visible_bubbles(self):
+        """Draws entries entering the viewport and recycles those leaving it."""
+        if not self._canvas or not hasattr(self, '_entries'):
+            return
+        start, end = self._visible_range()
+        slots = {}
+        for index, tag in self._slots.items():
+            if start <= index < end:
+                slots[index] = tag
+            else:
+                self._free_slots.append(tag)
+        for index in range(start, end):
+            if index not in slots:
+                tag = self._free_slots.pop() if self._free_slots else self._create_slot()
+                self._draw_entry(tag, index)
+                slots[index] = tag
+        for tag in self._free_slots:
+            self._canvas.itemconfigure(tag, state='hidden')
+        self._slots = slots
+    
+    def _release_all_slots(self):
+        """Marks every drawn bubble as stale."""
+        self._free_slots.extend(self._slots.values())
+        self._slots = {}
+    
+    def _create_slot(self):
+        """Creates the canvas items for one reusable bubble."""
+        canvas = self._canvas
+        self._slot_count += 1
+        tag = f'bubble{self._slot_count}'
+        self._create_rounded_rectangle(canvas, 0, 0, 30, 30, radius=12,
+                                       tags=(tag, f'{tag}.bg'), state='hidden')
+        canvas.create_text(0, 0, anchor='w', font=self._measurer.font, fill='#000000',
+                           justify='left', tags=(tag, f'{tag}.text'), state='hidden')
+        canvas.create_text(0, 0, anchor='e', font=('Segoe UI', 8), fill='#888888',
+                           tags=(tag, f'{tag}.time'), state='hidden')
+        canvas.create_text(0, 0, anchor='e', font=('Segoe UI', 8),
+                           tags=(tag, f'{tag}.status'), state='hidden')
+        canvas.create_oval(0, 0, 0, 0, tags=(tag, f'{tag}.avatar'), state='hidden')
+        canvas.create_text(0, 0, fill='white', font=('Segoe UI', 11, 'bold'),
+                           tags=(tag, f'{tag}.initial'), state='hidden')
+        return tag
+    
+    def _draw_entry(self, tag, index):
+        """Positions a recycled slot over entry ``index``."""
+        canvas = self._canvas
+        entry = self._entries[index]
+        message = entry.message
+        width = self._current_width()
+        padding = self.BUBBLE_PADDING
+        
+        # Colors for user vs assistant (may be customized via sub-properties)
         if message.is_user:
-            bubble_bg = user_bubble_bg
-            text_fg = user_fg
-            avatar_bg = "#128C7E"  # Dark green
-            avatar_text = "U"
+            bubble_bg = self.COLORS.get('user_bubble', '#DCF8C6')
+            text_fg = self._user_bubble_props.get('ForeColor', '#000000')
+            avatar_bg, avatar_text = "#128C7E", "U"  # Dark green
         else:
-            bubble_bg = assistant_bubble_bg
-            text_fg = assistant_fg
-            avatar_bg = "#0078D4"  # Blue
-            avatar_text = "A"
-        
-        # Calculate bubble dimensions
-        bubble_width = int(bubble_container_width * 0.70)
-        
-        # Create a temporary label to measure text height
-        temp_label = tk.Label(self._messages_frame, text=message.text, 
-                              font=('Segoe UI', 10), wraplength=bubble_width - 50)
-        temp_label.update_idletasks()
-        text_height = temp_label.winfo_reqheight()
-        text_width = min(temp_label.winfo_reqwidth(), bubble_width - 50)
-        temp_label.destroy()
-        
-        # Bubble dimensions with padding
-        padding = 12
-        timestamp_height = 15 if show_timestamp else 0
-        actual_bubble_width = text_width + padding * 2 + 20
-        actual_bubble_height = text_height + padding * 2 + timestamp_height
-        
-        # Avatar size
-        avatar_size = 32 if show_avatar else 0
-        
-        # Container frame height
-        container_height = max(actual_bubble_height, avatar_size) + 10
-        
-        # Container frame
-        bubble_frame = tk.Frame(self._messages_frame, bg='#FFFFFF', height=container_height)
-        bubble_frame.pack(fill=tk.X, padx=5, pady=3)
-        bubble_frame.pack_propagate(False)
-        
-        # Create avatar if enabled
-        if show_avatar:
-            avatar_canvas = tk.Canvas(bubble_frame, bg='#FFFFFF', highlightthickness=0,
-                                       width=avatar_size, height=avatar_size)
-            # Draw circular avatar
-            avatar_canvas.create_oval(2, 2, avatar_size-2, avatar_size-2, 
-                                       fill=avatar_bg, outline=avatar_bg)
-            avatar_canvas.create_text(avatar_size//2, avatar_size//2, 
-                                       text=avatar_text, fill='white',
-                                       font=('Segoe UI', 11, 'bold'))
-        
-        # Create canvas for rounded bubble
-        bubble_canvas = tk.Canvas(bubble_frame, bg='#FFFFFF', highlightthickness=0,
-                                   width=actual_bubble_width, height=actual_bubble_height)
-        
-        # Position based on sender
+            bubble_bg = self.COLORS.get('assistant_bubble', '#F0F0F0')
+            text_fg = self._assistant_bubble_props.get('ForeColor', '#000000')
+            avatar_bg, avatar_text = "#0078D4", "A"  # Blue
+        
+        # User bubbles hug the right edge with the avatar to their left,
+        # assistant bubbles start after the avatar on the left
+        row_top = self._offsets[index] + self.ROW_SPACING // 2
+        row_height = entry.height - self.ROW_SPACING
+        avatar_size = self.AVATAR_SIZE
         if message.is_user:
-            bubble_canvas.pack(side=tk.RIGHT, padx=5, pady=2)
-            if show_avatar:
-                avatar_canvas.pack(side=tk.RIGHT, padx=2, pady=2)
+            x2 = width - 10
+            x1 = x2 - entry.bubble_width
+            avatar_x = x1 - 7 - avatar_size
+        else:
+            avatar_x = 7
+            x1 = (avatar_x + avatar_size + 7) if entry.show_avatar else 10
+            x2 = x1 + entry.bubble_width
+        y1 = row_top + (row_height - entry.bubble_height) // 2
+        y2 = y1 + entry.bubble_height
+        
+        canvas.coords(f'{tag}.bg', *self._rounded_points(x1 + 2, y1 + 2, x2 - 2, y2 - 2, 12))
+        canvas.itemconfigure(f'{tag}.bg', fill=bubble_bg, outline=bubble_bg, state='normal')
+        
+        timestamp_height = 15 if entry.show_timestamp else 0
+        canvas.coords(f'{tag}.text', x1 + padding + 5, y1 + (entry.bubble_height - timestamp_height) // 2)
+        canvas.itemconfigure(f'{tag}.text', text='\n'.join(entry.lines), fill=text_fg, state='normal')
+        
+        if entry.show_timestamp:
+            canvas.coords(f'{tag}.time', x2 - 10, y2 - 8)
+            canvas.itemconfigure(f'{tag}.time', text=message.timestamp.strftime("%H:%M"), state='normal')
         else:
-            if show_avatar:
-                avatar_canvas.pack(side=tk.LEFT, padx=2, pady=2)
-            bubble_canvas.pack(side=tk.LEFT, padx=5, pady=2)
-        
-        # Draw rounded rectangle
-        self._create_rounded_rectangle(bubble_canvas, 2, 2, 
-                                        actual_bubble_width - 2, actual_bubble_height - 2,
-                                        radius=12, fill=bubble_bg, outline=bubble_bg)
-        
-        # Add text on canvas
-        text_x = padding + 5
-        text_y = (actual_bubble_height - timestamp_height) // 2
-        bubble_canvas.create_text(text_x, text_y, text=message.text, anchor='w',
-                                   font=('Segoe UI', 10), fill='#000000',
-                                   width=bubble_width - 50)
-        
-        # Add timestamp
-        if show_timestamp:
-            time_str = message.timestamp.strftime("%H:%M")
-            time_x = actual_bubble_width - 10
-            time_y = actual_bubble_height - 8
-            bubble_canvas.create_text(time_x, time_y, text=time_str, anchor='e',
-                                       font=('Segoe UI', 8), fill='#888888')
-        
-        # Add read status for user messages
-        if show_status and message.is_user:
-            status_x = actual_bubble_width - 35
-            status_y = actual_bubble_height - 8
+            canvas.itemconfigure(f'{tag}.time', state='hidden')
+        
+        if entry.show_status and message.is_user:
             if message.is_read:
-                status_text = "✓✓"  # Read
-                status_color = "#34B7F1"  # Blue checkmarks
+                status_text, status_color = "✓✓", "#34B7F1"  # Read, blue checkmarks
             else:
-                status_text = "✓"  # Sent
-                status_color = "#888888"
-            bubble_canvas.create_text(status_x, status_y, text=status_text, anchor='e',
-                                       font=('Segoe UI', 8), fill=status_color)
-        
-        # Store reference to bubble for context menu
-        bubble_canvas.message = message
-        bubble_canvas.bubble_frame = bubble_frame
-        
-        # Bind events
-        bubble_frame.bind('<MouseWheel>', self._on_mousewheel)
-        bubble_canvas.bind('<MouseWheel>', self._on_mousewheel)
-        bubble_canvas.bind('<Button-3>', lambda e: self._show_context_menu(e, message, bubble_frame))
-        bubble_canvas.bind('<Double-Button-1>', lambda e: self._on_bubble_double_click(message))
-        
-        # Update and scroll to bottom
-        self._messages_frame.update_idletasks()
-        self._scroll_to_bottom()
-        
-        return bubble_frame
+                status_text, status_color = "✓", "#888888"   # Sent
+            canvas.coords(f'{tag}.status', x2 - 35, y2 - 8)
+            canvas.itemconfigure(f'{tag}.status', text=status_text, fill=status_color, state='normal')
+        else:
+            canvas.itemconfigure(f'{tag}.status', state='hidden')
+        
+        if entry.show_avatar:
+            avatar_y = row_top + (row_height - avatar_size) // 2
+            canvas.coords(f'{tag}.avatar', avatar_x + 2, avatar_y + 2,
+                          avatar_x + avatar_size - 2, avatar_y + avatar_size - 2)
+            canvas.itemconfigure(f'{tag}.avatar', fill=avatar_bg, outline=avatar_bg, state='normal')
+            canvas.coords(f'{tag}.initial', avatar_x + avatar_size // 2, avatar_y + avatar_size // 2)
+            canvas.itemconfigure(f'{tag}.initial', text=avatar_text, state='normal')
+        else:
+            canvas.itemconfigure(f'{tag}.avatar', state='hidden')
+            canvas.itemconfigure(f'{tag}.initial', state='hidden')
+    
+    def _entry_at(self, y):
+        """Returns the index of the entry under a canvas-widget y position, or -1."""
+        canvas_y = self._canvas.canvasy(y)
+        index = bisect.bisect_right(self._offsets, canvas_y) - 1
+        return index if 0 <= index < len(self._entries) else -1
+    
+    def _on_canvas_right_click(self, event):
+        """Show the context menu for the bubble under the mouse."""
+        index = self._entry_at(event.y)
+        if index >= 0:
+            self._show_context_menu(event, self._entries[index].message)
     
-    def _show_context_menu(self, event, message, bubble_frame):
+    def _on_canvas_double_click(self, event):
+        """Dispatch double-clicks to the bubble under the mouse."""
+        index = self._entry_at(event.y)
+        if index >= 0:
+            self._on_bubble_double_click(self._entries[index].message)
+    
+    def _show_context_menu(self, event, message):
         """Show context menu for message bubble."""
-        menu = tk.Menu(self._messages_frame, tearoff=0)
+        menu = tk.Menu(self._canvas, tearoff=0)
         menu.add_command(label="📋 Copy", command=lambda: self._copy_message(message))
         menu.add_command(label="↩️ Reply", command=lambda: self._reply_to_message(message))
         menu.add_separator()
-        menu.add_command(label="🗑️ Delete", command=lambda: self._delete_message(message, bubble_frame))
+        menu.add_command(label="🗑️ Delete", command=lambda: self._delete_message(message))
         menu.tk_popup(event.x_root, event.y_root)
     
     def _copy_message(self, message):
@@ -520,50 +745,116 @@ class ChatPanel(Panel):
         if hasattr(self.txt_input, '_tk_widget') and self.txt_input._tk_widget:
             self.txt_input._tk_widget.focus_set()
     
-    def _delete_message(self, message, bubble_frame):
+    def _index_of_message(self, message):
+        """Returns the transcript index of a message, or -1."""
+        # Search from the end: the message being updated is usually the latest
+        for index in range(len(self._entries) - 1, -1, -1):
+            if self._entries[index].message is message:
+                return index
+        return -1
+    
+    def _delete_message(self, message):
         """Delete a message from the chat."""
         # Remove from manager
-        if message in self.manager.messages:
-            self.manager.messages.remove(message)
+        self.manager.remove_message(message)
         # Remove visual
-        bubble_frame.destroy()
-        self._messages_frame.update_idletasks()
+        index = self._index_of_message(message)
+        if index >= 0:
+            del self._entries[index]
+            self._rebuild_offsets(index)
+            self._release_all_slots()
+            self._update_scroll_region()
     
     def _on_bubble_double_click(self, message):
         """Handle double-click on bubble (toggle read status for demo)."""
         message.is_read = not message.is_read
-        # Could refresh the bubble here
+        self.refresh_message(message)
+    
+    def refresh_message(self, message):
+        """Re-measures and redraws the bubble of a message whose text or status changed."""
+        index = self._index_of_message(message)
+        if index < 0:
+            return
+        entry = self._entries[index]
+        old_height = entry.height
+        self._measure_entry(entry, self._current_width())
+        if entry.height != old_height:
+            self._rebuild_offsets(index)
+            self._release_all_slots()
+            self._update_scroll_region()
+        elif index in self._slots:
+            self._draw_entry(self._slots[index], index)
+    
+    def _on_stream_started(self, message):
+        """A streamed reply started: show typing and start the frame pump."""
+        self.show_typing_indicator()
+        if not self._stream_pump_active:
+            self._stream_pump_active = True
+            self.after(self.STREAM_FRAME_MS, self._pump_stream)
+    
+    def _pump_stream(self):
+        """Applies queued reply chunks once per frame while a stream is active."""
+        if self.manager.process_stream():
+            self.after(self.STREAM_FRAME_MS, self._pump_stream)
+        else:
+            self._stream_pump_active = False
+    
+    def _on_stream_updated(self, message):
+        """Grows the live bubble with the chunks received since the last frame."""
+        if self._index_of_message(message) < 0:
+            self.hide_typing_indicator()
+            self.add_message_bubble(message)
+            return
+        at_bottom = self._canvas.yview()[1] >= 0.999
+        self.refresh_message(message)
+        if at_bottom:
+            self._scroll_to_bottom()
+    
+    def _on_stream_completed(self, message):
+        """Finalizes the live bubble (or drops it if no text ever arrived)."""
+        self.hide_typing_indicator()
+        index = self._index_of_message(message)
+        if index >= 0 and not message.text:
+            self._delete_message(message)
+        elif index >= 0:
+            self.refresh_message(message)
     
     def show_typing_indicator(self, name="Assistant"):
         """Show typing indicator."""
-        if hasattr(self, '_typing_indicator') and self._typing_indicator:
+        if self._typing_indicator or not self._canvas:
             return  # Already showing
         
-        self._typing_indicator = tk.Frame(self._messages_frame, bg='#FFFFFF')
-        self._typing_indicator.pack(fill=tk.X, padx=5, pady=3)
-        
-        # Create typing dots animation
-        dots_canvas = tk.Canvas(self._typing_indicator, bg='#FFFFFF', 
-                                 highlightthickness=0, width=60, height=30)
-        dots_canvas.pack(side=tk.LEFT, padx=10)
+        canvas = self._canvas
+        self._typing_indicator = 'typing'
         
         # Draw typing bubble
-        self._create_rounded_rectangle(dots_canvas, 2, 2, 58, 28, 
-                                        radius=10, fill='#F0F0F0', outline='#F0F0F0')
+        self._create_rounded_rectangle(canvas, 0, 0, 56, 26, radius=10,
+                                       fill='#F0F0F0', outline='#F0F0F0', tags=('typing',))
         
         # Create animated dots
         self._typing_dots = []
         for i in range(3):
-            dot = dots_canvas.create_oval(12 + i*15, 12, 20 + i*15, 20, 
-                                           fill='#888888', outline='#888888')
+            dot = canvas.create_oval(10 + i*15, 10, 18 + i*15, 18,
+                                     fill='#888888', outline='#888888', tags=('typing',))
             self._typing_dots.append(dot)
         
-        self._dots_canvas = dots_canvas
+        self._dots_canvas = canvas
+        self._typing_origin = (0, 0)
         self._animate_typing_dots(0)
         
-        self._messages_frame.update_idletasks()
+        self._update_scroll_region()
         self._scroll_to_bottom()
     
+    def _position_typing_indicator(self):
+        """Keeps the typing indicator just below the last message."""
+        if not self._typing_indicator:
+            return
+        x, y = 15, self._offsets[-1] + 5
+        dx, dy = x - self._typing_origin[0], y - self._typing_origin[1]
+        if dx or dy:
+            self._canvas.move('typing', dx, dy)
+            self._typing_origin = (x, y)
+    
     def _animate_typing_dots(self, step):
         """Animate typing dots."""
         if not hasattr(self, '_typing_indicator') or not self._typing_indicator:
@@ -580,16 +871,17 @@ class ChatPanel(Panel):
     def hide_typing_indicator(self):
         """Hide typing indicator."""
         if hasattr(self, '_typing_indicator') and self._typing_indicator:
-            self._typing_indicator.destroy()
+            self._canvas.delete('typing')
             self._typing_indicator = None
             self._typing_dots = None
             self._dots_canvas = None
+            self._update_scroll_region()
     
     def _scroll_to_bottom(self):
         """Scroll the messages area to show the latest message."""
         if hasattr(self, '_canvas') and self._canvas:
-            self._canvas.update_idletasks()
             self._canvas.yview_moveto(1.0)
+            self._update_visible_bubbles()
         
     def after(self, ms, func):
         """Schedule a function to run after ms milliseconds."""
@@ -588,9 +588,7 @@ class ChatUI(Form):
         self.chat_panel.manager.clear_history()
         
         # Clear visual messages
-        if hasattr(self.chat_panel, '_messages_frame') and self.chat_panel._messages_frame:
-            for widget in self.chat_panel._messages_frame.winfo_children():
-                widget.destroy()
+        self.chat_panel.clear_messages()
         
         # Update UI
         self.lbl_msg_count.Text = 'Messages: 0'
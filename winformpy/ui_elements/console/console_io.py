@@ -31,8 +31,13 @@ from typing import Callable, Optional, List, Dict, Any
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
+import codecs
+import locale
+import os
+import re
 import threading
 import queue
+import uuid
 
 
 class OutputType(Enum):
@@ -116,6 +121,35 @@ class ConsoleIOBackend(ABC):
         """Returns the command history."""
         return list(self._command_history)
     
+    # True for backends whose output arrives from background threads and is
+    # delivered by process_output(); ConsolePanel then polls it
+    streams_output = False
+    
+    @property
+    def is_busy(self) -> bool:
+        """Returns True while a command is still running."""
+        return False
+    
+    def process_output(self, max_messages: Optional[int] = None) -> bool:
+        """
+        Deliver output produced by background threads through on_output.
+        
+        Streaming backends override this; it is called from the UI thread.
+        
+        Returns:
+            True if any output was delivered
+        """
+        return False
+    
+    def interrupt(self) -> bool:
+        """
+        Interrupt the running command (Ctrl+C).
+        
+        Returns:
+            True if a command was interrupted
+        """
+        return False
+    
     @abstractmethod
     def send_command(self, command: InputCommand) -> None:
         """
@@ -301,10 +335,20 @@ class LocalConsoleIO(ConsoleIOBackend):
 
 class SubprocessConsoleIO(ConsoleIOBackend):
     """
-    Subprocess-based I/O layer for executing shell commands.
+    Subprocess-based I/O layer backed by a persistent shell session.
     
-    Executes commands in a subprocess and streams output back
-    to the console.
+    One long-lived shell process (bash/sh, cmd or PowerShell) runs all
+    commands, so state such as the current directory and environment
+    variables carries over from one command to the next. Reader threads
+    stream stdout and stderr into an output queue while the command runs;
+    process_output() delivers the queued output in batches and must be
+    called from the UI thread (ConsolePanel does this automatically).
+    
+    Each command is followed by a marker line that carries its exit code,
+    which is how the end of a command is detected. Commands have no time
+    limit: a long build streams its output until it finishes or is stopped
+    with interrupt() (Ctrl+C in ConsolePanel). While a command is running,
+    lines sent with send_command() go to its standard input.
     
     Example:
         io = SubprocessConsoleIO(shell='powershell')
@@ -312,68 +356,347 @@ class SubprocessConsoleIO(ConsoleIOBackend):
         io.send_command(InputCommand("dir"))
     """
     
-    def __init__(self, shell: str = 'cmd', working_dir: Optional[str] = None):
+    streams_output = True
+    
+    # Queue items delivered per process_output() call (each item is one read
+    # of up to READ_CHUNK bytes), so a flood of output cannot freeze the UI
+    OUTPUT_BATCH = 64
+    READ_CHUNK = 4096
+    
+    # Shell function (bash/sh) that runs each command; see _start_session
+    RUN_FUNCTION = '__winformpy_run'
+    
+    # Shell command lines, per shell name
+    SHELLS = {
+        'bash': ['bash', '--noprofile', '--norc'],
+        'sh': ['sh'],
+        'cmd': ['cmd', '/D', '/Q'],
+        'powershell': ['powershell', '-NoLogo', '-NoProfile', '-NonInteractive', '-Command', '-'],
+    }
+    
+    def __init__(self, shell: str = 'cmd', working_dir: Optional[str] = None,
+                 env: Optional[Dict[str, str]] = None, encoding: Optional[str] = None):
         """
         Initialize subprocess I/O.
         
         Args:
-            shell: Shell to use ('cmd', 'powershell', 'bash')
-            working_dir: Working directory for commands
+            shell: Shell to use ('cmd', 'powershell', 'bash', 'sh')
+            working_dir: Working directory the shell session starts in
+            env: Extra environment variables for the shell session
+            encoding: Encoding of the shell's input and output
+                (default: the locale's preferred encoding)
         """
         super().__init__()
         self._shell = shell
         self._working_dir = working_dir
+        self._env = env
+        self._encoding = encoding or locale.getpreferredencoding(False)
         self._process = None
         self._output_queue: queue.Queue = queue.Queue()
         self._reader_thread: Optional[threading.Thread] = None
+        self._error_thread: Optional[threading.Thread] = None
+        self._session = 0
+        self._pending_commands = 0
+        self._token = ''
     
-    def send_command(self, command: InputCommand) -> None:
-        """Execute command in subprocess."""
+    @property
+    def is_busy(self) -> bool:
+        """Returns True while a command is running in the shell session."""
+        return self._pending_commands > 0
+    
+    @property
+    def is_running(self) -> bool:
+        """Returns True if the shell process is alive."""
+        return self._process is not None and self._process.poll() is None
+    
+    # =========================================================================
+    # Session
+    # =========================================================================
+    
+    def _start_session(self, cwd: Optional[str] = None) -> bool:
+        """Start the shell process and its reader threads."""
         import subprocess
         
-        self._add_to_history(command.command)
+        argv = self.SHELLS.get(self._shell, [self._shell])
+        env = dict(os.environ)
+        # Python children otherwise block-buffer output written to a pipe
+        env.setdefault('PYTHONUNBUFFERED', '1')
+        if self._env:
+            env.update(self._env)
+        
+        kwargs = {}
+        if os.name == 'nt':
+            kwargs['creationflags'] = subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            # Own process group, so interrupt() reaches the running command
+            kwargs['start_new_session'] = True
         
         try:
-            # Build command based on shell
-            if self._shell == 'powershell':
-                full_cmd = ['powershell', '-Command', command.command]
-            elif self._shell == 'bash':
-                full_cmd = ['bash', '-c', command.command]
-            else:
-                full_cmd = ['cmd', '/c', command.command]
-            
-            # Execute
-            result = subprocess.run(
-                full_cmd,
-                capture_output=True,
-                text=True,
-                cwd=self._working_dir or command.metadata.get('cwd'),
-                timeout=30
+            process = subprocess.Popen(
+                argv,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=0,
+                cwd=self._working_dir or cwd,
+                env=env,
+                **kwargs
             )
-            
-            # Output stdout
-            if result.stdout:
-                for line in result.stdout.splitlines():
-                    self.write_line(line)
-            
-            # Output stderr as error
-            if result.stderr:
-                for line in result.stderr.splitlines():
-                    self.write_error(line)
-            
-            # Show return code if non-zero
-            if result.returncode != 0:
-                self.write_warning(f"Exit code: {result.returncode}")
-                
-        except subprocess.TimeoutExpired:
-            self.write_error("Command timed out after 30 seconds")
         except FileNotFoundError:
             self.write_error(f"Shell not found: {self._shell}")
-        except Exception as e:
+            return False
+        except OSError as e:
             self.write_error(f"Error: {str(e)}")
+            return False
+        
+        self._session += 1
+        self._process = process
+        self._pending_commands = 0
+        self._token = f"__WINFORMPY_DONE_{uuid.uuid4().hex}__"
+        
+        if self._shell in ('bash', 'sh'):
+            # Commands run inside a function whose INT trap returns from it,
+            # so Ctrl+C abandons the rest of a command list or loop (not just
+            # the running child) while the shell and its state survive
+            self._write_stdin(f"{self.RUN_FUNCTION}() {{ trap 'trap : INT; return 130' INT; "
+                              "eval \"$1\"; }\n"
+                              "trap : INT\n")
+        
+        session = self._session
+        self._reader_thread = threading.Thread(
+            target=self._reader_loop, args=(process.stdout, OutputType.NORMAL, session, True),
+            name='ConsoleShellOut', daemon=True)
+        self._error_thread = threading.Thread(
+            target=self._reader_loop, args=(process.stderr, OutputType.ERROR, session, False),
+            name='ConsoleShellErr', daemon=True)
+        self._reader_thread.start()
+        self._error_thread.start()
+        return True
+    
+    def _stop_session(self) -> None:
+        """Close the shell's input and end the process."""
+        import subprocess
+        
+        process, self._process = self._process, None
+        self._pending_commands = 0
+        self._session += 1  # Drop the old session's pending events
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        try:
+            process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+    
+    def restart(self) -> bool:
+        """
+        Replace the shell session with a fresh one.
+        
+        Returns:
+            True if the new shell started
+        """
+        self._stop_session()
+        self.write_info(f"Restarting shell: {self._shell}")
+        return self._start_session()
+    
+    def _wrap_command(self, command: str) -> str:
+        """Return the shell input that runs command and then prints the end marker."""
+        token = self._token
+        if self._shell in ('bash', 'sh'):
+            # The here-document is read completely before anything runs, so a
+            # command that reads stdin cannot swallow the marker, and a syntax
+            # error (e.g. an unclosed quote) still ends with the marker line.
+            # The INT trap is reset afterwards: the one set by RUN_FUNCTION
+            # outlives it and must not fire while the shell is idle
+            return (f"{self.RUN_FUNCTION} \"$(cat <<'{token}'\n{command}\n{token}\n)\"; "
+                    f"printf '%s %s\\n' {token} \"$?\"; trap : INT\n")
+        if self._shell == 'powershell':
+            return (f"{command}\n"
+                    f"Write-Output (\"{token} \" + $(if ($?) {{ 0 }} "
+                    f"elseif ($LASTEXITCODE) {{ $LASTEXITCODE }} else {{ 1 }}))\n")
+        return f"{command}\necho {token} %errorlevel%\n"
+    
+    def _write_stdin(self, text: str) -> bool:
+        """Write text to the shell's standard input."""
+        try:
+            self._process.stdin.write(text.encode(self._encoding, errors='replace'))
+            self._process.stdin.flush()
+            return True
+        except (OSError, ValueError):
+            self.write_error("Shell session is not running")
+            return False
+    
+    # =========================================================================
+    # Reader threads
+    # =========================================================================
+    
+    def _reader_loop(self, stream, output_type: OutputType, session: int,
+                     watch_token: bool) -> None:
+        """Read one output stream of the shell until it closes (worker thread)."""
+        decoder = codecs.getincrementaldecoder(self._encoding)(errors='replace')
+        token = self._token
+        marker = re.compile(re.escape(token) + r' (-?\d+)\s*$')
+        pending = ''
+        partial = False  # A partial line was already delivered
+        while True:
+            try:
+                data = stream.read(self.READ_CHUNK)
+            except (OSError, ValueError):
+                data = b''
+            text = pending + decoder.decode(data, final=not data)
+            text = text.replace('\r\n', '\n')
+            lines = text.split('\n')
+            pending = lines.pop()
+            
+            chunk = []
+            for line in lines:
+                match = marker.search(line) if watch_token else None
+                if match is None:
+                    chunk.append(line + '\n')
+                    partial = False
+                    continue
+                # End marker: text before it is output without a final newline
+                if line[:match.start()] or partial:
+                    chunk.append(line[:match.start()] + '\n')
+                    partial = False
+                if chunk:
+                    self._output_queue.put((session, 'out', ''.join(chunk), output_type))
+                    chunk = []
+                self._output_queue.put((session, 'done', int(match.group(1)), None))
+            
+            if pending:
+                # Show partial lines (prompts, progress) right away, but hold
+                # back a tail that could be the start of the end marker
+                keep = self._marker_prefix_length(pending, token) if watch_token else 0
+                if keep < len(pending):
+                    chunk.append(pending[:len(pending) - keep])
+                    pending = pending[len(pending) - keep:]
+                    partial = True
+            if chunk:
+                self._output_queue.put((session, 'out', ''.join(chunk), output_type))
+            
+            if not data:
+                break
+        if watch_token:
+            process = self._process
+            code = process.wait() if process is not None and self._session == session else None
+            self._output_queue.put((session, 'exit', code, None))
+    
+    @staticmethod
+    def _marker_prefix_length(text: str, token: str) -> int:
+        """Length of the longest tail of text that may begin the end marker."""
+        start = text.find(token[0], max(0, len(text) - len(token)))
+        while start >= 0:
+            if token.startswith(text[start:]):
+                return len(text) - start
+            start = text.find(token[0], start + 1)
+        return 0
+    
+    # =========================================================================
+    # ConsoleIOBackend
+    # =========================================================================
+    
+    def send_command(self, command: InputCommand) -> None:
+        """
+        Run a command in the shell session, or pass the line to the running
+        command's standard input while one is busy.
+        """
+        if not self.is_running:
+            if self._process is not None:
+                self._stop_session()
+            if not self._start_session(command.metadata.get('cwd')):
+                return
+        
+        if self.is_busy:
+            self._write_stdin(command.command + '\n')
+            return
+        
+        self._add_to_history(command.command)
+        if not command.command.strip():
+            return
+        if self._write_stdin(self._wrap_command(command.command)):
+            self._pending_commands += 1
+    
+    def interrupt(self) -> bool:
+        """
+        Interrupt the running command (Ctrl+C).
+        
+        Returns:
+            True if a command was running and was signalled
+        """
+        import signal
+        
+        if not self.is_busy or not self.is_running:
+            return False
+        try:
+            if os.name == 'nt':
+                self._process.send_signal(signal.CTRL_BREAK_EVENT)
+            else:
+                os.killpg(self._process.pid, signal.SIGINT)
+        except OSError:
+            return False
+        return True
+    
+    def process_output(self, max_messages: Optional[int] = None) -> bool:
+        """
+        Deliver output queued by the reader threads through on_output.
+        Call periodically from the UI thread.
+        
+        Consecutive output of the same type is joined into one OutputMessage,
+        so a burst of lines is written to the console at once.
+        
+        Args:
+            max_messages: Maximum queue items to handle (default: OUTPUT_BATCH)
+        
+        Returns:
+            True if any output was delivered
+        """
+        limit = max_messages or self.OUTPUT_BATCH
+        texts: List[str] = []
+        text_type = None
+        delivered = False
+        
+        for _ in range(limit):
+            try:
+                session, kind, payload, output_type = self._output_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'out':
+                if texts and output_type != text_type:
+                    self.on_output(OutputMessage(''.join(texts), text_type))
+                    texts = []
+                texts.append(payload)
+                text_type = output_type
+                continue
+            
+            if texts:
+                self.on_output(OutputMessage(''.join(texts), text_type))
+                texts = []
+            delivered = True
+            if session != self._session:
+                continue  # Events of a session that was replaced
+            if kind == 'done':
+                self._pending_commands = max(0, self._pending_commands - 1)
+                if payload:
+                    self.write_warning(f"Exit code: {payload}")
+            elif kind == 'exit':
+                self._pending_commands = 0
+                self.write_warning(f"Shell exited (code {payload}); "
+                                   f"the next command starts a new session")
+        
+        if texts:
+            self.on_output(OutputMessage(''.join(texts), text_type))
+            delivered = True
+        return delivered
     
     def connect(self) -> bool:
-        """Initialize subprocess I/O."""
+        """Start the shell session."""
+        if not self.is_running and not self._start_session():
+            return False
         self._connected = True
         self.write_info(f"Shell: {self._shell}")
         if self._working_dir:
@@ -382,8 +705,9 @@ class SubprocessConsoleIO(ConsoleIOBackend):
         return True
     
     def disconnect(self) -> None:
-        """Cleanup subprocess I/O."""
+        """End the shell session."""
         self._connected = False
+        self._stop_session()
         self.on_disconnected()
 
 
@@ -95,6 +95,10 @@ class ConsolePanel(Panel):
     DEFAULT_FONT_SIZE = 11
     DEFAULT_PROMPT = '> '
     
+    # Polling of streaming I/O layers (see ConsoleIOBackend.process_output)
+    OUTPUT_POLL_MS = 30
+    OUTPUT_IDLE_POLL_MS = 100
+    
     # Color mapping for OutputType
     OUTPUT_COLORS = {
         OutputType.NORMAL: None,  # Uses ForeColor
@@ -169,6 +173,7 @@ class ConsolePanel(Panel):
         # I/O Layer
         self._console_io: Optional[ConsoleIOBackend] = defaults.pop('ConsoleIO')
         self._use_io_layer = self._console_io is not None
+        self._output_pump_active = False
         
         # Command history (used when not using I/O layer)
         self._command_history = []
@@ -202,6 +207,25 @@ class ConsolePanel(Panel):
         
         # Set error callback
         self._console_io.on_error = lambda err: self.WriteError(err)
+        
+        # Output of streaming backends arrives on worker threads and is
+        # written from here, on the UI thread
+        if self._console_io.streams_output and not self._output_pump_active:
+            self._output_pump_active = True
+            self._tk_widget.after(self.OUTPUT_POLL_MS, self._pump_output)
+    
+    def _pump_output(self) -> None:
+        """Deliver queued I/O layer output; polls faster while output flows."""
+        io = self._console_io
+        if io is None or not io.streams_output:
+            self._output_pump_active = False
+            return
+        delivered = io.process_output()
+        try:
+            self._tk_widget.after(self.OUTPUT_POLL_MS if delivered or io.is_busy
+                                  else self.OUTPUT_IDLE_POLL_MS, self._pump_output)
+        except Exception:
+            self._output_pump_active = False  # Widget destroyed
     
     def _handle_io_output(self, message: OutputMessage) -> None:
         """Handle output from the I/O layer."""
@@ -286,11 +310,12 @@ class ConsolePanel(Panel):
                 'BorderStyle': 'None'
             })
             
-            # Bind key events using WinFormPy BindKey
-            self._input_entry.BindKey('<Return>', self._on_command_enter)
-            self._input_entry.BindKey('<Up>', self._on_history_up)
-            self._input_entry.BindKey('<Down>', self._on_history_down)
-            self._input_entry.BindKey('<Escape>', self._on_escape)
+            # Bind key events using WinFormPy BindKey (handlers get sender, event)
+            self._input_entry.BindKey('Return', lambda sender, e: self._on_command_enter(e))
+            self._input_entry.BindKey('Up', lambda sender, e: self._on_history_up(e))
+            self._input_entry.BindKey('Down', lambda sender, e: self._on_history_down(e))
+            self._input_entry.BindKey('Escape', lambda sender, e: self._on_escape(e))
+            self._input_entry.BindKey('Control-c', lambda sender, e: self._on_interrupt(e))
             
             # Set focus to input
             self._input_entry.Focus()
@@ -524,6 +549,17 @@ class ConsolePanel(Panel):
         """
         self._process_command(command)
     
+    def Interrupt(self):
+        """
+        Interrupt the command running in the I/O layer (same as Ctrl+C).
+    
+        Returns:
+            True if a running command was interrupted
+        """
+        if self._use_io_layer and self._console_io:
+            return self._console_io.interrupt()
+        return False
+    
     def SetTheme(self, theme_name):
         """
         Apply a predefined theme.
@@ -671,6 +707,13 @@ class ConsolePanel(Panel):
             self._input_entry.Text = self._current_input
         return 'break'
     
+    def _on_interrupt(self, event):
+        """Handle Ctrl+C - interrupt the running command, if any."""
+        if self.Interrupt():
+            self.WriteLine('^C', '#808080')
+            return 'break'
+        return None
+    
     def _on_escape(self, event):
         """Handle Escape key - clear input."""
         self._input_entry.Text = ''
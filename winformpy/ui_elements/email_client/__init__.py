@@ -48,7 +48,8 @@ from .email_manager import (
     SortField,
     SortOrder,
     MessageThread,
-    EmailFilter
+    EmailFilter,
+    MessageStore
 )
 
 from .email_panel import EmailPanel
@@ -76,6 +77,7 @@ __all__ = [
     'SortOrder',
     'MessageThread',
     'EmailFilter',
+    'MessageStore',
     
     # UI
     'EmailPanel',
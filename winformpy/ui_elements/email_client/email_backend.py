@@ -501,8 +501,31 @@ class EmailBackend:
             EmailMessage or None if not found
         """
         return None
-    
-    def search_messages(self, criteria: Dict[str, Any], 
+
+    def get_messages(self, uids: List[int],
+                     folder: str = "INBOX") -> List[EmailMessage]:
+        """
+        Get several full messages in one request.
+
+        Backends that can batch (e.g. a single IMAP ``UID FETCH 1,5,9``)
+        should override this; the default falls back to one
+        get_message() call per UID.
+
+        Args:
+            uids: Message UIDs
+            folder: Folder path
+
+        Returns:
+            List of EmailMessage objects (UIDs not found are skipped)
+        """
+        messages = []
+        for uid in uids:
+            message = self.get_message(uid, folder)
+            if message:
+                messages.append(message)
+        return messages
+
+    def search_messages(self, criteria: Dict[str, Any],
                        folder: str = "INBOX") -> List[int]:
         """
         Search for messages matching criteria.
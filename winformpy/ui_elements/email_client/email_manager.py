@@ -16,11 +16,14 @@ Architecture:
 """
 
 from enum import Enum, auto
-from typing import List, Optional, Dict, Any, Callable
-from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Any, Callable, Tuple
+from dataclasses import dataclass, field, replace
+from collections import OrderedDict
 from datetime import datetime
 import threading
 import queue
+import pickle
+import sqlite3
 
 # Use try/except for imports to support both direct execution and package import
 try:
@@ -121,6 +124,289 @@ class EmailFilter:
     priority: EmailPriority = None
 
 
+# =============================================================================
+# Message Store
+# =============================================================================
+
+class MessageStore:
+    """
+    Tiered message cache used by EmailManager.
+
+    Tiers:
+    - Header index: header-only copy of every message seen (no body, no
+      attachment data), so list views and threading never refetch.
+    - Body LRU: full messages up to ``max_body_bytes`` of body text, HTML
+      and attachment data; least recently read messages are evicted first.
+    - Spill (optional): evicted bodies are written to a local SQLite file
+      at ``spill_path`` and promoted back into the LRU on the next read.
+
+    Messages are keyed by ``(folder, uid)`` since UIDs are only unique
+    within a folder. All methods are thread-safe (the sync loop runs on a
+    background thread).
+    """
+
+    DEFAULT_MAX_BODY_BYTES = 32 * 1024 * 1024
+
+    def __init__(self, max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+                 spill_path: str = None):
+        """
+        Initialize the store.
+
+        Args:
+            max_body_bytes: Byte budget of the in-memory body LRU
+            spill_path: SQLite file for evicted bodies (None disables spill)
+        """
+        self._max_body_bytes = max(0, int(max_body_bytes))
+        self._headers: Dict[Tuple[str, int], EmailMessage] = {}
+        self._bodies: "OrderedDict[Tuple[str, int], EmailMessage]" = OrderedDict()
+        self._body_sizes: Dict[Tuple[str, int], int] = {}
+        self._body_bytes = 0
+        self._lock = threading.RLock()
+
+        self._spill = None
+        if spill_path:
+            self._spill = sqlite3.connect(spill_path, check_same_thread=False)
+            self._spill.execute(
+                "CREATE TABLE IF NOT EXISTS bodies ("
+                "folder TEXT NOT NULL, uid INTEGER NOT NULL, "
+                "payload BLOB NOT NULL, PRIMARY KEY (folder, uid))"
+            )
+            self._spill.commit()
+
+    # -------------------------------------------------------------------------
+    # Properties
+    # -------------------------------------------------------------------------
+
+    @property
+    def max_body_bytes(self) -> int:
+        """Byte budget of the in-memory body LRU."""
+        return self._max_body_bytes
+
+    @max_body_bytes.setter
+    def max_body_bytes(self, value: int):
+        with self._lock:
+            self._max_body_bytes = max(0, int(value))
+            self._evict()
+
+    @property
+    def body_bytes(self) -> int:
+        """Bytes currently held by the in-memory body LRU."""
+        return self._body_bytes
+
+    @property
+    def header_count(self) -> int:
+        """Number of messages in the header index."""
+        return len(self._headers)
+
+    @property
+    def body_count(self) -> int:
+        """Number of full messages held in memory."""
+        return len(self._bodies)
+
+    def __len__(self) -> int:
+        return len(self._headers)
+
+    def __contains__(self, key: Tuple[str, int]) -> bool:
+        return key in self._headers
+
+    # -------------------------------------------------------------------------
+    # Lookup
+    # -------------------------------------------------------------------------
+
+    def get_header(self, folder: str, uid: int) -> Optional[EmailMessage]:
+        """Return the header-only copy of a message, or None."""
+        return self._headers.get((folder, uid))
+
+    def get_full(self, folder: str, uid: int) -> Optional[EmailMessage]:
+        """
+        Return the full message if its body is cached in memory or spill.
+
+        Args:
+            folder: Folder path
+            uid: Message UID
+
+        Returns:
+            EmailMessage with body, or None on a miss
+        """
+        key = (folder, uid)
+        with self._lock:
+            message = self._bodies.get(key)
+            if message is not None:
+                self._bodies.move_to_end(key)
+                return message
+
+            header = self._headers.get(key)
+            if header is None or self._spill is None:
+                return None
+            row = self._spill.execute(
+                "SELECT payload FROM bodies WHERE folder = ? AND uid = ?", key
+            ).fetchone()
+            if row is None:
+                return None
+            body_text, body_html, attachments = pickle.loads(row[0])
+            message = replace(header, body_text=body_text, body_html=body_html,
+                              attachments=attachments)
+            self._store_body(key, message)
+            return message
+
+    # -------------------------------------------------------------------------
+    # Mutation
+    # -------------------------------------------------------------------------
+
+    def put(self, message: EmailMessage) -> None:
+        """
+        Add or refresh a message.
+
+        The header index is always updated; the body tier only when the
+        message carries body content.
+        """
+        key = (message.folder, message.uid)
+        with self._lock:
+            self._headers[key] = self._header_copy(message)
+            if message.body_text or message.body_html:
+                self._store_body(key, message)
+            elif key in self._bodies:
+                # Keep the cached body but pick up refreshed flags/headers
+                cached = self._bodies[key]
+                cached.flags = message.flags
+                cached.subject = message.subject
+
+    def update(self, folder: str, uid: int,
+               change: Callable[[EmailMessage], None]) -> bool:
+        """
+        Apply ``change`` to every cached copy of a message.
+
+        Returns:
+            bool: True if the message was cached
+        """
+        key = (folder, uid)
+        with self._lock:
+            header = self._headers.get(key)
+            if header is None:
+                return False
+            change(header)
+            if key in self._bodies:
+                change(self._bodies[key])
+            return True
+
+    def move(self, uid: int, from_folder: str, to_folder: str) -> bool:
+        """Re-key a message after it was moved to another folder."""
+        old_key, new_key = (from_folder, uid), (to_folder, uid)
+        with self._lock:
+            header = self._headers.pop(old_key, None)
+            if header is None:
+                return False
+            header.folder = to_folder
+            self._headers[new_key] = header
+
+            message = self._bodies.pop(old_key, None)
+            if message is not None:
+                message.folder = to_folder
+                self._bodies[new_key] = message
+                self._body_sizes[new_key] = self._body_sizes.pop(old_key)
+            if self._spill is not None:
+                self._spill.execute(
+                    "DELETE FROM bodies WHERE folder = ? AND uid = ?", new_key)
+                self._spill.execute(
+                    "UPDATE bodies SET folder = ? WHERE folder = ? AND uid = ?",
+                    (to_folder, from_folder, uid))
+                self._spill.commit()
+            return True
+
+    def remove(self, folder: str, uid: int) -> bool:
+        """Drop a message from every tier."""
+        key = (folder, uid)
+        with self._lock:
+            found = self._headers.pop(key, None) is not None
+            if key in self._bodies:
+                del self._bodies[key]
+                self._body_bytes -= self._body_sizes.pop(key)
+            if self._spill is not None:
+                self._spill.execute(
+                    "DELETE FROM bodies WHERE folder = ? AND uid = ?", key)
+                self._spill.commit()
+            return found
+
+    def clear(self) -> None:
+        """Drop everything, including spilled bodies."""
+        with self._lock:
+            self._headers.clear()
+            self._bodies.clear()
+            self._body_sizes.clear()
+            self._body_bytes = 0
+            if self._spill is not None:
+                self._spill.execute("DELETE FROM bodies")
+                self._spill.commit()
+
+    def close(self) -> None:
+        """Close the spill database (the in-memory tiers stay usable)."""
+        with self._lock:
+            if self._spill is not None:
+                self._spill.close()
+                self._spill = None
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _header_copy(message: EmailMessage) -> EmailMessage:
+        """Copy of ``message`` without body content or attachment data."""
+        return replace(
+            message, body_text="", body_html="",
+            attachments=[replace(a, data=b"") for a in message.attachments]
+        )
+
+    @staticmethod
+    def _body_size(message: EmailMessage) -> int:
+        """Approximate memory held by the body tier for ``message``."""
+        size = len(message.body_text) + len(message.body_html)
+        for attachment in message.attachments:
+            size += len(attachment.data)
+        return size
+
+    def _store_body(self, key: Tuple[str, int], message: EmailMessage) -> None:
+        if key in self._bodies:
+            self._body_bytes -= self._body_sizes[key]
+        size = self._body_size(message)
+        self._bodies[key] = message
+        self._bodies.move_to_end(key)
+        self._body_sizes[key] = size
+        self._body_bytes += size
+        self._evict()
+
+    def _evict(self) -> None:
+        """Evict least recently used bodies until within budget."""
+        spilled = False
+        # Always keep the most recent body, even if it alone is over budget
+        while self._body_bytes > self._max_body_bytes and len(self._bodies) > 1:
+            key, message = self._bodies.popitem(last=False)
+            self._body_bytes -= self._body_sizes.pop(key)
+            if self._spill is not None:
+                payload = pickle.dumps(
+                    (message.body_text, message.body_html, message.attachments),
+                    protocol=pickle.HIGHEST_PROTOCOL
+                )
+                self._spill.execute(
+                    "INSERT OR REPLACE INTO bodies (folder, uid, payload) "
+                    "VALUES (?, ?, ?)", (key[0], key[1], payload))
+                spilled = True
+        if spilled:
+            self._spill.commit()
+
+
+def _set_flag(flag: EmailFlags) -> Callable[[EmailMessage], None]:
+    def change(message: EmailMessage) -> None:
+        message.flags |= flag
+    return change
+
+
+def _clear_flag(flag: EmailFlags) -> Callable[[EmailMessage], None]:
+    def change(message: EmailMessage) -> None:
+        message.flags &= ~flag
+    return change
+
+
 # =============================================================================
 # Email Manager
 # =============================================================================
@@ -137,13 +423,16 @@ class EmailManager:
     - Message threading
     """
     
-    def __init__(self, primitives: EmailBackend = None):
+    def __init__(self, primitives: EmailBackend = None,
+                 store: MessageStore = None):
         """
         Initialize the email manager.
         
         Args:
             primitives: EmailBackend instance for low-level operations.
                        If None, a default instance will be created.
+            store: MessageStore used as the message cache. If None, an
+                   in-memory store with the default body budget is used.
         """
         self._primitives = primitives or EmailBackend()
         
@@ -151,7 +440,7 @@ class EmailManager:
         self._account: Optional[EmailAccount] = None
         self._folders: List[EmailFolder] = []
         self._current_folder: str = "INBOX"
-        self._messages: Dict[int, EmailMessage] = {}  # UID -> Message
+        self._store = store if store is not None else MessageStore()
         self._threads: Dict[str, MessageThread] = {}  # ThreadID -> Thread
         
         # Sorting
@@ -166,6 +455,10 @@ class EmailManager:
         self._sync_thread: Optional[threading.Thread] = None
         self._sync_running = False
         self._sync_interval = 60  # seconds
+        
+        # Events raised by the sync thread are passed through this callable
+        # when set, e.g. form.BeginInvoke, so handlers run on the UI thread
+        self.event_invoker: Optional[Callable[..., Any]] = None
     
     # =========================================================================
     # Properties
@@ -181,6 +474,11 @@ class EmailManager:
         """Set the primitives layer."""
         self._primitives = value
     
+    @property
+    def store(self) -> MessageStore:
+        """Get the message cache."""
+        return self._store
+    
     @property
     def is_connected(self) -> bool:
         """Check if connected to server."""
@@ -351,7 +649,7 @@ class EmailManager:
         
         # Cache messages
         for msg in messages:
-            self._messages[msg.uid] = msg
+            self._store.put(msg)
         
         # Apply filter if provided
         if filter_:
@@ -376,23 +674,52 @@ class EmailManager:
         folder = folder or self._current_folder
         
         # Check cache first
-        if uid in self._messages:
-            cached = self._messages[uid]
-            if cached.body_text or cached.body_html:
-                return cached
+        cached = self._store.get_full(folder, uid)
+        if cached:
+            return cached
         
         # Fetch from server
         message = self._primitives.get_message(uid, folder)
         if message:
-            self._messages[uid] = message
+            self._store.put(message)
         return message
     
+    def get_message_batch(self, uids: List[int],
+                          folder: str = None) -> List[EmailMessage]:
+        """
+        Get several messages with full content, fetching cache misses
+        from the backend in a single batched request.
+        
+        Args:
+            uids: Message UIDs
+            folder: Folder path
+            
+        Returns:
+            List of EmailMessage objects in ``uids`` order
+        """
+        folder = folder or self._current_folder
+        
+        found: Dict[int, EmailMessage] = {}
+        missing = []
+        for uid in uids:
+            cached = self._store.get_full(folder, uid)
+            if cached:
+                found[uid] = cached
+            else:
+                missing.append(uid)
+        
+        if missing:
+            for message in self._primitives.get_messages(missing, folder):
+                self._store.put(message)
+                found[message.uid] = message
+        
+        return [found[uid] for uid in uids if uid in found]
+    
     def mark_as_read(self, uid: int, folder: str = None) -> bool:
         """Mark a message as read."""
         folder = folder or self._current_folder
         result = self._primitives.mark_as_read(uid, folder)
-        if result and uid in self._messages:
-            self._messages[uid].flags |= EmailFlags.SEEN
+        if result and self._store.update(folder, uid, _set_flag(EmailFlags.SEEN)):
             self._fire_event(EmailEventType.MESSAGE_FLAGS_CHANGED, {"uid": uid})
         return result
     
@@ -400,8 +727,7 @@ class EmailManager:
         """Mark a message as unread."""
         folder = folder or self._current_folder
         result = self._primitives.mark_as_unread(uid, folder)
-        if result and uid in self._messages:
-            self._messages[uid].flags &= ~EmailFlags.SEEN
+        if result and self._store.update(folder, uid, _clear_flag(EmailFlags.SEEN)):
             self._fire_event(EmailEventType.MESSAGE_FLAGS_CHANGED, {"uid": uid})
         return result
     
@@ -409,12 +735,13 @@ class EmailManager:
         """Toggle the starred status of a message."""
         folder = folder or self._current_folder
         result = self._primitives.toggle_star(uid, folder)
-        if result and uid in self._messages:
-            msg = self._messages[uid]
-            if EmailFlags.FLAGGED in msg.flags:
-                msg.flags &= ~EmailFlags.FLAGGED
+        header = self._store.get_header(folder, uid)
+        if result and header is not None:
+            if EmailFlags.FLAGGED in header.flags:
+                change = _clear_flag(EmailFlags.FLAGGED)
             else:
-                msg.flags |= EmailFlags.FLAGGED
+                change = _set_flag(EmailFlags.FLAGGED)
+            self._store.update(folder, uid, change)
             self._fire_event(EmailEventType.MESSAGE_FLAGS_CHANGED, {"uid": uid})
         return result
     
@@ -434,8 +761,7 @@ class EmailManager:
         folder = folder or self._current_folder
         result = self._primitives.delete_message(uid, folder, permanent)
         if result:
-            if uid in self._messages:
-                del self._messages[uid]
+            self._store.remove(folder, uid)
             self._fire_event(EmailEventType.MESSAGE_DELETED, {"uid": uid})
         return result
     
@@ -455,8 +781,7 @@ class EmailManager:
         from_folder = from_folder or self._current_folder
         result = self._primitives.move_message(uid, from_folder, to_folder)
         if result:
-            if uid in self._messages:
-                self._messages[uid].folder = to_folder
+            self._store.move(uid, from_folder, to_folder)
             self._fire_event(EmailEventType.MESSAGE_MOVED, {
                 "uid": uid, 
                 "from": from_folder, 
@@ -711,14 +1036,8 @@ class EmailManager:
         folder = folder or self._current_folder
         uids = self._primitives.search_messages(criteria, folder)
         
-        # Fetch messages
-        messages = []
-        for uid in uids:
-            msg = self.get_message(uid, folder)
-            if msg:
-                messages.append(msg)
-        
-        return messages
+        # Fetch messages (cache misses in one batched request)
+        return self.get_message_batch(uids, folder)
     
     # =========================================================================
     # Background Sync
@@ -767,10 +1086,8 @@ class EmailManager:
                 # Use IDLE if available, otherwise poll
                 new_uids = self._primitives.idle(timeout=self._sync_interval)
                 
-                for uid in new_uids:
-                    msg = self.get_message(uid)
-                    if msg:
-                        self._fire_event(EmailEventType.NEW_MESSAGE, {"message": msg})
+                for msg in self.get_message_batch(new_uids):
+                    self._post_event(EmailEventType.NEW_MESSAGE, {"message": msg})
             except Exception:
                 # Connection might be lost, try to reconnect
                 time.sleep(self._sync_interval)
@@ -817,6 +1134,14 @@ class EmailManager:
                 except Exception:
                     pass  # Don't let handler errors break the flow
     
+    def _post_event(self, event_type: EmailEventType,
+                    data: Dict[str, Any] = None) -> None:
+        """Fire an event from the sync thread, through event_invoker if set."""
+        if self.event_invoker is not None:
+            self.event_invoker(self._fire_event, event_type, data)
+        else:
+            self._fire_event(event_type, data)
+    
     # =========================================================================
     # Helper Methods
     # =========================================================================
@@ -219,6 +219,24 @@ class MasterDetailBackend(ABC):
         """
         return 'Details'
     
+    def prefetch_details(self, master_ids: List[Any], request: DataRequest) -> Dict[Any, DataResponse]:
+        """
+        Fetch the detail data of several master records in one round-trip.
+        
+        Override this when the data source can answer for many masters at
+        once (e.g. one SQL query with IN (...)); the results warm the
+        detail cache so selecting those masters needs no query. The default
+        fetches nothing.
+        
+        Args:
+            master_ids: IDs of the master records (not cached yet)
+            request: DataRequest used for each of them (usually the first page)
+            
+        Returns:
+            Dictionary master_id -> DataResponse (missing IDs are simply not cached)
+        """
+        return {}
+    
     # =========================================================================
     # Formatting
     # =========================================================================
@@ -381,6 +399,10 @@ class DemoMasterDetailBackend(MasterDetailBackend):
             )
         )
     
+    def prefetch_details(self, master_ids: List[Any], request: DataRequest) -> Dict[Any, DataResponse]:
+        # All orders are in memory: answer every master in one call
+        return {master_id: self.fetch_detail_data(master_id, request) for master_id in master_ids}
+    
     def get_detail_title(self) -> str:
         return 'Orders'
     
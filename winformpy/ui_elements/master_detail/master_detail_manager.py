@@ -4,10 +4,13 @@ Master-Detail Manager - Service layer for Master-Detail operations.
 This module manages the state and data flow between master and detail grids.
 """
 
-from typing import Any, Optional, Callable
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Callable
 
 import sys
 import os
+import queue
+import threading
 
 # Handle imports for both module and direct execution
 try:
@@ -29,6 +32,8 @@ class MasterDetailManager:
     - Fetches data from the backend
     - Maintains selection state
     - Coordinates master selection → detail refresh
+    - Caches detail pages (LRU keyed by master ID and request)
+    - Loads detail data on a background thread, dropping stale results
     - Provides formatted values
     
     Example:
@@ -47,19 +52,43 @@ class MasterDetailManager:
         
         # Fetch detail data
         detail_response = manager.fetch_detail_data(request)
+    
+    Background loading (UI thread polls for the result):
+        manager.load_detail_async(request)
+        ...
+        if manager.process_detail_results():
+            response = manager.fetch_detail_data(request)   # cache hit
     """
     
-    def __init__(self, backend: MasterDetailBackend):
+    DETAIL_CACHE_SIZE = 64  # Detail pages kept (LRU)
+    
+    def __init__(self, backend: MasterDetailBackend, detail_cache_size: int = None):
         """
         Initialize the manager with a backend.
         
         Args:
             backend: Implementation of MasterDetailBackend
+            detail_cache_size: Detail pages to cache (default DETAIL_CACHE_SIZE, 0 disables)
         """
         self._backend = backend
         self._selected_master_id: Any = None
         self._selected_master_record: dict = None
         
+        # Detail cache: (master_id, request key) -> DataResponse
+        self._detail_cache: "OrderedDict[tuple, DataResponse]" = OrderedDict()
+        self._detail_cache_size = self.DETAIL_CACHE_SIZE if detail_cache_size is None else detail_cache_size
+        self._detail_failures: Dict[tuple, DataResponse] = {}
+        self._cache_lock = threading.Lock()
+        
+        # Background loading: newest detail request wins, prefetches queue up
+        self._detail_generation = 0
+        self._pending_detail: Optional[tuple] = None
+        self._pending_prefetch: List[tuple] = []
+        self._detail_results: "queue.Queue" = queue.Queue()
+        self._loading_generation = 0
+        self._worker: Optional[threading.Thread] = None
+        self._worker_wakeup = threading.Condition()
+        
         # Callbacks
         self._on_master_selection_changed: Callable[[Any], None] = None
         self._on_detail_data_changed: Callable[[], None] = None
@@ -203,18 +232,213 @@ class MasterDetailManager:
         if self._selected_master_id is None:
             return DataResponse(records=[], page_info=PageInfo())
         
-        return self._backend.fetch_detail_data(self._selected_master_id, request)
+        return self._fetch_detail(self._selected_master_id, request)
     
     def format_detail_value(self, value: Any, column) -> str:
         """Format a value for display in the detail grid."""
         return self._backend.format_detail_value(value, column)
     
+    # =========================================================================
+    # Detail Cache
+    # =========================================================================
+    
+    @property
+    def detail_cache_size(self) -> int:
+        """Get/set the number of detail pages cached (0 disables the cache)."""
+        return self._detail_cache_size
+    
+    @detail_cache_size.setter
+    def detail_cache_size(self, value: int):
+        self._detail_cache_size = max(0, value)
+        with self._cache_lock:
+            while len(self._detail_cache) > self._detail_cache_size:
+                self._detail_cache.popitem(last=False)
+    
+    @staticmethod
+    def _request_key(request: DataRequest) -> tuple:
+        """Hashable identity of a detail request."""
+        sort_order = getattr(request.sort_order, 'value', request.sort_order)
+        filters = repr(sorted((request.filters or {}).items(), key=lambda item: str(item[0])))
+        return (request.page, request.page_size, request.search_text, request.case_sensitive,
+                request.exact_match, request.sort_column, sort_order, filters)
+    
+    def get_cached_detail(self, master_id: Any, request: DataRequest) -> Optional[DataResponse]:
+        """
+        Get a cached detail page without querying the backend.
+        
+        Returns:
+            The cached DataResponse, or None
+        """
+        key = (master_id, self._request_key(request))
+        with self._cache_lock:
+            response = self._detail_cache.get(key)
+            if response is not None:
+                self._detail_cache.move_to_end(key)
+            return response
+    
+    def _store_detail(self, key: tuple, response: DataResponse):
+        if not response.success:
+            # Served once to the grid so the error is shown without a second query
+            with self._cache_lock:
+                self._detail_failures[key] = response
+            return
+        if self._detail_cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._detail_cache[key] = response
+            self._detail_cache.move_to_end(key)
+            while len(self._detail_cache) > self._detail_cache_size:
+                self._detail_cache.popitem(last=False)
+    
+    def _fetch_detail(self, master_id: Any, request: DataRequest) -> DataResponse:
+        """Cache lookup, then backend query (any thread)."""
+        key = (master_id, self._request_key(request))
+        with self._cache_lock:
+            response = self._detail_cache.get(key) or self._detail_failures.pop(key, None)
+            if response is not None:
+                if response.success:
+                    self._detail_cache.move_to_end(key)
+                return response
+        try:
+            response = self._backend.fetch_detail_data(master_id, request)
+        except Exception as e:
+            response = DataResponse(records=[], page_info=PageInfo(), success=False, error_message=str(e))
+        self._store_detail(key, response)
+        return response
+    
+    def invalidate_detail_cache(self, master_id: Any = None):
+        """
+        Drop cached detail pages.
+        
+        Args:
+            master_id: Only drop the pages of this master (default: all)
+        """
+        with self._cache_lock:
+            if master_id is None:
+                self._detail_cache.clear()
+                self._detail_failures.clear()
+            else:
+                for key in [key for key in self._detail_cache if key[0] == master_id]:
+                    del self._detail_cache[key]
+    
+    def prefetch_details(self, master_ids: List[Any], request: DataRequest) -> int:
+        """
+        Warm the cache for several masters with one backend call
+        (MasterDetailBackend.prefetch_details).
+        
+        Args:
+            master_ids: Master IDs whose detail page to load
+            request: The detail request (usually the first page)
+            
+        Returns:
+            Number of pages added to the cache
+        """
+        request_key = self._request_key(request)
+        with self._cache_lock:
+            missing = [master_id for master_id in master_ids
+                       if master_id is not None and (master_id, request_key) not in self._detail_cache]
+        if not missing or self._detail_cache_size <= 0:
+            return 0
+        responses = self._backend.prefetch_details(missing, request) or {}
+        added = 0
+        for master_id, response in responses.items():
+            if response is not None and response.success:
+                self._store_detail((master_id, request_key), response)
+                added += 1
+        return added
+    
+    # =========================================================================
+    # Background Detail Loading
+    # =========================================================================
+    
+    @property
+    def is_detail_loading(self) -> bool:
+        """Whether the latest load_detail_async() result has not been processed yet."""
+        return self._loading_generation == self._detail_generation and self._loading_generation != 0
+    
+    def load_detail_async(self, request: DataRequest) -> int:
+        """
+        Load the selected master's detail page on the background thread.
+        
+        A newer call supersedes a pending one; results of superseded calls
+        still fill the cache but are not reported by process_detail_results().
+        
+        Args:
+            request: DataRequest for the detail grid
+            
+        Returns:
+            Generation number of this load
+        """
+        self._detail_generation += 1
+        self._loading_generation = self._detail_generation
+        with self._worker_wakeup:
+            self._pending_detail = (self._detail_generation, self._selected_master_id, request)
+            self._ensure_worker()
+            self._worker_wakeup.notify()
+        return self._detail_generation
+    
+    def prefetch_details_async(self, master_ids: List[Any], request: DataRequest):
+        """Run prefetch_details() on the background thread (after pending detail loads)."""
+        with self._worker_wakeup:
+            self._pending_prefetch.append((list(master_ids), request))
+            self._ensure_worker()
+            self._worker_wakeup.notify()
+    
+    def cancel_detail_load(self):
+        """Drop the result of the pending load_detail_async() call."""
+        self._detail_generation += 1
+        self._loading_generation = 0
+    
+    def process_detail_results(self) -> bool:
+        """
+        Handle finished background loads. Call from the UI thread.
+        
+        Returns:
+            True when the result of the latest load_detail_async() arrived;
+            it is then served by fetch_detail_data() from the cache
+        """
+        current = False
+        while True:
+            try:
+                generation = self._detail_results.get_nowait()
+            except queue.Empty:
+                break
+            if generation == self._detail_generation and generation == self._loading_generation:
+                self._loading_generation = 0
+                current = True
+        return current
+    
+    def _ensure_worker(self):
+        """Start the loader thread (caller holds _worker_wakeup)."""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._worker_loop, name='MasterDetailLoader', daemon=True)
+            self._worker.start()
+    
+    def _worker_loop(self):
+        while True:
+            with self._worker_wakeup:
+                while self._pending_detail is None and not self._pending_prefetch:
+                    self._worker_wakeup.wait()
+                job, self._pending_detail = self._pending_detail, None
+                prefetch = self._pending_prefetch.pop(0) if job is None else None
+            if job is not None:
+                generation, master_id, request = job
+                if generation == self._detail_generation:
+                    self._fetch_detail(master_id, request)
+                self._detail_results.put(generation)
+            else:
+                try:
+                    self.prefetch_details(*prefetch)
+                except Exception:
+                    pass
+    
     # =========================================================================
     # Refresh
     # =========================================================================
     
     def refresh_detail(self):
         """Notify that detail data should be refreshed."""
+        self.invalidate_detail_cache(self._selected_master_id)
         if self._on_detail_data_changed:
             self._on_detail_data_changed()
 
@@ -55,14 +55,18 @@ class _MasterGridBackend:
     Implements the DataGridBackend interface by delegating to the manager.
     """
     
-    def __init__(self, md_manager: MasterDetailManager):
+    def __init__(self, md_manager: MasterDetailManager, on_fetched: Callable[[DataResponse], None] = None):
         self._manager = md_manager
+        self._on_fetched = on_fetched
     
     def get_columns(self) -> List[ColumnDefinition]:
         return self._manager.get_master_columns()
     
     def fetch_data(self, request: DataRequest) -> DataResponse:
-        return self._manager.fetch_master_data(request)
+        response = self._manager.fetch_master_data(request)
+        if self._on_fetched and response.success:
+            self._on_fetched(response)
+        return response
     
     def format_value(self, value: Any, column: ColumnDefinition) -> str:
         return self._manager.format_master_value(value, column)
@@ -108,9 +112,12 @@ class MasterDetailPanel(Panel):
         Orientation: 'horizontal' or 'vertical'
         MasterWidth: Width of master panel (when horizontal)
         MasterHeight: Height of master panel (when vertical)
+        DetailDelay: Milliseconds a selection must stay before details load
+        AsyncDetail: Query detail data on a background thread (opt-in)
+        PrefetchDetails: Warm the detail cache for each loaded master page
     
     Features:
-    - Automatic detail refresh on master selection
+    - Automatic detail refresh on master selection (debounced, cached)
     - Resizable split layout
     - Sub-properties for customizing internal elements
     
@@ -134,6 +141,9 @@ class MasterDetailPanel(Panel):
         }, manager=manager)
     """
     
+    DETAIL_DELAY = 150      # ms a master selection must stay before details load
+    DETAIL_POLL_MS = 30     # Polling interval for background detail results
+    
     # Color scheme
     COLORS = {
         'background': '#FFFFFF',
@@ -168,6 +178,15 @@ class MasterDetailPanel(Panel):
                 - 'MasterList': Sub-properties for master ListView
                 - 'DetailPanel': Sub-properties for detail panel container
                 - 'DetailGrid': Sub-properties for detail DataGridPanel
+                - 'DetailDelay': Debounce of master selection in ms (default 150);
+                  cached details are shown at once
+                - 'AsyncDetail': Fetch detail data on a background thread
+                  (default False; only for backends that may be called from
+                  another thread, e.g. not a sqlite3 connection made on the
+                  UI thread; needs DetailCacheSize > 0)
+                - 'PrefetchDetails': Call backend.prefetch_details() for each
+                  loaded master page (default True)
+                - 'DetailCacheSize': Detail pages kept in the LRU cache (default 64)
             backend: Optional MasterDetailBackend for data source
             manager: Optional pre-configured MasterDetailManager
             
@@ -204,6 +223,10 @@ class MasterDetailPanel(Panel):
         self._master_list_props = props.pop('MasterList', {})
         self._detail_panel_props = props.pop('DetailPanel', {})
         self._detail_grid_props = props.pop('DetailGrid', {})
+        self._detail_delay = props.pop('DetailDelay', self.DETAIL_DELAY)
+        self._async_detail = props.pop('AsyncDetail', False)
+        self._prefetch_details = props.pop('PrefetchDetails', True)
+        detail_cache_size = props.pop('DetailCacheSize', None)
         
         defaults = {
             'Width': 1000,
@@ -221,6 +244,8 @@ class MasterDetailPanel(Panel):
             self._manager = MasterDetailManager(backend)
         else:
             raise ValueError("Either 'backend' or 'manager' must be provided")
+        if detail_cache_size is not None:
+            self._manager.detail_cache_size = detail_cache_size
         
         # Wire up manager events
         self._manager.on_master_selection_changed = self._on_master_selection_changed
@@ -248,6 +273,10 @@ class MasterDetailPanel(Panel):
         # Store widgets with event handlers to prevent GC
         self._list_items = []
         
+        # Detail loading state
+        self._detail_job = None
+        self._detail_pump_active = False
+        
         self._build_ui()
     
     # =========================================================================
@@ -394,7 +423,7 @@ class MasterDetailPanel(Panel):
     def _build_master_grid(self):
         """Build the master as a DataGrid."""
         # Create adapter backend
-        master_backend = _MasterGridBackend(self._manager)
+        master_backend = _MasterGridBackend(self._manager, self._on_master_page_fetched)
         self._master_grid_manager = DataGridManager(master_backend)
         
         # Build grid props
@@ -442,6 +471,8 @@ class MasterDetailPanel(Panel):
         for item in response.items:
             display = f"{item.icon}  {item.text}" if item.icon else item.text
             self._master_listbox._tk_widget.insert('end', display)
+        
+        self._prefetch_for(item.id for item in response.items)
     
     def _build_detail_content(self):
         """Build the detail panel content (always a DataGrid)."""
@@ -484,6 +515,13 @@ class MasterDetailPanel(Panel):
         self._detail_grid.RowClick = lambda s, e: self.DetailRowClick(s, e)
         self._detail_grid.RowDoubleClick = lambda s, e: self.DetailRowDoubleClick(s, e)
         self._detail_grid.SelectionChanged = lambda s, e: self.DetailSelectionChanged(s, e)
+        
+        # The master was loaded first: warm the cache for its rows now
+        if self._master_grid_manager is not None:
+            id_field = self._manager.get_master_id_field()
+            self._prefetch_for(record.get(id_field) for record in self._master_grid_manager.records)
+        else:
+            self._prefetch_for(item.id for item in self._list_items)
     
     # =========================================================================
     # Event Handlers
@@ -514,9 +552,15 @@ class MasterDetailPanel(Panel):
         # Update detail title
         self._update_detail_title(master_id)
         
-        # Refresh detail DataGrid
-        self._detail_grid_manager.go_to_page(1)  # Reset to first page
-        self._detail_grid_manager.refresh()
+        # Refresh detail DataGrid: at once when cached, otherwise once the
+        # selection settles (keyboard scrolling passes many rows)
+        self._cancel_detail_job()
+        if (master_id is None or self._detail_delay <= 0 or
+                self._manager.get_cached_detail(master_id, self._first_detail_request()) is not None):
+            self._manager.cancel_detail_load()
+            self._show_detail()
+        else:
+            self._detail_job = self._tk_widget.after(self._detail_delay, self._start_detail_load)
         
         # Fire external event
         self.MasterSelectionChanged(self, {
@@ -524,6 +568,64 @@ class MasterDetailPanel(Panel):
             'master_record': self._manager.selected_master_record
         })
 
+    def _first_detail_request(self) -> DataRequest:
+        """The request the detail grid makes for the first page."""
+        request = self._detail_grid_manager._create_request()
+        request.page = 1
+        return request
+    
+    def _cancel_detail_job(self):
+        if self._detail_job is not None:
+            self._tk_widget.after_cancel(self._detail_job)
+            self._detail_job = None
+    
+    def _start_detail_load(self):
+        """Selection settled: query the detail page (in the background if enabled)."""
+        self._detail_job = None
+        if not self._use_async_detail():
+            self._show_detail()
+            return
+        self._manager.load_detail_async(self._first_detail_request())
+        self._detail_header.Text = f"{self._detail_header.Text} (loading...)"
+        if not self._detail_pump_active:
+            self._detail_pump_active = True
+            self._tk_widget.after(self.DETAIL_POLL_MS, self._pump_detail)
+    
+    def _use_async_detail(self) -> bool:
+        """Background loads hand their result over through the cache, so need one."""
+        return self._async_detail and self._manager.detail_cache_size > 0
+    
+    def _pump_detail(self):
+        """Applies the background result of the latest selection (stale ones are dropped)."""
+        if self._manager.process_detail_results():
+            self._update_detail_title(self._manager.selected_master_id)
+            self._show_detail()
+        if self._manager.is_detail_loading:
+            self._tk_widget.after(self.DETAIL_POLL_MS, self._pump_detail)
+        else:
+            self._detail_pump_active = False
+    
+    def _show_detail(self):
+        """Show the first detail page (a cache hit after a background load)."""
+        self._detail_grid_manager.go_to_page(1)  # Reset to first page
+        self._detail_grid_manager.refresh()
+    
+    def _on_master_page_fetched(self, response: DataResponse):
+        """A master page was loaded: warm the detail cache for its rows."""
+        id_field = self._manager.get_master_id_field()
+        self._prefetch_for(record.get(id_field) for record in response.records)
+    
+    def _prefetch_for(self, master_ids):
+        if not self._prefetch_details or self._detail_grid_manager is None:
+            return
+        master_ids = list(master_ids)
+        if not master_ids:
+            return
+        if self._use_async_detail():
+            self._manager.prefetch_details_async(master_ids, self._first_detail_request())
+        else:
+            self._manager.prefetch_details(master_ids, self._first_detail_request())
+    
     def _on_master_data_changed(self):
         """Handle master data change from manager - triggers refresh of master view."""
         self.refresh_master()
@@ -567,11 +669,13 @@ class MasterDetailPanel(Panel):
             self._load_master_list()
     
     def refresh_detail(self):
-        """Refresh the detail DataGrid."""
+        """Refresh the detail DataGrid (re-queries the selected master's details)."""
+        self._manager.invalidate_detail_cache(self._manager.selected_master_id)
         self._detail_grid_manager.refresh()
     
     def refresh(self):
         """Refresh both master and detail views."""
+        self._manager.invalidate_detail_cache()
         self.refresh_master()
         if self._manager.selected_master_id is not None:
             self.refresh_detail()
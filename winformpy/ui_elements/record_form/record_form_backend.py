@@ -5,8 +5,12 @@ This module defines the contract that all record form backends must implement.
 The backend is responsible for CRUD operations on individual records.
 """
 
+import json
+import os
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from itertools import count, islice
 from typing import Any, Dict, List, Optional, Callable
 from enum import Enum
 
@@ -192,9 +196,15 @@ class RecordFormBackend(ABC):
 
 class InMemoryRecordBackend(RecordFormBackend):
     """
-    Simple in-memory backend for testing and demos.
+    In-memory backend for testing, demos and small local stores.
     
-    Stores records in a list and provides basic CRUD operations.
+    Records are kept in a dict keyed by primary key (insertion ordered), so
+    lookups, updates and deletes do not scan the records. Records are copied
+    in and out (shallow copies): setting a field on a returned dict does not
+    change the store until it is passed to update(). New IDs come from a
+    monotonic counter and are never reused. Optional secondary indexes speed
+    up find() on declared fields, begin/commit/rollback group changes into
+    a batch, and an optional journal file persists every change.
     
     Example:
         backend = InMemoryRecordBackend()
@@ -209,42 +219,188 @@ class InMemoryRecordBackend(RecordFormBackend):
             'ShowUpdateButton': True,
             'ShowDeleteButton': True
         })
+    
+    Journaled store with an index and a batch:
+        backend = InMemoryRecordBackend(indexes=['department'],
+                                        journal_file='employees.jsonl')
+        with backend.transaction():
+            for row in rows:
+                backend.insert(row)
+        sales = backend.find('department', 'Sales')
     """
     
-    def __init__(self, records: List[Dict[str, Any]] = None, primary_key: str = 'id'):
+    COMPACT_MIN_LINES = 1000    # Journal lines before compaction is considered
+    
+    def __init__(self, records: List[Dict[str, Any]] = None, primary_key: str = 'id',
+                 indexes: List[str] = None, journal_file: str = None):
         """
         Initialize the in-memory backend.
         
         Args:
             records: Optional initial list of records.
             primary_key: Name of the primary key field.
+            indexes: Optional field names to keep secondary indexes on.
+            journal_file: Optional path of an append-only journal (JSON Lines).
+                When it exists its records replace `records`; otherwise it is
+                created with `records` as the first snapshot.
         """
         super().__init__()
-        self._records: List[Dict[str, Any]] = records or []
         self._primary_key = primary_key
+        self._records: Dict[Any, Dict[str, Any]] = {}
+        self._indexes: Dict[str, Dict[Any, Dict[Any, None]]] = {name: {} for name in (indexes or [])}
         self._next_id = 1
+        # Insertion sequence per key, so rollback can restore the record order
+        self._seq: Dict[Any, int] = {}
+        self._seq_counter = count()
+        
+        # Transaction state: undo log of (key, previous record or None, sequence)
+        self._undo: Optional[List[tuple]] = None
+        self._pending_ops: List[dict] = []
         
-        # Calculate next ID
-        if self._records:
-            max_id = max((r.get(self._primary_key, 0) for r in self._records), default=0)
-            if isinstance(max_id, int):
-                self._next_id = max_id + 1
+        self._journal_file = journal_file
+        self._journal = None
+        self._journal_lines = 0
+        
+        if journal_file and os.path.exists(journal_file):
+            self._load_journal()
+        else:
+            self._load_records(records or [])
+            if journal_file:
+                self._write_snapshot()
+    
+    # =========================================================================
+    # Records and indexes
+    # =========================================================================
+    
+    def _load_records(self, records: List[Dict[str, Any]]):
+        """Replace all records (no journaling); records without a key get one."""
+        self._records = {}
+        self._seq = {}
+        for index in self._indexes.values():
+            index.clear()
+        for record in records:
+            record = dict(record)
+            if record.get(self._primary_key) in (None, ''):
+                record[self._primary_key] = self._allocate_id()
+            self._put(record)
+    
+    def _allocate_id(self) -> int:
+        new_id = self._next_id
+        self._next_id += 1
+        return new_id
+    
+    def _put(self, record: Dict[str, Any], seq: Optional[int] = None):
+        """Store record under its key, keeping indexes and the ID counter in sync."""
+        key = record[self._primary_key]
+        old = self._records.get(key)
+        if old is not None:
+            self._unindex(key, old)
+        elif seq is not None or key not in self._seq:
+            self._seq[key] = next(self._seq_counter) if seq is None else seq
+        self._records[key] = record
+        self._index(key, record)
+        if isinstance(key, int) and not isinstance(key, bool) and key >= self._next_id:
+            self._next_id = key + 1
+    
+    def _remove(self, key) -> Optional[Dict[str, Any]]:
+        record = self._records.pop(key, None)
+        if record is not None:
+            self._unindex(key, record)
+            self._seq.pop(key, None)
+        return record
+    
+    @staticmethod
+    def _index_value(value):
+        """Hashable form of a field value for the indexes."""
+        try:
+            hash(value)
+            return value
+        except TypeError:
+            return repr(value)
+    
+    def _index(self, key, record):
+        for name, index in self._indexes.items():
+            # dict as an insertion-ordered set of keys
+            index.setdefault(self._index_value(record.get(name)), {})[key] = None
+    
+    def _unindex(self, key, record):
+        for name, index in self._indexes.items():
+            value = self._index_value(record.get(name))
+            bucket = index.get(value)
+            if bucket is not None:
+                bucket.pop(key, None)
+                if not bucket:
+                    del index[value]
+    
+    def _record_change(self, key, previous, op: dict, seq: Optional[int] = None):
+        """Remember how to undo a change and journal it (batched in a transaction)."""
+        if self._undo is not None:
+            self._undo.append((key, previous, seq))
+            self._pending_ops.append(op)
+        else:
+            self._journal_write([op])
+    
+    # =========================================================================
+    # Queries
+    # =========================================================================
     
     def set_records(self, records: List[Dict[str, Any]]):
         """Set the records list."""
-        self._records = records
-        if self._records:
-            max_id = max((r.get(self._primary_key, 0) for r in self._records), default=0)
-            if isinstance(max_id, int):
-                self._next_id = max_id + 1
+        if self._undo is not None:
+            raise RuntimeError("set_records() is not allowed inside a transaction")
+        self._load_records(records)
+        if self._journal_file:
+            self._write_snapshot()
     
     def get_records(self) -> List[Dict[str, Any]]:
-        """Get all records."""
-        return self._records.copy()
+        """Get all records (shallow copies)."""
+        return [dict(record) for record in self._records.values()]
+    
+    def get_record(self, key) -> Optional[Dict[str, Any]]:
+        """Get a shallow copy of the record with the given primary key, or None."""
+        record = self._records.get(key)
+        return dict(record) if record is not None else None
+    
+    def count(self) -> int:
+        """Number of records."""
+        return len(self._records)
+    
+    def get_page(self, offset: int, limit: int) -> List[Dict[str, Any]]:
+        """Get shallow copies of `limit` records starting at `offset` (insertion order)."""
+        return [dict(record) for record in islice(self._records.values(), offset, offset + limit)]
+    
+    def create_index(self, field_name: str):
+        """Add a secondary index on field_name (built from the current records)."""
+        if field_name in self._indexes:
+            return
+        self._indexes[field_name] = {}
+        index = self._indexes[field_name]
+        for key, record in self._records.items():
+            index.setdefault(self._index_value(record.get(field_name)), {})[key] = None
+    
+    def find(self, field_name: str, value) -> List[Dict[str, Any]]:
+        """
+        Get shallow copies of the records whose field equals value.
+        
+        Uses the secondary index when field_name is indexed, otherwise scans.
+        """
+        if field_name == self._primary_key:
+            record = self._records.get(value)
+            found = [record] if record is not None else []
+        elif field_name not in self._indexes:
+            found = [r for r in self._records.values() if r.get(field_name) == value]
+        else:
+            index = self._indexes[field_name]
+            found = [self._records[key] for key in index.get(self._index_value(value), ())]
+        return [dict(record) for record in found]
     
     def get_primary_key_field(self) -> str:
         return self._primary_key
     
+    # =========================================================================
+    # CRUD
+    # =========================================================================
+    
     def insert(self, record: Dict[str, Any]) -> RecordResponse:
         """Insert a new record."""
         try:
@@ -262,14 +418,19 @@ class InMemoryRecordBackend(RecordFormBackend):
                 )
             
             # Generate ID if not provided
-            new_record = record.copy()
+            new_record = dict(record)
             if self._primary_key not in new_record or not new_record[self._primary_key]:
-                new_record[self._primary_key] = self._next_id
-                self._next_id += 1
+                new_record[self._primary_key] = self._allocate_id()
+            elif new_record[self._primary_key] in self._records:
+                return RecordResponse(
+                    success=False,
+                    error_message=f"Record with {self._primary_key}={new_record[self._primary_key]} already exists"
+                )
             
-            self._records.append(new_record)
+            self._put(new_record)
+            self._record_change(new_record[self._primary_key], None, {'op': 'put', 'record': new_record})
             
-            response = RecordResponse(success=True, record=new_record)
+            response = RecordResponse(success=True, record=dict(new_record))
             self.on_insert_complete(response)
             return response
             
@@ -292,16 +453,20 @@ class InMemoryRecordBackend(RecordFormBackend):
                     validation_errors=validation.errors
                 )
             
-            # Find and update
             pk_value = record.get(self._primary_key)
-            for i, r in enumerate(self._records):
-                if r.get(self._primary_key) == pk_value:
-                    self._records[i] = record.copy()
-                    response = RecordResponse(success=True, record=self._records[i])
-                    self.on_update_complete(response)
-                    return response
+            previous = self._records.get(pk_value)
+            if previous is None:
+                return RecordResponse(success=False, error_message=f"Record with {self._primary_key}={pk_value} not found")
+            
+            # The stored dict is never handed out, so previous is still the
+            # record as it was before this update
+            new_record = dict(record)
+            self._put(new_record)
+            self._record_change(pk_value, previous, {'op': 'put', 'record': new_record})
             
-            return RecordResponse(success=False, error_message=f"Record with {self._primary_key}={pk_value} not found")
+            response = RecordResponse(success=True, record=dict(new_record))
+            self.on_update_complete(response)
+            return response
             
         except Exception as e:
             return RecordResponse(success=False, error_message=str(e))
@@ -314,14 +479,15 @@ class InMemoryRecordBackend(RecordFormBackend):
                 return RecordResponse(success=False, error_message="Delete cancelled")
             
             pk_value = record.get(self._primary_key)
-            for i, r in enumerate(self._records):
-                if r.get(self._primary_key) == pk_value:
-                    deleted = self._records.pop(i)
-                    response = RecordResponse(success=True, record=deleted)
-                    self.on_delete_complete(response)
-                    return response
+            seq = self._seq.get(pk_value)
+            deleted = self._remove(pk_value)
+            if deleted is None:
+                return RecordResponse(success=False, error_message=f"Record with {self._primary_key}={pk_value} not found")
             
-            return RecordResponse(success=False, error_message=f"Record with {self._primary_key}={pk_value} not found")
+            self._record_change(pk_value, deleted, {'op': 'del', 'key': pk_value}, seq)
+            response = RecordResponse(success=True, record=dict(deleted))
+            self.on_delete_complete(response)
+            return response
             
         except Exception as e:
             return RecordResponse(success=False, error_message=str(e))
@@ -329,6 +495,135 @@ class InMemoryRecordBackend(RecordFormBackend):
     def get_default_values(self) -> Dict[str, Any]:
         """Get default values for a new record."""
         return {self._primary_key: None}
+    
+    # =========================================================================
+    # Transactions
+    # =========================================================================
+    
+    @property
+    def in_transaction(self) -> bool:
+        """Whether begin() was called without a matching commit()/rollback()."""
+        return self._undo is not None
+    
+    def begin(self):
+        """
+        Start a batch: changes apply immediately in memory but are written
+        to the journal together on commit() and can be undone with rollback().
+        """
+        if self._undo is not None:
+            raise RuntimeError("A transaction is already in progress")
+        self._undo = []
+        self._pending_ops = []
+    
+    def commit(self):
+        """Keep the changes made since begin() and journal them as one batch."""
+        if self._undo is None:
+            raise RuntimeError("No transaction in progress")
+        ops = self._pending_ops
+        self._undo = None
+        self._pending_ops = []
+        if ops:
+            # One line: a crash mid-write loses the whole batch, never half of it
+            self._journal_write([{'op': 'batch', 'ops': ops}])
+    
+    def rollback(self):
+        """Undo the changes made since begin(). IDs handed out are not reused."""
+        if self._undo is None:
+            raise RuntimeError("No transaction in progress")
+        undo = self._undo
+        self._undo = None
+        self._pending_ops = []
+        restored = False
+        for key, previous, seq in reversed(undo):
+            if previous is None:
+                self._remove(key)
+            elif key in self._records:
+                self._put(previous)
+            else:
+                self._put(previous, seq)
+                restored = True
+        if restored:
+            # Deleted records come back at their original position
+            self._records = dict(sorted(self._records.items(), key=lambda item: self._seq[item[0]]))
+        if undo:
+            # Persist the counter so IDs handed out are not reused after a restart
+            self._journal_write([{'op': 'meta', 'next_id': self._next_id}])
+    
+    @contextmanager
+    def transaction(self):
+        """Context manager: begin(), then commit() or rollback() on an exception."""
+        self.begin()
+        try:
+            yield self
+        except BaseException:
+            self.rollback()
+            raise
+        else:
+            self.commit()
+    
+    # =========================================================================
+    # Journal
+    # =========================================================================
+    
+    def _load_journal(self):
+        """Rebuild the records from the journal (a torn last line is ignored)."""
+        with open(self._journal_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                self._journal_lines += 1
+                try:
+                    op = json.loads(line)
+                except ValueError:
+                    continue
+                self._apply_op(op)
+    
+    def _apply_op(self, op: dict):
+        kind = op.get('op')
+        if kind == 'put':
+            self._put(op['record'])
+        elif kind == 'del':
+            self._remove(op['key'])
+        elif kind == 'batch':
+            for item in op['ops']:
+                self._apply_op(item)
+        elif kind == 'meta':
+            self._next_id = max(self._next_id, op.get('next_id', 1))
+    
+    def _journal_write(self, ops: List[dict]):
+        if not self._journal_file:
+            return
+        if self._journal is None:
+            self._journal = open(self._journal_file, 'a', encoding='utf-8')
+        # Values that JSON cannot represent (dates...) are stored as text
+        self._journal.write(''.join(json.dumps(op, default=str) + '\n' for op in ops))
+        self._journal.flush()
+        self._journal_lines += len(ops)
+        if self._journal_lines >= self.COMPACT_MIN_LINES and self._journal_lines >= 2 * len(self._records):
+            self._write_snapshot()
+    
+    def _write_snapshot(self):
+        """Rewrite the journal as the live records (temporary file + atomic replace)."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        temp_file = self._journal_file + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            # next_id keeps IDs monotonic across deletes and restarts
+            f.write(json.dumps({'op': 'meta', 'next_id': self._next_id}) + '\n')
+            for record in self._records.values():
+                f.write(json.dumps({'op': 'put', 'record': record}, default=str) + '\n')
+        os.replace(temp_file, self._journal_file)
+        self._journal_lines = len(self._records) + 1
+    
+    def compact(self):
+        """Rewrite the journal as a snapshot of the current records."""
+        if self._journal_file and self._undo is None:
+            self._write_snapshot()
+    
+    def close(self):
+        """Close the journal file (it is reopened on the next change)."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
 
 
 def create_record_backend(backend_type: str = "memory", **kwargs) -> RecordFormBackend:
@@ -54,6 +54,7 @@ from winformpy.winformpy import (
 
 # Panel and UI components
 from .web_browser_panel import WebBrowserPanel
+from .web_browser_store import BrowserDataStore
 from .web_browser_ui import WebBrowserUI, BrowserUI
 
 __all__ = [
@@ -67,6 +68,8 @@ __all__ = [
     'TKINTERWEB_AVAILABLE',
     # Panel
     'WebBrowserPanel',
+    # History & favorites
+    'BrowserDataStore',
     # Full browser app
     'WebBrowserUI',
     'BrowserUI'  # Alias
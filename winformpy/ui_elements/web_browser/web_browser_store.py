@@ -0,0 +1,395 @@
+"""
+Module: web_browser_store.py
+Description: Persistent history and favorites store for WebBrowserUI.
+
+Changes are appended to a JSON Lines log by a background writer thread,
+in batches, so a navigation never waits for the disk. The log is read
+once at start-up into in-memory indexes:
+
+- visits in chronological order (paginated history view)
+- URL -> HistoryEntry (visit count, last title/time) for "visited" checks
+- host -> URLs, and the favorites by URL
+
+When the log holds many more lines than live records, the writer thread
+compacts it: the live records are written to a temporary file that then
+atomically replaces the log.
+
+Log records (one JSON object per line):
+    {"op": "visit", "url": ..., "title": ..., "visited": ...}
+    {"op": "fav", "url": ..., "title": ..., "added": ...}
+    {"op": "unfav", "url": ...}
+    {"op": "clear_history"}
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+
+def url_key(url: str) -> str:
+    """Short form of a URL used for autocomplete: no scheme, no leading 'www.'."""
+    key = url.split('://', 1)[-1]
+    return key[4:] if key.startswith('www.') else key
+
+
+def url_host(url: str) -> str:
+    """Lower-case host of a URL ('' for file: or malformed URLs)."""
+    try:
+        host = urlsplit(url).hostname or ''
+    except ValueError:
+        return ''
+    return host[4:] if host.startswith('www.') else host
+
+
+class HistoryEntry:
+    """Aggregated visits of one URL."""
+
+    __slots__ = ('url', 'title', 'visit_count', 'last_visited')
+
+    def __init__(self, url, title, visited):
+        self.url = url
+        self.title = title
+        self.visit_count = 0
+        self.last_visited = visited
+
+
+class BrowserDataStore:
+    """
+    Append-only, indexed store of browsing history and favorites.
+
+    All methods are meant to be called from the UI thread; they only touch
+    memory and queue the change for the writer thread.
+
+    Example:
+        store = BrowserDataStore('browser_data.jsonl', legacy_file='browser_data.json')
+        store.add_visit('Python', 'https://www.python.org/')
+        store.is_visited('https://www.python.org/')     # True
+        visits, total = store.history_page(0, 20)        # newest first
+        store.close()                                    # flush pending writes
+    """
+
+    MAX_VISITS = 5000       # Visits kept; older ones are dropped
+    FLUSH_DELAY = 0.5       # Seconds the writer waits to batch more changes
+    COMPACT_MIN_LINES = 2000
+
+    _STOP = object()
+
+    def __init__(self, log_file: str, legacy_file: Optional[str] = None):
+        """
+        Load the store.
+
+        Args:
+            log_file: Path of the JSON Lines log (created on first write)
+            legacy_file: Optional browser_data.json ({'favorites', 'history'})
+                imported once when the log does not exist yet
+        """
+        self._log_file = log_file
+        self._visits: List[dict] = []
+        self._by_url: Dict[str, HistoryEntry] = {}
+        self._by_host: Dict[str, Set[str]] = {}
+        self._favorites: Dict[str, dict] = {}
+        self._log_lines = 0
+
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+
+        if os.path.exists(log_file):
+            self._load_log()
+        elif legacy_file and os.path.exists(legacy_file):
+            self._import_legacy(legacy_file)
+
+    # =========================================================================
+    # Loading
+    # =========================================================================
+
+    def _load_log(self):
+        try:
+            with open(self._log_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    self._log_lines += 1
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # Torn last line after a crash
+                    self._apply(record)
+        except OSError:
+            pass
+
+    def _import_legacy(self, legacy_file):
+        try:
+            with open(legacy_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        for fav in data.get('favorites', []):
+            if fav.get('url'):
+                self._apply({'op': 'fav', **fav})
+        for item in data.get('history', []):
+            if item.get('url'):
+                self._apply({'op': 'visit', **item})
+        # Start the log from a compacted snapshot of the imported data
+        self._write_snapshot(self._snapshot())
+
+    def _apply(self, record):
+        """Applies one log record to the in-memory indexes.
+
+        Visits are trimmed here so replaying the log on load drops exactly
+        the visits that were dropped while the store was running.
+        """
+        op = record.get('op')
+        if op == 'visit':
+            url = record['url']
+            visit = {'title': record.get('title') or url, 'url': url, 'visited': record.get('visited', '')}
+            self._visits.append(visit)
+            entry = self._by_url.get(url)
+            if entry is None:
+                entry = self._by_url[url] = HistoryEntry(url, visit['title'], visit['visited'])
+                self._by_host.setdefault(url_host(url), set()).add(url)
+            entry.visit_count += 1
+            entry.title = visit['title']
+            entry.last_visited = visit['visited']
+            self._trim_visits()
+        elif op == 'fav':
+            self._favorites[record['url']] = {
+                'title': record.get('title') or record['url'],
+                'url': record['url'],
+                'added': record.get('added', ''),
+            }
+        elif op == 'unfav':
+            self._favorites.pop(record.get('url'), None)
+        elif op == 'clear_history':
+            self._visits.clear()
+            self._by_url.clear()
+            self._by_host.clear()
+
+    def _trim_visits(self):
+        """Drops the oldest visits beyond MAX_VISITS (amortized: 10% at a time)."""
+        excess = len(self._visits) - self.MAX_VISITS
+        if excess <= 0:
+            return
+        excess = max(excess, self.MAX_VISITS // 10)
+        for visit in self._visits[:excess]:
+            entry = self._by_url.get(visit['url'])
+            if entry is not None:
+                entry.visit_count -= 1
+                if entry.visit_count <= 0:
+                    del self._by_url[visit['url']]
+                    urls = self._by_host.get(url_host(visit['url']))
+                    if urls is not None:
+                        urls.discard(visit['url'])
+                        if not urls:
+                            del self._by_host[url_host(visit['url'])]
+        del self._visits[:excess]
+
+    # =========================================================================
+    # History
+    # =========================================================================
+
+    def add_visit(self, title: str, url: str) -> bool:
+        """
+        Records a visit to url.
+
+        Returns:
+            bool: True if the URL had not been visited before
+        """
+        record = {'op': 'visit', 'url': url, 'title': title or url,
+                  'visited': datetime.now().isoformat(timespec='seconds')}
+        with self._lock:
+            is_new = url not in self._by_url
+            self._apply(record)
+            self._enqueue(record)
+        return is_new
+
+    def clear_history(self):
+        """Removes all visits."""
+        with self._lock:
+            self._apply({'op': 'clear_history'})
+            self._enqueue({'op': 'clear_history'})
+
+    def is_visited(self, url: str) -> bool:
+        """Whether url is in the history."""
+        return url in self._by_url
+
+    def get_entry(self, url: str) -> Optional[HistoryEntry]:
+        """Visit count, title and last visit of url, or None."""
+        return self._by_url.get(url)
+
+    def urls_for_host(self, host: str) -> List[str]:
+        """Visited URLs of a host ('www.' is ignored)."""
+        host = host.lower()
+        return sorted(self._by_host.get(host[4:] if host.startswith('www.') else host, ()))
+
+    def suggestion_keys(self) -> List[str]:
+        """Distinct visited and favorite URLs in autocomplete form (see url_key)."""
+        keys = {url_key(url) for url in self._by_url}
+        keys.update(url_key(url) for url in self._favorites)
+        return sorted(keys)
+
+    @property
+    def visit_count(self) -> int:
+        """Number of visits in the history."""
+        return len(self._visits)
+
+    def history_page(self, page: int, page_size: int) -> Tuple[List[dict], int]:
+        """
+        One page of visits, newest first.
+
+        Returns:
+            tuple: (visits on the page, total number of visits)
+        """
+        total = len(self._visits)
+        end = total - page * page_size
+        start = max(0, end - page_size)
+        if end <= 0:
+            return [], total
+        return [dict(visit) for visit in reversed(self._visits[start:end])], total
+
+    def visits(self) -> List[dict]:
+        """All visits, oldest first (copies)."""
+        return [dict(visit) for visit in self._visits]
+
+    # =========================================================================
+    # Favorites
+    # =========================================================================
+
+    def add_favorite(self, title: str, url: str) -> bool:
+        """
+        Adds a favorite.
+
+        Returns:
+            bool: False if url already was a favorite
+        """
+        if url in self._favorites:
+            return False
+        record = {'op': 'fav', 'url': url, 'title': title or url,
+                  'added': datetime.now().isoformat(timespec='seconds')}
+        with self._lock:
+            self._apply(record)
+            self._enqueue(record)
+        return True
+
+    def remove_favorite(self, url: str) -> bool:
+        """Removes a favorite. Returns False if url was not one."""
+        if url not in self._favorites:
+            return False
+        record = {'op': 'unfav', 'url': url}
+        with self._lock:
+            self._apply(record)
+            self._enqueue(record)
+        return True
+
+    def is_favorite(self, url: str) -> bool:
+        """Whether url is a favorite."""
+        return url in self._favorites
+
+    def favorites(self) -> List[dict]:
+        """Favorites in the order they were added (copies)."""
+        return [dict(fav) for fav in self._favorites.values()]
+
+    # =========================================================================
+    # Writer thread
+    # =========================================================================
+
+    def _enqueue(self, record):
+        """Queues a record for the writer thread (caller holds the lock)."""
+        if self._closed:
+            return
+        self._queue.put(record)
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._writer_loop, name='BrowserDataStore', daemon=True)
+            self._writer.start()
+
+    def _writer_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            # Give a burst of navigations FLUSH_DELAY to share one write
+            deadline = time.monotonic() + self.FLUSH_DELAY
+            while batch[-1] is not self._STOP:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            records = [record for record in batch if record is not self._STOP]
+            try:
+                if records:
+                    self._append(records)
+                self._compact_if_needed()
+            except OSError:
+                pass
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if batch[-1] is self._STOP:
+                return
+
+    def _append(self, records):
+        lines = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records)
+        with open(self._log_file, 'a+b') as f:
+            # After a crash the log may end in a torn line: start a new one
+            # so the first record is not glued to it and lost on load
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    lines = '\n' + lines
+            f.write(lines.encode('utf-8'))
+        self._log_lines += len(records)
+
+    def _snapshot(self):
+        """Live records (caller holds the lock or owns the store).
+
+        Visit and favorite dicts are never mutated once stored, so copying
+        the containers is enough; serializing happens outside the lock.
+        """
+        return list(self._favorites.values()), list(self._visits)
+
+    def _compact_if_needed(self):
+        live = len(self._favorites) + len(self._visits)
+        if self._log_lines < self.COMPACT_MIN_LINES or self._log_lines < 2 * live:
+            return
+        with self._lock:
+            # Queued records are not in the log yet and are not part of a
+            # snapshot taken now either; compact once they are written
+            if not self._queue.empty():
+                return
+            snapshot = self._snapshot()
+        self._write_snapshot(snapshot)
+
+    def _write_snapshot(self, snapshot):
+        favorites, visits = snapshot
+        temp_file = self._log_file + '.tmp'
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                for fav in favorites:
+                    f.write(json.dumps({'op': 'fav', **fav}, ensure_ascii=False) + '\n')
+                for visit in visits:
+                    f.write(json.dumps({'op': 'visit', **visit}, ensure_ascii=False) + '\n')
+            os.replace(temp_file, self._log_file)
+            self._log_lines = len(favorites) + len(visits)
+        except OSError:
+            pass
+
+    def flush(self):
+        """Blocks until every queued change is on disk."""
+        self._queue.join()
+
+    def close(self):
+        """Writes pending changes and stops the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            writer = self._writer
+            if writer is not None:
+                self._queue.put(self._STOP)
+        if writer is not None:
+            writer.join(timeout=5)
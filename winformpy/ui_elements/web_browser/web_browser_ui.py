@@ -19,8 +19,6 @@ Requires: tkinterweb (pip install tkinterweb)
 
 import sys
 import os
-import json
-from datetime import datetime
 
 # Add project root to path for direct execution
 _current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -29,15 +27,17 @@ if _project_root not in sys.path:
     sys.path.insert(0, _project_root)
 
 from winformpy.winformpy import (
-    Form, Panel, Button, Label, TextBox, ProgressBar,
+    Form, Panel, Button, Label, TextBox, ProgressBar, PictureBox, PictureBoxSizeMode,
     MenuStrip, ToolStripMenuItem,
     TabControl, TabPage,
     DockStyle, AnchorStyles, FlatStyle, Font, FontStyle,
     MessageBox, DialogResult, OpenFileDialog,
     Application, InputBox, Clipboard,
+    AutoCompleteMode, AutoCompleteSource, AutoCompleteStringCollection,
     TKINTERWEB_AVAILABLE, _ensure_tkinterweb
 )
 from winformpy.ui_elements.web_browser.web_browser_panel import WebBrowserPanel
+from winformpy.ui_elements.web_browser.web_browser_store import BrowserDataStore, url_key
 
 
 class WebBrowserUI(Form):
@@ -72,6 +72,14 @@ class WebBrowserUI(Form):
     # Default settings
     DEFAULT_HOME = "https://www.google.com"
     DEFAULT_SEARCH = "https://www.google.com/search?q="
+    HISTORY_PAGE_SIZE = 15  # History sidebar entries per page
+    
+    # Tab hibernation: inactive tabs beyond these limits are discarded (LRU)
+    MAX_LIVE_TABS = 8            # Live (rendered) tabs, including the current one
+    TAB_MEMORY_BUDGET_MB = 600   # Estimated memory of all live tabs
+    TAB_BASE_MB = 25             # Estimated cost of an HtmlFrame with a small page
+    TAB_MB_PER_1000_NODES = 2    # Estimated cost of the document tree
+    SCREENSHOT_WIDTH = 480       # Width of the optional discard screenshot
     
     def __init__(self, props=None):
         """Initialize the WebBrowserUI."""
@@ -93,12 +101,16 @@ class WebBrowserUI(Form):
         
         super().__init__(default_props)
         
-        # Data storage
-        self._favorites = []
-        self._history = []
+        # Data storage (favorites and history live in self._store)
+        self._store = None
+        self._history_page = 0
         self._downloads = []
         self._tabs = []
         self._current_tab_index = -1
+        self._tab_clock = 0
+        self._max_live_tabs = self.MAX_LIVE_TABS
+        self._tab_memory_budget_mb = self.TAB_MEMORY_BUDGET_MB
+        self._tab_screenshots = False
         self._sidebar_visible = False
         self._sidebar_panel = None
         
@@ -117,6 +129,9 @@ class WebBrowserUI(Form):
         # Bind keyboard shortcuts
         self._bind_shortcuts()
         
+        # Write pending history/favorites before the process can exit
+        self.FormClosed = lambda s, e: self._store.close()
+        
         # Open initial tab
         self.NewTab(self.DEFAULT_HOME)
     
@@ -327,6 +342,12 @@ class WebBrowserUI(Form):
         # Bind Enter key for navigation using WinFormPy method
         self._txt_url.BindKey('Return', lambda s, e: self._navigate_from_url_bar())
         
+        # Suggestions from visited and favorite URLs
+        self._url_suggestions = AutoCompleteStringCollection(self._store.suggestion_keys())
+        self._txt_url.AutoCompleteCustomSource = self._url_suggestions
+        self._txt_url.AutoCompleteSource = AutoCompleteSource.CustomSource
+        self._txt_url.AutoCompleteMode = AutoCompleteMode.SuggestAppend
+        
         # Go button
         self._btn_go = Button(self._nav_bar, {
             'Text': 'Go',
@@ -700,29 +721,22 @@ class WebBrowserUI(Form):
             'Padding': (0, 0, 0, 0)
         })
         
-        # Create browser panel inside the TabPage
-        # ShowNavigationBar: False - each tab only shows the web content
-        # Navigation is handled by the main browser toolbar
-        browser = WebBrowserPanel(tab_page, {
-            'Dock': DockStyle.Fill,
-            'ShowNavigationBar': False,
-            'ShowStatusBar': False
-        })
-        
-        # Wire events
-        browser.DocumentTitleChanged = lambda s, e: self._on_tab_title_changed(browser)
-        browser.Navigated = lambda s, e: self._on_tab_navigated(browser, e)
-        browser.Navigating = lambda s, e: self._on_tab_navigating(browser, e)
-        browser.DocumentCompleted = lambda s, e: self._on_document_completed(browser, e)
+        browser = self._create_tab_browser(tab_page)
         
         # Add to tabs list
         tab_index = len(self._tabs)
-        self._tabs.append({
+        tab = {
             'browser': browser,
             'tab_page': tab_page,
             'title': 'New Tab',
-            'url': url
-        })
+            'url': url,
+            'memory_mb': self.TAB_BASE_MB,
+            'last_active': 0,
+            'snapshot': None,      # Set while the tab is discarded
+            'placeholder': None
+        }
+        self._tabs.append(tab)
+        self._touch_tab(tab)
         
         # Switch to new tab
         self._current_tab_index = tab_index
@@ -734,6 +748,24 @@ class WebBrowserUI(Form):
         # Navigate
         browser.Navigate(url)
         
+        self._enforce_tab_budget()
+        return browser
+    
+    def _create_tab_browser(self, tab_page):
+        """Create the browser panel of a tab and wire its events."""
+        # ShowNavigationBar: False - each tab only shows the web content
+        # Navigation is handled by the main browser toolbar
+        browser = WebBrowserPanel(tab_page, {
+            'Dock': DockStyle.Fill,
+            'ShowNavigationBar': False,
+            'ShowStatusBar': False
+        })
+        
+        # Wire events
+        browser.DocumentTitleChanged = lambda s, e: self._on_tab_title_changed(browser)
+        browser.Navigated = lambda s, e: self._on_tab_navigated(browser, e)
+        browser.Navigating = lambda s, e: self._on_tab_navigating(browser, e)
+        browser.DocumentCompleted = lambda s, e: self._on_document_completed(browser, e)
         return browser
     
     def _on_tab_selected_changed(self):
@@ -742,6 +774,12 @@ class WebBrowserUI(Form):
         if new_index >= 0 and new_index < len(self._tabs):
             self._current_tab_index = new_index
             tab = self._tabs[new_index]
+            self._touch_tab(tab)
+            if tab['snapshot'] is not None:
+                # Let the placeholder paint, then rebuild the page
+                self._tab_control._tk_widget.after(50, lambda: self._restore_tab(tab))
+            else:
+                self._enforce_tab_budget()
             self.Text = f"{tab['title']} - WinFormPy Browser"
             self._update_tab_info()
             # Update URL bar with current tab's URL
@@ -767,8 +805,7 @@ class WebBrowserUI(Form):
         tab = self._tabs[index]
         
         # Remove browser
-        if tab['browser'] and hasattr(tab['browser'], '_tk_widget'):
-            tab['browser']._tk_widget.destroy()
+        self._destroy_tab_browser(tab)
         
         # Remove TabPage from TabControl
         if tab['tab_page'] and hasattr(self._tab_control, 'RemoveTab'):
@@ -813,6 +850,185 @@ class WebBrowserUI(Form):
             return self._tabs[self._current_tab_index]['browser']
         return None
     
+    # ========== Tab Hibernation ==========
+    
+    @property
+    def MaxLiveTabs(self):
+        """Maximum number of tabs kept rendered; older inactive tabs are discarded."""
+        return self._max_live_tabs
+    
+    @MaxLiveTabs.setter
+    def MaxLiveTabs(self, value):
+        self._max_live_tabs = max(1, int(value))
+        self._enforce_tab_budget()
+    
+    @property
+    def TabMemoryBudgetMB(self):
+        """Estimated memory (MB) all live tabs may use before the least recently used are discarded."""
+        return self._tab_memory_budget_mb
+    
+    @TabMemoryBudgetMB.setter
+    def TabMemoryBudgetMB(self, value):
+        self._tab_memory_budget_mb = value
+        self._enforce_tab_budget()
+    
+    @property
+    def TabScreenshots(self):
+        """Whether discarded tabs keep a screenshot shown until the page is reloaded (needs Pillow)."""
+        return self._tab_screenshots
+    
+    @TabScreenshots.setter
+    def TabScreenshots(self, value):
+        self._tab_screenshots = bool(value)
+    
+    @property
+    def LiveTabMemoryMB(self):
+        """Estimated memory (MB) of all live tabs."""
+        return sum(tab['memory_mb'] for tab in self._tabs if tab['snapshot'] is None)
+    
+    def GetTabMemoryEstimate(self, index):
+        """Estimated memory (MB) of a tab; 0 when it is discarded."""
+        tab = self._tabs[index]
+        return 0 if tab['snapshot'] is not None else tab['memory_mb']
+    
+    def IsTabDiscarded(self, index):
+        """Whether the tab at index is discarded (restored when selected)."""
+        return self._tabs[index]['snapshot'] is not None
+    
+    def DiscardTab(self, index):
+        """
+        Tear down an inactive tab to a snapshot (URL, title, scroll position,
+        navigation history and optional screenshot).
+        
+        Returns:
+            bool: False for the current tab or a tab already discarded
+        """
+        if index == self._current_tab_index or not 0 <= index < len(self._tabs):
+            return False
+        tab = self._tabs[index]
+        if tab['snapshot'] is not None:
+            return False
+        
+        web = tab['browser'].Browser
+        tab['snapshot'] = {
+            'url': tab.get('url') or web.Url,
+            'title': tab['title'],
+            'scroll': self._get_scroll_position(web),
+            'history': list(web._history),
+            'history_index': web._history_index,
+            'screenshot': self._take_screenshot(web) if self._tab_screenshots else None
+        }
+        self._destroy_tab_browser(tab)
+        tab['browser'] = None
+        tab['placeholder'] = self._create_tab_placeholder(tab)
+        return True
+    
+    def _touch_tab(self, tab):
+        """Mark a tab as the most recently used."""
+        self._tab_clock += 1
+        tab['last_active'] = self._tab_clock
+    
+    def _enforce_tab_budget(self):
+        """Discard least recently used inactive tabs until the live tabs fit the budget."""
+        current = self._tabs[self._current_tab_index] if 0 <= self._current_tab_index < len(self._tabs) else None
+        live = [tab for tab in self._tabs if tab['snapshot'] is None]
+        memory = sum(tab['memory_mb'] for tab in live)
+        candidates = sorted((tab for tab in live if tab is not current), key=lambda tab: tab['last_active'])
+        for tab in candidates:
+            if len(live) <= self._max_live_tabs and memory <= self._tab_memory_budget_mb:
+                break
+            if self.DiscardTab(self._tabs.index(tab)):
+                live.remove(tab)
+                memory -= tab['memory_mb']
+    
+    def _restore_tab(self, tab):
+        """Rebuild a discarded tab from its snapshot."""
+        if tab not in self._tabs or tab['snapshot'] is None:
+            return
+        snapshot = tab['snapshot']
+        if tab['placeholder'] is not None:
+            tab['tab_page'].RemoveControl(tab['placeholder'])
+            tab['placeholder']._tk_widget.destroy()
+            tab['placeholder'] = None
+        
+        browser = self._create_tab_browser(tab['tab_page'])
+        tab['browser'] = browser
+        tab['snapshot'] = None
+        tab['memory_mb'] = self.TAB_BASE_MB
+        
+        # Reload without adding a history entry; keep Back/Forward working
+        web = browser.Browser
+        web._history = snapshot['history']
+        web._history_index = snapshot['history_index']
+        tab['restoring'] = True
+        web._navigating_internally = True
+        try:
+            web.Navigate(snapshot['url'])
+        finally:
+            web._navigating_internally = False
+            tab['restoring'] = False
+        web._update_can_go_back_forward()
+        tab['restore_scroll'] = snapshot['scroll']
+        
+        self._enforce_tab_budget()
+    
+    def _destroy_tab_browser(self, tab):
+        """Destroy the browser panel of a tab (the TabPage is kept)."""
+        browser = tab['browser']
+        if not browser or not hasattr(browser, '_tk_widget'):
+            return
+        if tab['tab_page']:
+            tab['tab_page'].RemoveControl(browser)
+        browser._tk_widget.destroy()
+        # Stops the WebBrowser title polling loop
+        browser.Browser._html_frame = None
+    
+    def _create_tab_placeholder(self, tab):
+        """Lightweight content shown in a discarded tab until it is restored."""
+        snapshot = tab['snapshot']
+        placeholder = Panel(tab['tab_page'], {'Dock': DockStyle.Fill, 'BackColor': '#FFFFFF'})
+        Label(placeholder, {
+            'Text': f"{snapshot['title']}\n{snapshot['url']}",
+            'Dock': DockStyle.Top,
+            'Height': 48,
+            'TextAlign': 'MiddleCenter'
+        })
+        if snapshot['screenshot'] is not None:
+            try:
+                from PIL import ImageTk
+                PictureBox(placeholder, {
+                    'Image': ImageTk.PhotoImage(snapshot['screenshot']),
+                    'Dock': DockStyle.Fill,
+                    'SizeMode': PictureBoxSizeMode.CenterImage
+                })
+            except Exception:
+                pass
+        return placeholder
+    
+    def _get_scroll_position(self, web):
+        """Vertical scroll fraction of a WebBrowser (0.0 at the top)."""
+        try:
+            return float(web.HtmlFrame.html.yview()[0])
+        except Exception:
+            return 0.0
+    
+    def _take_screenshot(self, web):
+        """Thumbnail of the visible page (PIL image), or None if unsupported."""
+        try:
+            image = web.HtmlFrame.screenshot_page(full=False)
+            image.thumbnail((self.SCREENSHOT_WIDTH, self.SCREENSHOT_WIDTH * 4))
+            return image
+        except Exception:
+            return None
+    
+    def _measure_tab(self, tab):
+        """Update the memory estimate of a live tab from its document size."""
+        try:
+            nodes = len(tab['browser'].Browser.HtmlFrame.html.search('*'))
+        except Exception:
+            nodes = 0
+        tab['memory_mb'] = self.TAB_BASE_MB + nodes * self.TAB_MB_PER_1000_NODES / 1000
+    
     # ========== Tab Events ==========
     
     def _on_tab_title_changed(self, browser):
@@ -826,8 +1042,21 @@ class WebBrowserUI(Form):
                     tab['tab_page'].Text = display_title
                 if i == self._current_tab_index:
                     self.Text = f"{title} - WinFormPy Browser"
+                # The title arrives once the document is parsed
+                self._measure_tab(tab)
+                scroll = tab.pop('restore_scroll', None)
+                if scroll:
+                    browser._tk_widget.after(100, lambda: self._restore_scroll(browser, scroll))
+                self._enforce_tab_budget()
                 break
     
+    def _restore_scroll(self, browser, scroll):
+        """Scroll a restored tab back to where it was discarded."""
+        try:
+            browser.Browser.HtmlFrame.html.yview_moveto(scroll)
+        except Exception:
+            pass
+    
     def _on_tab_navigated(self, browser, e):
         """Handle navigation completed."""
         url = e.Url if hasattr(e, 'Url') else str(e)
@@ -840,8 +1069,9 @@ class WebBrowserUI(Form):
                     self._update_url_bar(url)
                 break
         
-        # Add to history
-        self._add_to_history(browser.DocumentTitle or url, url)
+        # Add to history (not when a discarded tab reloads its page)
+        if not any(tab['browser'] is browser and tab.get('restoring') for tab in self._tabs):
+            self._add_to_history(browser.DocumentTitle or url, url)
         
         # Update status
         self._status_label.Text = f'Done - {url}'
@@ -937,6 +1167,7 @@ class WebBrowserUI(Form):
         if self._sidebar_visible and self._sidebar_panel == 'history':
             self.HideSidebar()
         else:
+            self._history_page = 0
             self.ShowSidebar('history')
     
     def _show_downloads_sidebar(self):
@@ -948,8 +1179,9 @@ class WebBrowserUI(Form):
     
     def _populate_favorites_sidebar(self):
         """Populate favorites in sidebar."""
+        favorites = self._store.favorites()
         y = 5
-        for fav in self._favorites:
+        for fav in favorites:
             btn = Button(self._sidebar_content, {
                 'Text': fav.get('title', fav.get('url', ''))[:30],
                 'Left': 5,
@@ -963,7 +1195,7 @@ class WebBrowserUI(Form):
             btn.Click = lambda s, e, u=url: self.Navigate(u)
             y += 32
         
-        if not self._favorites:
+        if not favorites:
             Label(self._sidebar_content, {
                 'Text': 'No favorites yet.\nPress Ctrl+D to add.',
                 'Left': 10,
@@ -973,9 +1205,14 @@ class WebBrowserUI(Form):
             })
     
     def _populate_history_sidebar(self):
-        """Populate history in sidebar."""
+        """Populate one page of history (newest first) in sidebar."""
+        visits, total = self._store.history_page(self._history_page, self.HISTORY_PAGE_SIZE)
+        if not visits and self._history_page > 0:
+            self._history_page = 0
+            visits, total = self._store.history_page(0, self.HISTORY_PAGE_SIZE)
+        
         y = 5
-        for item in reversed(self._history[-50:]):  # Last 50 items
+        for item in visits:
             title = item.get('title', item.get('url', ''))[:30]
             btn = Button(self._sidebar_content, {
                 'Text': title,
@@ -989,11 +1226,8 @@ class WebBrowserUI(Form):
             url = item.get('url', '')
             btn.Click = lambda s, e, u=url: self.Navigate(u)
             y += 32
-            
-            if y > 500:  # Limit visible items
-                break
         
-        if not self._history:
+        if not total:
             Label(self._sidebar_content, {
                 'Text': 'No browsing history.',
                 'Left': 10,
@@ -1001,6 +1235,45 @@ class WebBrowserUI(Form):
                 'Width': 220,
                 'Height': 30
             })
+            return
+        
+        # Pager: newer / older pages
+        first = self._history_page * self.HISTORY_PAGE_SIZE + 1
+        last = first + len(visits) - 1
+        btn_newer = Button(self._sidebar_content, {
+            'Text': '<',
+            'Left': 5,
+            'Top': y + 5,
+            'Width': 30,
+            'Height': 26,
+            'FlatStyle': FlatStyle.Flat,
+            'Enabled': self._history_page > 0
+        })
+        btn_newer.Click = lambda s, e: self._show_history_page(self._history_page - 1)
+        Label(self._sidebar_content, {
+            'Text': f'{first}-{last} of {total}',
+            'Left': 40,
+            'Top': y + 10,
+            'Width': 160,
+            'Height': 20,
+            'TextAlign': 'MiddleCenter'
+        })
+        btn_older = Button(self._sidebar_content, {
+            'Text': '>',
+            'Left': 205,
+            'Top': y + 5,
+            'Width': 30,
+            'Height': 26,
+            'FlatStyle': FlatStyle.Flat,
+            'Enabled': last < total
+        })
+        btn_older.Click = lambda s, e: self._show_history_page(self._history_page + 1)
+    
+    def _show_history_page(self, page):
+        """Show another page of the history sidebar."""
+        self._history_page = max(0, page)
+        self._sidebar_content.ClearChildren()
+        self._populate_history_sidebar()
     
     def _populate_downloads_sidebar(self):
         """Populate downloads in sidebar."""
@@ -1018,17 +1291,14 @@ class WebBrowserUI(Form):
     @property
     def Favorites(self):
         """Get favorites list."""
-        return self._favorites.copy()
+        return self._store.favorites()
     
     def AddFavorite(self, title, url):
         """Add a favorite."""
-        self._favorites.append({
-            'title': title,
-            'url': url,
-            'added': datetime.now().isoformat()
-        })
-        self._save_data()
-        self._update_favorites_menu()
+        if self._store.add_favorite(title, url):
+            if not self._store.is_visited(url):
+                self._url_suggestions.Add(url_key(url))
+            self._update_favorites_menu()
     
     def _add_current_to_favorites(self):
         """Add current page to favorites."""
@@ -1037,14 +1307,13 @@ class WebBrowserUI(Form):
             url = self.CurrentTab.Url or ''
             
             # Check if already in favorites
-            for fav in self._favorites:
-                if fav.get('url') == url:
-                    MessageBox.Show(
-                        'This page is already in your favorites.',
-                        'Favorites',
-                        'OK'
-                    )
-                    return
+            if self._store.is_favorite(url):
+                MessageBox.Show(
+                    'This page is already in your favorites.',
+                    'Favorites',
+                    'OK'
+                )
+                return
             
             self.AddFavorite(title, url)
             self._status_label.Text = f'Added to favorites: {title}'
@@ -1062,21 +1331,19 @@ class WebBrowserUI(Form):
     
     @property
     def History(self):
-        """Get history list."""
-        return self._history.copy()
+        """Get history list (oldest first)."""
+        return self._store.visits()
+    
+    def IsVisited(self, url):
+        """Whether url is in the browsing history."""
+        return self._store.is_visited(url)
     
     def _add_to_history(self, title, url):
         """Add entry to history."""
         if url and not url.startswith('about:'):
-            self._history.append({
-                'title': title,
-                'url': url,
-                'visited': datetime.now().isoformat()
-            })
-            # Keep only last 1000 entries
-            if len(self._history) > 1000:
-                self._history = self._history[-1000:]
-            self._save_data()
+            # Memory only; the store writes to disk on its own thread
+            if self._store.add_visit(title, url) and not self._store.is_favorite(url):
+                self._url_suggestions.Add(url_key(url))
     
     def _clear_history(self):
         """Clear browsing history."""
@@ -1086,39 +1353,26 @@ class WebBrowserUI(Form):
             'YesNo'
         )
         if result == DialogResult.Yes:
-            self._history.clear()
-            self._save_data()
+            self._store.clear_history()
+            self._url_suggestions.Clear()
+            self._url_suggestions.AddRange(self._store.suggestion_keys())
+            if self._sidebar_visible and self._sidebar_panel == 'history':
+                self.ShowSidebar('history')
             self._status_label.Text = 'History cleared'
     
     # ========== Data Persistence ==========
     
     def _get_data_file(self):
-        """Get path to data file."""
-        return os.path.join(_current_dir, 'browser_data.json')
+        """Get path to data file (append-only JSON Lines log)."""
+        return os.path.join(_current_dir, 'browser_data.jsonl')
     
     def _load_data(self):
         """Load saved favorites and history."""
-        try:
-            data_file = self._get_data_file()
-            if os.path.exists(data_file):
-                with open(data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self._favorites = data.get('favorites', [])
-                    self._history = data.get('history', [])
-        except Exception:
-            pass
-    
-    def _save_data(self):
-        """Save favorites and history."""
-        try:
-            data = {
-                'favorites': self._favorites,
-                'history': self._history
-            }
-            with open(self._get_data_file(), 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-        except Exception:
-            pass
+        # browser_data.json is the format used before the log; imported once
+        self._store = BrowserDataStore(
+            self._get_data_file(),
+            legacy_file=os.path.join(_current_dir, 'browser_data.json')
+        )
     
     # ========== File Operations ==========
     
@@ -21,6 +21,11 @@ import tkinter.ttk as ttk
 import tkinter.font as tkfont
 import tkinter.font as tkfont
 import os
+import time
+import weakref
+import bisect
+import itertools
+from collections import OrderedDict, deque
 from enum import Enum, IntFlag, IntEnum
 from datetime import datetime, date
 try:
@@ -29,11 +34,24 @@ except ImportError:
     winsound = None
 from datetime import date, datetime
 import sys
-import subprocess
 import importlib
 from typing import List, Tuple, Optional, Union, Literal
 
 
+# Printing lives in winformpy/printing.py and is imported the first time one
+# of its names is looked up here (PEP 562), keeping it off the startup path.
+_PRINTING_EXPORTS = frozenset(('PageSettings', 'PrintedPage', 'PrintDocument',
+                               'DataGridViewPrinter', 'RichTextBoxPrinter'))
+
+
+def __getattr__(name):
+    if name in _PRINTING_EXPORTS:
+        value = getattr(importlib.import_module('.printing', __package__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class EventArgs:
     """
     Provides data for events in the winformpy library, matching the .NET pattern.
@@ -90,18 +108,55 @@ class PaintEventArgs(EventArgs):
         self.ClipRectangle = clip_rectangle
 
 
- # Import winformpy_tools utilities
-try:
-    from .winformpy_tools import css_to_tkinter_config, apply_css_to_widget
-except ImportError:
+class RetrieveVirtualItemEventArgs(EventArgs):
+    """Event data for ListView.RetrieveVirtualItem: set Item for ItemIndex."""
+    def __init__(self, item_index):
+        super().__init__()
+        self.ItemIndex = item_index
+        self.Item = None
+
+
+class CacheVirtualItemsEventArgs(EventArgs):
+    """Event data for ListView.CacheVirtualItems (inclusive index range about to be shown)."""
+    def __init__(self, start_index, end_index):
+        super().__init__()
+        self.StartIndex = start_index
+        self.EndIndex = end_index
+
+
+class PrintPageEventArgs(EventArgs):
+    """Event data for PrintDocument.PrintPage: draw one page, set HasMorePages."""
+    def __init__(self, graphics, margin_bounds, page_bounds, page_settings):
+        super().__init__()
+        self.Graphics = graphics
+        self.MarginBounds = margin_bounds
+        self.PageBounds = page_bounds
+        self.PageSettings = page_settings
+        self.HasMorePages = False
+
+
+# winformpy_tools utilities: only imported the first time a control applies
+# CSS, so plain `from winformpy import Form` does not pay for it.
+def _load_winformpy_tools():
     try:
-        from winformpy_tools import css_to_tkinter_config, apply_css_to_widget
+        from . import winformpy_tools
     except ImportError:
-        # Fallback if import fails
-        def css_to_tkinter_config(css_string, current_widget=None):
-            return {}
-        def apply_css_to_widget(widget, css_string):
-            pass
+        try:
+            import winformpy_tools
+        except ImportError:
+            return None
+    return winformpy_tools
+
+
+def css_to_tkinter_config(css_string, current_widget=None):
+    tools = _load_winformpy_tools()
+    return tools.css_to_tkinter_config(css_string, current_widget) if tools else {}
+
+
+def apply_css_to_widget(widget, css_string):
+    tools = _load_winformpy_tools()
+    if tools:
+        tools.apply_css_to_widget(widget, css_string)
 
 import warnings
 
@@ -168,6 +223,7 @@ def install_library(library_name: str, import_name: str = None) -> bool:
         __import__(check_name)
         return True
     except ImportError:
+        import subprocess
         print(f"Installing '{library_name}'...")
         try:
             if _is_uv_managed_environment():
@@ -1152,6 +1208,95 @@ class Color:
         return 255  # Default opaque
 
 
+class _SharedTkFont(tkfont.Font):
+    """A tkfont.Font shared by every Font with the same attributes.
+
+    Read-only (configure() with options raises) and memoizes measure() and
+    metrics(), which autosize and text wrapping call with the same arguments
+    over and over.
+    """
+
+    MaxMeasureEntries = 4096
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._measure_cache = {}
+        self._metrics_cache = {}
+
+    def measure(self, text, displayof=None):
+        if displayof is not None:
+            return super().measure(text, displayof)
+        width = self._measure_cache.get(text)
+        if width is None:
+            if len(self._measure_cache) >= self.MaxMeasureEntries:
+                self._measure_cache.clear()
+            width = self._measure_cache[text] = super().measure(text)
+        return width
+
+    def metrics(self, *options, **kw):
+        if kw:
+            return super().metrics(*options, **kw)
+        if options not in self._metrics_cache:
+            self._metrics_cache[options] = super().metrics(*options)
+        return self._metrics_cache[options]
+
+    def configure(self, **options):
+        if options:
+            raise TypeError(f"Font {self.name} is shared and read-only; "
+                            "create a Font with the new attributes instead")
+        return super().configure()
+
+    config = configure
+
+
+class _FontCache:
+    """Process-wide flyweight cache of Tk fonts.
+
+    Keyed by (family, size, weight, slant, underline, overstrike). Values are
+    held weakly, so the Tcl font is deleted once no Font uses it any more.
+    """
+
+    _fonts = weakref.WeakValueDictionary()
+
+    @classmethod
+    def get(cls, family, size, weight='normal', slant='roman',
+            underline=False, overstrike=False):
+        """Returns the shared _SharedTkFont for these attributes."""
+        key = (family, size, weight, slant, bool(underline), bool(overstrike))
+        tk_font = cls._fonts.get(key)
+        root = getattr(tk, '_default_root', None)
+        # A font created under a previous (destroyed) root is not reusable
+        if tk_font is None or root is None or tk_font._tk is not root.tk:
+            tk_font = _SharedTkFont(family=family, size=size, weight=weight,
+                                    slant=slant, underline=bool(underline),
+                                    overstrike=bool(overstrike))
+            cls._fonts[key] = tk_font
+        return tk_font
+
+    @classmethod
+    def resolve(cls, font_value):
+        """Returns a tkfont.Font for a Font, a (family, size[, style]) tuple or a font name.
+
+        Font objects and tuples map to shared fonts; anything else falls back
+        to a new tkfont.Font.
+        """
+        if isinstance(font_value, Font):
+            return font_value.ToTkFont()
+        if isinstance(font_value, tuple) and len(font_value) >= 2:
+            tokens = ' '.join(str(t) for t in font_value[2:]).lower().split()
+            return cls.get(font_value[0], font_value[1],
+                           weight='bold' if 'bold' in tokens else 'normal',
+                           slant='italic' if 'italic' in tokens else 'roman',
+                           underline='underline' in tokens,
+                           overstrike='overstrike' in tokens)
+        return tkfont.Font(font=font_value)
+
+    @classmethod
+    def clear(cls):
+        """Forgets all cached fonts (fonts still in use stay alive)."""
+        cls._fonts.clear()
+
+
 class Font:
     """Represents a font for text rendering.
     
@@ -1162,6 +1307,10 @@ class Font:
         font2 = Font("Segoe UI", 10, FontStyle.Bold)
         font3 = Font("Consolas", 9, FontStyle.Bold | FontStyle.Italic)
         font4 = Font.FromSystemFont()
+
+    Fonts with the same family, size and style share one Tk font (see
+    _FontCache), so creating many identical Font objects is cheap. Changing
+    Name/Size/Style switches this Font to another shared Tk font.
     """
     
     def __init__(self, family=None, size=None, style=None):
@@ -1190,7 +1339,7 @@ class Font:
         self._create_tk_font()
     
     def _create_tk_font(self):
-        """Create the underlying Tkinter font."""
+        """Look up the shared Tkinter font for the current attributes."""
         # Handle both FontStyle enum and string values
         if isinstance(self._style, str):
             weight = "bold" if self._style.lower() == "bold" else "normal"
@@ -1203,9 +1352,9 @@ class Font:
             underline = bool(self._style & FontStyle.Underline)
             overstrike = bool(self._style & FontStyle.Strikeout)
         
-        self._tk_font = tkfont.Font(
-            family=self._family,
-            size=self._size,
+        self._tk_font = _FontCache.get(
+            self._family,
+            self._size,
             weight=weight,
             slant=slant,
             underline=underline,
@@ -1410,13 +1559,265 @@ class Rectangle:
     def __str__(self):
         return f"{{X={self.X},Y={self.Y},Width={self.Width},Height={self.Height}}}"
 
+    def IntersectsWith(self, rect):
+        """True if this rectangle and rect overlap."""
+        return (self.X < rect.X + rect.Width and rect.X < self.X + self.Width and
+                self.Y < rect.Y + rect.Height and rect.Y < self.Y + self.Height)
+
+    @staticmethod
+    def Union(a, b):
+        """Smallest rectangle containing both a and b."""
+        left, top = min(a.X, b.X), min(a.Y, b.Y)
+        right, bottom = max(a.Right, b.Right), max(a.Bottom, b.Bottom)
+        return Rectangle(left, top, right - left, bottom - top)
+
+
+# =============================================================================
+# Retained-mode drawing (Paint / Graphics)
+# =============================================================================
+
+class Pen:
+    """Color, width and dash pattern used by Graphics.Draw* methods.
+
+    Usage: pen = Pen(Color.Red, 2); pen.DashPattern = (4, 2)
+    """
+
+    def __init__(self, color="#000000", width=1):
+        self.Color = color
+        self.Width = width
+        self.DashPattern = None  # e.g. (4, 2): 4 px dash, 2 px gap
+
+
+class SolidBrush:
+    """Fill color used by Graphics.Fill* and DrawString."""
+
+    def __init__(self, color="#000000"):
+        self.Color = color
+
+
+def _points_to_coords(points):
+    """Flattens [(x, y), Point, ...] into (x1, y1, x2, y2, ...)."""
+    coords = []
+    for point in points:
+        if isinstance(point, Point):
+            coords += (point.X, point.Y)
+        else:
+            coords += (point[0], point[1])
+    return tuple(coords)
+
+
+def _rect_coords(args):
+    """(x, y, w, h) or (Rectangle,) -> canvas corner coords (x1, y1, x2, y2)."""
+    if len(args) == 1:
+        rect = args[0]
+        return (rect.X, rect.Y, rect.X + rect.Width, rect.Y + rect.Height)
+    x, y, width, height = args
+    return (x, y, x + width, y + height)
+
+
+class Graphics:
+    """
+    System.Drawing-style drawing surface over a tk.Canvas, in retained mode.
+
+    Inside a Paint handler every call records a draw command instead of
+    creating a canvas item. When the handler returns, the recorded frame is
+    diffed against the previous one, position by position: unchanged
+    commands cost nothing, changed ones update their existing canvas item
+    (coords / itemconfigure) and only surplus or different-kind items are
+    created or deleted. A 30 fps chart that moves its polyline therefore
+    issues one ``coords`` call per frame instead of deleting and recreating
+    every item.
+
+    During a clipped paint (``Invalidate(rect)``) only the part of the frame
+    touching ClipBounds is diffed: items lying completely outside it are kept
+    as they are, so a handler may skip those shapes with ``IsVisible``.
+
+    Usage (inside a Paint handler):
+        def on_paint(sender, e):
+            g = e.Graphics
+            g.FillRectangle(SolidBrush(Color.White), e.ClipRectangle)
+            g.DrawLines(Pen(Color.Blue, 2), samples)
+            g.DrawString("CPU", Font('Segoe UI', 9), SolidBrush(Color.Black), 4, 4)
+    """
+
+    def __init__(self, canvas):
+        self._canvas = canvas
+        # Previous frame: [kind, coords, options, item id, bbox, ref]; ref
+        # keeps the font / image a canvas item only names alive
+        self._items = []
+        self._commands = None
+        self._clip = None
+        self._default_font = None
+
+    # -- Frame lifecycle (driven by ControlBase painting) ----------------
+
+    def _begin_paint(self, clip=None):
+        self._commands = []
+        self._clip = clip
+
+    def _abandon_paint(self):
+        """Drops a half-recorded frame (the Paint handler raised)."""
+        self._commands = None
+
+    def _end_paint(self):
+        """Applies the recorded frame to the canvas."""
+        commands, self._commands = self._commands, None
+        if commands is None:
+            return
+        clip = self._clip
+        old = self._items
+        if clip is not None:
+            # Only the invalidated region is repainted: items entirely outside
+            # it are neither reused nor deleted (the handler may have skipped
+            # their shapes with IsVisible), and commands outside it are ignored
+            commands = [command for command in commands if self._bbox_in_clip(command[3], clip)]
+        pending = iter(commands)
+        new = []
+        for prev in old:
+            if clip is not None and not self._bbox_in_clip(prev[4], clip):
+                new.append(prev)
+                continue
+            command = next(pending, None)
+            if command is None:
+                self._canvas.delete(prev[3])
+            else:
+                new.append(self._apply_command(command, prev, new))
+        for command in pending:
+            new.append(self._apply_command(command, None, new))
+        self._items = new
+
+    def _apply_command(self, command, prev, new):
+        """Draws command by reusing prev's canvas item when possible."""
+        canvas = self._canvas
+        kind, coords, options, bbox, ref = command
+        if prev is None:
+            item = getattr(canvas, 'create_' + kind)(*coords, **dict(options))
+        elif prev[0] != kind:
+            canvas.delete(prev[3])
+            item = getattr(canvas, 'create_' + kind)(*coords, **dict(options))
+            # Keep the painter's order: just above the previous command
+            if new:
+                canvas.tag_raise(item, new[-1][3])
+            else:
+                canvas.tag_lower(item)
+        else:
+            item = prev[3]
+            if prev[1] != coords:
+                canvas.coords(item, *coords)
+            if prev[2] != options:
+                previous = dict(prev[2])
+                canvas.itemconfigure(item, **{key: value for key, value in options
+                                              if previous.get(key) != value})
+        return [kind, coords, options, item, bbox, ref]
+
+    @staticmethod
+    def _bbox_in_clip(bbox, clip):
+        return (bbox[0] < clip.X + clip.Width and clip.X < bbox[2] and
+                bbox[1] < clip.Y + clip.Height and clip.Y < bbox[3])
+
+    def _record(self, kind, coords, options, margin=0, bbox=None, ref=None):
+        if self._commands is None:
+            raise RuntimeError("Graphics can only draw inside a Paint handler")
+        if bbox is None:
+            xs, ys = coords[0::2], coords[1::2]
+            bbox = (min(xs) - margin, min(ys) - margin, max(xs) + margin, max(ys) + margin)
+        self._commands.append((kind, tuple(coords), options, bbox, ref))
+
+    @staticmethod
+    def _pen_options(pen, fill_key):
+        dash = tuple(pen.DashPattern) if pen.DashPattern else ''
+        return ((fill_key, str(pen.Color)), ('width', pen.Width), ('dash', dash))
+
+    # -- Public API -----------------------------------------------------
+
+    @property
+    def ClipBounds(self):
+        """Gets the region being repainted (the whole surface when not clipped)."""
+        if self._clip is not None:
+            return self._clip
+        return Rectangle(0, 0, self._canvas.winfo_width(), self._canvas.winfo_height())
+
+    def IsVisible(self, *args):
+        """True if the (x, y, width, height) rectangle touches ClipBounds."""
+        if self._clip is None:
+            return True
+        return self._bbox_in_clip(_rect_coords(args), self._clip)
+
+    def Clear(self, color):
+        """Fills the whole surface with color."""
+        self._canvas.configure(bg=str(color))
+
+    def DrawLine(self, pen, x1, y1, x2, y2):
+        self._record('line', (x1, y1, x2, y2), self._pen_options(pen, 'fill'), pen.Width)
+
+    def DrawLines(self, pen, points):
+        """Draws a connected polyline (one canvas item, however many points)."""
+        coords = _points_to_coords(points)
+        if len(coords) >= 4:
+            self._record('line', coords, self._pen_options(pen, 'fill'), pen.Width)
+
+    def DrawRectangle(self, pen, *rect):
+        """DrawRectangle(pen, x, y, width, height) or DrawRectangle(pen, rectangle)."""
+        self._record('rectangle', _rect_coords(rect),
+                     self._pen_options(pen, 'outline') + (('fill', ''),), pen.Width)
+
+    def FillRectangle(self, brush, *rect):
+        """FillRectangle(brush, x, y, width, height) or FillRectangle(brush, rectangle)."""
+        self._record('rectangle', _rect_coords(rect),
+                     (('outline', ''), ('width', 0), ('dash', ''), ('fill', str(brush.Color))))
+
+    def DrawEllipse(self, pen, *rect):
+        self._record('oval', _rect_coords(rect),
+                     self._pen_options(pen, 'outline') + (('fill', ''),), pen.Width)
+
+    def FillEllipse(self, brush, *rect):
+        self._record('oval', _rect_coords(rect),
+                     (('outline', ''), ('width', 0), ('dash', ''), ('fill', str(brush.Color))))
+
+    def DrawPolygon(self, pen, points):
+        self._record('polygon', _points_to_coords(points),
+                     self._pen_options(pen, 'outline') + (('fill', ''),), pen.Width)
+
+    def FillPolygon(self, brush, points):
+        self._record('polygon', _points_to_coords(points),
+                     (('outline', ''), ('width', 0), ('dash', ''), ('fill', str(brush.Color))))
+
+    def DrawString(self, text, font, brush, x, y):
+        """Draws text with its top-left corner at (x, y)."""
+        if font is None:
+            if self._default_font is None:
+                self._default_font = _FontCache.get('Segoe UI', 9)
+            tk_font = self._default_font
+        else:
+            tk_font = _FontCache.resolve(font)
+        text = str(text)
+        width = max(tk_font.measure(line) for line in text.split('\n'))
+        height = tk_font.metrics('linespace') * (text.count('\n') + 1)
+        self._record('text', (x, y),
+                     (('text', text), ('fill', str(brush.Color)), ('font', str(tk_font)), ('anchor', 'nw')),
+                     bbox=(x, y, x + width, y + height), ref=tk_font)
+
+    def DrawImage(self, image, x, y):
+        """Draws a tk PhotoImage with its top-left corner at (x, y)."""
+        self._record('image', (x, y), (('image', str(image)), ('anchor', 'nw')),
+                     bbox=(x, y, x + image.width(), y + image.height()), ref=image)
+
 
 class ScrollableControlMixin:
     """
     Mixin to add scrolling capabilities to a control (Panel, TabPage, etc.).
     Scrollbars are only shown when content exceeds visible area.
+    
+    Child rectangles are indexed from their Left/Top/Width/Height as they are
+    placed, so the scroll region comes from a maintained extent instead of
+    querying every child widget. With many children, those outside the
+    viewport (plus an overscan margin) are unmapped while scrolling and
+    mapped again when they come into view.
     """
 
+    SCROLL_CULL_THRESHOLD = 200   # Indexed children before off-screen ones are unmapped
+    SCROLL_OVERSCAN = 1.0         # Viewport sizes kept mapped on each side
+
     def _init_scroll_properties(self, defaults):
         """Initialize scroll-related properties."""
         self.AutoScroll = defaults.get('AutoScroll', False)
@@ -1433,6 +1834,20 @@ class ScrollableControlMixin:
         self._container = None  # The container where children are added
         self._v_scrollbar_visible = False
         self._h_scrollbar_visible = False
+        
+        # Child index: control -> placed widget / (x, y, w, h)
+        self._scroll_widgets = {}
+        self._scroll_rects = {}
+        self._scroll_extent = (0, 0)      # Max right/bottom of indexed children
+        self._scroll_extent_dirty = False # A child at the edge shrank or left
+        self._scroll_region = None        # Last scrollregion applied
+        self._scroll_rows = None          # Controls sorted by top (culling), None when stale
+        self._scroll_row_tops = []
+        self._scroll_max_height = 0
+        self._scroll_mapped = set()       # Indexed controls currently placed
+        self._scroll_culling = False      # Some indexed children may be unmapped
+        self._scroll_update_job = None
+        self._scroll_cull_job = None
 
     def _setup_scroll_infrastructure(self, parent_widget, bg_color):
         """
@@ -1487,12 +1902,14 @@ class ScrollableControlMixin:
         if self._v_scrollbar:
             self._v_scrollbar.set(first, last)
             self._update_scrollbar_visibility()
+            self._schedule_scroll_cull()
     
     def _on_h_scroll(self, first, last):
         """Handle horizontal scrollbar updates and visibility."""
         if self._h_scrollbar:
             self._h_scrollbar.set(first, last)
             self._update_scrollbar_visibility()
+            self._schedule_scroll_cull()
     
     def _update_scrollbar_visibility(self):
         """Show/hide scrollbars based on whether they are needed."""
@@ -1552,69 +1969,173 @@ class ScrollableControlMixin:
         """Updates the scroll region based on the current controls.
         
         This method recalculates the scrollable area to ensure all child controls are accessible.
+        Child widgets that were not placed as WinFormPy controls are measured too.
         """
-        self._update_scroll_region()
+        if self._canvas and self._scroll_frame:
+            self._scroll_frame.update_idletasks()
+            self._scroll_extent_dirty = True
+        self._update_scroll_region(measure_untracked=True)
 
-    def _update_scroll_region(self):
-        """Manually update the scroll region based on child controls."""
+    def _update_scroll_region(self, measure_untracked=False):
+        """Update the scroll region from the child index (no widget queries)."""
         if not self._canvas or not self._scroll_frame:
             return
-            
-        if hasattr(self, 'Invalidate'):
-            self.Invalidate()
-        else:
-            self._scroll_frame.update_idletasks()
-        
-        # Calculate bounding box of all children in _scroll_frame
-        req_width = 0
-        req_height = 0
-        
-        # Iterate over children to find max bounds
-        children = self._scroll_frame.winfo_children()
-        
-        if not children:
-            # If no children, use a minimum size or 0
-            req_width = 1
-            req_height = 1
-        else:
-            for child in children:
+        if self._scroll_update_job is not None:
+            try:
+                self._scroll_frame.after_cancel(self._scroll_update_job)
+            except tk.TclError:
+                pass
+            self._scroll_update_job = None
+        
+        if self._scroll_extent_dirty:
+            self._scroll_extent_dirty = False
+            right = bottom = 0
+            for x, y, w, h in self._scroll_rects.values():
+                right = max(right, x + w)
+                bottom = max(bottom, y + h)
+            self._scroll_extent = (right, bottom)
+        req_width, req_height = self._scroll_extent
+        
+        if measure_untracked:
+            # Raw Tk widgets (and controls placed by their own geometry code)
+            tracked = set(self._scroll_widgets.values())
+            for child in self._scroll_frame.winfo_children():
+                if child in tracked:
+                    continue
                 try:
-                    # Force update to get accurate info
-                    # child.update_idletasks() 
-                    
-                    x = child.winfo_x()
-                    y = child.winfo_y()
                     w = child.winfo_width()
                     h = child.winfo_height()
-                    
                     # If unmapped or 1x1, try to use requested size
                     if w <= 1: w = child.winfo_reqwidth()
                     if h <= 1: h = child.winfo_reqheight()
-                    
-                    req_width = max(req_width, x + w)
-                    req_height = max(req_height, y + h)
+                    req_width = max(req_width, child.winfo_x() + w)
+                    req_height = max(req_height, child.winfo_y() + h)
                 except Exception:
                     pass
         
         # Add margins
         margin_x, margin_y = self.AutoScrollMargin if hasattr(self, 'AutoScrollMargin') else (0, 0)
-        req_width += margin_x + 20 # Extra padding
-        req_height += margin_y + 20 # Extra padding
+        req_width = max(req_width, 1) + margin_x + 20 # Extra padding
+        req_height = max(req_height, 1) + margin_y + 20 # Extra padding
         
         # Apply AutoScrollMinSize if set
         if self.AutoScrollMinSize:
             min_w, min_h = self.AutoScrollMinSize
             req_width = max(req_width, min_w)
             req_height = max(req_height, min_h)
-            
-        # Resize the scroll frame window in the canvas
-        self._canvas.itemconfig(self._scroll_frame_id, width=req_width, height=req_height)
         
-        # Update scrollregion
-        self._canvas.configure(scrollregion=(0, 0, req_width, req_height))
+        if (req_width, req_height) != self._scroll_region:
+            self._scroll_region = (req_width, req_height)
+            # Resize the scroll frame window in the canvas
+            self._canvas.itemconfig(self._scroll_frame_id, width=req_width, height=req_height)
+            
+            # Update scrollregion
+            self._canvas.configure(scrollregion=(0, 0, req_width, req_height))
         
         # Update scrollbar visibility after changing scroll region
         self._update_scrollbar_visibility()
+        self._schedule_scroll_cull()
+
+    def _track_scroll_child(self, control, widget):
+        """Index the rectangle of a child placed at Left/Top/Width/Height.
+        
+        Called by the child after placing `widget` (its outermost Tk widget);
+        the scroll region is updated once at the next idle moment.
+        """
+        if not self._canvas:
+            return
+        rect = (control.Left, control.Top, control.Width or 0, control.Height or 0)
+        old = self._scroll_rects.get(control)
+        if control not in self._scroll_widgets:
+            widget.bind('<Destroy>', lambda e, c=control: self._untrack_scroll_child(c), add='+')
+        self._scroll_widgets[control] = widget
+        if control not in self._scroll_mapped:
+            self._scroll_mapped.add(control)
+            # Placed outside the cull pass (new, moved or shown again)
+            self._schedule_scroll_cull()
+        if rect != old:
+            self._scroll_rects[control] = rect
+            self._scroll_rows = None
+            right, bottom = self._scroll_extent
+            if old is not None and ((old[0] + old[2] >= right and rect[0] + rect[2] < right) or
+                                    (old[1] + old[3] >= bottom and rect[1] + rect[3] < bottom)):
+                self._scroll_extent_dirty = True
+            else:
+                self._scroll_extent = (max(right, rect[0] + rect[2]), max(bottom, rect[1] + rect[3]))
+            if self._scroll_update_job is None:
+                try:
+                    self._scroll_update_job = self._scroll_frame.after_idle(self._update_scroll_region)
+                except tk.TclError:
+                    pass
+
+    def _untrack_scroll_child(self, control):
+        """Remove a child from the index (removed or destroyed)."""
+        rect = self._scroll_rects.pop(control, None)
+        self._scroll_widgets.pop(control, None)
+        self._scroll_mapped.discard(control)
+        if rect is not None:
+            self._scroll_rows = None
+            right, bottom = self._scroll_extent
+            if rect[0] + rect[2] >= right or rect[1] + rect[3] >= bottom:
+                self._scroll_extent_dirty = True
+
+    def _schedule_scroll_cull(self):
+        if self._scroll_cull_job is not None:
+            return
+        if len(self._scroll_rects) < self.SCROLL_CULL_THRESHOLD and not self._scroll_culling:
+            return
+        try:
+            self._scroll_cull_job = self._canvas.after_idle(self._cull_scroll_children)
+        except tk.TclError:
+            pass
+
+    def _cull_scroll_children(self):
+        """Unmap indexed children outside the overscanned viewport, map those inside."""
+        self._scroll_cull_job = None
+        if not self._canvas:
+            return
+        controls = self._scroll_rects
+        self._scroll_culling = len(controls) >= self.SCROLL_CULL_THRESHOLD
+        if not self._scroll_culling:
+            # Too few children to bother: make sure none stays unmapped
+            visible = set(controls)
+        else:
+            try:
+                view_w = self._canvas.winfo_width()
+                view_h = self._canvas.winfo_height()
+                left = self._canvas.canvasx(0) - view_w * self.SCROLL_OVERSCAN
+                top = self._canvas.canvasy(0) - view_h * self.SCROLL_OVERSCAN
+            except tk.TclError:
+                return
+            right = left + view_w * (1 + 2 * self.SCROLL_OVERSCAN)
+            bottom = top + view_h * (1 + 2 * self.SCROLL_OVERSCAN)
+            if self._scroll_rows is None:
+                self._scroll_rows = sorted(controls, key=lambda c: controls[c][1])
+                self._scroll_row_tops = [controls[c][1] for c in self._scroll_rows]
+                self._scroll_max_height = max(rect[3] for rect in controls.values())
+            # Only children starting less than one max height above the view can reach it
+            lo = bisect.bisect_left(self._scroll_row_tops, top - self._scroll_max_height)
+            hi = bisect.bisect_right(self._scroll_row_tops, bottom)
+            visible = set()
+            for control in itertools.islice(self._scroll_rows, lo, hi):
+                x, y, w, h = controls[control]
+                if y + h > top and x < right and x + w > left:
+                    visible.add(control)
+        
+        for control in self._scroll_mapped - visible:
+            try:
+                self._scroll_widgets[control].place_forget()
+            except tk.TclError:
+                pass
+        for control in visible - self._scroll_mapped:
+            if not getattr(control, '_visible', True):
+                continue
+            x, y, w, h = controls[control]
+            try:
+                self._scroll_widgets[control].place(x=x, y=y, width=w, height=h, in_=control.master)
+            except tk.TclError:
+                continue
+        self._scroll_mapped = visible
 
     def _bind_mouse_wheel(self, widget):
         """Bind mouse wheel events for scrolling."""
@@ -2043,6 +2564,7 @@ class PrinterSettings:
         self.FromPage = 1
         self.ToPage = 9999
         self.PrintToFile = False
+        self.PrintFileName = ""  # .pdf or .ps file written by PrintDocument.Print()
         self.Color = True  # True=color, False=grayscale
         self.PrintRange = "AllPages"  # "AllPages", "Selection", "CurrentPage", "SomePages"
         self.PaperSource = "AutomaticFeed"
@@ -2071,6 +2593,7 @@ class PrinterSettings:
         self.FromPage = settings_dict.get('FromPage', self.FromPage)
         self.ToPage = settings_dict.get('ToPage', self.ToPage)
         self.PrintToFile = settings_dict.get('PrintToFile', self.PrintToFile)
+        self.PrintFileName = settings_dict.get('PrintFileName', self.PrintFileName)
         self.Color = settings_dict.get('Color', self.Color)
         self.PrintRange = settings_dict.get('PrintRange', self.PrintRange)
         self.PaperSource = settings_dict.get('PaperSource', self.PaperSource)
@@ -2092,6 +2615,7 @@ class PrinterSettings:
             'FromPage': self.FromPage,
             'ToPage': self.ToPage,
             'PrintToFile': self.PrintToFile,
+            'PrintFileName': self.PrintFileName,
             'Color': self.Color,
             'PrintRange': self.PrintRange,
             'PaperSource': self.PaperSource,
@@ -2268,7 +2792,18 @@ class PrintDialog:
                 self.PrinterSettings.PrintRange = "CurrentPage"
             elif range_value == 3:
                 self.PrinterSettings.PrintRange = "SomePages"
-                # Parse pages from entry_pages if needed
+                # "3" or "3-7"
+                bounds = entry_pages.get().replace(' ', '').split('-')
+                try:
+                    self.FromPage = int(bounds[0])
+                    self.ToPage = int(bounds[-1]) if bounds[-1] else 9999
+                except ValueError:
+                    self.FromPage, self.ToPage = 1, 9999
+                self.PrinterSettings.FromPage = self.FromPage
+                self.PrinterSettings.ToPage = self.ToPage
+
+            if self.Document is not None:
+                self.Document.PrinterSettings = self.PrinterSettings
             
             dialog.destroy()
             
@@ -2676,6 +3211,12 @@ class PageSetupDialog:
                 )
             except:
                 pass
+            from .printing import PageSettings
+            if isinstance(self.PageSettings, PageSettings):
+                # Margins here are in mm, PageSettings uses hundredths of an inch
+                self.PageSettings.PaperSize = self.PaperSize
+                self.PageSettings.Landscape = self.Orientation == "Landscape"
+                self.PageSettings.Margins = tuple(round(mm * 100 / 25.4) for mm in self.Margins)
             dialog.destroy()
             
         def on_cancel():
@@ -2703,8 +3244,105 @@ class PageSetupDialog:
         self.PaperSize = "A4"
 
 
+class _PrintPreviewPages:
+    """
+    Random access to a PrintDocument's pages for PrintPreviewDialog.
+
+    Pages are generated in order, only when asked for, and the most
+    recently shown CACHE_SIZE are kept. Going back past the cache
+    regenerates from the first page, because PrintPage is sequential.
+    """
+
+    CACHE_SIZE = 64
+
+    def __init__(self, document):
+        self._document = document
+        self._cache = OrderedDict()
+        self._pages = None
+        self._next = 1
+        self.Count = None  # Known once the last page has been generated
+
+    def Get(self, number):
+        """Returns page number (1-based), or None past the last page."""
+        page = self._cache.get(number)
+        if page is not None:
+            self._cache.move_to_end(number)
+            return page
+        if number < 1 or (self.Count is not None and number > self.Count):
+            return None
+        if self._pages is None or number < self._next:
+            self.Close()
+            self._pages = self._document.GeneratePages()
+            self._next = 1
+        while self._next <= number:
+            page = next(self._pages, None)
+            if page is None:
+                self.Count = self._next - 1
+                self.Close()
+                return None
+            self._next += 1
+            self._cache[page.Number] = page
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return page
+
+    def Close(self):
+        """Stops page generation (raises the document's EndPrint)."""
+        if self._pages is not None:
+            pages, self._pages = self._pages, None
+            pages.close()
+
+
+def _draw_printed_page(canvas, page, left, top, scale, fonts):
+    """Draws a PrintedPage on a canvas; scale is pixels per page unit.
+
+    Tk fonts used are appended to fonts, which must outlive the items.
+    """
+    from .printing import _print_text_width
+    bounds = page.Bounds
+    canvas.create_rectangle(left, top, left + bounds.Width * scale, top + bounds.Height * scale,
+                            fill="white", outline="black")
+
+    def points(coords):
+        return [left + value * scale if i % 2 == 0 else top + value * scale
+                for i, value in enumerate(coords)]
+
+    for command in page.Commands:
+        kind = command[0]
+        if kind == 'text':
+            _, x, y, text, ps_name, size, color = command
+            pixels = round(size * 100 / 72 * scale)
+            if pixels < 4:
+                # Too small to read: draw a grey bar where the text goes
+                width = _print_text_width(text, ps_name, size) * scale
+                middle = top + y * scale + pixels / 2
+                canvas.create_line(left + x * scale, middle, left + x * scale + width, middle, fill="#B0B0B0")
+                continue
+            family = ps_name.split('-')[0]
+            font = _FontCache.get(family, -pixels,
+                                  weight='bold' if 'Bold' in ps_name else 'normal',
+                                  slant='italic' if ('Italic' in ps_name or 'Oblique' in ps_name) else 'roman')
+            fonts.append(font)
+            canvas.create_text(left + x * scale, top + y * scale, text=text, font=font, fill=color, anchor='nw')
+        elif kind == 'line':
+            _, coords, color, width, dash = command
+            canvas.create_line(*points(coords), fill=color, width=max(1, width * scale),
+                               dash=tuple(max(1, round(v * scale)) for v in dash) if dash else '')
+        else:
+            _, coords, outline, fill, width = command
+            create = {'rect': canvas.create_rectangle, 'oval': canvas.create_oval,
+                      'polygon': canvas.create_polygon}[kind]
+            create(*points(coords), outline=outline or '', fill=fill or '',
+                   width=max(1, width * scale) if outline else 0)
+
+
 class PrintPreviewDialog:
-    """Represents a dialog box form that contains a PrintPreviewControl for printing."""
+    """Represents a dialog box form that contains a PrintPreviewControl for printing.
+
+    Shows Rows x Columns pages of Document from StartPage (0-based). Pages
+    are generated only when shown and a bounded number is cached, so long
+    documents open as fast as short ones.
+    """
 
     def __init__(self):
         self.Document = None
@@ -2712,6 +3350,9 @@ class PrintPreviewDialog:
         self.AutoZoom = True
         self.ShowHelp = False
         self.Zoom = 1.0
+        self.StartPage = 0
+        self.Columns = 1
+        self.Rows = 1
         
     def ShowDialog(self, owner=None):
         """Shows the dialog and returns the result."""
@@ -2734,26 +3375,32 @@ class PrintPreviewDialog:
                 dialog.transient(parent_window)
             except tk.TclError:
                 pass
-            
+
+        pages = _PrintPreviewPages(self.Document) if self.Document is not None else None
+        fonts = []  # Tk fonts of the pages on screen
+
         # Toolbar
         toolbar = tk.Frame(dialog, bd=1, relief=tk.RAISED)
         toolbar.pack(side=tk.TOP, fill=tk.X)
         
         def do_print():
-            # In a real implementation, this would trigger self.Document.Print()
-            from tkinter import messagebox
-            messagebox.showinfo("Print", "Sending document to printer...")
+            if pages is not None:
+                pages.Close()
+            self.Document.Print()
             dialog.destroy()
             
-        btn_print = tk.Button(toolbar, text="Print", command=do_print)
+        btn_print = tk.Button(toolbar, text="Print", command=do_print,
+                              state=tk.NORMAL if self.Document is not None else tk.DISABLED)
         btn_print.pack(side=tk.LEFT, padx=2, pady=2)
         
         def zoom_in():
+            self.AutoZoom = False
             self.Zoom += 0.25
             update_preview()
             
         def zoom_out():
             if self.Zoom > 0.25:
+                self.AutoZoom = False
                 self.Zoom -= 0.25
                 update_preview()
                 
@@ -2762,9 +3409,35 @@ class PrintPreviewDialog:
         
         btn_zoom_out = tk.Button(toolbar, text="Zoom Out (-)", command=zoom_out)
         btn_zoom_out.pack(side=tk.LEFT, padx=2, pady=2)
+
+        def set_layout(columns, rows):
+            self.Columns, self.Rows = columns, rows
+            self.AutoZoom = True
+            update_preview()
+
+        for text, columns, rows in (("1 Page", 1, 1), ("2 Pages", 2, 1), ("4 Pages", 2, 2), ("6 Pages", 3, 2)):
+            tk.Button(toolbar, text=text, command=lambda c=columns, r=rows: set_layout(c, r)).pack(
+                side=tk.LEFT, padx=2, pady=2)
+
+        def show_page(start):
+            self.StartPage = max(0, start)
+            update_preview()
+
+        btn_prev = tk.Button(toolbar, text="<", command=lambda: show_page(self.StartPage - self.Columns * self.Rows))
+        btn_prev.pack(side=tk.LEFT, padx=(10, 2), pady=2)
+        lbl_page = tk.Label(toolbar, text="")
+        lbl_page.pack(side=tk.LEFT, padx=2)
+        btn_next = tk.Button(toolbar, text=">", command=lambda: show_page(self.StartPage + self.Columns * self.Rows))
+        btn_next.pack(side=tk.LEFT, padx=2, pady=2)
         
-        btn_close = tk.Button(toolbar, text="Close", command=dialog.destroy)
+        def close():
+            if pages is not None:
+                pages.Close()
+            dialog.destroy()
+
+        btn_close = tk.Button(toolbar, text="Close", command=close)
         btn_close.pack(side=tk.RIGHT, padx=2, pady=2)
+        dialog.protocol("WM_DELETE_WINDOW", close)
         
         # Preview Area
         container = tk.Frame(dialog, bg="darkgray")
@@ -2787,12 +3460,22 @@ class PrintPreviewDialog:
         
         def update_preview():
             canvas.delete("all")
-            
-            # A4 size approx in pixels at 96 DPI: 794 x 1123
-            base_w, base_h = 794, 1123
-            
-            w = int(base_w * self.Zoom)
-            h = int(base_h * self.Zoom)
+            del fonts[:]
+            per_view = self.Columns * self.Rows
+            shown = []
+            if pages is not None:
+                shown = [pages.Get(self.StartPage + 1 + i) for i in range(per_view)]
+                shown = [page for page in shown if page is not None]
+                if not shown and self.StartPage > 0 and pages.Count:
+                    # Past the end (e.g. layout change): show the last pages
+                    self.StartPage = max(0, pages.Count - per_view)
+                    shown = [pages.Get(self.StartPage + 1 + i) for i in range(per_view)]
+                    shown = [page for page in shown if page is not None]
+            if shown:
+                base_w, base_h = shown[0].Bounds.Width, shown[0].Bounds.Height
+            else:
+                bounds = self.Document.DefaultPageSettings.Bounds if self.Document is not None else Rectangle(0, 0, 827, 1169)
+                base_w, base_h = bounds.Width, bounds.Height
             
             # Center in canvas if smaller than canvas
             cw = canvas.winfo_width()
@@ -2801,27 +3484,45 @@ class PrintPreviewDialog:
             # Avoid division by zero if canvas is not yet mapped
             if cw <= 1: cw = 800
             if ch <= 1: ch = 600
-            
-            x = max(20, (cw - w) // 2)
-            y = 20
-            
-            # Draw "Paper"
-            canvas.create_rectangle(x, y, x+w, y+h, fill="white", outline="black", tags="paper")
-            
-            # Draw "Content" placeholder
-            font_size = int(12 * self.Zoom)
-            doc_name = "Document"
-            if self.Document and hasattr(self.Document, 'DocumentName'):
-                doc_name = self.Document.DocumentName
-                
-            canvas.create_text(x + w//2, y + h//2, text=f"{doc_name} Preview\n(Simulated)", 
-                               font=("Segoe UI", font_size), justify=tk.CENTER)
+
+            gap = 20
+            if self.AutoZoom:
+                scale = min((cw - gap * (self.Columns + 1)) / (self.Columns * base_w),
+                            (ch - gap * (self.Rows + 1)) / (self.Rows * base_h))
+                scale = max(scale, 0.02)
+                self.Zoom = scale / 0.96
+            else:
+                # Zoom 1.0 is the paper's real size at 96 DPI
+                scale = 0.96 * self.Zoom
+            w, h = base_w * scale, base_h * scale
+            total_w = self.Columns * w + (self.Columns - 1) * gap
+            x0 = max(gap, (cw - total_w) / 2)
+
+            for i, page in enumerate(shown):
+                row, column = divmod(i, self.Columns)
+                _draw_printed_page(canvas, page, x0 + column * (w + gap), gap + row * (h + gap), scale, fonts)
+            if not shown:
+                # No document (or no pages): empty sheet
+                canvas.create_rectangle(x0, gap, x0 + w, gap + h, fill="white", outline="black")
+
+            has_next = pages is not None and pages.Get(self.StartPage + per_view + 1) is not None
+            btn_prev.config(state=tk.NORMAL if self.StartPage > 0 else tk.DISABLED)
+            btn_next.config(state=tk.NORMAL if has_next else tk.DISABLED)
+            if shown:
+                first, last = shown[0].Number, shown[-1].Number
+                text = f"Page {first}" if first == last else f"Pages {first}-{last}"
+                lbl_page.config(text=text + (f" of {pages.Count}" if pages.Count else ""))
+            else:
+                lbl_page.config(text="")
             
             # Update scrollregion
-            canvas.config(scrollregion=(0, 0, x + w + 20, y + h + 20))
+            canvas.config(scrollregion=(0, 0, x0 + total_w + gap, gap + self.Rows * (h + gap)))
 
         # Bind configure to center
         canvas.bind("<Configure>", lambda e: update_preview())
+        dialog.bind("<Prior>", lambda e: btn_prev.invoke())
+        dialog.bind("<Next>", lambda e: btn_next.invoke())
+        dialog.bind("<Home>", lambda e: show_page(0))
         
         # Initial draw
         dialog.update_idletasks()
@@ -2833,8 +3534,827 @@ class PrintPreviewDialog:
 
 
 
-class ControlBase:
+def _no_op_event(*args, **kwargs):
+    """Default handler for events nobody has subscribed to."""
+    return None
+
+
+# =============================================================================
+# Lazy event bindings
+# =============================================================================
+
+class _EventSlot:
+    """
+    Class-level VB event whose Tk binding is installed on first subscription.
+
+    Reading it returns the handler, or the shared no-op while nobody has
+    subscribed; assigning a handler (control.MouseMove = handler) stores it
+    on the instance and lets the owner bind the Tk sequences that raise it.
+    Declare one slot per event name (a slot knows its own name).
+    """
+
+    __slots__ = ('name', '_attr')
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self._attr = '_event_' + name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return obj.__dict__.get(self._attr, _no_op_event)
+
+    def __set__(self, obj, handler):
+        obj.__dict__[self._attr] = handler
+        if handler is not _no_op_event:
+            obj._on_event_subscribed(self.name)
+
+
+class _LazyEventsMixin:
+    """
+    Binds high-frequency Tk events (motion, enter/leave, configure, ...)
+    only for the events somebody handles.
+
+    Subclasses list them in _LAZY_EVENT_BINDINGS as
+    ``(sequences, handler method, event names)`` and implement
+    _bind_lazy_sequence(). Once the widget exists, _install_lazy_events()
+    binds the handlers of events already subscribed; later subscriptions
+    bind theirs on the spot. <Motion> is coalesced to one MouseMove per
+    frame; a pending move is flushed before button and leave events so
+    handlers still see them in order.
+    """
+
+    _LAZY_EVENT_BINDINGS = ()
+
+    # MouseMove is raised at most once per frame (milliseconds)
+    MOTION_FRAME_MS = 16
+
+    _lazy_events_target = None
+    _lazy_bound_handlers = frozenset()
+    _pending_motion = None
+    _motion_job = None
+
+    def _is_event_subscribed(self, event_name):
+        return self.__dict__.get('_event_' + event_name, _no_op_event) is not _no_op_event
+
+    def _on_event_subscribed(self, event_name):
+        if self._lazy_events_target is None:
+            return  # Bound by _install_lazy_events once the widget exists
+        for sequences, method, events in self._LAZY_EVENT_BINDINGS:
+            if event_name in events:
+                self._install_lazy_binding(sequences, method)
+
+    def _install_lazy_events(self, target):
+        """Binds the lazy handlers needed so far on target (once per widget)."""
+        if target is self._lazy_events_target:
+            return
+        self._lazy_events_target = target
+        self._lazy_bound_handlers = set()
+        for sequences, method, events in self._LAZY_EVENT_BINDINGS:
+            if any(self._is_event_subscribed(name) for name in events):
+                self._install_lazy_binding(sequences, method)
+
+    def _install_lazy_binding(self, sequences, method):
+        if method in self._lazy_bound_handlers:
+            return
+        self._lazy_bound_handlers.add(method)
+        callback = getattr(self, method)
+        for sequence in sequences:
+            self._bind_lazy_sequence(sequence, callback)
+
+    def _bind_lazy_sequence(self, sequence, callback):
+        raise NotImplementedError
+
+    # -- Motion coalescing ---------------------------------------------
+
+    def _on_mouse_move(self, event):
+        """Handler for <Motion>: keeps the latest event, raised once per frame."""
+        self._pending_motion = event
+        if self._motion_job is None:
+            root = self._lazy_events_target._root()
+            self._motion_job = (root, root.after(self.MOTION_FRAME_MS, self._on_motion_frame))
+
+    def _on_motion_frame(self):
+        self._motion_job = None
+        try:
+            alive = self._lazy_events_target.winfo_exists()
+        except tk.TclError:
+            alive = False
+        if alive:
+            self._dispatch_pending_motion()
+        else:
+            self._pending_motion = None
+
+    def _flush_mouse_move(self):
+        """Raises a pending MouseMove now (before a button or leave event)."""
+        if self._motion_job is not None:
+            root, job = self._motion_job
+            self._motion_job = None
+            root.after_cancel(job)
+            self._dispatch_pending_motion()
+
+    def _dispatch_pending_motion(self):
+        event, self._pending_motion = self._pending_motion, None
+        if event is not None:
+            self._dispatch_mouse_move(event)
+
+    def _dispatch_mouse_move(self, event):
+        self.MouseMove(self, EventArgs(event))
+
+
+_event_bindtag_ids = itertools.count()
+
+
+class ControlCollection(list):
+    """
+    Child controls of a container (the ``Controls`` attribute).
+
+    A plain list in every respect (order, indexing, slicing, iteration),
+    plus an identity index so ``control in container.Controls`` is O(1)
+    instead of a scan over every sibling.
+    """
+
+    __slots__ = ('_ids',)
+
+    def __init__(self, iterable=()):
+        super().__init__(iterable)
+        self._reindex()
+
+    def _track(self, item):
+        self._ids[id(item)] = self._ids.get(id(item), 0) + 1
+
+    def _untrack(self, item):
+        count = self._ids.get(id(item), 0) - 1
+        if count > 0:
+            self._ids[id(item)] = count
+        else:
+            self._ids.pop(id(item), None)
+
+    def _reindex(self):
+        self._ids = {}
+        for item in self:
+            self._track(item)
+
+    def __contains__(self, item):
+        return id(item) in self._ids
+
+    def append(self, item):
+        super().append(item)
+        self._track(item)
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self._track(item)
+
+    def extend(self, iterable):
+        items = list(iterable)
+        super().extend(items)
+        for item in items:
+            self._track(item)
+
+    def __iadd__(self, iterable):
+        self.extend(iterable)
+        return self
+
+    def remove(self, item):
+        # Identity match, like the membership test
+        for index, existing in enumerate(self):
+            if existing is item:
+                super().__delitem__(index)
+                self._untrack(item)
+                return
+        raise ValueError('ControlCollection.remove(x): x not in collection')
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self._untrack(item)
+        return item
+
+    def clear(self):
+        super().clear()
+        self._ids.clear()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._reindex()
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            super().__delitem__(index)
+            self._reindex()
+        else:
+            item = self[index]
+            super().__delitem__(index)
+            self._untrack(item)
+
+    def __imul__(self, count):
+        super().__imul__(count)
+        self._reindex()
+        return self
+
+
+class _LayoutScheduler:
+    """
+    Coalesces container layout requests into one pass per idle cycle.
+
+    Containers are marked dirty with ``request``; a single ``after_idle``
+    callback then runs every pending dock, anchor, AutoSize, flow and table
+    layout top-down (outer containers first). Containers dirtied while the
+    pass runs, e.g. a parent whose AutoSize child just grew, are handled in
+    the same flush.
+    """
+
+    MaxPasses = 8  # safety net against layouts that keep dirtying each other
+
+    _dirty = {}
+    _idle_root = None
+    _idle_job = None
+    flushing = False
+    # > 0 while any batched pass (idle flush or container resize) is placing
+    # controls; _place_control skips its per-control repaint meanwhile.
+    batch_depth = 0
+
+    @classmethod
+    def request(cls, container):
+        """Marks a container dirty and schedules the idle flush."""
+        cls._dirty[id(container)] = container
+        if not cls.flushing:
+            cls._ensure_scheduled(container)
+
+    @classmethod
+    def discard(cls, container):
+        """Forgets a pending request (the caller is laying out right now)."""
+        cls._dirty.pop(id(container), None)
+
+    @classmethod
+    def _ensure_scheduled(cls, container):
+        widget = container._layout_container_widget()
+        try:
+            root = widget._root()
+        except (tk.TclError, AttributeError):
+            return
+        if cls._idle_job is not None:
+            if cls._idle_root is root or cls._root_alive(cls._idle_root):
+                return
+            # The root that held the pending flush was destroyed (e.g. the
+            # first Form closed): its job will never run
+            cls._idle_job = None
+            cls._idle_root = None
+        try:
+            cls._idle_job = root.after_idle(cls.flush)
+            cls._idle_root = root
+        except (tk.TclError, RuntimeError):
+            cls._idle_job = None
+            cls._idle_root = None
+
+    @staticmethod
+    def _root_alive(root):
+        try:
+            return bool(root.winfo_exists())
+        except (tk.TclError, RuntimeError, AttributeError):
+            return False
+
+    @staticmethod
+    def _depth(container):
+        depth = 0
+        current = container
+        while current is not None and depth < 64:
+            current = getattr(getattr(current, 'master', None), '_control_wrapper', None)
+            depth += 1
+        return depth
+
+    @classmethod
+    def flush(cls):
+        """Runs all pending layouts now. Call from the Tk thread."""
+        cls._idle_job = None
+        if cls.flushing:
+            return
+        cls.flushing = True
+        cls.batch_depth += 1
+        try:
+            for _ in range(cls.MaxPasses):
+                if not cls._dirty:
+                    break
+                batch = sorted(cls._dirty.values(), key=cls._depth)
+                cls._dirty.clear()
+                for container in batch:
+                    # Still suspended: ResumeLayout will pick it up
+                    if container._layout_suspend_count:
+                        continue
+                    try:
+                        container._perform_pending_layout()
+                    except tk.TclError:
+                        pass
+        finally:
+            cls.flushing = False
+            cls.batch_depth -= 1
+        if cls._dirty:
+            cls._ensure_scheduled(next(iter(cls._dirty.values())))
+
+
+class _DeferredLayoutMixin:
+    """
+    SuspendLayout/ResumeLayout support shared by controls and forms.
+
+    While a container is suspended, child placement and its own layout
+    engine are only recorded; ResumeLayout applies them in a single pass.
+    Outside a suspension, AutoSize and layout requests are still deferred
+    to the idle-time _LayoutScheduler so consecutive property assignments
+    trigger one layout instead of one per assignment.
+    """
+
+    _layout_suspend_count = 0
+    _layout_pending = False
+    _deferred_placements = None
+    _performing_layout = False
+
+    def SuspendLayout(self):
+        """Temporarily suspends the layout logic for the control.
+
+        Calls can be nested; layout resumes when every SuspendLayout has been
+        matched by a ResumeLayout.
+        """
+        self._layout_suspend_count += 1
+
+    def ResumeLayout(self, performLayout=True):
+        """Resumes usual layout logic.
+
+        Args:
+            performLayout: True to execute pending layout requests now;
+                False to leave them to the next idle cycle.
+        """
+        if self._layout_suspend_count > 0:
+            self._layout_suspend_count -= 1
+        if self._layout_suspend_count:
+            return
+        if performLayout:
+            _LayoutScheduler.discard(self)
+            self._perform_pending_layout()
+        elif self._layout_pending or self._deferred_placements:
+            _LayoutScheduler.request(self)
+
+    def PerformLayout(self):
+        """Forces the container to apply layout logic to its child controls now."""
+        _LayoutScheduler.discard(self)
+        self._perform_pending_layout()
+
+    def _layout_container_widget(self):
+        """Returns the Tk widget that hosts this container's children."""
+        return (getattr(self, '_container', None)
+                or getattr(self, '_tk_widget', None)
+                or getattr(self, '_root', None))
+
+    def _request_layout(self):
+        """Marks this container's layout dirty for the next idle pass."""
+        self._layout_pending = True
+        if not self._layout_suspend_count:
+            _LayoutScheduler.request(self)
+
+    def _perform_or_defer_layout(self):
+        """Runs the layout engine now, or records it while layout is suspended."""
+        if self._layout_suspend_count:
+            self._layout_pending = True
+        else:
+            self._run_layout()
+
+    def _run_layout(self):
+        # Child setters notify the parent while it lays them out; the flag
+        # keeps those notifications from re-dirtying this container.
+        if self._performing_layout:
+            return
+        self._performing_layout = True
+        try:
+            self._on_layout()
+        finally:
+            self._performing_layout = False
+
+    def _defer_placement(self, control):
+        """Queues placement of a child while layout is suspended.
+
+        Returns:
+            True if the placement was deferred, False if the caller should
+            place the control immediately.
+        """
+        if not self._layout_suspend_count:
+            return False
+        if self._deferred_placements is None:
+            self._deferred_placements = {}
+        self._deferred_placements[id(control)] = control
+        self._layout_pending = True
+        return True
+
+    def _perform_pending_layout(self):
+        """Applies deferred placements, then runs the layout engine."""
+        placements = self._deferred_placements
+        self._deferred_placements = None
+        self._layout_pending = False
+        if placements:
+            for control in placements.values():
+                if getattr(control, '_tk_widget', None):
+                    control._place_control(control.Width, control.Height)
+        self._run_layout()
+
+    def _on_layout(self):
+        """Runs this container's layout engine: Dock first, then AutoSize.
+
+        FlowLayoutPanel and TableLayoutPanel override this with their own
+        engines.
+        """
+        controls = getattr(self, 'Controls', None) or []
+        if any(getattr(ctrl, '_dock', DockStyle.None_) != DockStyle.None_ for ctrl in controls):
+            ControlBase._layout_docked_children(self._layout_container_widget())
+        self._apply_pending_autosize()
+        if getattr(self, 'AutoScroll', False) and hasattr(self, '_update_scroll_region'):
+            self._update_scroll_region()
+
+    def _apply_pending_autosize(self):
+        if not getattr(self, 'AutoSize', False) or getattr(self, '_applying_autosize', False):
+            return
+        if hasattr(self, '_apply_autosize_panel'):
+            self._apply_autosize_panel()
+        elif hasattr(self, '_apply_autosize'):
+            self._apply_autosize()
+
+
+class _ContainerLayoutDispatcher:
+    """
+    Single <Configure>/<Map> handler per container widget.
+
+    Anchored and docked children register here instead of each binding its
+    own handler on the container. A resize runs one pass: the shared dock
+    layout once for all docked siblings, then every anchor, using the size
+    carried by the event so no winfo_* round-trips are needed. Events that
+    do not change the size are ignored, and during a live window drag
+    layouts are throttled to one per FrameInterval.
+    """
+
+    FrameInterval = 16  # ms, roughly one layout per frame while dragging
+
+    def __init__(self, container):
+        self.container = container
+        self._anchored = {}
+        self._docked = {}
+        self._size = None
+        self._pending_size = None
+        self._job = None
+        self._last_layout = 0.0
+        container.bind('<Configure>', self._on_configure, add='+')
+        container.bind('<Map>', self._on_map, add='+')
+
+    @classmethod
+    def for_container(cls, container):
+        """Returns the dispatcher of a container widget, creating it on first use."""
+        dispatcher = getattr(container, '_layout_dispatcher', None)
+        if dispatcher is None:
+            dispatcher = cls(container)
+            container._layout_dispatcher = dispatcher
+        return dispatcher
+
+    def register(self, control):
+        """Tracks a child according to its current Dock/Anchor settings."""
+        self.unregister(control)
+        if control._dock != DockStyle.None_:
+            self._docked[id(control)] = control
+        elif control._anchor:
+            self._anchored[id(control)] = control
+
+    def unregister(self, control):
+        self._anchored.pop(id(control), None)
+        self._docked.pop(id(control), None)
+
+    def _on_configure(self, event):
+        if event.widget is not self.container:
+            return
+        size = (event.width, event.height)
+        if size[0] <= 1 or size[1] <= 1 or size == self._size:
+            self._pending_size = None
+            return
+        self._pending_size = size
+        if self._job is not None:
+            return
+        elapsed = (time.monotonic() - self._last_layout) * 1000
+        if elapsed >= self.FrameInterval:
+            self._flush()
+        else:
+            try:
+                self._job = self.container.after(int(self.FrameInterval - elapsed) + 1, self._flush)
+            except tk.TclError:
+                self._job = None
+
+    def _flush(self):
+        self._job = None
+        size, self._pending_size = self._pending_size, None
+        if size is not None and size != self._size:
+            self.layout(size)
+
+    def layout(self, size):
+        """Lays out every registered child for a container of the given size."""
+        self._size = size
+        self._last_layout = time.monotonic()
+        width, height = size
+        _LayoutScheduler.batch_depth += 1
+        try:
+            shared_dock = False
+            for ctrl in list(self._docked.values()):
+                if ctrl._dock == DockStyle.None_ or not ctrl._tk_widget:
+                    continue
+                if type(ctrl)._on_dock_resize is ControlBase._on_dock_resize:
+                    shared_dock = True
+                else:
+                    # Controls with their own docking (e.g. WebBrowser)
+                    ctrl._on_dock_resize()
+            if shared_dock:
+                ControlBase._layout_docked_children(self.container, size)
+
+            for ctrl in list(self._anchored.values()):
+                try:
+                    ctrl._apply_anchor_layout(width, height)
+                except tk.TclError:
+                    # Destroyed child
+                    self.unregister(ctrl)
+        finally:
+            _LayoutScheduler.batch_depth -= 1
+
+    def _on_map(self, event):
+        if event.widget is not self.container:
+            return
+        for ctrl in list(self._anchored.values()):
+            ctrl._calculate_initial_distances()
+
+
+class _UIDispatcher:
+    """
+    Process-wide queue of callables to run on the Tk thread (Invoke/BeginInvoke).
+
+    Other threads only append to a deque (atomic in CPython, so no lock) and
+    never call into Tk. A single pump, started with ``after`` on the Tk thread
+    when the first Form is created, drains the queue in batches: up to
+    MaxBatch callables or MaxBatchTime seconds per tick, then it yields to
+    the Tk event loop and continues at once if work is left, or checks again
+    after PollInterval ms. tkinter offers no safe cross-thread wake-up (a call
+    from another thread blocks until the Tk thread services it and fails
+    before mainloop runs), hence the polling.
+    """
+
+    PollInterval = 15       # ms between checks of an empty queue
+    MaxBatch = 256          # callables run per tick
+    MaxBatchTime = 0.008    # seconds of callables run per tick
+
+    _queue = deque()
+    _root = None
+    _thread_id = None
+    _pump_job = None
+
+    # Metrics (see Application.GetInvokeQueueStats)
+    _peak_depth = 0
+    _dispatched = 0
+    _batches = 0
+    _last_batch = 0
+    _max_batch = 0
+    _max_latency = 0.0
+
+    @classmethod
+    def attach(cls, tk_widget):
+        """Starts the pump on the Tk thread that owns tk_widget. Call from that thread."""
+        import threading
+        try:
+            root = tk_widget._root()
+        except (AttributeError, tk.TclError):
+            return
+        if cls._root is root and cls._pump_job is not None:
+            return
+        cls._root = root
+        cls._thread_id = threading.get_ident()
+        cls._pump_job = None
+        cls._schedule(cls.PollInterval)
+
+    @classmethod
+    def is_ui_thread(cls):
+        """True on the Tk thread (the main thread until a Form attaches the pump)."""
+        import threading
+        thread_id = cls._thread_id
+        if thread_id is None:
+            thread_id = threading.main_thread().ident
+        return threading.get_ident() == thread_id
+
+    @classmethod
+    def post(cls, callback, args=(), future=None, report=True):
+        """
+        Queues callback(*args) for the Tk thread. Safe to call from any thread.
+
+        Args:
+            callback: Callable to run
+            args: Positional arguments for callback
+            future: Optional concurrent.futures.Future that receives the result
+            report: Pass exceptions to Tk's report_callback_exception
+        """
+        queue = cls._queue
+        queue.append((callback, args, future, report, time.monotonic()))
+        depth = len(queue)
+        if depth > cls._peak_depth:
+            cls._peak_depth = depth
+
+    @classmethod
+    def _schedule(cls, delay):
+        root = cls._root
+        if root is None:
+            return
+        try:
+            cls._pump_job = root.after(delay, cls._pump)
+        except (tk.TclError, RuntimeError):
+            # Root destroyed: the next Form attaches a new pump
+            cls._pump_job = None
+            cls._root = None
+
+    @classmethod
+    def _pump(cls):
+        """Runs one batch of queued callables on the Tk thread."""
+        cls._pump_job = None
+        queue = cls._queue
+        count = 0
+        try:
+            if queue:
+                now = time.monotonic()
+                deadline = time.perf_counter() + cls.MaxBatchTime
+                while queue and count < cls.MaxBatch:
+                    callback, args, future, report, posted = queue.popleft()
+                    count += 1
+                    if now - posted > cls._max_latency:
+                        cls._max_latency = now - posted
+                    cls._run(callback, args, future, report)
+                    if time.perf_counter() >= deadline:
+                        break
+        finally:
+            # Also when SystemExit/KeyboardInterrupt leaves the batch early
+            if count:
+                cls._dispatched += count
+                cls._batches += 1
+                cls._last_batch = count
+                if count > cls._max_batch:
+                    cls._max_batch = count
+            cls._schedule(0 if queue else cls.PollInterval)
+
+    @classmethod
+    def _run(cls, callback, args, future, report):
+        if future is not None and not future.set_running_or_notify_cancel():
+            return  # Cancelled (e.g. an Invoke that timed out)
+        try:
+            result = callback(*args)
+        except (SystemExit, KeyboardInterrupt) as e:
+            # Like tkinter's CallWrapper: Application.Exit() and Ctrl+C
+            # leave mainloop instead of being reported
+            if future is not None:
+                future.set_exception(e)
+            raise
+        except BaseException as e:
+            if future is not None:
+                future.set_exception(e)
+            if report and cls._root is not None:
+                cls._root.report_callback_exception(type(e), e, e.__traceback__)
+            elif report:
+                raise
+            return
+        if future is not None:
+            future.set_result(result)
+
+    @classmethod
+    def stats(cls):
+        return {
+            'QueueDepth': len(cls._queue),
+            'PeakQueueDepth': cls._peak_depth,
+            'Dispatched': cls._dispatched,
+            'Batches': cls._batches,
+            'LastBatchSize': cls._last_batch,
+            'MaxBatchSize': cls._max_batch,
+            'MaxLatencyMs': round(cls._max_latency * 1000, 3),
+            'PumpRunning': cls._pump_job is not None,
+        }
+
+    @classmethod
+    def reset_stats(cls):
+        cls._peak_depth = len(cls._queue)
+        cls._dispatched = cls._batches = cls._last_batch = cls._max_batch = 0
+        cls._max_latency = 0.0
+
+
+class _InvokeMixin:
+    """Control.Invoke/BeginInvoke/InvokeRequired, shared by ControlBase and Form."""
+
+    @property
+    def InvokeRequired(self):
+        """True when called from a thread other than the UI (Tk) thread.
+
+        Controls may only be touched from the UI thread; other threads must
+        go through Invoke or BeginInvoke.
+        """
+        return not _UIDispatcher.is_ui_thread()
+
+    def Invoke(self, method, *args, timeout=None):
+        """Runs method(*args) on the UI thread and returns its result.
+
+        Called from the UI thread, method runs immediately. Called from another
+        thread, the call is queued and the thread blocks until it has run;
+        exceptions raised by method are re-raised in the calling thread.
+
+        Args:
+            method: Callable to run
+            *args: Arguments for method
+            timeout: Optional seconds to wait; on timeout the queued call is
+                cancelled (if it has not started) and TimeoutError is raised
+
+        Returns:
+            The value returned by method
+        """
+        if _UIDispatcher.is_ui_thread():
+            return method(*args)
+        from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+        future = Future()
+        _UIDispatcher.post(method, args, future, report=False)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Invoke did not run within {timeout} s") from None
+
+    def BeginInvoke(self, method, *args):
+        """Queues method(*args) to run on the UI thread and returns at once.
+
+        Safe to call from any thread; calls run in the order they were queued.
+        Exceptions are reported like any Tk callback error and are also stored
+        in the returned future.
+
+        Returns:
+            concurrent.futures.Future: Completes with method's result (see EndInvoke)
+        """
+        from concurrent.futures import Future
+        future = Future()
+        _UIDispatcher.post(method, args, future)
+        return future
+
+    def EndInvoke(self, async_result, timeout=None):
+        """Waits for a BeginInvoke call and returns its result (re-raising its exception).
+
+        Must not be called from the UI thread before the call has run, as
+        the UI thread would wait for itself.
+        """
+        return async_result.result(timeout)
+
+
+class ControlBase(_InvokeMixin, _LazyEventsMixin, _DeferredLayoutMixin):
     """Base class for all WinFormPy controls."""
+
+    _placement_suppressed = False
+
+    # Common VB events: shared no-op defaults instead of per-instance
+    # lambdas. Subscribing (control.Click = handler) sets an instance
+    # attribute that shadows the default.
+    MouseClick = MouseDoubleClick = staticmethod(_no_op_event)
+    Enter = Leave = GotFocus = LostFocus = staticmethod(_no_op_event)
+    KeyDown = KeyPress = staticmethod(_no_op_event)
+    Click = DoubleClick = staticmethod(_no_op_event)
+    TextChanged = VisibleChanged = EnabledChanged = staticmethod(_no_op_event)
+    FontChanged = staticmethod(_no_op_event)
+    BackColorChanged = ForeColorChanged = staticmethod(_no_op_event)
+    Validating = Validated = staticmethod(_no_op_event)
+
+    # Events raised from high-frequency Tk events: the Tk binding is only
+    # made once one of them is handled (see _LazyEventsMixin).
+    MouseDown = _EventSlot()
+    MouseUp = _EventSlot()
+    MouseEnter = _EventSlot()
+    MouseLeave = _EventSlot()
+    MouseMove = _EventSlot()
+    MouseHover = _EventSlot()
+    MouseWheel = _EventSlot()
+    KeyUp = _EventSlot()
+    Paint = _EventSlot()
+    Resize = _EventSlot()
+    Move = _EventSlot()
+    SizeChanged = _EventSlot()
+    LocationChanged = _EventSlot()
+
+    _LAZY_EVENT_BINDINGS = (
+        (('<ButtonPress>',), '_on_mouse_down', ('MouseDown',)),
+        (('<ButtonRelease>',), '_on_mouse_up', ('MouseUp',)),
+        (('<Enter>',), '_on_mouse_enter', ('MouseEnter',)),
+        (('<Leave>',), '_on_mouse_leave', ('MouseLeave',)),
+        (('<Motion>',), '_on_mouse_move', ('MouseMove', 'MouseHover')),
+        # <Button-4>/<Button-5>: mouse wheel on Linux
+        (('<MouseWheel>', '<Button-4>', '<Button-5>'), '_on_mouse_wheel', ('MouseWheel',)),
+        (('<KeyRelease>',), '_on_key_up', ('KeyUp',)),
+        (('<Configure>',), '_on_paint',
+         ('Paint', 'Resize', 'Move', 'SizeChanged', 'LocationChanged')),
+    )
+
+    _events_bindtag = None
+
+    # Retained-mode painting state (see Invalidate / CreateGraphics)
+    _paint_graphics = None
+    _paint_overlay = None
+    _paint_job = None
+    _paint_clip = None
+    _paint_full = False
+    _painted_size = None
     
     def __init__(self, master_tk_widget, Left=0, Top=0):
         # The actual Tkinter widget (e.g., tk.Button, tk.Label)
@@ -2859,40 +4379,10 @@ class ControlBase:
         self._tooltip_text = ""
         self._tooltip_instance = None
         
-        # Common VB events (callbacks) - MUST be defined before properties that trigger them
-        self.MouseDown = lambda button=None, x=None, y=None: None
-        self.MouseUp = lambda button=None, x=None, y=None: None
-        self.MouseEnter = lambda sender=None, e=None: None
-        self.MouseLeave = lambda sender=None, e=None: None
-        self.MouseMove = lambda sender=None, e=None: None
-        self.MouseWheel = lambda sender=None, e=None: None
-        self.MouseClick = lambda sender=None, e=None: None
-        self.MouseDoubleClick = lambda sender=None, e=None: None
-        self.MouseHover = lambda sender=None, e=None: None
-        self.Enter = lambda sender=None, e=None: None  # GotFocus
-        self.Leave = lambda sender=None, e=None: None  # LostFocus
-        self.GotFocus = lambda sender=None, e=None: None
-        self.LostFocus = lambda sender=None, e=None: None
-        self.KeyDown = lambda sender=None, e=None: None
-        self.Click = lambda sender=None, e=None: None
-        self.DoubleClick = lambda sender=None, e=None: None
-        self.Paint = lambda sender=None, e=None: None
-        self.Resize = lambda sender=None, e=None: None
-        self.Move = lambda sender=None, e=None: None
-        self.KeyPress = lambda sender=None, e=None: None
-        self.KeyUp = lambda sender=None, e=None: None
-        self.TextChanged = lambda sender=None, e=None: None
-        self.VisibleChanged = lambda sender=None, e=None: None
-        self.EnabledChanged = lambda sender=None, e=None: None
-        self.LocationChanged = lambda sender=None, e=None: None
-        self.SizeChanged = lambda sender=None, e=None: None
-        self.FontChanged = lambda sender=None, e=None: None
-        self.BackColorChanged = lambda sender=None, e=None: None
-        self.ForeColorChanged = lambda sender=None, e=None: None
-        self.Validating = lambda sender=None, e=None: None
-        self.Validated = lambda sender=None, e=None: None
-        
-        # New VB properties (after event handlers are defined)
+        # Common VB events (callbacks) are class-level no-ops shared by every
+        # instance; assigning e.g. self.Click = handler shadows them.
+        
+        # New VB properties
         self.Enabled = True
         self._visible = True
         self.BackColor = None
@@ -3182,6 +4672,8 @@ class ControlBase:
         # Refresh geometry
         if hasattr(self, '_place_control'):
             self._place_control(self.Width, self.Height)
+        # Lay out children now instead of waiting for the idle pass
+        super().PerformLayout()
         self.Refresh()
 
     def GetTkWidget(self):
@@ -3210,7 +4702,10 @@ class ControlBase:
 
     def ClearChildren(self):
         """Removes all child widgets from this control."""
+        overlay = getattr(self, '_paint_overlay', None)
         for child in self.GetChildren():
+            if child is overlay:
+                continue  # Paint surface, not a child control
             try:
                 child.destroy()
             except Exception:
@@ -3238,29 +4733,43 @@ class ControlBase:
             except Exception:
                 pass
 
+    def _layout_parent(self):
+        """Returns the wrapper of the container this control is placed in, or None."""
+        master = getattr(self, 'master', None)
+        parent = getattr(master, '_control_wrapper', None) if master else None
+        return parent if parent is not self else None
+
     def _notify_parent_layout_changed(self):
         """Notifies the parent container that this control's layout has changed.
         
-        This triggers the parent to recalculate its AutoSize if enabled.
+        This marks the parent dirty so its AutoSize is recalculated in the next
+        idle layout pass (or on ResumeLayout while the parent is suspended),
+        instead of synchronously on every property assignment.
         Prevents recursion by checking if parent is already applying AutoSize.
         """
-        # Get the parent container wrapper
-        parent = None
-        if hasattr(self, 'master') and self.master:
-            # Check if master has a _control_wrapper reference (Panel, GroupBox, etc.)
-            if hasattr(self.master, '_control_wrapper'):
-                parent = self.master._control_wrapper
-        
-        # If parent has AutoSize enabled, recalculate it
-        if parent and hasattr(parent, 'AutoSize') and parent.AutoSize:
-            # Prevent recursion: don't notify if parent is already applying AutoSize
-            if getattr(parent, '_applying_autosize', False):
-                return
-                
-            if hasattr(parent, '_apply_autosize_panel'):
-                parent._apply_autosize_panel()
-            elif hasattr(parent, '_apply_autosize'):
-                parent._apply_autosize()
+        parent = self._layout_parent()
+        if parent is None or not hasattr(parent, '_request_layout'):
+            return
+        # Prevent recursion: don't notify if parent is already laying out
+        if getattr(parent, '_applying_autosize', False) or parent._performing_layout:
+            return
+        if parent._layout_suspend_count or getattr(parent, 'AutoSize', False):
+            parent._request_layout()
+
+    def _track_in_scroll_parent(self, widget):
+        """Reports the placed rectangle to an AutoScroll parent's child index."""
+        parent = getattr(self.master, '_control_wrapper', None)
+        if parent is not None and hasattr(parent, '_track_scroll_child') and getattr(parent, 'AutoScroll', False):
+            parent._track_scroll_child(self, widget)
+
+    def _request_placement(self):
+        """Places the control now, or defers it while the parent's layout is suspended."""
+        if not (hasattr(self, '_tk_widget') and self._tk_widget) or self._placement_suppressed:
+            return
+        parent = self._layout_parent()
+        if parent is not None and hasattr(parent, '_defer_placement') and parent._defer_placement(self):
+            return
+        self._place_control(self.Width, self.Height)
 
     @property
     def Left(self):
@@ -3269,8 +4778,7 @@ class ControlBase:
     @Left.setter
     def Left(self, value):
         self._left = value
-        if hasattr(self, '_tk_widget') and self._tk_widget:
-            self._place_control(self.Width, self.Height)
+        self._request_placement()
         # Trigger LocationChanged
         self.LocationChanged()
         # Notify parent only after initialization is complete
@@ -3284,8 +4792,7 @@ class ControlBase:
     @Top.setter
     def Top(self, value):
         self._top = value
-        if hasattr(self, '_tk_widget') and self._tk_widget:
-            self._place_control(self.Width, self.Height)
+        self._request_placement()
         # Trigger LocationChanged
         self.LocationChanged()
         # Notify parent only after initialization is complete
@@ -3302,8 +4809,7 @@ class ControlBase:
         # Update _original_size when Width is set with AutoSize disabled
         if not self.AutoSize and self._height is not None:
             self._original_size = (value, self._height)
-        if hasattr(self, '_tk_widget') and self._tk_widget:
-            self._place_control(self.Width, self.Height)
+        self._request_placement()
         # Trigger SizeChanged
         self.SizeChanged()
         # Notify parent only after initialization is complete
@@ -3320,8 +4826,7 @@ class ControlBase:
         # Update _original_size when Height is set with AutoSize disabled
         if not self.AutoSize and self._width is not None:
             self._original_size = (self._width, value)
-        if hasattr(self, '_tk_widget') and self._tk_widget:
-            self._place_control(self.Width, self.Height)
+        self._request_placement()
         # Trigger SizeChanged
         self.SizeChanged()
         # Notify parent only after initialization is complete
@@ -3337,8 +4842,7 @@ class ControlBase:
         if isinstance(value, (tuple, list)) and len(value) >= 2:
             self._left = value[0]
             self._top = value[1]
-            if hasattr(self, '_tk_widget') and self._tk_widget:
-                self._place_control(self.Width, self.Height)
+            self._request_placement()
 
     @property
     def Size(self):
@@ -3354,13 +4858,11 @@ class ControlBase:
         if isinstance(value, (tuple, list)) and len(value) >= 2:
             self._width = value[0]
             self._height = value[1]
-            if hasattr(self, '_tk_widget') and self._tk_widget:
-                self._place_control(self.Width, self.Height)
+            self._request_placement()
         elif hasattr(value, 'Width') and hasattr(value, 'Height'):
             self._width = value.Width
             self._height = value.Height
-            if hasattr(self, '_tk_widget') and self._tk_widget:
-                self._place_control(self.Width, self.Height)
+            self._request_placement()
         
     @property
     def AutoSize(self):
@@ -3574,7 +5076,7 @@ class ControlBase:
     def Tag(self, value):
         self._tag = value
 
-    def Invalidate(self):
+    def Invalidate(self, rect=None):
         """Marks the control as invalid and requests repainting.
         
         This Windows Forms method marks the control or form as 
@@ -3582,19 +5084,122 @@ class ControlBase:
         queue to be repainted when the system is free.
         It is more efficient as it allows the system to combine several 
         repaint requests.
+        
+        With a Paint handler, every call before the next idle moment is
+        merged into one Paint whose e.ClipRectangle is the union of the
+        invalidated rectangles (the whole control when rect is None).
+        
+        Args:
+            rect: Optional Rectangle to repaint
         """
+        if self.Paint is not _no_op_event:
+            self._request_paint(rect)
+            return
         if hasattr(self, '_tk_widget') and self._tk_widget:
             try:
                 self._tk_widget.update_idletasks()
             except tk.TclError:
                 pass
 
+    def CreateGraphics(self):
+        """Gets the retained-mode Graphics of this control's drawing surface.
+        
+        Canvas-based controls draw on their own canvas; Frame-based ones
+        (Panel, UserControl) get a canvas behind their child controls on
+        first use. Draw on it from the Paint handler (e.Graphics).
+        
+        Returns:
+            Graphics, or None if the control has no surface to draw on
+        """
+        if self._paint_graphics is None:
+            surface = self._create_paint_surface()
+            if surface is None:
+                return None
+            self._paint_graphics = Graphics(surface)
+        return self._paint_graphics
+
+    def _create_paint_surface(self):
+        widget = self._tk_widget
+        if widget is None:
+            return None
+        if isinstance(widget, tk.Canvas):
+            return widget
+        if getattr(self, 'AutoScroll', False) and isinstance(getattr(self, '_canvas', None), tk.Canvas):
+            # Scrollable containers draw on their scroll canvas; embedded
+            # child windows always stay above canvas items
+            return self._canvas
+        if widget.winfo_class() not in ('Frame', 'TFrame'):
+            return None
+        canvas = tk.Canvas(widget, highlightthickness=0, bd=0)
+        canvas.place(x=0, y=0, relwidth=1, relheight=1)
+        canvas.lower()
+        # Mouse events on the background still reach the container's bindings
+        canvas.bindtags((str(canvas),) + widget.bindtags())
+        self._paint_overlay = canvas
+        return canvas
+
+    def _request_paint(self, rect=None):
+        """Schedules one Paint for the next idle moment (merging requests)."""
+        if rect is None or self._paint_full:
+            self._paint_full = True
+            self._paint_clip = None
+        elif self._paint_clip is None:
+            self._paint_clip = rect
+        else:
+            self._paint_clip = Rectangle.Union(self._paint_clip, rect)
+        if self._paint_job is None and self._tk_widget is not None:
+            self._paint_job = self._tk_widget._root().after_idle(self._paint_now)
+
+    def _paint_now(self):
+        self._paint_job = None
+        clip = None if self._paint_full else self._paint_clip
+        self._paint_full = False
+        self._paint_clip = None
+        try:
+            if not self._tk_widget.winfo_exists():
+                return
+        except tk.TclError:
+            return
+        graphics = self.CreateGraphics()
+        if graphics is None:
+            bounds = clip or Rectangle(0, 0, self._tk_widget.winfo_width(), self._tk_widget.winfo_height())
+            self.Paint(self, PaintEventArgs(None, bounds))
+            return
+        if self._paint_overlay is not None:
+            # Follow BackColor changes of the container
+            background = self._tk_widget.cget('bg')
+            if self._paint_overlay.cget('bg') != background:
+                self._paint_overlay.configure(bg=background)
+        graphics._begin_paint(clip)
+        try:
+            self.Paint(self, PaintEventArgs(graphics, graphics.ClipBounds))
+        except BaseException:
+            graphics._abandon_paint()
+            raise
+        graphics._end_paint()
+
+    def _flush_paint(self):
+        """Runs a pending Paint now instead of at the next idle moment."""
+        if self._paint_job is not None:
+            self._tk_widget._root().after_cancel(self._paint_job)
+            self._paint_now()
+
+    def _repaint_if_resized(self, event):
+        """Paint after <Configure> only when the size changed, not on a move."""
+        if self.Paint is _no_op_event:
+            return
+        size = (getattr(event, 'width', None), getattr(event, 'height', None))
+        if size != self._painted_size:
+            self._painted_size = size
+            self._request_paint(None)
+
     def Update(self):
         """Forces the control to repaint.
         
         This Windows Forms method forces the control to repaint 
         its client area.
         """
+        self._flush_paint()
         if hasattr(self, '_tk_widget') and self._tk_widget:
             try:
                 self._tk_widget.update()
@@ -3673,11 +5278,8 @@ class ControlBase:
                 except Exception:
                     pass
             
-            # Update scroll region if parent has AutoScroll enabled
-            if hasattr(self.master, '_control_wrapper'):
-                parent = self.master._control_wrapper
-                if hasattr(parent, '_update_scroll_region') and getattr(parent, 'AutoScroll', False):
-                    parent._update_scroll_region()
+            # Index the new rectangle if parent has AutoScroll enabled
+            self._track_in_scroll_parent(self._tk_widget)
             
             # Set the cursor
             self._tk_widget.config(cursor=self.Cursor)
@@ -3686,30 +5288,56 @@ class ControlBase:
             self._apply_visual_config()
             
             # Force update to ensure visual changes are applied immediately
-            self.Invalidate()
+            # (a batched layout pass repaints once when it finishes)
+            if not _LayoutScheduler.batch_depth:
+                self.Invalidate()
 
     def _bind_common_events(self):
-        """Binds common events to the widget."""
+        """Binds common events to the widget.
+        
+        Mouse motion, enter/leave, buttons, wheel, key release and
+        <Configure> are bound lazily, when their events get a handler.
+        """
         if self._tk_widget:
             self._tk_widget.bind('<Button-1>', self._on_click)
-            self._tk_widget.bind('<ButtonPress>', self._on_mouse_down)
-            self._tk_widget.bind('<ButtonRelease>', self._on_mouse_up)
-            self._tk_widget.bind('<Enter>', self._on_mouse_enter)
-            self._tk_widget.bind('<Leave>', self._on_mouse_leave)
-            self._tk_widget.bind('<Motion>', self._on_mouse_move)
-            self._tk_widget.bind('<MouseWheel>', self._on_mouse_wheel)
-            # Linux support for mouse wheel
-            self._tk_widget.bind('<Button-4>', self._on_mouse_wheel)
-            self._tk_widget.bind('<Button-5>', self._on_mouse_wheel)
             self._tk_widget.bind('<FocusIn>', self._on_enter)
             self._tk_widget.bind('<FocusOut>', self._on_leave)
             self._tk_widget.bind('<Key>', self._on_key_down)
             self._tk_widget.bind('<Double-Button-1>', self._on_double_click)
-            self._tk_widget.bind('<Configure>', self._on_paint)
             self._tk_widget.bind('<KeyPress>', self._on_key_press)
-            self._tk_widget.bind('<KeyRelease>', self._on_key_up)
             # Context Menu
             self._tk_widget.bind('<Button-3>', self._on_right_click)
+            self._install_lazy_events(self._tk_widget)
+
+    def _bind_lazy_sequence(self, sequence, callback):
+        """Binds a lazily-installed handler on this control's own bindtag.
+        
+        The tag sits right after the widget's tag, so widget-level bindings
+        made by subclasses are neither replaced nor duplicated by it.
+        """
+        widget = self._tk_widget
+        tags = widget.bindtags()
+        tag = self._events_bindtag
+        if tag not in tags:
+            tag = self._events_bindtag = f'WinFormPyEvents{next(_event_bindtag_ids)}'
+            widget.bindtags((tags[0], tag) + tags[1:])
+            widget.bind_class(tag, '<Destroy>', lambda e: self._release_events_bindtag(widget, tag))
+        widget.bind_class(tag, sequence, callback)
+
+    @staticmethod
+    def _release_events_bindtag(widget, tag):
+        for sequence in widget.bind_class(tag):
+            widget.unbind_class(tag, sequence)
+
+    def _raise_events(self, event, *names):
+        """Raises the named events with one EventArgs, built only if someone listens."""
+        args = None
+        for name in names:
+            handler = getattr(self, name)
+            if handler is not _no_op_event:
+                if args is None:
+                    args = EventArgs(event)
+                handler(self, args)
 
     def _on_right_click(self, event):
         """Handler for Right Click (Context Menu)."""
@@ -3719,10 +5347,12 @@ class ControlBase:
 
     def _on_mouse_down(self, event):
         """Handler for MouseDown event."""
+        self._flush_mouse_move()
         self.MouseDown(self, EventArgs(event))
 
     def _on_mouse_up(self, event):
         """Handler for MouseUp event."""
+        self._flush_mouse_move()
         self.MouseUp(self, EventArgs(event))
 
     def _on_mouse_enter(self, event):
@@ -3731,14 +5361,13 @@ class ControlBase:
 
     def _on_mouse_leave(self, event):
         """Handler for MouseLeave event."""
+        self._flush_mouse_move()
         self.MouseLeave(self, EventArgs(event))
 
-    def _on_mouse_move(self, event):
-        """Handler for MouseMove event."""
-        self.MouseMove(self, EventArgs(event))
+    def _dispatch_mouse_move(self, event):
+        """Raises MouseMove (and MouseHover) for a coalesced motion event."""
         # MouseHover simulation (could use a timer, but this is a simple start)
-        if hasattr(self, 'MouseHover'):
-            self.MouseHover(self, EventArgs(event))
+        self._raise_events(event, 'MouseMove', 'MouseHover')
 
     def _on_mouse_wheel(self, event):
         """Handler for MouseWheel event."""
@@ -3746,53 +5375,35 @@ class ControlBase:
 
     def _on_enter(self, event):
         """Handler for Enter (GotFocus) event."""
-        self.Enter(self, EventArgs(event))
-        self.GotFocus(self, EventArgs(event))
+        self._raise_events(event, 'Enter', 'GotFocus')
 
     def _on_leave(self, event):
         """Handler for Leave (LostFocus) event."""
         # Focus loss is often used for validation in WinForms
-        if hasattr(self, 'Validating'):
-            self.Validating(self, EventArgs(event))
-            
-        self.Leave(self, EventArgs(event))
-        self.LostFocus(self, EventArgs(event))
-        
-        if hasattr(self, 'Validated'):
-            self.Validated(self, EventArgs(event))
+        self._raise_events(event, 'Validating', 'Leave', 'LostFocus', 'Validated')
 
     def _on_key_down(self, event):
         """Handler for KeyDown event."""
-        self.KeyDown(self, EventArgs(event))
+        self._raise_events(event, 'KeyDown')
 
     def _on_click(self, event):
         """Handler for Click event."""
-        # Call Click(sender, e)
-        self.Click(self, EventArgs(event))
-        self.MouseClick(self, EventArgs(event))
+        self._flush_mouse_move()
+        self._raise_events(event, 'Click', 'MouseClick')
 
     def _on_double_click(self, event):
         """Handler for DoubleClick event."""
-        # Call DoubleClick(sender, e)
-        self.DoubleClick(self, EventArgs(event))
-        self.MouseDoubleClick(self, EventArgs(event))
+        self._raise_events(event, 'DoubleClick', 'MouseDoubleClick')
 
     def _on_paint(self, event):
         """Handler for Paint, Resize and Move events."""
-        self.Paint(self, PaintEventArgs())
+        self._repaint_if_resized(event)
         # Trigger SizeChanged/LocationChanged if size/position changed
-        self.Resize(self, EventArgs(event))
-        self.Move(self, EventArgs(event))
-        
-        # Optionally trigger SizeChanged and LocationChanged if they differ from stored values
-        if hasattr(self, 'SizeChanged'):
-             self.SizeChanged(self, EventArgs(event))
-        if hasattr(self, 'LocationChanged'):
-             self.LocationChanged(self, EventArgs(event))
+        self._raise_events(event, 'Resize', 'Move', 'SizeChanged', 'LocationChanged')
 
     def _on_key_press(self, event):
         """Handler for KeyPress event."""
-        self.KeyPress(self, EventArgs(event))
+        self._raise_events(event, 'KeyPress')
 
     def _on_key_up(self, event):
         """Handler for KeyUp event."""
@@ -4108,15 +5719,20 @@ class ControlBase:
         if self._dock != DockStyle.None_:
             # Apply Dock
             self._apply_dock()
-            # Bind resizing for Dock
-            self.master.bind('<Configure>', self._on_dock_resize, add='+')
         elif self._anchor:
             # Calculate initial distances for Anchor
             self._calculate_initial_distances()
-            # Bind resizing for Anchor
-            self.master.bind('<Configure>', self._on_container_resize, add='+')
-            # Also bind to the map event for when the window is shown
-            self.master.bind('<Map>', lambda e: self._calculate_initial_distances(), add='+')
+        # Resizing (and <Map> for Anchor) is handled by the container's dispatcher
+        self._register_layout_dispatch()
+
+    def _register_layout_dispatch(self):
+        """Registers this control with its container's resize dispatcher."""
+        try:
+            if not self.master or not self.master.winfo_exists():
+                return
+        except (tk.TclError, AttributeError):
+            return
+        _ContainerLayoutDispatcher.for_container(self.master).register(self)
     
     def _calculate_initial_distances(self):
         """Calculates the initial distances of the control to the container edges."""
@@ -4246,9 +5862,13 @@ class ControlBase:
                 return
 
         # Get new container size
-        new_width = self.master.winfo_width()
-        new_height = self.master.winfo_height()
-        
+        self._apply_anchor_layout(self.master.winfo_width(), self.master.winfo_height())
+
+    def _apply_anchor_layout(self, new_width, new_height):
+        """Repositions the control for a container of the given size (Anchor)."""
+        if not self._tk_widget or self._dock != DockStyle.None_:
+            return
+
         # Ignore events from containers without a valid size
         if new_width <= 1 or new_height <= 1:
             return
@@ -4318,13 +5938,18 @@ class ControlBase:
                 if int(new_width_ctrl) <= 0 or int(new_height_ctrl) <= 0:
                     return
 
-                self.Left = int(new_left)
-                self.Top = int(new_top)
-                self.Width = int(new_width_ctrl)
-                self.Height = int(new_height_ctrl)
+                # Assign all four properties, then place once
+                self._placement_suppressed = True
+                try:
+                    self.Left = int(new_left)
+                    self.Top = int(new_top)
+                    self.Width = int(new_width_ctrl)
+                    self.Height = int(new_height_ctrl)
+                finally:
+                    self._placement_suppressed = False
 
                 # Reposition with the new size
-                self._tk_widget.place(x=self.Left, y=self.Top, width=self.Width, height=self.Height)
+                self._place_control(self.Width, self.Height)
         except tk.TclError:
             return
         
@@ -4363,8 +5988,14 @@ class ControlBase:
         ControlBase._layout_docked_children(container)
 
     @staticmethod
-    def _layout_docked_children(container):
-        """Shared layout for all Dock controls in a container."""
+    def _layout_docked_children(container, size=None):
+        """Shared layout for all Dock controls in a container.
+
+        Args:
+            container: Tk widget hosting the docked controls.
+            size: Known (width, height) of the container, e.g. from a
+                <Configure> event. When omitted it is queried from Tk.
+        """
         if container is None:
             return
         
@@ -4372,17 +6003,20 @@ class ControlBase:
         if getattr(container, '_dock_layout_in_progress', False):
             return
 
-        # Ensure valid geometry of the container
-        if hasattr(container, 'update_idletasks'):
+        if size is not None:
+            container_width, container_height = size
+        else:
+            # Ensure valid geometry of the container
+            if hasattr(container, 'update_idletasks'):
+                try:
+                    container.update_idletasks()
+                except tk.TclError:
+                    return
             try:
-                container.update_idletasks()
+                container_width = container.winfo_width()
+                container_height = container.winfo_height()
             except tk.TclError:
                 return
-        try:
-            container_width = container.winfo_width()
-            container_height = container.winfo_height()
-        except tk.TclError:
-            return
 
         if container_width <= 1 or container_height <= 1:
             try:
@@ -4535,8 +6169,6 @@ class ControlBase:
         # Clear Dock if Anchor is set
         if self._dock != DockStyle.None_:
             self._dock = DockStyle.None_
-            if hasattr(self, '_dock_resize_bound'):
-                delattr(self, '_dock_resize_bound')
         
         # Handle legacy string input
         if isinstance(value, str):
@@ -4562,6 +6194,8 @@ class ControlBase:
         # Recalculate initial distances
         if hasattr(self, 'Width') and hasattr(self, 'Height'):
             self._calculate_initial_distances()
+        if getattr(self, '_anchor_dock_initialized', False):
+            self._register_layout_dispatch()
     
     @property
     def Dock(self):
@@ -4601,11 +6235,9 @@ class ControlBase:
         
         # If it changes from None to something, or changes value, apply
         if self._tk_widget:
+            # Track resizes through the container's dispatcher
+            self._register_layout_dispatch()
             if value != DockStyle.None_:
-                # Register the resize binding if it does not exist
-                if not hasattr(self, '_dock_resize_bound'):
-                    self.master.bind('<Configure>', self._on_dock_resize, add='+')
-                    self._dock_resize_bound = True
                 # Apply dock immediately
                 self._apply_dock()
             else:
@@ -4884,21 +6516,6 @@ class ControlBase:
                     except tk.TclError:
                         pass  # Ignore unsupported options
     
-    def Invalidate(self):
-        """Marks the control as invalid and requests repaint.
-        
-        This Windows Forms method marks the control as invalid and
-        adds a message to the UI message queue
-        so it repaints when the system is free.
-        It is more efficient as it allows the system to combine multiple
-        repaint requests.
-        """
-        if self._tk_widget:
-            try:
-                self._tk_widget.update_idletasks()
-            except tk.TclError:
-                pass
-    
     def Refresh(self):
         """Forces an immediate repaint of the control.
         
@@ -4907,6 +6524,9 @@ class ControlBase:
         message queue and repaints the control immediately.
         It is equivalent to Invalidate() + Update() in Windows Forms.
         """
+        if self.Paint is not _no_op_event:
+            self._request_paint(None)
+            self._flush_paint()
         if self._tk_widget:
             try:
                 # Invalidate() - marks as invalid and adds to queue
@@ -5117,7 +6737,7 @@ class UserControl(ControlBase, ScrollableControlMixin):
         super().__init__(master_widget, defaults['Left'], defaults['Top'])
         
         # Initialize Controls list early to avoid AttributeError in property setters
-        self.Controls = []
+        self.Controls = ControlCollection()
         self.ControlAdded = lambda control: None
         self.ControlRemoved = lambda control: None
         
@@ -5243,7 +6863,8 @@ class UserControl(ControlBase, ScrollableControlMixin):
             control.master._control_wrapper = self
         
         # Reposition the control in the new container
-        control._place_control()
+        if not self._defer_placement(control):
+            control._place_control()
         
         # Inherit properties from the container
         if hasattr(control, 'Enabled'):
@@ -5268,21 +6889,24 @@ class UserControl(ControlBase, ScrollableControlMixin):
             
             control_should_be_visible = control._visible and usercontrol_visible
             if control_should_be_visible:
-                control._place_control()
+                if not self._defer_placement(control):
+                    control._place_control()
             else:
                 if hasattr(control, '_tk_widget') and control._tk_widget:
                     control._tk_widget.place_forget()
         else:
             if self.get_Visible():
-                control._place_control()
-        
-        # Update scroll region if AutoScroll is enabled
-        if self.AutoScroll:
-            self._update_scroll_region()
+                if not self._defer_placement(control):
+                    control._place_control()
         
-        # Apply AutoSize if enabled
-        if self.AutoSize:
-            self._apply_autosize()
+        # Update scroll region and apply AutoSize (deferred while suspended)
+        if self._layout_suspend_count:
+            self._layout_pending = True
+        else:
+            if self.AutoScroll:
+                self._update_scroll_region()
+            if self.AutoSize:
+                self._apply_autosize()
         
         self.ControlAdded(control)
 
@@ -5293,6 +6917,7 @@ class UserControl(ControlBase, ScrollableControlMixin):
             
             # Update scroll region if AutoScroll is enabled
             if self.AutoScroll:
+                self._untrack_scroll_child(control)
                 self._update_scroll_region()
             
             # Apply AutoSize if enabled
@@ -5303,7 +6928,7 @@ class UserControl(ControlBase, ScrollableControlMixin):
             
     def _on_paint(self, event):
         """Handles the paint/resize event."""
-        self.Paint()
+        self._repaint_if_resized(event)
         self.Resize()
     
     def _apply_autosize(self):
@@ -5425,13 +7050,34 @@ class UserControl(ControlBase, ScrollableControlMixin):
 
 ############# Basic Controls #############
 
-class Form(ScrollableControlMixin):
+class Form(ScrollableControlMixin, _InvokeMixin, _LazyEventsMixin, _DeferredLayoutMixin):
     """
     Represents the main window (Form).
     
     Usage - Option 1: form = Form(); form.Text = "My App"; form.Width = 800
     Usage - Option 2: form = Form({'Text': 'My App', 'Width': 800, 'Height': 600})
     """
+
+    # Bindings on the root see the events of every child widget, so these
+    # are only made (in Show) for the events that have a handler.
+    MouseDown = _EventSlot()
+    MouseUp = _EventSlot()
+    MouseMove = _EventSlot()
+    MouseEnter = _EventSlot()
+    MouseLeave = _EventSlot()
+    MouseWheel = _EventSlot()
+    KeyUp = _EventSlot()
+
+    _LAZY_EVENT_BINDINGS = (
+        (('<ButtonPress>',), '_on_mouse_down', ('MouseDown',)),
+        (('<ButtonRelease>',), '_on_mouse_up', ('MouseUp',)),
+        (('<Motion>',), '_on_mouse_move', ('MouseMove',)),
+        (('<Enter>',), '_on_mouse_enter', ('MouseEnter',)),
+        (('<Leave>',), '_on_mouse_leave', ('MouseLeave',)),
+        # <Button-4>/<Button-5>: mouse wheel on Linux
+        (('<MouseWheel>', '<Button-4>', '<Button-5>'), '_on_mouse_wheel', ('MouseWheel',)),
+        (('<KeyRelease>',), '_on_key_up', ('KeyUp',)),
+    )
     
     def __init__(self, props=None, parent=None):
         # Intelligent argument handling to support Form(parent, props) and Form(props)
@@ -5475,6 +7121,9 @@ class Form(ScrollableControlMixin):
         else:
             self._root = tk.Tk()
         
+        # Runs Invoke/BeginInvoke calls queued by other threads
+        _UIDispatcher.attach(self._root)
+        
         # Suppress "invalid command name" errors from after callbacks on destroyed widgets
         # This happens at the Tcl level, so we need to override bgerror
         self._root.report_callback_exception = self._suppress_after_errors
@@ -5524,7 +7173,7 @@ class Form(ScrollableControlMixin):
         self._init_scroll_properties(defaults)
         
         # Internal list to keep a reference to all controls
-        self.Controls = [] 
+        self.Controls = ControlCollection()
         
         # Additional properties
         self.BackgroundImage = None
@@ -5554,16 +7203,10 @@ class Form(ScrollableControlMixin):
         self.GotFocus = lambda sender, e: None
         self.LostFocus = lambda sender, e: None
         self.KeyDown = lambda sender, e: None
-        self.KeyUp = lambda sender, e: None
         self.KeyPress = lambda sender, e: None
         self.Click = lambda sender, e: None
         self.DoubleClick = lambda sender, e: None
-        self.MouseDown = lambda sender, e: None
-        self.MouseUp = lambda sender, e: None
-        self.MouseMove = lambda sender, e: None
-        self.MouseEnter = lambda sender, e: None
-        self.MouseLeave = lambda sender, e: None
-        self.MouseWheel = lambda sender, e: None
+        # MouseDown/Up/Move/Enter/Leave/Wheel and KeyUp: class-level slots
         self.Closing = self.FormClosing # Alias
         self.Closed = self.FormClosed   # Alias
 
@@ -5978,18 +7621,10 @@ class Form(ScrollableControlMixin):
         self._root.bind('<Configure>', self._on_configure)
         self._root.bind('<Key>', lambda e: self.KeyDown(self, EventArgs(e)))
         self._root.bind('<KeyPress>', lambda e: self.KeyPress(self, EventArgs(e)))
-        self._root.bind('<KeyRelease>', lambda e: self.KeyUp(self, EventArgs(e)))
         self._root.bind('<Button-1>', lambda e: self.Click(self, EventArgs(e)))
         self._root.bind('<Double-Button-1>', lambda e: self.DoubleClick(self, EventArgs(e)))
-        self._root.bind('<ButtonPress>', lambda e: self.MouseDown(self, EventArgs(e)))
-        self._root.bind('<ButtonRelease>', lambda e: self.MouseUp(self, EventArgs(e)))
-        self._root.bind('<Motion>', lambda e: self.MouseMove(self, EventArgs(e)))
-        self._root.bind('<Enter>', lambda e: self.MouseEnter(self, EventArgs(e)))
-        self._root.bind('<Leave>', lambda e: self.MouseLeave(self, EventArgs(e)))
-        self._root.bind('<MouseWheel>', lambda e: self.MouseWheel(self, EventArgs(e)))
-        # Linux support for mouse wheel
-        self._root.bind('<Button-4>', lambda e: self.MouseWheel(self, EventArgs(e)))
-        self._root.bind('<Button-5>', lambda e: self.MouseWheel(self, EventArgs(e)))
+        # Mouse, wheel and key release: only the events with a handler
+        self._install_lazy_events(self._root)
         
         # Trigger Load event
         self.Load(self, EventArgs())
@@ -6003,6 +7638,31 @@ class Form(ScrollableControlMixin):
         if isinstance(self._root, tk.Tk):
             self._root.mainloop()
 
+    def _bind_lazy_sequence(self, sequence, callback):
+        # add='+' keeps any binding the application made on the root itself
+        self._root.bind(sequence, callback, add='+')
+
+    def _on_mouse_down(self, event):
+        self._flush_mouse_move()
+        self.MouseDown(self, EventArgs(event))
+
+    def _on_mouse_up(self, event):
+        self._flush_mouse_move()
+        self.MouseUp(self, EventArgs(event))
+
+    def _on_mouse_enter(self, event):
+        self.MouseEnter(self, EventArgs(event))
+
+    def _on_mouse_leave(self, event):
+        self._flush_mouse_move()
+        self.MouseLeave(self, EventArgs(event))
+
+    def _on_mouse_wheel(self, event):
+        self.MouseWheel(self, EventArgs(event))
+
+    def _on_key_up(self, event):
+        self.KeyUp(self, EventArgs(event))
+
     def _on_activated(self, event):
         self.Activated(self, EventArgs(event))
         self.GotFocus(self, EventArgs(event))
@@ -6140,7 +7800,17 @@ class Form(ScrollableControlMixin):
             
         REPLACES: self._root.after(0, lambda: ...)
         WITH: self.InvokeAsync(lambda: ...)
+        
+        Safe to call from any thread: calls from other threads go through
+        the BeginInvoke queue, since Tk's after() must only be called on
+        the UI thread.
         """
+        if not _UIDispatcher.is_ui_thread():
+            if delay:
+                self.BeginInvoke(self.InvokeAsync, callback, delay)
+            else:
+                self.BeginInvoke(callback)
+            return
         if hasattr(self, '_root') and self._root:
             try:
                 self._root.after(delay, callback)
@@ -6334,7 +8004,8 @@ class Form(ScrollableControlMixin):
             control.master._control_wrapper = self
         
         # Reposition the control in the new container
-        control._place_control()
+        if not self._defer_placement(control):
+            control._place_control()
         
         # Inherit container properties
         if hasattr(control, 'Enabled') and hasattr(self, 'Enabled'):
@@ -6345,8 +8016,10 @@ class Form(ScrollableControlMixin):
                 except tk.TclError:
                     pass
         
-        # Update scroll region if AutoScroll is enabled
-        if self.AutoScroll:
+        # Update scroll region if AutoScroll is enabled (deferred while suspended)
+        if self._layout_suspend_count:
+            self._layout_pending = True
+        elif self.AutoScroll:
             self._update_scroll_region()
         
         # Invoke ControlAdded event
@@ -6359,6 +8032,7 @@ class Form(ScrollableControlMixin):
             
             # Update scroll region if AutoScroll is enabled
             if self.AutoScroll:
+                self._untrack_scroll_child(control)
                 self._update_scroll_region()
                 
             self.ControlRemoved(self, control)
@@ -6837,24 +8511,15 @@ class Button(ControlBase):
             # Note: We intentionally do NOT bind <Button-1> here because
             # tk.Button's `command` parameter already handles click events.
             # Binding <Button-1> would cause the Click event to fire twice.
-            self._tk_widget.bind('<ButtonPress>', self._on_mouse_down)
-            self._tk_widget.bind('<ButtonRelease>', self._on_mouse_up)
-            self._tk_widget.bind('<Enter>', self._on_mouse_enter)
-            self._tk_widget.bind('<Leave>', self._on_mouse_leave)
-            self._tk_widget.bind('<Motion>', self._on_mouse_move)
-            self._tk_widget.bind('<MouseWheel>', self._on_mouse_wheel)
-            # Linux support for mouse wheel
-            self._tk_widget.bind('<Button-4>', self._on_mouse_wheel)
-            self._tk_widget.bind('<Button-5>', self._on_mouse_wheel)
             self._tk_widget.bind('<FocusIn>', self._on_enter)
             self._tk_widget.bind('<FocusOut>', self._on_leave)
             self._tk_widget.bind('<Key>', self._on_key_down)
             self._tk_widget.bind('<Double-Button-1>', self._on_double_click)
-            self._tk_widget.bind('<Configure>', self._on_paint)
             self._tk_widget.bind('<KeyPress>', self._on_key_press)
-            self._tk_widget.bind('<KeyRelease>', self._on_key_up)
             # Context Menu
             self._tk_widget.bind('<Button-3>', self._on_right_click)
+            # Mouse, wheel, key release and <Configure>: bound when handled
+            self._install_lazy_events(self._tk_widget)
 
     def set_Enabled(self, enabled):
         """Sets whether the button is enabled."""
@@ -7365,7 +9030,451 @@ class Label(ControlBase):
             pass
 
 
-class TextBox(ControlBase):
+# =============================================================
+# AutoComplete (TextBox, ComboBox)
+# =============================================================
+
+class _AutoCompleteIndex:
+    """Sorted, case-insensitive prefix index over a list of strings.
+
+    Built once per source; a lookup is two bisects, so it stays well under a
+    millisecond even for hundreds of thousands of entries.
+    """
+
+    def __init__(self, strings):
+        self._values = sorted(set(map(str, strings)), key=str.lower)
+        self._keys = [value.lower() for value in self._values]
+
+    def find(self, prefix):
+        """Returns the (start, stop) positions of the entries starting with prefix."""
+        prefix = prefix.lower()
+        start = bisect.bisect_left(self._keys, prefix)
+        stop = bisect.bisect_left(self._keys, prefix + '\U0010ffff', start)
+        return start, stop
+
+    def __getitem__(self, position):
+        return self._values[position]
+
+    def __len__(self):
+        return len(self._values)
+
+
+class AutoCompleteStringCollection:
+    """Strings used when AutoCompleteSource is CustomSource.
+
+    The prefix index is built on the first lookup after a change and shared
+    by every control that uses this collection.
+
+    Usage:
+        source = AutoCompleteStringCollection(customer_names)
+        textbox.AutoCompleteCustomSource = source
+        textbox.AutoCompleteSource = AutoCompleteSource.CustomSource
+        textbox.AutoCompleteMode = AutoCompleteMode.SuggestAppend
+    """
+
+    def __init__(self, items=None):
+        self._items = list(items) if items else []
+        self._index = None
+
+    def Add(self, value):
+        self._items.append(value)
+        self._index = None
+        return len(self._items) - 1
+
+    def AddRange(self, values):
+        self._items.extend(values)
+        self._index = None
+
+    def Remove(self, value):
+        if value in self._items:
+            self._items.remove(value)
+            self._index = None
+
+    def Clear(self):
+        self._items.clear()
+        self._index = None
+
+    def Contains(self, value):
+        return value in self._items
+
+    @property
+    def Count(self):
+        return len(self._items)
+
+    def _get_index(self):
+        if self._index is None:
+            self._index = _AutoCompleteIndex(self._items)
+        return self._index
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return f"AutoCompleteStringCollection({self._items!r})"
+
+    # List compatibility aliases
+    def append(self, value): return self.Add(value)
+    def extend(self, values): self.AddRange(values)
+    def remove(self, value): self.Remove(value)
+    def clear(self): self.Clear()
+
+
+class _AutoCompleteDropDown:
+    """Suggestion list shown under the edit box.
+
+    Virtualized: the Listbox only ever holds VisibleRows rows, refilled from
+    the index as the user scrolls, so 100k matches cost the same as 8.
+    """
+
+    VisibleRows = 8
+
+    def __init__(self, owner_widget, on_accept):
+        self._on_accept = on_accept
+        self._owner = owner_widget
+        self._index = None
+        self._start = self._stop = 0
+        self._top_row = 0
+        self._selected = -1
+
+        self._top = tk.Toplevel(owner_widget)
+        self._top.overrideredirect(True)
+        self._top.withdraw()
+        self._list = tk.Listbox(self._top, height=self.VisibleRows, activestyle='none',
+                                exportselection=False, takefocus=0, borderwidth=1)
+        self._scroll = tk.Scrollbar(self._top, command=self._on_scroll)
+        self._scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self._list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # Handle clicks ourselves so the edit box keeps the focus
+        self._list.bind('<Button-1>', self._on_click)
+        self._list.bind('<MouseWheel>', lambda e: self.scroll(-1 if e.delta > 0 else 1))
+        self._list.bind('<Button-4>', lambda e: self.scroll(-1))
+        self._list.bind('<Button-5>', lambda e: self.scroll(1))
+
+    @property
+    def Visible(self):
+        return self._top.winfo_ismapped()
+
+    @property
+    def Count(self):
+        return self._stop - self._start
+
+    def show(self, index, start, stop):
+        """Shows the matches index[start:stop]."""
+        self._index, self._start, self._stop = index, start, stop
+        self._top_row = 0
+        self._selected = -1
+        self._render()
+        owner = self._owner
+        x = owner.winfo_rootx()
+        y = owner.winfo_rooty() + owner.winfo_height()
+        self._top.update_idletasks()
+        height = self._top.winfo_reqheight()
+        self._top.geometry(f"{max(owner.winfo_width(), 120)}x{height}+{x}+{y}")
+        self._top.deiconify()
+        self._top.lift()
+
+    def hide(self):
+        if self._top.winfo_exists():
+            self._top.withdraw()
+        self._index = None
+
+    def destroy(self):
+        if self._top.winfo_exists():
+            self._top.destroy()
+
+    def move(self, delta):
+        """Moves the highlighted row by delta, scrolling it into view."""
+        if not self.Count:
+            return
+        self._selected = max(0, min(self.Count - 1, self._selected + delta))
+        if self._selected < self._top_row:
+            self._top_row = self._selected
+        elif self._selected >= self._top_row + self.VisibleRows:
+            self._top_row = self._selected - self.VisibleRows + 1
+        self._render()
+
+    def scroll(self, rows):
+        self._set_top_row(self._top_row + rows)
+        return 'break'
+
+    def selected_value(self):
+        if self._index is None or not 0 <= self._selected < self.Count:
+            return None
+        return self._index[self._start + self._selected]
+
+    def _set_top_row(self, row):
+        self._top_row = max(0, min(max(0, self.Count - self.VisibleRows), row))
+        self._render()
+
+    def _render(self):
+        count = self.Count
+        rows = min(self.VisibleRows, count - self._top_row)
+        first = self._start + self._top_row
+        self._list.delete(0, tk.END)
+        if rows > 0:
+            self._list.insert(tk.END, *(self._index[first + i] for i in range(rows)))
+        self._list.config(height=max(1, min(self.VisibleRows, count)))
+        row = self._selected - self._top_row
+        if 0 <= row < rows:
+            self._list.selection_set(row)
+        if count:
+            self._scroll.set(self._top_row / count, (self._top_row + rows) / count)
+
+    def _on_scroll(self, action, amount, unit=None):
+        if action == 'moveto':
+            self._set_top_row(int(float(amount) * self.Count))
+        elif action == 'scroll':
+            step = self.VisibleRows if unit == 'pages' else 1
+            self._set_top_row(self._top_row + int(amount) * step)
+
+    def _on_click(self, event):
+        row = self._list.nearest(event.y)
+        if 0 <= row < self._list.size():
+            self._selected = self._top_row + row
+            value = self.selected_value()
+            if value is not None:
+                self._on_accept(value)
+        return 'break'
+
+
+class _AutoCompleteController:
+    """Implements AutoCompleteMode for a control whose widget is Entry-like.
+
+    Keystrokes are debounced by DebounceMs. Append completes the text inline
+    and selects the added part; Suggest shows an _AutoCompleteDropDown.
+    The controller stays bound once created; with AutoCompleteMode.None_ its
+    handlers simply do nothing.
+    """
+
+    DebounceMs = 40
+    _IGNORED_KEYS = frozenset((
+        'Up', 'Down', 'Left', 'Right', 'Home', 'End', 'Prior', 'Next', 'Return',
+        'KP_Enter', 'Escape', 'Tab', 'Shift_L', 'Shift_R', 'Control_L', 'Control_R',
+        'Alt_L', 'Alt_R', 'Caps_Lock', 'Num_Lock', 'Insert',
+    ))
+    # Cached directory listings for the FileSystem sources
+    _MaxDirectoryIndexes = 16
+
+    def __init__(self, control):
+        self._control = control
+        self._widget = control._tk_widget
+        self._pending = None
+        self._last_key = None
+        self._dropdown = None
+        self._directory_indexes = {}
+        self._widget.bind('<KeyPress>', self._on_key_press, add='+')
+        self._widget.bind('<KeyRelease>', self._on_key_release, add='+')
+        self._widget.bind('<FocusOut>', self._on_focus_out, add='+')
+        self._widget.bind('<Destroy>', self._on_destroy, add='+')
+
+    # -- mode / source -------------------------------------------------
+
+    def _mode(self):
+        return _coerce_enum(AutoCompleteMode, self._control.AutoCompleteMode)
+
+    def _get_index(self, text):
+        """Returns the _AutoCompleteIndex for the current source, or None."""
+        source = _coerce_enum(AutoCompleteSource, self._control.AutoCompleteSource)
+        if source == AutoCompleteSource.CustomSource:
+            custom = self._control.AutoCompleteCustomSource
+            return custom._get_index() if custom is not None else None
+        if source == AutoCompleteSource.ListItems:
+            return self._control._get_autocomplete_items_index()
+        if source in (AutoCompleteSource.FileSystem, AutoCompleteSource.AllSystemSources):
+            return self._get_directory_index(text, directories_only=False)
+        if source == AutoCompleteSource.FileSystemDirectories:
+            return self._get_directory_index(text, directories_only=True)
+        return None
+
+    def _get_directory_index(self, text, directories_only):
+        directory = os.path.dirname(text)
+        if not directory or not os.path.isdir(directory):
+            return None
+        key = (directory, directories_only)
+        index = self._directory_indexes.get(key)
+        if index is None:
+            try:
+                with os.scandir(directory) as entries:
+                    paths = [os.path.join(directory, entry.name) for entry in entries
+                             if not directories_only or entry.is_dir()]
+            except OSError:
+                return None
+            if len(self._directory_indexes) >= self._MaxDirectoryIndexes:
+                self._directory_indexes.clear()
+            index = self._directory_indexes[key] = _AutoCompleteIndex(paths)
+        return index
+
+    # -- event handlers ------------------------------------------------
+
+    def _on_key_press(self, event):
+        self._last_key = event.keysym
+        dropdown = self._dropdown
+        if dropdown is None or not dropdown.Visible:
+            return None
+        if event.keysym == 'Down':
+            dropdown.move(1)
+        elif event.keysym == 'Up':
+            dropdown.move(-1)
+        elif event.keysym == 'Next':
+            dropdown.move(dropdown.VisibleRows)
+        elif event.keysym == 'Prior':
+            dropdown.move(-dropdown.VisibleRows)
+        elif event.keysym in ('Return', 'KP_Enter'):
+            value = dropdown.selected_value()
+            if value is None:
+                dropdown.hide()
+                return None
+            self._accept(value)
+        elif event.keysym == 'Escape':
+            dropdown.hide()
+        else:
+            return None
+        return 'break'
+
+    def _on_key_release(self, event):
+        if event.keysym in self._IGNORED_KEYS or self._mode() == AutoCompleteMode.None_:
+            return
+        if self._pending is not None:
+            self._widget.after_cancel(self._pending)
+        self._pending = self._widget.after(self.DebounceMs, self._update)
+
+    def _on_focus_out(self, event):
+        # Delay so a click in the dropdown is handled first
+        if self._dropdown is not None:
+            self._widget.after(150, self._hide_if_unfocused)
+
+    def _on_destroy(self, event):
+        if event.widget is self._widget and self._dropdown is not None:
+            self._dropdown.destroy()
+            self._dropdown = None
+
+    def _hide_if_unfocused(self):
+        if self._dropdown is not None and self._widget.focus_get() is not self._widget:
+            self._dropdown.hide()
+
+    # -- completion ----------------------------------------------------
+
+    def _update(self):
+        """Runs one lookup for the text typed so far."""
+        self._pending = None
+        widget = self._widget
+        mode = self._mode()
+        if mode == AutoCompleteMode.None_ or not widget.winfo_exists():
+            self._hide()
+            return
+        text = widget.get()
+        if widget.selection_present():
+            # Ignore a previously appended (selected) completion
+            text = text[:widget.index('sel.first')]
+        index = self._get_index(text) if text else None
+        start, stop = index.find(text) if index is not None else (0, 0)
+        if start == stop:
+            self._hide()
+            return
+
+        if mode in (AutoCompleteMode.Append, AutoCompleteMode.SuggestAppend) \
+                and self._last_key not in ('BackSpace', 'Delete') \
+                and widget.index('insert') >= len(text):
+            first = index[start]
+            if len(first) > len(text):
+                widget.delete(len(text), tk.END)
+                widget.insert(len(text), first[len(text):])
+                widget.selection_range(len(text), tk.END)
+                widget.icursor(len(text))
+
+        if mode in (AutoCompleteMode.Suggest, AutoCompleteMode.SuggestAppend):
+            if self._dropdown is None:
+                self._dropdown = _AutoCompleteDropDown(widget, self._accept)
+            self._dropdown.show(index, start, stop)
+        else:
+            self._hide()
+
+    def _accept(self, value):
+        widget = self._widget
+        widget.delete(0, tk.END)
+        widget.insert(0, value)
+        widget.icursor(tk.END)
+        self._hide()
+
+    def _hide(self):
+        if self._dropdown is not None:
+            self._dropdown.hide()
+
+
+def _coerce_enum(enum_type, value):
+    """Maps an enum member, its name ('Suggest', 'None') or its value to the member."""
+    if isinstance(value, enum_type) or value is None:
+        return value if value is not None else enum_type.None_
+    if isinstance(value, str):
+        name = value if value != 'None' else 'None_'
+        return enum_type.__members__.get(name, enum_type.None_)
+    try:
+        return enum_type(value)
+    except ValueError:
+        return enum_type.None_
+
+
+class _AutoCompleteMixin:
+    """AutoCompleteMode / AutoCompleteSource / AutoCompleteCustomSource for TextBox and ComboBox."""
+
+    _autocomplete = None
+    _autocomplete_mode = AutoCompleteMode.None_
+    _autocomplete_source = AutoCompleteSource.None_
+    _autocomplete_custom_source = None
+
+    @property
+    def AutoCompleteMode(self):
+        """Gets or sets how automatic completion works (None_, Suggest, Append, SuggestAppend)."""
+        return self._autocomplete_mode
+
+    @AutoCompleteMode.setter
+    def AutoCompleteMode(self, value):
+        self._autocomplete_mode = _coerce_enum(AutoCompleteMode, value)
+        self._setup_autocomplete()
+
+    @property
+    def AutoCompleteSource(self):
+        """Gets or sets where completion strings come from."""
+        return self._autocomplete_source
+
+    @AutoCompleteSource.setter
+    def AutoCompleteSource(self, value):
+        self._autocomplete_source = _coerce_enum(AutoCompleteSource, value)
+
+    @property
+    def AutoCompleteCustomSource(self):
+        """Gets or sets the strings used with AutoCompleteSource.CustomSource."""
+        return self._autocomplete_custom_source
+
+    @AutoCompleteCustomSource.setter
+    def AutoCompleteCustomSource(self, value):
+        if value is not None and not isinstance(value, AutoCompleteStringCollection):
+            value = AutoCompleteStringCollection(value)
+        self._autocomplete_custom_source = value
+
+    def _supports_autocomplete(self):
+        return True
+
+    def _get_autocomplete_items_index(self):
+        """Index for AutoCompleteSource.ListItems; None for controls without items."""
+        return None
+
+    def _setup_autocomplete(self):
+        """Creates the controller once the widget exists and a mode is set."""
+        if (self._autocomplete is None
+                and self._autocomplete_mode != AutoCompleteMode.None_
+                and getattr(self, '_tk_widget', None) is not None
+                and self._supports_autocomplete()):
+            self._autocomplete = _AutoCompleteController(self)
+
+
+class TextBox(_AutoCompleteMixin, ControlBase):
     """Represents a simple text box."""
     
     def __init__(self, master_form, props=None):
@@ -7511,10 +9620,8 @@ class TextBox(ControlBase):
             
             # Bind events for Text widget
             self._tk_widget.bind('<<Modified>>', self._on_text_changed)
-            self._tk_widget.bind('<KeyRelease>', self._on_key_up)
             self._tk_widget.bind('<Button-1>', self._on_click)
             self._tk_widget.bind('<Double-Button-1>', self._on_double_click)
-            self._tk_widget.bind('<Motion>', self._on_mouse_move)
         else:
             self._text_var = tk.StringVar(value=self._text_value)
             self._tk_widget = tk.Entry(self.master, textvariable=self._text_var)
@@ -7530,12 +9637,11 @@ class TextBox(ControlBase):
             
             # Bind events for Entry widget
             self._text_var.trace('w', self._on_text_changed_entry)
-            self._tk_widget.bind('<KeyRelease>', self._on_key_up)
             self._tk_widget.bind('<Button-1>', self._on_click)
             self._tk_widget.bind('<Double-Button-1>', self._on_double_click)
-            self._tk_widget.bind('<Motion>', self._on_mouse_move)
         
         self._bind_common_events()
+        self._setup_autocomplete()
         
         # Apply style configurations
         config = {}
@@ -7619,7 +9725,8 @@ class TextBox(ControlBase):
             try:
                 self._container_frame.place(**place_args)
             except tk.TclError:
-                pass
+                return
+            self._track_in_scroll_parent(self._container_frame)
         else:
             # Use parent's implementation for single line or multiline without scrollbars
             super()._place_control(width, height)
@@ -7687,10 +9794,14 @@ class TextBox(ControlBase):
             except (tk.TclError, ValueError):
                 pass
 
-    def _on_mouse_move(self, event):
-        """Handler for MouseMove event."""
+    def _dispatch_mouse_move(self, event):
+        """Raises MouseMove (TextBox passes x, y) for a coalesced motion event."""
         self.MouseMove(event.x, event.y)
 
+    def _supports_autocomplete(self):
+        # As in WinForms, AutoComplete only applies to single-line text boxes
+        return not self.Multiline
+
     def _validate_length(self, new_text):
         return len(new_text) <= self.MaxLength
 
@@ -8359,8 +10470,16 @@ class RadioButton(ControlBase):
                 # _apply_autosize() already calls _place_control()
 
 
-class ComboBox(ControlBase):
+class ComboBox(_AutoCompleteMixin, ControlBase):
     """Represents a ComboBox (drop-down)."""
+
+    # Item changes are pushed to Tk once per idle cycle (or on EndUpdate)
+    _updating = False
+    _items_dirty = False
+    _items_flush_id = None
+    # Sorted (lowercase text, index) pairs for FindString/FindStringExact
+    _items_index = None
+    _autocomplete_items_index = None
     
     class ObjectCollection:
         def __init__(self, owner):
@@ -8561,7 +10680,7 @@ class ComboBox(ControlBase):
         self._tk_widget.config(height=self.MaxDropDownItems)
         
         # Update items if they were added before widget creation
-        self._update_items()
+        self._flush_items()
         
         if self.MaxLength > 0:
             vcmd = (self.master.register(self._validate_length), '%P')
@@ -8607,6 +10726,7 @@ class ComboBox(ControlBase):
         
         # Bind events
         self._tk_widget.bind('<<ComboboxSelected>>', self._on_selected_index_changed)
+        self._setup_autocomplete()
         # self._tk_widget.bind('<Post>', self._on_drop_down)
         self._tk_widget.bind('<Unmap>', self._on_drop_down_closed) # Approximation
         
@@ -8626,9 +10746,48 @@ class ComboBox(ControlBase):
         self._auto_register_with_parent()
 
     def _update_items(self):
-        if hasattr(self, '_tk_widget') and self._tk_widget is not None:
+        """Marks the items as changed; Tk receives them on the next idle cycle.
+
+        Adding N items one by one therefore sends the values list once, not N
+        times. Inside BeginUpdate/EndUpdate nothing is scheduled at all.
+        """
+        self._items_index = None
+        self._autocomplete_items_index = None
+        self._items_dirty = True
+        if self._updating or self._items_flush_id is not None:
+            return
+        widget = getattr(self, '_tk_widget', None)
+        if widget is not None:
+            try:
+                self._items_flush_id = widget.after_idle(self._flush_items)
+            except tk.TclError:
+                self._flush_items()
+
+    def _flush_items(self):
+        """Pushes pending item changes to the Tk widget now."""
+        widget = getattr(self, '_tk_widget', None)
+        if self._items_flush_id is not None:
+            flush_id, self._items_flush_id = self._items_flush_id, None
+            try:
+                widget.after_cancel(flush_id)
+            except tk.TclError:
+                pass
+        if self._items_dirty and widget is not None:
+            self._items_dirty = False
             # Convert to list for Tkinter
-            self._tk_widget['values'] = list(self._items)
+            widget['values'] = list(self._items)
+
+    def _get_autocomplete_items_index(self):
+        if self._autocomplete_items_index is None:
+            self._autocomplete_items_index = _AutoCompleteIndex(self._items)
+        return self._autocomplete_items_index
+
+    def _get_find_index(self):
+        """Returns the sorted (lowercase text, index) pairs, rebuilding them if stale."""
+        if self._items_index is None:
+            self._items_index = sorted(
+                (str(item).lower(), i) for i, item in enumerate(self._items))
+        return self._items_index
 
     @property
     def Items(self):
@@ -8704,6 +10863,7 @@ class ComboBox(ControlBase):
     @property
     def SelectedItem(self):
         """Gets or sets the selected item."""
+        self._flush_items()
         idx = self._tk_widget.current()
         if idx >= 0 and idx < len(self._items):
             if self._data_source:
@@ -8743,11 +10903,13 @@ class ComboBox(ControlBase):
     @property
     def SelectedIndex(self):
         """Gets or sets the index of the selected item."""
+        self._flush_items()
         return self._tk_widget.current()
 
     @SelectedIndex.setter
     def SelectedIndex(self, index):
         if index >= -1 and index < len(self._items):
+            self._flush_items()
             self._tk_widget.current(index)
             self._on_selected_index_changed()
 
@@ -8839,29 +11001,37 @@ class ComboBox(ControlBase):
     def EndUpdate(self):
         self._updating = False
         self._ignore_change = False
-        self._update_items()
+        self._flush_items()
 
     def FindString(self, s, start_index=-1):
         s = s.lower()
-        for i in range(start_index + 1, len(self._items)):
-            if str(self._items[i]).lower().startswith(s):
-                return i
+        index = self._get_find_index()
+        # Every item starting with s sorts between s and s + the highest code point
+        lo = bisect.bisect_left(index, (s,))
+        hi = bisect.bisect_left(index, (s + '\U0010ffff',), lo)
+        after = wrapped = -1
+        for _, i in index[lo:hi]:
+            if i > start_index:
+                if after == -1 or i < after:
+                    after = i
+            elif wrapped == -1 or i < wrapped:
+                wrapped = i
+        if after != -1:
+            return after
         # Wrap around
-        if start_index != -1:
-            for i in range(0, start_index + 1):
-                if str(self._items[i]).lower().startswith(s):
-                    return i
-        return -1
+        return wrapped if start_index != -1 else -1
 
     def FindStringExact(self, s, start_index=-1):
         s = s.lower()
-        for i in range(start_index + 1, len(self._items)):
-            if str(self._items[i]).lower() == s:
-                return i
+        index = self._get_find_index()
+        # Equal texts are ordered by item index
+        pos = bisect.bisect_left(index, (s, start_index + 1))
+        if pos < len(index) and index[pos][0] == s:
+            return index[pos][1]
         if start_index != -1:
-            for i in range(0, start_index + 1):
-                if str(self._items[i]).lower() == s:
-                    return i
+            pos = bisect.bisect_left(index, (s,))
+            if pos < len(index) and index[pos][0] == s:
+                return index[pos][1]
         return -1
         
     def Select(self, start, length):
@@ -12496,6 +14666,246 @@ class MaskedTextBox(TextBox):
         return f"MaskedTextBox, Text: {self.Text}"
 
 
+class AsyncCompletedEventArgs(EventArgs):
+    """Event data for the LoadCompleted event (System.ComponentModel.AsyncCompletedEventArgs)."""
+    def __init__(self, error=None, cancelled=False, user_state=None):
+        super().__init__()
+        self.Error = error
+        self.Cancelled = cancelled
+        self.UserState = user_state
+
+
+class ProgressChangedEventArgs(EventArgs):
+    """Event data for the LoadProgressChanged event (System.ComponentModel.ProgressChangedEventArgs)."""
+    def __init__(self, progress_percentage, user_state=None):
+        super().__init__()
+        self.ProgressPercentage = progress_percentage
+        self.UserState = user_state
+
+
+class _ImageLoadJob:
+    """A single PictureBox.LoadAsync request tracked by the image load pool."""
+
+    def __init__(self, owner, location, target_size, size_mode):
+        import threading
+        self.owner = owner
+        self.location = location
+        self.target_size = target_size
+        self.size_mode = size_mode
+        self.cancel_event = threading.Event()
+        self.future = None
+        self.done = False
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+
+class _ImageLoadPool:
+    """
+    Bounded worker pool shared by every PictureBox.LoadAsync call.
+
+    Workers only read and decode: they open the file or URL, decode and resize
+    with PIL when it is available, and hand back raw pixel buffers (or the
+    encoded bytes when PIL is missing). PhotoImage creation and every event
+    are performed by a pump that runs on the Tk thread via ``after``, so no
+    Tk call is ever made from a worker thread.
+    """
+
+    MaxWorkers = max(1, min(4, os.cpu_count() or 1))
+    PumpInterval = 15  # ms between result drains while jobs are pending
+    _ChunkSize = 64 * 1024
+
+    _executor = None
+    _results = None
+    _pending = set()
+    _pump_root = None
+    _pump_job = None
+
+    @classmethod
+    def submit(cls, job, tk_widget):
+        """Queues a job and makes sure the Tk-side pump is running. Call from the Tk thread."""
+        import queue
+        from concurrent.futures import ThreadPoolExecutor
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(max_workers=cls.MaxWorkers,
+                                               thread_name_prefix='PictureBoxLoader')
+            cls._results = queue.SimpleQueue()
+        cls._pending.add(job)
+        job.future = cls._executor.submit(cls._work, job)
+        cls._ensure_pump(tk_widget)
+
+    @classmethod
+    def cancel(cls, job):
+        """Cancels a job; a job that has not started yet is dropped from the queue."""
+        job.cancel_event.set()
+        if job.future is not None and job.future.cancel():
+            # Never reached a worker, so report the cancellation ourselves
+            cls._results.put(('done', job, None, None))
+
+    @classmethod
+    def _ensure_pump(cls, tk_widget):
+        try:
+            root = tk_widget._root()
+        except tk.TclError:
+            return
+        if cls._pump_job is not None:
+            if cls._pump_root is root and _LayoutScheduler._root_alive(root):
+                return
+            # The pump's root was destroyed (its after() never fires) or is
+            # not the caller's: drop the stale job and pump on this root
+            try:
+                cls._pump_root.after_cancel(cls._pump_job)
+            except (tk.TclError, RuntimeError):
+                pass
+            cls._pump_job = None
+        try:
+            cls._pump_root = root
+            cls._pump_job = root.after(cls.PumpInterval, cls._pump)
+        except tk.TclError:
+            cls._pump_root = None
+
+    @classmethod
+    def _pump(cls):
+        """Drains worker results on the Tk thread."""
+        cls._pump_job = None
+        progress = {}
+        finished = []
+        while True:
+            try:
+                kind, job, payload, error = cls._results.get_nowait()
+            except Exception:
+                break
+            if kind == 'progress':
+                # Coalesce: only the latest percentage per job is reported
+                progress[job] = payload
+            else:
+                progress.pop(job, None)
+                finished.append((job, payload, error))
+
+        try:
+            for job, percent in progress.items():
+                if not job.cancelled and not job.done:
+                    cls._call_owner(job.owner._on_async_progress, job, percent)
+            for job, payload, error in finished:
+                cls._pending.discard(job)
+                if not job.done:
+                    job.done = True
+                    cls._call_owner(job.owner._on_async_finished, job, payload, error)
+        finally:
+            if cls._pending and cls._pump_root is not None:
+                try:
+                    cls._pump_job = cls._pump_root.after(cls.PumpInterval, cls._pump)
+                except tk.TclError:
+                    cls._pending.clear()
+
+    @classmethod
+    def _call_owner(cls, callback, *args):
+        """Runs a PictureBox callback (user event handlers); an error in one
+        is reported like any Tk callback error and does not stop the pump."""
+        try:
+            callback(*args)
+        except Exception:
+            root = cls._pump_root
+            if root is not None:
+                root.report_callback_exception(*sys.exc_info())
+            else:
+                raise
+
+    @classmethod
+    def _work(cls, job):
+        """Worker body: read, decode and resize without touching Tk."""
+        try:
+            def report(percent):
+                cls._results.put(('progress', job, percent, None))
+            data = _read_image_bytes(job.location, job.cancel_event, report, cls._ChunkSize)
+            payload = None
+            if data is not None and not job.cancelled:
+                payload = _decode_image_bytes(data, job.target_size, job.size_mode)
+            cls._results.put(('done', job, None if job.cancelled else payload, None))
+        except Exception as e:
+            cls._results.put(('done', job, None, e))
+
+
+def _read_image_bytes(location, cancel_event=None, progress=None, chunk_size=64 * 1024):
+    """Reads an image file or URL in chunks, reporting percentage progress.
+
+    Returns None if ``cancel_event`` is set while reading.
+    """
+    if '://' in location and not location.lower().startswith('file://'):
+        import urllib.request
+        stream = urllib.request.urlopen(location, timeout=30)
+        length = stream.headers.get('Content-Length')
+        total = int(length) if length and length.isdigit() else 0
+    else:
+        if location.lower().startswith('file://'):
+            import urllib.request
+            location = urllib.request.url2pathname(location[7:])
+        stream = open(location, 'rb')
+        total = os.path.getsize(location)
+
+    chunks = []
+    read = 0
+    last_percent = -1
+    with stream:
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            read += len(chunk)
+            if progress and total:
+                percent = min(100, read * 100 // total)
+                if percent != last_percent:
+                    last_percent = percent
+                    progress(percent)
+    if progress and last_percent != 100:
+        progress(100)
+    return b''.join(chunks)
+
+
+def _decode_image_bytes(data, target_size=None, size_mode=None):
+    """Decodes image bytes into a thread-neutral payload for ``_create_photo_image``.
+
+    With PIL the image is decoded and resized for StretchImage/Zoom here, and the
+    payload is ``('raw', mode, size, pixels)``. Without PIL the encoded bytes are
+    passed through as ``('encoded', data)`` for Tk's own PNG/GIF/PPM decoder.
+    """
+    try:
+        from PIL import Image as PILImage
+    except ImportError:
+        return ('encoded', data)
+
+    import io
+    img = PILImage.open(io.BytesIO(data))
+    new_size = None
+    if target_size and size_mode in (PictureBoxSizeMode.StretchImage, PictureBoxSizeMode.Zoom):
+        box_w, box_h = max(1, target_size[0]), max(1, target_size[1])
+        if size_mode == PictureBoxSizeMode.Zoom:
+            scale = min(box_w / img.width, box_h / img.height)
+            new_size = (max(1, int(img.width * scale)), max(1, int(img.height * scale)))
+        else:
+            new_size = (box_w, box_h)
+        # JPEG can decode at a reduced scale directly, which makes thumbnails cheap
+        img.draft('RGB', new_size)
+    img = img.convert('RGBA')
+    if new_size and new_size != img.size:
+        img = img.resize(new_size, PILImage.Resampling.LANCZOS)
+    return ('raw', img.mode, img.size, img.tobytes())
+
+
+def _create_photo_image(payload, master=None):
+    """Builds a PhotoImage from a decode payload. Must run on the Tk thread."""
+    if payload[0] == 'raw':
+        from PIL import Image as PILImage, ImageTk
+        _, mode, size, pixels = payload
+        return ImageTk.PhotoImage(PILImage.frombytes(mode, size, pixels), master=master)
+    import base64
+    return tk.PhotoImage(master=master, data=base64.b64encode(payload[1]))
+
+
 class PictureBox(ControlBase):
     """
     Represents a PictureBox to display images with VB.NET-like properties.
@@ -12558,6 +14968,7 @@ class PictureBox(ControlBase):
         self.LoadProgressChanged = lambda sender, e: None
         self.SizeModeChanged = lambda sender, e: None
         self.Error = lambda sender, e: None
+        self._async_job = None
         
         # Create the Tkinter widget (Label with image)
         self._tk_widget = tk.Label(self.master, image=self.Image)
@@ -12668,72 +15079,92 @@ class PictureBox(ControlBase):
             self._load_image_from_location()
 
     def LoadAsync(self, url=None):
-        """Loads the image asynchronously."""
+        """Loads the image asynchronously.
+
+        Reading and decoding run on a small shared worker pool, so loading
+        hundreds of thumbnails does not spawn hundreds of threads. The
+        PhotoImage is created on the UI thread when the data is ready, then
+        LoadCompleted is raised. Progress is reported through
+        LoadProgressChanged. Starting a new load cancels the previous one.
+        """
         if url:
             self.ImageLocation = url
-            
-        # Simple threading wrapper for async load
-        import threading
-        def async_loader():
-            try:
-                self._load_image_from_location()
-                # Schedule event on main thread
-                if hasattr(self, '_tk_widget') and self._tk_widget:
-                    try:
-                        if self._tk_widget.winfo_exists():
-                            self._tk_widget.after(0, lambda: self.LoadCompleted(self, EventArgs.Empty))
-                    except Exception:
-                        pass
-            except Exception as e:
-                if hasattr(self, '_tk_widget') and self._tk_widget:
-                    try:
-                        if self._tk_widget.winfo_exists():
-                            self._tk_widget.after(0, lambda: self.Error(self, e))
-                    except Exception:
-                        pass
-                
-        threading.Thread(target=async_loader, daemon=True).start()
+        if not self.ImageLocation:
+            return
+
+        if self.WaitOnLoad:
+            self._load_image_from_location()
+            self.LoadCompleted(self, AsyncCompletedEventArgs())
+            return
+
+        self.CancelAsync()
+        if self.InitialImage:
+            self._tk_widget.config(image=self.InitialImage)
+
+        self._original_image_path = self.ImageLocation
+        job = _ImageLoadJob(self, self.ImageLocation, (self.Width, self.Height), self.SizeMode)
+        self._async_job = job
+        _ImageLoadPool.submit(job, self._tk_widget)
 
     def CancelAsync(self):
-        """Cancels an asynchronous image load."""
-        # Not fully implemented in this simple wrapper
-        pass
+        """Cancels an asynchronous image load.
+
+        LoadCompleted is raised with Cancelled set to True.
+        """
+        job = getattr(self, '_async_job', None)
+        if job is not None and not job.done:
+            _ImageLoadPool.cancel(job)
+
+    def _on_async_progress(self, job, percent):
+        """Raises LoadProgressChanged on the UI thread."""
+        if job is self._async_job:
+            self.LoadProgressChanged(self, ProgressChangedEventArgs(percent))
+
+    def _on_async_finished(self, job, payload, error):
+        """Completes an asynchronous load on the UI thread."""
+        if job is self._async_job:
+            self._async_job = None
+        try:
+            if not self._tk_widget.winfo_exists():
+                return
+        except tk.TclError:
+            return
+
+        if job.cancelled:
+            self.LoadCompleted(self, AsyncCompletedEventArgs(cancelled=True))
+            return
+        if error is None:
+            try:
+                self._show_loaded_image(_create_photo_image(payload, self._tk_widget))
+            except Exception as e:
+                error = e
+        if error is not None:
+            if self.ErrorImage:
+                self._tk_widget.config(image=self.ErrorImage)
+            self.Error(self, error)
+        self.LoadCompleted(self, AsyncCompletedEventArgs(error=error))
+
+    def _show_loaded_image(self, photo):
+        """Displays an image that is already sized for the current SizeMode."""
+        self.Image = photo
+        anchor = 'nw' if self.SizeMode in (PictureBoxSizeMode.Normal, PictureBoxSizeMode.StretchImage) else 'center'
+        self._tk_widget.config(image=photo, anchor=anchor)
+        if self.SizeMode == PictureBoxSizeMode.AutoSize:
+            self.Width = photo.width()
+            self.Height = photo.height()
+            self._place_control(self.Width, self.Height)
 
     def _load_image_from_location(self):
-        """Load the image from ImageLocation."""
+        """Load the image from ImageLocation synchronously on the UI thread."""
         try:
             # Store the original image path for Zoom and StretchImage modes
             self._original_image_path = self.ImageLocation
-            
-            # Basic implementation using tk.PhotoImage for supported formats (GIF, PNG, PPM/PGM)
-            # For JPG and others, PIL is required but we avoid hard dependency here to prevent errors
-            import threading
-            new_image = tk.PhotoImage(file=self.ImageLocation)
-            self.Image = new_image
-            
-            # Update UI on main thread if called from background
-            def update_ui():
-                if hasattr(self, '_tk_widget') and self._tk_widget:
-                    try:
-                        self._tk_widget.config(image=self.Image)
-                        self._apply_properties()
-                    except Exception:
-                        pass
-                
-            if threading.current_thread() is threading.main_thread():
-                update_ui()
-            else:
-                if hasattr(self, '_tk_widget') and self._tk_widget:
-                    try:
-                        if self._tk_widget.winfo_exists():
-                            self._tk_widget.after(0, update_ui)
-                    except Exception:
-                        pass
-                
+            data = _read_image_bytes(self.ImageLocation)
+            payload = _decode_image_bytes(data, (self.Width, self.Height), self.SizeMode)
+            self._show_loaded_image(_create_photo_image(payload, self._tk_widget))
         except Exception as e:
             if self.ErrorImage:
-                # Load error image if available
-                pass
+                self._tk_widget.config(image=self.ErrorImage)
             # Trigger Error event
             self.Error(self, e)
     
@@ -13108,7 +15539,7 @@ class GroupBox(ControlBase):
         super().__init__(master_widget, defaults['Left'], defaults['Top'])
         
         # Initialize Controls list early to avoid AttributeError in property setters
-        self.Controls = []
+        self.Controls = ControlCollection()
         self.ControlAdded = lambda control: None
         self.ControlRemoved = lambda control: None
         
@@ -13485,7 +15916,7 @@ class GroupBox(ControlBase):
                     font_val = self.Font
                     if not font_val:
                         font_val = ('TkDefaultFont', 9)
-                    f = tkfont.Font(font=font_val)
+                    f = _FontCache.resolve(font_val)
                     title_height = f.metrics("linespace")
                     title_width = f.measure(self.Text)
                     # Add some margin for the title
@@ -13748,7 +16179,7 @@ class Panel(ControlBase, ScrollableControlMixin):
         super().__init__(master_widget, defaults['Left'], defaults['Top'])
         
         # Initialize Controls list early to avoid AttributeError in property setters
-        self.Controls = []
+        self.Controls = ControlCollection()
         self.ControlAdded = lambda control: None
         self.ControlRemoved = lambda control: None
         
@@ -13873,7 +16304,6 @@ class Panel(ControlBase, ScrollableControlMixin):
         
         # Bind events
         self._bind_common_events()
-        self._tk_widget.bind('<Configure>', self._on_paint)
         
         # Auto-register with the parent container if needed
         self._auto_register_with_parent()
@@ -13936,7 +16366,8 @@ class Panel(ControlBase, ScrollableControlMixin):
             control_should_be_visible = control._visible and panel_visible
             if control_should_be_visible:
                 # Show the control
-                control._place_control()
+                if not self._defer_placement(control):
+                    control._place_control()
             else:
                 # Hide the control
                 if hasattr(control, '_tk_widget') and control._tk_widget:
@@ -13944,17 +16375,18 @@ class Panel(ControlBase, ScrollableControlMixin):
         else:
             # If the control has no _visible, use default behavior
             if self.get_Visible():
-                control._place_control()
+                if not self._defer_placement(control):
+                    control._place_control()
 
         # Trigger ControlAdded event
         self.ControlAdded(control)
 
-
-        # Update scroll region if AutoScroll is enabled
+        # Update scroll region and apply AutoSize (deferred while suspended)
+        if self._layout_suspend_count:
+            self._layout_pending = True
+            return
         if self.AutoScroll:
             self._update_scroll_region()
-        
-        # Apply AutoSize if enabled
         if self.AutoSize:
             self._apply_autosize_panel()
 
@@ -14002,6 +16434,23 @@ class Panel(ControlBase, ScrollableControlMixin):
         # This will automatically propagate to all children
         super().set_Visible(value)
 
+    def AddRange(self, controls):
+        """Adds several controls to the Panel with a single layout pass.
+
+        Controls that already belong to the Panel (e.g. auto-registered when
+        they were created with the Panel as parent) are skipped.
+
+        Args:
+            controls: Iterable of controls, added in order.
+        """
+        self.SuspendLayout()
+        try:
+            for control in controls:
+                if control not in self.Controls:
+                    self.AddControl(control)
+        finally:
+            self.ResumeLayout()
+
     def RemoveControl(self, control):
         """Removes a control from the Panel."""
         if control in self.Controls:
@@ -14011,12 +16460,15 @@ class Panel(ControlBase, ScrollableControlMixin):
             if hasattr(control, '_tk_widget') and control._tk_widget:
                 control._tk_widget.place_forget()
             
-            # Update scroll region if AutoScroll is enabled
             if self.AutoScroll:
-                self._update_scroll_region()
-                
+                self._untrack_scroll_child(control)
             self.ControlRemoved(control)
-            # Apply AutoSize if enabled
+            # Update scroll region and apply AutoSize (deferred while suspended)
+            if self._layout_suspend_count:
+                self._layout_pending = True
+                return
+            if self.AutoScroll:
+                self._update_scroll_region()
             if self.AutoSize:
                 self._apply_autosize_panel()
     
@@ -14211,7 +16663,7 @@ class Panel(ControlBase, ScrollableControlMixin):
 
     def _on_paint(self, event):
         """Handler for Paint and Resize events."""
-        self.Paint()
+        self._repaint_if_resized(event)
         self.Resize()
 
 
@@ -14338,6 +16790,12 @@ class FlowLayoutPanel(Panel):
         # Override AddControl para aplicar el layout automático
         self._original_add_control = super().AddControl
 
+        # Estado del layout incremental
+        self._flow_states = []      # (estado antes, estado después) de cada control
+        self._flow_key = None       # parámetros de la última pasada completa
+        self._flow_dirty_from = None
+        self._flow_placed = {}      # id(control) -> (x, y, width, height)
+
         # Override Resize event to update layout
         self.Resize = self._on_resize_internal
         
@@ -14354,8 +16812,9 @@ class FlowLayoutPanel(Panel):
         # Añadir usando el método del padre
         self._original_add_control(control)
         
-        # Aplicar layout automático
-        self._apply_flow_layout()
+        # Solo hay que colocar el control nuevo (va al final del flujo)
+        self._invalidate_flow(len(self.Controls) - 1)
+        self._perform_or_defer_layout()
     
     def RemoveControl(self, control):
         """Quita un control del FlowLayoutPanel y reorganiza el layout.
@@ -14363,11 +16822,61 @@ class FlowLayoutPanel(Panel):
         Args:
             control: Control a quitar
         """
+        if control in self.Controls:
+            self._invalidate_flow(self.Controls.index(control))
+        self._flow_placed.pop(id(control), None)
         super().RemoveControl(control)
-        self._apply_flow_layout()
-    
-    def _apply_flow_layout(self):
-        """Aplica el layout automático según FlowDirection y WrapContents."""
+        self._perform_or_defer_layout()
+
+    def _defer_placement(self, control):
+        # El motor de flujo coloca todos los hijos; no hace falta guardar
+        # la posición original mientras el layout está suspendido
+        if not self._layout_suspend_count:
+            return False
+        self._layout_pending = True
+        return True
+
+    def _invalidate_flow(self, index):
+        """Marca el flujo como pendiente a partir del índice indicado."""
+        index = max(0, index)
+        if self._flow_dirty_from is None or index < self._flow_dirty_from:
+            self._flow_dirty_from = index
+
+    def _on_layout(self):
+        """Motor de layout del panel: flujo y, después, AutoSize."""
+        start = self._flow_dirty_from
+        self._apply_flow_layout(0 if start is None else start)
+        self._apply_pending_autosize()
+
+    def _flow_layout_key(self):
+        """Parámetros que, si cambian, invalidan todo el flujo calculado."""
+        padding = self.Padding
+        return (self.Width, self.Height,
+                tuple(padding) if isinstance(padding, (tuple, list)) else padding,
+                self.FlowDirection, self.WrapContents)
+
+    def _apply_flow_layout(self, start=0):
+        """Aplica el layout automático según FlowDirection y WrapContents.
+
+        El estado del cursor de flujo antes de cada control se guarda en
+        ``_flow_states``, de modo que un cambio en el índice ``start`` solo
+        recoloca los controles desde ese índice. Tamaño, padding, dirección
+        o ajuste distintos de la última pasada fuerzan un cálculo completo.
+        Los controles cuya posición no cambia no se vuelven a colocar.
+
+        Args:
+            start: Índice del primer control que hay que recolocar
+        """
+        self._flow_dirty_from = None
+        
+        key = self._flow_layout_key()
+        if key != self._flow_key:
+            self._flow_key = key
+            start = 0
+        states = self._flow_states
+        start = min(start, len(states), len(self.Controls))
+        del states[start:]
+        
         if not self.Controls:
             return
         
@@ -14385,22 +16894,26 @@ class FlowLayoutPanel(Panel):
         available_width = self.Width - pad_left - pad_right
         available_height = self.Height - pad_top - pad_bottom
         
-        # Posición inicial
-        current_x = pad_left
-        current_y = pad_top
-        if self.FlowDirection == 'RightToLeft':
-             current_x = self.Width - pad_right
-        elif self.FlowDirection == 'BottomUp':
-             current_y = self.Height - pad_bottom
-             
-        max_row_height = 0
-        max_col_width = 0
-        
-        for control in self.Controls:
-            if not hasattr(control, 'Width') or not hasattr(control, 'Height'):
-                continue
-            
-            if not hasattr(control, '_visible') or control._visible:
+        if start > 0:
+            # Reanudar el flujo desde el estado guardado
+            current_x, current_y, max_row_height, max_col_width = states[start - 1][1]
+        else:
+            # Posición inicial
+            current_x = pad_left
+            current_y = pad_top
+            if self.FlowDirection == 'RightToLeft':
+                 current_x = self.Width - pad_right
+            elif self.FlowDirection == 'BottomUp':
+                 current_y = self.Height - pad_bottom
+            max_row_height = 0
+            max_col_width = 0
+        
+        for index in range(start, len(self.Controls)):
+            control = self.Controls[index]
+            state_before = (current_x, current_y, max_row_height, max_col_width)
+            
+            if (hasattr(control, 'Width') and hasattr(control, 'Height')
+                    and (not hasattr(control, '_visible') or control._visible)):
                 control_width = control.Width
                 control_height = control.Height
                 
@@ -14411,6 +16924,7 @@ class FlowLayoutPanel(Panel):
                 
                 full_width = m_left + control_width + m_right
                 full_height = m_top + control_height + m_bottom
+                flow_break = getattr(control, '_flow_break', False)
                 
                 if self.FlowDirection == 'LeftToRight':
                     # Flujo horizontal (izquierda a derecha)
@@ -14421,14 +16935,13 @@ class FlowLayoutPanel(Panel):
                          current_y += max_row_height
                          max_row_height = 0
 
-                    control.Left = current_x + m_left
-                    control.Top = current_y + m_top
-                    control._place_control(control_width, control_height)
+                    self._place_flow_control(control, current_x + m_left, current_y + m_top,
+                                             control_width, control_height)
                     
                     current_x += full_width
                     max_row_height = max(max_row_height, full_height)
                     
-                    if getattr(control, '_flow_break', False):
+                    if flow_break:
                         current_x = pad_left
                         current_y += max_row_height
                         max_row_height = 0
@@ -14441,14 +16954,13 @@ class FlowLayoutPanel(Panel):
                         current_y += max_row_height
                         max_row_height = 0
                     
-                    control.Left = current_x - m_right - control_width
-                    control.Top = current_y + m_top
-                    control._place_control(control_width, control_height)
+                    self._place_flow_control(control, current_x - m_right - control_width,
+                                             current_y + m_top, control_width, control_height)
                     
                     current_x -= full_width
                     max_row_height = max(max_row_height, full_height)
 
-                    if getattr(control, '_flow_break', False):
+                    if flow_break:
                         current_x = self.Width - pad_right
                         current_y += max_row_height
                         max_row_height = 0
@@ -14461,14 +16973,13 @@ class FlowLayoutPanel(Panel):
                         current_x += max_col_width
                         max_col_width = 0
                     
-                    control.Left = current_x + m_left
-                    control.Top = current_y + m_top
-                    control._place_control(control_width, control_height)
+                    self._place_flow_control(control, current_x + m_left, current_y + m_top,
+                                             control_width, control_height)
                     
                     current_y += full_height
                     max_col_width = max(max_col_width, full_width)
 
-                    if getattr(control, '_flow_break', False):
+                    if flow_break:
                         current_y = pad_top
                         current_x += max_col_width
                         max_col_width = 0
@@ -14481,21 +16992,39 @@ class FlowLayoutPanel(Panel):
                         current_x += max_col_width
                         max_col_width = 0
                     
-                    control.Left = current_x + m_left
-                    control.Top = current_y - m_bottom - control_height
-                    control._place_control(control_width, control_height)
+                    self._place_flow_control(control, current_x + m_left,
+                                             current_y - m_bottom - control_height,
+                                             control_width, control_height)
                     
                     current_y -= full_height
                     max_col_width = max(max_col_width, full_width)
 
-                    if getattr(control, '_flow_break', False):
+                    if flow_break:
                         current_y = self.Height - pad_bottom
                         current_x += max_col_width
                         max_col_width = 0
+            
+            states.append((state_before, (current_x, current_y, max_row_height, max_col_width)))
 
         # Update scroll region if AutoScroll is enabled
         if self.AutoScroll and hasattr(self, '_update_scroll_region'):
             self._update_scroll_region()
+
+    def _place_flow_control(self, control, x, y, width, height):
+        """Coloca un control del flujo solo si su posición o tamaño cambió."""
+        geometry = (x, y, width, height)
+        if (self._flow_placed.get(id(control)) == geometry
+                and control.Left == x and control.Top == y):
+            return
+        # Asignar Left/Top sin que cada setter recoloque el control
+        control._placement_suppressed = True
+        try:
+            control.Left = x
+            control.Top = y
+        finally:
+            control._placement_suppressed = False
+        control._place_control(width, height)
+        self._flow_placed[id(control)] = geometry
     
     def set_FlowDirection(self, direction):
         """Establece la dirección del flujo y reorganiza los controles.
@@ -14518,7 +17047,9 @@ class FlowLayoutPanel(Panel):
     def SetFlowBreak(self, control, value):
         """Sets the value of the flow-break setting for the control."""
         control._flow_break = value
-        self._apply_flow_layout()
+        if control in self.Controls:
+            self._invalidate_flow(self.Controls.index(control))
+            self._perform_or_defer_layout()
 
     def GetFlowBreak(self, control):
         """Returns the value of the flow-break setting for the control."""
@@ -14608,6 +17139,12 @@ class TableLayoutPanel(Panel):
         self._original_add_control = super().AddControl
         self._next_cell = (0, 0)  # Próxima celda disponible
 
+        # Caché del layout: tamaños de filas/columnas y geometría colocada
+        self._table_metrics = None
+        self._table_metrics_key = None
+        self._table_dirty = None    # None: limpio, True: todo, dict: solo esos controles
+        self._table_placed = {}     # id(control) -> (x, y, width, height)
+
         # Override Resize event to update layout
         self.Resize = self._on_resize_internal
         
@@ -14662,8 +17199,10 @@ class TableLayoutPanel(Panel):
         # Guardar en la matriz de celdas
         self._cell_controls[(row, column)] = control
         
-        # Aplicar layout automático
-        self._apply_table_layout()
+        # Aplicar layout automático solo al control nuevo (diferido si el
+        # layout está suspendido)
+        self._invalidate_table(control)
+        self._perform_or_defer_layout()
     
     def RemoveControl(self, control):
         """Quita un control del TableLayoutPanel y reorganiza el layout.
@@ -14676,9 +17215,13 @@ class TableLayoutPanel(Panel):
             if ctrl == control:
                 del self._cell_controls[cell]
                 break
+        self._table_placed.pop(id(control), None)
         
         super().RemoveControl(control)
-        self._apply_table_layout()
+        # El resto de celdas no se mueve salvo que cambien los tamaños
+        # (filas/columnas AutoSize), lo que detecta la clave del layout
+        self._invalidate_table()
+        self._perform_or_defer_layout()
     
     def SetCellPosition(self, control, column, row):
         """Establece la posición de un control en una celda específica.
@@ -14696,7 +17239,8 @@ class TableLayoutPanel(Panel):
         
         # Añadir a nueva celda
         self._cell_controls[(row, column)] = control
-        self._apply_table_layout()
+        self._invalidate_table(control)
+        self._perform_or_defer_layout()
     
     def GetCellPosition(self, control):
         """Obtiene la posición de celda de un control.
@@ -14743,7 +17287,8 @@ class TableLayoutPanel(Panel):
     def SetRowSpan(self, control, value):
         """Sets the number of rows that the control spans."""
         control._row_span = value
-        self._apply_table_layout()
+        self._invalidate_table(control)
+        self._perform_or_defer_layout()
 
     def GetRowSpan(self, control):
         return getattr(control, '_row_span', 1)
@@ -14751,7 +17296,8 @@ class TableLayoutPanel(Panel):
     def SetColumnSpan(self, control, value):
         """Sets the number of columns that the control spans."""
         control._column_span = value
-        self._apply_table_layout()
+        self._invalidate_table(control)
+        self._perform_or_defer_layout()
 
     def GetColumnSpan(self, control):
         return getattr(control, '_column_span', 1)
@@ -14765,10 +17311,63 @@ class TableLayoutPanel(Panel):
             row += 1
         self._next_cell = (row, col)
     
-    def _apply_table_layout(self):
-        """Aplica el layout automático según las filas y columnas definidas."""
-        if not self._cell_controls:
+    def _defer_placement(self, control):
+        # El motor de celdas coloca todos los hijos; no hace falta guardar
+        # la posición original mientras el layout está suspendido
+        if not self._layout_suspend_count:
+            return False
+        self._layout_pending = True
+        return True
+
+    def _invalidate_table(self, control=None):
+        """Marca un control (o, sin argumento, ninguno) para la próxima pasada."""
+        if self._table_dirty is True:
             return
+        if self._table_dirty is None:
+            self._table_dirty = {}
+        if control is not None:
+            self._table_dirty[id(control)] = control
+
+    def _on_layout(self):
+        """Motor de layout del panel: celdas y, después, AutoSize."""
+        dirty = self._table_dirty
+        if isinstance(dirty, dict):
+            self._apply_table_layout(list(dirty.values()))
+        else:
+            self._apply_table_layout()
+        self._apply_pending_autosize()
+
+    def _table_layout_key(self):
+        """Parámetros de los que dependen los tamaños de filas y columnas."""
+        padding = self.Padding
+        key = (self.Width, self.Height,
+               tuple(padding) if isinstance(padding, (tuple, list)) else padding,
+               tuple(tuple(style) for style in self.ColumnStyles),
+               tuple(tuple(style) for style in self.RowStyles))
+        # Las filas/columnas AutoSize dependen además del tamaño del contenido
+        if any(style[0] == 'AutoSize' for style in list(self.ColumnStyles) + list(self.RowStyles)):
+            content = []
+            for cell, control in self._cell_controls.items():
+                margin = getattr(control, 'Margin', (3, 3, 3, 3))
+                content.append((cell, getattr(control, 'Width', 0), getattr(control, 'Height', 0),
+                                tuple(margin) if isinstance(margin, (tuple, list)) else margin))
+            key += (tuple(content),)
+        return key
+
+    def _get_table_metrics(self):
+        """Devuelve (column_widths, row_heights, column_positions, row_positions).
+
+        El cálculo se guarda en caché y solo se repite cuando cambian los
+        estilos, el padding, el tamaño del panel o, con filas/columnas
+        AutoSize, el contenido.
+
+        Returns:
+            Tupla (métricas, recalculadas) donde recalculadas indica si la
+            caché no era válida.
+        """
+        key = self._table_layout_key()
+        if key == self._table_metrics_key:
+            return self._table_metrics, False
         
         # Obtener padding
         padding = self.Padding
@@ -14799,8 +17398,31 @@ class TableLayoutPanel(Panel):
         for height in row_heights[:-1]:
             row_positions.append(row_positions[-1] + height)
         
+        self._table_metrics = (column_widths, row_heights, column_positions, row_positions)
+        self._table_metrics_key = key
+        return self._table_metrics, True
+
+    def _apply_table_layout(self, controls=None):
+        """Aplica el layout automático según las filas y columnas definidas.
+
+        Args:
+            controls: Controles a recolocar. None recoloca todos; se ignora
+                si los tamaños de filas o columnas han cambiado.
+        """
+        self._table_dirty = None
+        if not self._cell_controls:
+            return
+        
+        metrics, recalculated = self._get_table_metrics()
+        column_widths, row_heights, column_positions, row_positions = metrics
+        
+        cells = self._cell_controls.items()
+        if controls is not None and not recalculated:
+            wanted = {id(control) for control in controls}
+            cells = [(cell, ctrl) for cell, ctrl in cells if id(ctrl) in wanted]
+        
         # Posicionar controles en sus celdas
-        for (row, col), control in self._cell_controls.items():
+        for (row, col), control in cells:
             if row >= len(row_heights) or col >= len(column_widths):
                 continue
             
@@ -14881,12 +17503,15 @@ class TableLayoutPanel(Panel):
                     final_y = cell_y + (cell_height - ctrl_h) // 2
                     final_h = ctrl_h
 
+            geometry = (int(final_x), int(final_y), int(max(0, final_w)), int(max(0, final_h)))
+            # Skip controls already at this geometry
+            if (self._table_placed.get(id(control)) == geometry
+                    and (control._left, control._top, control._width, control._height) == geometry):
+                continue
+            
             # Update control properties directly without triggering layout
             # Set backing fields directly to avoid triggering setters
-            control._left = int(final_x)
-            control._top = int(final_y)
-            control._width = int(max(0, final_w))
-            control._height = int(max(0, final_h))
+            control._left, control._top, control._width, control._height = geometry
             
             # Position the widget directly
             widget_to_place = control._tk_widget
@@ -14894,7 +17519,8 @@ class TableLayoutPanel(Panel):
                 widget_to_place = control._container_frame
             
             try:
-                widget_to_place.place(x=int(final_x), y=int(final_y), width=int(max(0, final_w)), height=int(max(0, final_h)))
+                widget_to_place.place(x=geometry[0], y=geometry[1], width=geometry[2], height=geometry[3])
+                self._table_placed[id(control)] = geometry
             except Exception:
                 pass
     
@@ -15079,7 +17705,7 @@ class TabPage(ControlBase, ScrollableControlMixin):
         ControlBase.__init__(self, master_for_frame, defaults['Left'], defaults['Top'])
         
         # Initialize Controls list early to avoid AttributeError in property setters
-        self.Controls = []
+        self.Controls = ControlCollection()
         self.ControlAdded = lambda control: None
         self.ControlRemoved = lambda control: None
         
@@ -15384,6 +18010,7 @@ class TabPage(ControlBase, ScrollableControlMixin):
             
             # Update scroll region if AutoScroll is enabled
             if self.AutoScroll:
+                self._untrack_scroll_child(control)
                 self._update_scroll_region()
                 
             self.ControlRemoved(control)
@@ -17280,7 +19907,7 @@ class SplitContainer(ControlBase):
         self.Panel2 = SplitterPanel(self, {'Name': 'Panel2'})
         
         # Add panels to Controls collection
-        self.Controls = [self.Panel1, self.Panel2]
+        self.Controls = ControlCollection([self.Panel1, self.Panel2])
         
         # Add panels to PanedWindow
         self._add_panels()
@@ -18818,6 +21445,7 @@ class ListViewItemCollection:
             # Clear UI
             for item in self._owner._tk_widget.get_children():
                 self._owner._tk_widget.delete(item)
+            self._owner._invalidate_icon_view()
 
     def Contains(self, item):
         """Determines whether the specified item is located in the collection."""
@@ -18867,6 +21495,8 @@ class ListViewItemCollection:
             # Re-index
             for i, it in enumerate(self._items):
                 it._index = i
+            if self._owner:
+                self._owner._invalidate_icon_view()
 
     def RemoveAt(self, index):
         """Removes the item at the specified index."""
@@ -18967,6 +21597,9 @@ class ListView(ControlBase):
     """
     Represents a ListView with VB.NET properties.
     """
+
+    # Views drawn on the icon canvas instead of the Treeview
+    _ICON_VIEWS = (View.LargeIcon, View.SmallIcon, View.Tile)
     
     def __init__(self, master_form, props=None):
         defaults = {
@@ -19048,6 +21681,12 @@ class ListView(ControlBase):
         self._use_compatible_state_image_behavior = True
         self._virtual_list_size = 0
         self._virtual_mode = False
+        # VirtualMode: the Treeview only holds the rows in view
+        self._virtual_top = 0
+        self._virtual_row_ids = []
+        self._virtual_selected = set()
+        self._virtual_scrollbar = None
+        self._virtual_redraw_job = None
         
         # Icon size configuration (configurable)
         self._small_icon_size = 16
@@ -19150,27 +21789,31 @@ class ListView(ControlBase):
             show = 'headings' if value == View.Details else 'tree'
             if self._tk_widget:
                 self._tk_widget.config(show=show)
-        elif value == View.LargeIcon or value == View.SmallIcon:
-            # Icon views need special handling
-            # We need to switch from Treeview to a different display mode
+        elif value in self._ICON_VIEWS:
+            # Icon views are drawn on a canvas instead of the Treeview
             self._switch_to_icon_view(value)
         
         # If switching from icon view back to Details/List, restore Treeview
-        if (old_view == View.LargeIcon or old_view == View.SmallIcon) and \
-           (value == View.Details or value == View.List):
+        if old_view in self._ICON_VIEWS and (value == View.Details or value == View.List):
             self._switch_from_icon_view(value)
     
     def _switch_to_icon_view(self, view_mode):
-        """Switch from Treeview to icon-based display."""
-        import tkinter as tk
-        
+        """Switch from Treeview to the canvas-based icon display."""
         # Create canvas if it doesn't exist
-        if not hasattr(self, '_icon_canvas') or not self._icon_canvas:
+        if not getattr(self, '_icon_canvas', None):
             self._icon_canvas = tk.Canvas(self.master, bg='white', highlightthickness=0)
-            self._icon_frame = tk.Frame(self._icon_canvas, bg='white')
-            self._icon_scrollbar = tk.Scrollbar(self.master, orient='vertical', command=self._icon_canvas.yview)
+            self._icon_scrollbar = tk.Scrollbar(self.master, orient='vertical', command=self._on_icon_yview)
             self._icon_canvas.configure(yscrollcommand=self._icon_scrollbar.set)
-            self._icon_canvas_window = self._icon_canvas.create_window((0, 0), window=self._icon_frame, anchor='nw')
+            self._icon_canvas.bind('<Configure>', lambda e: self._render_icon_view(self._view))
+            self._icon_canvas.bind('<MouseWheel>', self._on_icon_mouse_wheel)
+            self._icon_canvas.bind('<Button-4>', self._on_icon_mouse_wheel)
+            self._icon_canvas.bind('<Button-5>', self._on_icon_mouse_wheel)
+            self._icon_canvas.bind('<Button-1>', self._on_icon_click)
+            self._icon_canvas.bind('<Double-Button-1>', self._on_icon_double_click)
+            self._icon_tiles = {}       # item index -> canvas tag of the tile showing it
+            self._icon_free_tiles = []  # hidden tiles ready to be recycled
+            self._icon_tile_count = 0
+            self._icon_images = {}      # (id(source), size) -> (source, resized PhotoImage)
         
         # Hide treeview
         if self._tk_widget:
@@ -19199,11 +21842,7 @@ class ListView(ControlBase):
             self._icon_canvas.place(x=self._left, y=self._top, width=canvas_width, height=self._height)
             self._icon_scrollbar.place(x=self._left + canvas_width, y=self._top, width=20, height=self._height)
         
-        # Clear existing icons
-        for widget in self._icon_frame.winfo_children():
-            widget.destroy()
-        
-        # Render items as icons
+        self._icon_canvas.yview_moveto(0)
         self._render_icon_view(view_mode)
         
         # Make sure canvas is visible (use tkraise instead of lift for canvas widgets)
@@ -19325,131 +21964,237 @@ class ListView(ControlBase):
             print(f"Image resize error: {e}")
             return photo_image
     
+    def _icon_view_metrics(self, view_mode):
+        """Returns (icon_size, cell_width, cell_height, columns) for an icon view."""
+        if view_mode == View.SmallIcon:
+            icon_size = self._small_icon_size
+            cell_width = self._small_icon_spacing
+            cell_height = icon_size + 50
+        elif view_mode == View.Tile:
+            icon_size = self._large_icon_size
+            cell_width = self._tile_size.Width or 200
+            cell_height = self._tile_size.Height or icon_size + 16
+        else:
+            icon_size = self._large_icon_size
+            cell_width = self._large_icon_spacing
+            cell_height = icon_size + 50
+        
+        canvas_width = self._icon_canvas.winfo_width()
+        if canvas_width <= 1:
+            canvas_width = max(200, self._width - 20)
+        return icon_size, cell_width, cell_height, max(1, canvas_width // cell_width)
+    
     def _render_icon_view(self, view_mode):
-        """Render items in icon view mode."""
-        import tkinter as tk
+        """Lay out the icon view and redraw the visible tiles.
         
-        if not hasattr(self, '_icon_frame') or not self._icon_frame:
+        Only the scroll region is computed for the whole item list; tiles are
+        materialized for the visible rows by _update_visible_icon_tiles.
+        """
+        canvas = getattr(self, '_icon_canvas', None)
+        if not canvas or view_mode not in self._ICON_VIEWS:
             return
         
-        # Use configurable sizes
-        icon_size = self._large_icon_size if view_mode == View.LargeIcon else self._small_icon_size
-        icon_spacing = self._large_icon_spacing if view_mode == View.LargeIcon else self._small_icon_spacing
-        text_width = 70 if view_mode == View.LargeIcon else 50
-        
-        # Get the appropriate image list
-        image_list = self._large_image_list if view_mode == View.LargeIcon else self._small_image_list
-        
-        # Calculate grid layout
-        canvas_width = max(200, self._width - 40)
-        col_count = max(1, canvas_width // icon_spacing)
-        
-        for i, item in enumerate(self._items):
-            # Create frame for each item
-            item_frame = tk.Frame(self._icon_frame, bg='white', relief='flat', bd=0)
-            
-            # Calculate position
-            row = i // col_count
-            col = i % col_count
-            item_frame.grid(row=row, column=col, padx=5, pady=5, sticky='n')
-            
-            # Add icon if available
-            icon_added = False
-            img = None
-            
-            # Try ImageKey first (preferred)
-            if image_list and hasattr(item, 'ImageKey') and item.ImageKey:
-                try:
-                    img = image_list.Images[item.ImageKey]
-                except (KeyError, AttributeError):
-                    pass
-            
-            # Try ImageIndex if ImageKey didn't work
-            if not img and image_list and hasattr(item, 'ImageIndex') and item.ImageIndex is not None and item.ImageIndex >= 0:
-                try:
-                    images_dict = image_list._images
-                    if images_dict and item.ImageIndex < len(images_dict):
-                        img = list(images_dict.values())[item.ImageIndex]
-                except (AttributeError, IndexError):
-                    pass
-            
-            # If we have an image, display it
-            if img:
-                try:
-                    # Check if resize is needed (ImageList already resizes to ImageSize)
-                    if img.width() == icon_size and img.height() == icon_size:
-                        # Already correct size, use as-is
-                        resized_img = img
-                    else:
-                        # Resize image to match configured icon size
-                        resized_img = self._resize_image(img, icon_size, icon_size)
-                    icon_label = tk.Label(item_frame, image=resized_img, bg='white', bd=0)
-                    icon_label.image = resized_img  # Keep reference to prevent garbage collection
-                    icon_label.pack()
-                    icon_added = True
-                except Exception as e:
-                    # If image fails, continue to text
-                    print(f"Icon error: {e}")
-                    pass
-            
-            # If no icon was added, try to use default icon from ImageList
-            if not icon_added:
-                try:
-                    # Try to get default icon from ImageList
-                    if image_list:
-                        images_dict = image_list._images
-                        if images_dict and len(images_dict) > 0:
-                            # Use first image as default
-                            default_img = list(images_dict.values())[0]
-                            if default_img:
-                                # Check if resize is needed
-                                if default_img.width() == icon_size and default_img.height() == icon_size:
-                                    resized_img = default_img
-                                else:
-                                    # Resize default image to match configured icon size
-                                    resized_img = self._resize_image(default_img, icon_size, icon_size)
-                                icon_label = tk.Label(item_frame, image=resized_img, bg='white', bd=0)
-                                icon_label.image = resized_img
-                                icon_label.pack()
-                                icon_added = True
-                except:
-                    pass
-                
-                # If still no icon, add text placeholder
-                if not icon_added:
-                    placeholder = tk.Label(item_frame, text='📄', bg='white', fg='gray', 
-                                          font=('Arial', icon_size), bd=0)
-                    placeholder.pack()
-            
-            # Add text label
-            display_text = item.Text
-            if len(display_text) > 12:
-                display_text = display_text[:9] + '...'
-            
-            text_label = tk.Label(item_frame, text=display_text, bg='white', fg='black', 
-                                 font=('Segoe UI', 8), wraplength=text_width, bd=0)
-            text_label.pack()
-            
-            # Store reference for selection
-            item._icon_frame = item_frame
+        icon_size, cell_width, cell_height, col_count = self._icon_view_metrics(view_mode)
+        image_list = self._small_image_list if view_mode == View.SmallIcon else self._large_image_list
+        # Positional table for ImageIndex lookups, built once per layout
+        image_table = list(image_list._images.values()) if image_list else []
+        self._icon_layout = (view_mode, icon_size, cell_width, cell_height, col_count, image_list, image_table)
         
-        # Update canvas size and scroll region
-        self._icon_frame.update_idletasks()
+        # Every tile is stale after a relayout
+        for tag in self._icon_tiles.values():
+            self._icon_free_tiles.append(tag)
+        self._icon_tiles = {}
         
-        # Calculate required height
         total_rows = (len(self._items) + col_count - 1) // col_count
-        required_height = total_rows * (icon_size + 50)
+        canvas.configure(scrollregion=(0, 0, col_count * cell_width, total_rows * cell_height))
+        self._update_visible_icon_tiles()
+    
+    def _invalidate_icon_view(self):
+        """Schedules a single icon view relayout after item changes."""
+        if self._view not in self._ICON_VIEWS or not getattr(self, '_icon_canvas', None):
+            return
+        if getattr(self, '_icon_relayout_job', None) is None:
+            def relayout():
+                self._icon_relayout_job = None
+                self._render_icon_view(self._view)
+            self._icon_relayout_job = self._icon_canvas.after_idle(relayout)
+    
+    def _update_visible_icon_tiles(self):
+        """Draws tiles for the rows in view, recycling tiles that scrolled out."""
+        canvas = self._icon_canvas
+        view_mode, icon_size, cell_width, cell_height, col_count, image_list, image_table = self._icon_layout
+        items = self._items._items
+        
+        height = canvas.winfo_height()
+        if height <= 1:
+            height = self._height
+        top = int(canvas.canvasy(0))
+        first_row = max(0, top // cell_height - 1)
+        last_row = (top + height) // cell_height + 1
+        start = first_row * col_count
+        end = min(len(items), (last_row + 1) * col_count)
+        
+        tiles = {}
+        for index, tag in self._icon_tiles.items():
+            if start <= index < end:
+                tiles[index] = tag
+            else:
+                self._icon_free_tiles.append(tag)
         
-        # Update frame size
-        self._icon_frame.configure(width=canvas_width, height=max(required_height, self._height))
+        selected = set(self._tk_widget.selection()) if self._tk_widget else set()
+        for index in range(start, end):
+            if index in tiles:
+                continue
+            tag = self._icon_free_tiles.pop() if self._icon_free_tiles else self._create_icon_tile()
+            self._draw_icon_tile(tag, items[index], index, selected)
+            tiles[index] = tag
+        
+        for tag in self._icon_free_tiles:
+            canvas.itemconfigure(tag, state='hidden')
+        self._icon_tiles = tiles
+    
+    def _create_icon_tile(self):
+        """Creates the canvas items for one reusable tile."""
+        canvas = self._icon_canvas
+        self._icon_tile_count += 1
+        tag = f'tile{self._icon_tile_count}'
+        canvas.create_rectangle(0, 0, 0, 0, fill='#CCE8FF', outline='#99D1FF',
+                                tags=(tag, f'{tag}.sel'), state='hidden')
+        canvas.create_image(0, 0, tags=(tag, f'{tag}.img'), state='hidden')
+        canvas.create_text(0, 0, text='📄', fill='gray', tags=(tag, f'{tag}.glyph'), state='hidden')
+        canvas.create_text(0, 0, fill='black', font=('Segoe UI', 8), tags=(tag, f'{tag}.text'), state='hidden')
+        return tag
+    
+    def _draw_icon_tile(self, tag, item, index, selected):
+        """Positions a recycled tile and binds it to an item."""
+        canvas = self._icon_canvas
+        view_mode, icon_size, cell_width, cell_height, col_count, image_list, image_table = self._icon_layout
+        row, col = divmod(index, col_count)
+        x, y = col * cell_width, row * cell_height
+        photo = self._get_icon_image(item, image_list, image_table, icon_size)
+        
+        if view_mode == View.Tile:
+            icon_x, icon_y, icon_anchor = x + 4, y + cell_height // 2, 'w'
+            glyph_x = x + 4 + icon_size // 2
+            text_x, text_y, text_anchor = x + icon_size + 10, y + cell_height // 2, 'w'
+            lines = [item.Text] + [str(sub) for sub in list(item.SubItems)[:2]]
+            text, text_width, justify = '\n'.join(lines), cell_width - icon_size - 14, 'left'
+        else:
+            icon_x, icon_y, icon_anchor = x + cell_width // 2, y + 5, 'n'
+            glyph_x = icon_x
+            text_x, text_y, text_anchor = icon_x, y + icon_size + 10, 'n'
+            text = item.Text if len(item.Text) <= 12 else item.Text[:9] + '...'
+            text_width, justify = (70 if view_mode == View.LargeIcon else 50), 'center'
+        
+        canvas.coords(f'{tag}.sel', x + 2, y + 2, x + cell_width - 2, y + cell_height - 2)
+        canvas.itemconfigure(f'{tag}.sel', state='normal' if item._id in selected else 'hidden')
+        if photo is not None:
+            canvas.coords(f'{tag}.img', icon_x, icon_y)
+            canvas.itemconfigure(f'{tag}.img', image=photo, anchor=icon_anchor, state='normal')
+            canvas.itemconfigure(f'{tag}.glyph', state='hidden')
+        else:
+            canvas.itemconfigure(f'{tag}.img', state='hidden')
+            canvas.coords(f'{tag}.glyph', glyph_x, icon_y if view_mode == View.Tile else y + 5 + icon_size // 2)
+            canvas.itemconfigure(f'{tag}.glyph', font=('Arial', icon_size // 2 or 1), state='normal')
+        canvas.coords(f'{tag}.text', text_x, text_y)
+        canvas.itemconfigure(f'{tag}.text', text=text, width=text_width, anchor=text_anchor,
+                             justify=justify, state='normal')
+    
+    def _get_icon_image(self, item, image_list, image_table, icon_size):
+        """Returns the icon for an item at icon_size, resizing each source image once."""
+        if not image_list:
+            return None
+        img = None
+        if getattr(item, 'ImageKey', None):
+            img = image_list._images.get(item.ImageKey)
+        index = getattr(item, 'ImageIndex', None)
+        if img is None and index is not None and 0 <= index < len(image_table):
+            img = image_table[index]
+        if img is None and image_table:
+            # Use first image as default
+            img = image_table[0]
+        if img is None:
+            return None
         
-        # Update scroll region
-        self._icon_canvas.update_idletasks()
-        self._icon_canvas.configure(scrollregion=(0, 0, canvas_width, required_height))
+        key = (id(img), icon_size)
+        cached = self._icon_images.get(key)
+        if cached is None or cached[0] is not img:
+            try:
+                if img.width() == icon_size and img.height() == icon_size:
+                    resized = img
+                else:
+                    resized = self._resize_image(img, icon_size, icon_size)
+            except Exception:
+                return None
+            cached = (img, resized)
+            self._icon_images[key] = cached
+        return cached[1]
+    
+    def _icon_index_at(self, x, y):
+        """Returns the item index under a canvas-widget position, or -1."""
+        layout = getattr(self, '_icon_layout', None)
+        if not layout:
+            return -1
+        cell_width, cell_height, col_count = layout[2], layout[3], layout[4]
+        cx, cy = self._icon_canvas.canvasx(x), self._icon_canvas.canvasy(y)
+        col, row = int(cx // cell_width), int(cy // cell_height)
+        if cx < 0 or cy < 0 or col >= col_count:
+            return -1
+        index = row * col_count + col
+        return index if index < len(self._items) else -1
+    
+    def _refresh_icon_selection(self):
+        """Updates the selection highlight of the materialized tiles."""
+        if self._view not in self._ICON_VIEWS or not getattr(self, '_icon_canvas', None):
+            return
+        selected = set(self._tk_widget.selection())
+        items = self._items._items
+        for index, tag in self._icon_tiles.items():
+            if index < len(items):
+                state = 'normal' if items[index]._id in selected else 'hidden'
+                self._icon_canvas.itemconfigure(f'{tag}.sel', state=state)
+    
+    def _on_icon_yview(self, *args):
+        """Scrollbar command for the icon canvas."""
+        self._icon_canvas.yview(*args)
+        self._update_visible_icon_tiles()
+    
+    def _on_icon_mouse_wheel(self, event):
+        """Scrolls the icon canvas with the mouse wheel."""
+        if getattr(event, 'num', 0) == 4 or getattr(event, 'delta', 0) > 0:
+            self._on_icon_yview('scroll', -1, 'units')
+        else:
+            self._on_icon_yview('scroll', 1, 'units')
+        self._on_mouse_wheel(event)
+    
+    def _on_icon_click(self, event):
+        """Selects the item under the mouse in icon views."""
+        self._icon_canvas.focus_set()
+        index = self._icon_index_at(event.x, event.y)
+        if index < 0:
+            self._tk_widget.selection_set(())
+        else:
+            item_id = self._items[index]._id
+            if self._multi_select and event.state & 0x0004:
+                self._tk_widget.selection_toggle(item_id)
+            else:
+                self._tk_widget.selection_set(item_id)
+            self._focused_item = self._items[index]
+        self.Click(self, EventArgs(event))
+        self.MouseClick(self, EventArgs(event))
+    
+    def _on_icon_double_click(self, event):
+        """Raises DoubleClick and ItemActivate in icon views."""
+        index = self._icon_index_at(event.x, event.y)
+        self.DoubleClick(self, EventArgs(event))
+        if index >= 0:
+            self.ItemActivate(self, EventArgs({'Item': self._items[index]}))
 
     @property
     def SelectedItems(self):
         """Gets the collection of selected items."""
+        if self._virtual_mode:
+            return [self._retrieve_virtual_item(i) for i in sorted(self._virtual_selected)]
         selections = self._tk_widget.selection()
         selected_items = []
         for sel in selections:
@@ -19463,6 +22208,8 @@ class ListView(ControlBase):
     @property
     def SelectedIndices(self):
         """Gets the collection of selected indices."""
+        if self._virtual_mode:
+            return sorted(self._virtual_selected)
         selections = self._tk_widget.selection()
         indices = []
         for sel in selections:
@@ -19738,14 +22485,167 @@ class ListView(ControlBase):
     def UseCompatibleStateImageBehavior(self, value): self._use_compatible_state_image_behavior = value
 
     @property
-    def VirtualListSize(self): return self._virtual_list_size
+    def VirtualListSize(self):
+        """Gets or sets the number of items when VirtualMode is True."""
+        return self._virtual_list_size
+
     @VirtualListSize.setter
-    def VirtualListSize(self, value): self._virtual_list_size = value
+    def VirtualListSize(self, value):
+        self._virtual_list_size = max(0, value)
+        self._virtual_selected = {i for i in self._virtual_selected if i < self._virtual_list_size}
+        if self._virtual_mode:
+            self._render_virtual_rows()
 
     @property
-    def VirtualMode(self): return self._virtual_mode
+    def VirtualMode(self):
+        """Gets or sets whether items come from RetrieveVirtualItem instead of Items.
+
+        In VirtualMode (Details and List views) the Treeview only ever holds
+        the rows in view; each one is requested through RetrieveVirtualItem
+        when it scrolls into view, so VirtualListSize can be in the millions.
+        """
+        return self._virtual_mode
+
     @VirtualMode.setter
-    def VirtualMode(self, value): self._virtual_mode = value
+    def VirtualMode(self, value):
+        self._virtual_mode = bool(value)
+        self._virtual_top = 0
+        self._virtual_selected = set()
+        if not self._tk_widget:
+            return
+        for row_id in self._tk_widget.get_children():
+            self._tk_widget.delete(row_id)
+        self._virtual_row_ids = []
+        if self._virtual_mode:
+            self._setup_virtual_mode()
+            self._render_virtual_rows()
+        else:
+            if self._virtual_scrollbar is not None:
+                self._virtual_scrollbar.place_forget()
+            self._refresh_items()
+
+    # VirtualMode helpers
+
+    def _setup_virtual_mode(self):
+        """Creates the external scrollbar and the scroll/keyboard bindings (once)."""
+        if self._virtual_scrollbar is None:
+            self._virtual_scrollbar = ttk.Scrollbar(self._tk_widget, orient='vertical',
+                                                    command=self._on_virtual_yview)
+            widget = self._tk_widget
+            widget.bind('<MouseWheel>', self._on_virtual_mouse_wheel, add='+')
+            widget.bind('<Button-4>', self._on_virtual_mouse_wheel, add='+')
+            widget.bind('<Button-5>', self._on_virtual_mouse_wheel, add='+')
+            widget.bind('<Configure>', lambda e: self._virtual_mode and self._render_virtual_rows(), add='+')
+            for key in ('<Up>', '<Down>', '<Prior>', '<Next>', '<Home>', '<End>'):
+                widget.bind(key, self._on_virtual_key, add='+')
+        self._virtual_scrollbar.place(relx=1.0, x=-16, y=0, width=16, relheight=1.0)
+
+    def _virtual_page_size(self):
+        """Number of rows that fit in the Treeview."""
+        height = self._tk_widget.winfo_height()
+        if height <= 1:
+            height = self.Height
+        if self._view == View.Details:
+            height -= 25  # heading row
+        rowheight = 26 if self._grid_lines else 25
+        return max(1, height // rowheight)
+
+    def _retrieve_virtual_item(self, index):
+        e = RetrieveVirtualItemEventArgs(index)
+        self.RetrieveVirtualItem(self, e)
+        item = e.Item
+        if item is None:
+            item = ListViewItem()
+        item._list_view = self
+        item._index = index
+        return item
+
+    def _render_virtual_rows(self):
+        """Fills the Treeview rows with items [top, top + page) of the virtual list."""
+        if not self._tk_widget:
+            return
+        size = self._virtual_list_size
+        page = self._virtual_page_size()
+        self._virtual_top = max(0, min(self._virtual_top, size - page))
+        top = self._virtual_top
+        count = max(0, min(page, size - top))
+        if count:
+            self.CacheVirtualItems(self, CacheVirtualItemsEventArgs(top, top + count - 1))
+
+        tree = self._tk_widget
+        row_ids = self._virtual_row_ids
+        while len(row_ids) > count:
+            tree.delete(row_ids.pop())
+        while len(row_ids) < count:
+            row_ids.append(tree.insert('', 'end'))
+
+        selected = []
+        for row, row_id in enumerate(row_ids):
+            index = top + row
+            item = self._retrieve_virtual_item(index)
+            item._id = row_id
+            image = self._get_item_image(item)
+            tree.item(row_id, text=item.Text, values=self._item_ui_values(item),
+                      tags=('evenrow' if index % 2 == 0 else 'oddrow',),
+                      image=image if image else '')
+            if index in self._virtual_selected:
+                selected.append(row_id)
+        if tuple(tree.selection()) != tuple(selected):
+            tree.selection_set(selected)
+
+        if self._virtual_scrollbar is not None:
+            if size:
+                self._virtual_scrollbar.set(top / size, (top + count) / size)
+            else:
+                self._virtual_scrollbar.set(0.0, 1.0)
+
+    def _virtual_scroll_to(self, top):
+        if top != self._virtual_top:
+            self._virtual_top = top
+            self._render_virtual_rows()
+
+    def _on_virtual_yview(self, action, amount, unit=None):
+        page = self._virtual_page_size()
+        if action == 'moveto':
+            self._virtual_scroll_to(int(float(amount) * self._virtual_list_size))
+        elif action == 'scroll':
+            step = page if unit == 'pages' else 1
+            self._virtual_scroll_to(self._virtual_top + int(amount) * step)
+
+    def _on_virtual_mouse_wheel(self, event):
+        if not self._virtual_mode:
+            return None
+        if getattr(event, 'num', None) == 4 or getattr(event, 'delta', 0) > 0:
+            self._virtual_scroll_to(max(0, self._virtual_top - 3))
+        else:
+            self._virtual_scroll_to(self._virtual_top + 3)
+        return 'break'
+
+    def _on_virtual_key(self, event):
+        """Keyboard navigation over the whole virtual list, not just the visible rows."""
+        if not self._virtual_mode or not self._virtual_list_size:
+            return None
+        page = self._virtual_page_size()
+        focus = self._tk_widget.focus()
+        if focus in self._virtual_row_ids:
+            current = self._virtual_top + self._virtual_row_ids.index(focus)
+        else:
+            current = min(self._virtual_selected) if self._virtual_selected else -1
+        moves = {'Up': current - 1, 'Down': current + 1, 'Prior': current - page,
+                 'Next': current + page, 'Home': 0, 'End': self._virtual_list_size - 1}
+        target = max(0, min(self._virtual_list_size - 1, moves[event.keysym]))
+        self._virtual_selected = {target}
+        self.EnsureVisible(target)
+        self._render_virtual_rows()
+        row = target - self._virtual_top
+        if 0 <= row < len(self._virtual_row_ids):
+            self._tk_widget.focus(self._virtual_row_ids[row])
+        return 'break'
+
+    def _virtual_index_of(self, row_id):
+        if row_id in self._virtual_row_ids:
+            return self._virtual_top + self._virtual_row_ids.index(row_id)
+        return -1
 
     def AddItem(self, item):
         """Adds a ListViewItem to the ListView. (Legacy support)"""
@@ -19791,7 +22691,20 @@ class ListView(ControlBase):
 
     def EnsureVisible(self, index):
         """Ensures that the item at the specified index is visible."""
+        if self._virtual_mode:
+            if 0 <= index < self._virtual_list_size:
+                page = self._virtual_page_size()
+                if index < self._virtual_top:
+                    self._virtual_scroll_to(index)
+                elif index >= self._virtual_top + page:
+                    self._virtual_scroll_to(index - page + 1)
+            return
         if 0 <= index < len(self._items):
+            if self._view in self._ICON_VIEWS and getattr(self, '_icon_layout', None):
+                col_count = self._icon_layout[4]
+                total_rows = (len(self._items) + col_count - 1) // col_count
+                self._on_icon_yview('moveto', (index // col_count) / max(1, total_rows))
+                return
             item = self._items[index]
             if item._id:
                 self._tk_widget.see(item._id)
@@ -19822,7 +22735,13 @@ class ListView(ControlBase):
 
     def GetItemAt(self, x, y):
         """Retrieves the item at the specified location."""
+        if self._view in self._ICON_VIEWS and getattr(self, '_icon_canvas', None):
+            index = self._icon_index_at(x, y)
+            return self._items[index] if index >= 0 else None
         item_id = self._tk_widget.identify_row(y)
+        if self._virtual_mode:
+            index = self._virtual_index_of(item_id)
+            return self._retrieve_virtual_item(index) if index >= 0 else None
         if item_id:
             for item in self._items:
                 if item._id == item_id:
@@ -19845,8 +22764,28 @@ class ListView(ControlBase):
         return ListViewHitTestInfo(item, ListViewHitTestLocations.None_ if not item else ListViewHitTestLocations.Image) # Simplified
 
     def RedrawItems(self, start_index, end_index, invalidate_only):
-        """Redraws items."""
-        pass
+        """Redraws the items from start_index to end_index (inclusive).
+
+        In VirtualMode the rows in view are requested again through
+        RetrieveVirtualItem. With invalidate_only the redraw waits until the
+        UI is idle, so many calls in a row cost a single redraw.
+        """
+        if not self._virtual_mode or not self._tk_widget:
+            return
+        top = self._virtual_top
+        if end_index < top or start_index >= top + len(self._virtual_row_ids):
+            return
+        if not invalidate_only:
+            self._render_virtual_rows()
+        elif self._virtual_redraw_job is None:
+            def redraw():
+                self._virtual_redraw_job = None
+                if self._virtual_mode:
+                    self._render_virtual_rows()
+            try:
+                self._virtual_redraw_job = self._tk_widget.after_idle(redraw)
+            except tk.TclError:
+                pass
 
     def Sort(self):
         """Sorts the items."""
@@ -19887,27 +22826,27 @@ class ListView(ControlBase):
         
         return None
 
+    def _item_ui_values(self, item):
+        """Treeview column values for an item (checkbox symbol, text in Details, subitems)."""
+        # Checkbox symbol: ☐ (unchecked) or ☑ (checked)
+        if self._check_boxes:
+            checkbox_symbol = '☑' if item.Checked else '☐'
+            if self._view == View.Details:
+                return [checkbox_symbol, item.Text] + list(item.SubItems)
+            return [checkbox_symbol] + list(item.SubItems)
+        if self._view == View.Details:
+            return [item.Text] + list(item.SubItems)
+        return list(item.SubItems)
+
     def _add_item_to_ui(self, item):
         # In Details view (show='headings'), the 'text' parameter is not shown
         # Only 'values' are displayed in columns, so include item.Text as first value
         # In List view (show='tree'), 'text' is shown, so don't duplicate in values
         
-        # Checkbox symbol: ☐ (unchecked) or ☑ (checked)
-        if self._check_boxes:
-            checkbox_symbol = '☑' if item.Checked else '☐'
-            if self._view == View.Details:
-                values = [checkbox_symbol, item.Text] + list(item.SubItems)
-            else:
-                values = [checkbox_symbol] + list(item.SubItems)
-        else:
-            if self._view == View.Details:
-                values = [item.Text] + list(item.SubItems)
-            else:
-                values = list(item.SubItems)
+        values = self._item_ui_values(item)
         
-        # Determine row tag for grid lines
-        row_count = len(self._tk_widget.get_children())
-        tag = 'evenrow' if row_count % 2 == 0 else 'oddrow'
+        # Determine row tag for grid lines (items are appended, so the index is the row)
+        tag = 'evenrow' if item._index % 2 == 0 else 'oddrow'
         
         # Get image from SmallImageList if available
         image = self._get_item_image(item)
@@ -19915,23 +22854,13 @@ class ListView(ControlBase):
         # Insert with image (ttk.Treeview supports 'image' parameter)
         item._id = self._tk_widget.insert('', 'end', text=item.Text, values=values, 
                                          tags=(tag,), image=image if image else '')
+        self._invalidate_icon_view()
 
     def _insert_item_to_ui(self, index, item):
         # Include item.Text as the first value only for Details view
         # In List view, text is shown separately, so don't duplicate in values
         
-        # Checkbox symbol: ☐ (unchecked) or ☑ (checked)
-        if self._check_boxes:
-            checkbox_symbol = '☑' if item.Checked else '☐'
-            if self._view == View.Details:
-                values = [checkbox_symbol, item.Text] + list(item.SubItems)
-            else:
-                values = [checkbox_symbol] + list(item.SubItems)
-        else:
-            if self._view == View.Details:
-                values = [item.Text] + list(item.SubItems)
-            else:
-                values = list(item.SubItems)
+        values = self._item_ui_values(item)
         
         # Determine row tag for grid lines
         tag = 'evenrow' if index % 2 == 0 else 'oddrow'
@@ -19942,6 +22871,7 @@ class ListView(ControlBase):
         # Insert with image
         item._id = self._tk_widget.insert('', index, text=item.Text, values=values, 
                                          tags=(tag,), image=image if image else '')
+        self._invalidate_icon_view()
 
     def _update_columns(self):
         # Add checkbox column if CheckBoxes is enabled
@@ -19967,6 +22897,9 @@ class ListView(ControlBase):
             self._tk_widget.column(str(i), width=col.Width, anchor=anchor)
 
     def _refresh_items(self):
+        if self._virtual_mode:
+            self._render_virtual_rows()
+            return
         # Clear all
         for item in self._tk_widget.get_children():
             self._tk_widget.delete(item)
@@ -20040,6 +22973,16 @@ class ListView(ControlBase):
         self._apply_grid_tags()
 
     def _on_selection_changed(self, event):
+        if self._virtual_mode:
+            # Keep selections scrolled out of view; replace the visible part
+            top, bottom = self._virtual_top, self._virtual_top + len(self._virtual_row_ids)
+            selected = {i for i in self._virtual_selected if not top <= i < bottom}
+            selected.update(self._virtual_index_of(row_id) for row_id in self._tk_widget.selection())
+            selected.discard(-1)
+            if selected == self._virtual_selected:
+                return  # re-applied by _render_virtual_rows, not a user change
+            self._virtual_selected = selected
+        self._refresh_icon_selection()
         self.SelectedIndexChanged(self, EventArgs(event))
         selected = self.SelectedItems
         for item in selected:
@@ -20097,6 +23040,9 @@ class ListView(ControlBase):
                                 break
                         return  # Don't process normal click events
         
+        if self._virtual_mode and not (event.state & 0x0005):
+            # Plain click (no Shift/Control) replaces the whole selection
+            self._virtual_selected = set()
         self.Click(self, EventArgs(event))
         self.MouseClick(self, EventArgs({'Button': 'Left', 'Clicks': 1, 'X': event.x, 'Y': event.y}))
         item = self.GetItemAt(event.x, event.y)
@@ -22770,6 +25716,24 @@ class Application:
         import sys
         sys.exit()
 
+    @staticmethod
+    def GetInvokeQueueStats():
+        """
+        Returns metrics of the Invoke/BeginInvoke queue.
+        
+        Returns:
+            dict: QueueDepth (calls waiting now), PeakQueueDepth, Dispatched
+            (calls run), Batches (pump ticks that ran calls), LastBatchSize,
+            MaxBatchSize, MaxLatencyMs (longest wait from queueing to running)
+            and PumpRunning.
+        """
+        return _UIDispatcher.stats()
+    
+    @staticmethod
+    def ResetInvokeQueueStats():
+        """Resets the peak, counter and latency metrics of the Invoke queue."""
+        _UIDispatcher.reset_stats()
+
 
 class Clipboard:
     """